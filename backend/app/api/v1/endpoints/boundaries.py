@@ -7,8 +7,9 @@ from typing import Optional, List
 from pydantic import BaseModel
 
 from app.core.boundary_service import get_boundary_service
+from app.core.fast_json import FastJSONResponse
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
 class BoundaryLayer(BaseModel):
@@ -55,15 +56,18 @@ async def get_layer(
             detail=f"Invalid layer. Must be one of: {valid_layers}"
         )
     
+    # Large GeoJSON: return the response directly so FastAPI skips
+    # jsonable_encoder and orjson serializes the dict in one pass
+    
     # If bounds provided, filter by viewport
     if all(v is not None for v in [min_lng, min_lat, max_lng, max_lat]):
-        return service.get_layer_within_bounds(
+        return FastJSONResponse(service.get_layer_within_bounds(
             layer_id, min_lng, min_lat, max_lng, max_lat, limit
-        )
+        ))
     
     # Load features with limit
     result = service.get_layer(layer_id, limit=limit)
-    return result
+    return FastJSONResponse(result)
 
 
 @router.get("/layer/{layer_id}/search")
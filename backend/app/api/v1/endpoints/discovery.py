@@ -12,26 +12,39 @@ import asyncio
 import json
 import uuid
 from datetime import datetime
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any, AsyncGenerator
+from typing import List, Literal, Optional, Dict, Any, AsyncGenerator
 from sqlalchemy.orm import Session
 from geoalchemy2.shape import from_shape
 from shapely.geometry import Point
 import logging
 
 from app.core.arcgis_parcel_service import get_parcel_discovery_service, DiscoveryParcel
+from app.core.cancellation import stream_until_disconnected
+from app.core.compact_geometry import encode_parcels_compact, zoom_for_bounds
+from app.core.cpu_pool import run_cpu
+from app.core.fast_json import FastJSONResponse
 from app.core.google_places_service import get_google_places_service, PlaceResult
 from app.core.llm_enrichment_service import llm_enrichment_service
 from app.db.base import SessionLocal
 from app.models.property import Property
 from app.core.dependencies import get_current_user, get_db
 from app.models.user import User
+from app.schemas.discovery import (
+    AreaType,
+    DiscoveryFilters,
+    DiscoveryJobResponse,
+    DiscoveryProgress,
+    DiscoveryRequest,
+    DiscoveryStatusResponse,
+    DiscoveryStep,
+)
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
 def sse_message(data: dict) -> str:
@@ -45,6 +58,9 @@ class DiscoveryQueryRequest(BaseModel):
     min_acres: Optional[float] = None
     max_acres: Optional[float] = None
     limit: int = 500
+    # Optional point to search outward from (e.g. map focus); defaults to area center
+    focus_lng: Optional[float] = None
+    focus_lat: Optional[float] = None
 
 
 class ParcelResponse(BaseModel):
@@ -64,6 +80,8 @@ class DiscoveryQueryResponse(BaseModel):
     success: bool
     parcels: List[ParcelResponse]
     total_count: int
+    # How much of the area was searched (tiles fetched vs needed, truncation, early stop)
+    coverage: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 
@@ -79,6 +97,10 @@ async def query_parcels(request: DiscoveryQueryRequest):
         min_acres: Minimum parcel size in acres (optional)
         max_acres: Maximum parcel size in acres (optional)
         limit: Maximum number of parcels to return (default 500)
+        focus_lng, focus_lat: Optional point to search outward from
+    
+    Tiles are searched center-out and the search stops once `limit` parcels
+    are found; `coverage` reports how much of the area was actually searched.
     """
     try:
         print(f"🔍 DISCOVERY ENDPOINT: Received query - min_acres={request.min_acres}, max_acres={request.max_acres}, limit={request.limit}")
@@ -95,12 +117,17 @@ async def query_parcels(request: DiscoveryQueryRequest):
         
         # Query parcels
         service = get_parcel_discovery_service()
-        parcels = await service.query_parcels_in_area(
+        focus = None
+        if request.focus_lng is not None and request.focus_lat is not None:
+            focus = (request.focus_lng, request.focus_lat)
+        result = await service.query_parcels_in_area_with_coverage(
             geometry=request.geometry,
             min_acres=request.min_acres,
             max_acres=request.max_acres,
             limit=request.limit,
+            focus=focus,
         )
+        parcels = result.parcels
         
         print(f"✅ DISCOVERY ENDPOINT: Service returned {len(parcels)} parcels")
         logger.info(f"✅ Found {len(parcels)} parcels")
@@ -124,6 +151,7 @@ async def query_parcels(request: DiscoveryQueryRequest):
             success=True,
             parcels=parcel_responses,
             total_count=len(parcel_responses),
+            coverage=result.coverage_dict(),
         )
         
     except HTTPException:
@@ -357,6 +385,7 @@ async def process_parcels(request: ProcessParcelsRequest):
 @router.post("/process/places/stream")
 async def process_places_stream(
     request: ProcessPlacesRequest,
+    http_request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -368,7 +397,8 @@ async def process_places_stream(
     2. Run LLM enrichment to find decision-maker contact
     3. Stream progress updates
     
-    Returns SSE stream with progress and results.
+    Returns SSE stream with progress and results. Stops (aborting the
+    enrichment in flight) if the client disconnects.
     """
     if not request.places:
         raise HTTPException(status_code=400, detail="No places provided")
@@ -587,7 +617,7 @@ async def process_places_stream(
         })
     
     return StreamingResponse(
-        generate(),
+        stream_until_disconnected(http_request, generate()),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -710,6 +740,11 @@ class ViewportRequest(BaseModel):
     max_lng: float
     max_lat: float
     limit: int = 2000
+    # "geojson" (default) or "compact": quantized, delta-encoded, zoom-simplified
+    # rings with ids only (see app/core/compact_geometry.py); details via GET /parcel
+    encoding: Literal["geojson", "compact"] = "geojson"
+    # Map zoom used to simplify compact geometry (default: estimated from the bbox)
+    zoom: Optional[float] = None
 
 
 class ViewportParcel(BaseModel):
@@ -723,6 +758,7 @@ class ViewportResponse(BaseModel):
     success: bool
     parcels: List[ViewportParcel]
     count: int
+    coverage: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
 
@@ -752,13 +788,28 @@ async def get_viewport_parcels(request: ViewportRequest):
         }
         
         # Use existing parcel discovery service
+        # Tiles are fetched outward from the viewport center
         service = get_parcel_discovery_service()
-        parcels = await service.query_parcels_in_area(
+        result = await service.query_parcels_in_area_with_coverage(
             geometry=bbox_polygon,
             min_acres=None,
             max_acres=None,
             limit=request.limit,
         )
+        parcels = result.parcels
+        
+        if request.encoding == "compact":
+            zoom = request.zoom if request.zoom is not None else zoom_for_bounds(request.min_lng, request.max_lng)
+            payload = await run_cpu(
+                encode_parcels_compact, [(p.id, p.geometry) for p in parcels], zoom,
+            )
+            return FastJSONResponse({
+                "success": True,
+                "encoding": "compact",
+                "count": len(payload["parcels"]),
+                "coverage": result.coverage_dict(),
+                **payload,
+            })
         
         # Convert to simplified response
         result_parcels = [
@@ -773,6 +824,7 @@ async def get_viewport_parcels(request: ViewportRequest):
             success=True,
             parcels=result_parcels,
             count=len(result_parcels),
+            coverage=result.coverage_dict(),
         )
         
     except Exception as e:
@@ -783,3 +835,234 @@ async def get_viewport_parcels(request: ViewportRequest):
             count=0,
             error=str(e),
         )
+
+
+@router.get("/parcel", response_model=ParcelResponse)
+async def get_parcel_details(
+    lat: float = Query(..., ge=-90, le=90),
+    lng: float = Query(..., ge=-180, le=180),
+):
+    """
+    Full details for the parcel at a point - used on click when the map shows
+    compact viewport geometry (ids only). Served from the cached parcel tile.
+    """
+    service = get_parcel_discovery_service()
+    parcel = await service.get_parcel_at_point(lat, lng)
+    if not parcel:
+        raise HTTPException(status_code=404, detail="No parcel found at this location")
+    
+    return ParcelResponse(
+        id=parcel.id,
+        address=parcel.address,
+        acreage=parcel.acreage,
+        apn=parcel.apn,
+        regrid_id=parcel.regrid_id,
+        geometry=parcel.geometry,
+        centroid=parcel.centroid,
+        owner=parcel.owner,
+    )
+
+
+# ============ Discovery Jobs ============
+
+class DiscoveryJobActionResponse(BaseModel):
+    """Result of an action on a discovery job"""
+    success: bool
+    message: str
+    job_id: str
+
+
+async def _resolve_area_polygon(request: DiscoveryRequest) -> Dict[str, Any]:
+    """GeoJSON polygon of the requested area (400 if it can't be resolved)."""
+    from app.core.geocoding_service import geocoding_service
+    
+    if request.area_type == AreaType.POLYGON:
+        if not request.polygon:
+            raise HTTPException(status_code=400, detail="polygon is required for area_type 'polygon'")
+        return request.polygon.model_dump()
+    
+    try:
+        area_polygon = await geocoding_service.get_area_polygon(
+            request.area_type.value, request.value, request.state
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not area_polygon:
+        raise HTTPException(status_code=400, detail=f"Could not resolve area '{request.value}'")
+    return area_polygon
+
+
+@router.post("/jobs", response_model=DiscoveryJobResponse)
+async def submit_discovery_job(
+    request: DiscoveryRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Start a discovery job and return its id at once. Poll
+    GET /discover/jobs/{job_id} for progress - with DISCOVERY_EXECUTION=queue
+    the job runs on a worker process (`python -m app.worker`), not in the API.
+    """
+    from app.core.discovery_orchestrator import discovery_orchestrator
+    
+    area_polygon = await _resolve_area_polygon(request)
+    
+    job_id = uuid.uuid4()
+    filters = request.filters or DiscoveryFilters()
+    
+    try:
+        await discovery_orchestrator.submit_job(
+            job_id,
+            current_user.id,
+            area_polygon,
+            filters,
+            mode=request.mode,
+            tiers=[tier.value for tier in request.tiers] if request.tiers else None,
+            business_type_ids=request.business_type_ids,
+            scoring_prompt=request.scoring_prompt,
+            city=request.city,
+            state=request.state,
+            job_titles=request.job_titles,
+            industries=request.industries,
+            property_categories=[c.value for c in request.property_categories] if request.property_categories else None,
+            min_acres=request.min_acres,
+            max_acres=request.max_acres,
+        )
+    except Exception as e:
+        logger.error(f"❌ Could not submit discovery job: {e}")
+        raise HTTPException(status_code=503, detail="Could not queue discovery job")
+    
+    return DiscoveryJobResponse(
+        job_id=job_id,
+        status=DiscoveryStep.QUEUED,
+        message=f"{request.mode.value} discovery job queued",
+    )
+
+
+@router.post("/stream")
+async def stream_discovery_job(
+    request: DiscoveryRequest,
+    http_request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Run a discovery job in this request and stream its progress as SSE.
+    The job id is in the X-Discovery-Job-Id header. Disconnecting (or
+    POST /discover/jobs/{job_id}/cancel) stops the job within about a second;
+    what it stored so far is kept.
+    """
+    from app.core.discovery_orchestrator import discovery_orchestrator
+    
+    area_polygon = await _resolve_area_polygon(request)
+    job_id = uuid.uuid4()
+    filters = request.filters or DiscoveryFilters()
+    
+    async def generate() -> AsyncGenerator[str, None]:
+        async for progress in discovery_orchestrator.stream_discovery(
+            job_id,
+            current_user.id,
+            area_polygon,
+            filters,
+            db,
+            mode=request.mode,
+            tiers=[tier.value for tier in request.tiers] if request.tiers else None,
+            business_type_ids=request.business_type_ids,
+            scoring_prompt=request.scoring_prompt,
+            city=request.city,
+            state=request.state,
+            job_titles=request.job_titles,
+            industries=request.industries,
+            property_categories=[c.value for c in request.property_categories] if request.property_categories else None,
+            min_acres=request.min_acres,
+            max_acres=request.max_acres,
+        ):
+            yield sse_message(progress)
+    
+    return StreamingResponse(
+        stream_until_disconnected(http_request, generate()),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+            "X-Discovery-Job-Id": str(job_id),
+        }
+    )
+
+
+@router.get("/jobs/{job_id}", response_model=DiscoveryStatusResponse)
+async def get_discovery_job(
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+):
+    """Status and progress of a discovery job (from whichever process is running it)."""
+    from app.core.discovery_orchestrator import discovery_orchestrator
+    
+    job = await asyncio.to_thread(discovery_orchestrator.get_job_status, job_id)
+    if not job or job.get("user_id") != str(current_user.id):
+        raise HTTPException(status_code=404, detail="Discovery job not found")
+    
+    return DiscoveryStatusResponse(
+        job_id=job_id,
+        status=job["status"],
+        progress=job["progress"] or DiscoveryProgress(current_step=job["status"], steps_completed=0),
+        started_at=job["started_at"],
+        completed_at=job.get("completed_at"),
+        error=job.get("error"),
+    )
+
+
+@router.post("/jobs/{job_id}/resume", response_model=DiscoveryJobActionResponse)
+async def resume_discovery_job(
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Resume an interrupted or failed regrid-first / tile-first job from its last
+    checkpoint. Parcels, images, VLM scores and enrichments already paid for
+    are not requested again.
+    """
+    from app.core.discovery_orchestrator import discovery_orchestrator
+    
+    job = await asyncio.to_thread(discovery_orchestrator.get_job_status, job_id)
+    if not job or job.get("user_id") != str(current_user.id):
+        raise HTTPException(status_code=404, detail="Discovery job not found")
+    
+    if not await discovery_orchestrator.request_resume(job_id):
+        raise HTTPException(
+            status_code=409,
+            detail="Job is still running, already completed, or has no checkpoint to resume from",
+        )
+    
+    return DiscoveryJobActionResponse(
+        success=True,
+        message="Discovery job resumed from its last checkpoint",
+        job_id=str(job_id),
+    )
+
+
+@router.post("/jobs/{job_id}/cancel", response_model=DiscoveryJobActionResponse)
+async def cancel_discovery_job(
+    job_id: uuid.UUID,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stop a queued or running discovery job. In-flight imagery, VLM and
+    enrichment requests are aborted within about a second; properties the
+    job already stored are kept, and GET /discover/jobs/{job_id} reports it
+    as cancelled with its partial result.
+    """
+    from app.core.discovery_orchestrator import discovery_orchestrator
+    
+    job = await asyncio.to_thread(discovery_orchestrator.get_job_status, job_id)
+    if not job or job.get("user_id") != str(current_user.id):
+        raise HTTPException(status_code=404, detail="Discovery job not found")
+    
+    if not await asyncio.to_thread(discovery_orchestrator.cancel_job, job_id):
+        raise HTTPException(status_code=409, detail="Job has already finished")
+    
+    return DiscoveryJobActionResponse(
+        success=True,
+        message="Discovery job is being cancelled",
+        job_id=str(job_id),
+    )
@@ -0,0 +1,84 @@
+"""
+Parcel Vector Tile Endpoints
+
+Proxies Regrid parcel MVT tiles so the map can draw parcel outlines as a
+vector tile source instead of downloading GeoJSON from /discover/viewport.
+
+- Tiles within the tileserver's zoom range are passed through as-is (no decode)
+- Deeper zooms are cut from the cached parent tile
+- ?fields=ll_uuid,address keeps only those attributes (smaller tiles)
+- Strong browser caching: ETag / If-None-Match and Cache-Control
+- Signed-in users only (bearer token) - tiles are fetched with the server's
+  paid tileserver token
+"""
+
+from typing import Optional
+
+import mercantile
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+import logging
+
+from app.core.arcgis_parcel_service import TileFetchError, get_parcel_discovery_service
+from app.core.config import settings
+from app.core.dependencies import get_current_user
+from app.core.fast_json import FastJSONResponse
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(default_response_class=FastJSONResponse)
+
+MVT_MEDIA_TYPE = "application/vnd.mapbox-vector-tile"
+
+# Deepest zoom the map may request (tiles past REGRID_TILES_MAX_ZOOM are overzoomed)
+MAX_MAP_ZOOM = 22
+
+
+@router.get("/tiles/{z}/{x}/{y}.mvt")
+async def get_parcel_tile(
+    request: Request,
+    z: int,
+    x: int,
+    y: int,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated attributes to keep (e.g. ll_uuid,address). Default: all"
+    ),
+    current_user: User = Depends(get_current_user),
+):
+    """Parcel outlines as a Mapbox Vector Tile (204 when the tile has no parcels)."""
+    if not 0 <= z <= MAX_MAP_ZOOM or not (0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        raise HTTPException(status_code=400, detail="Invalid tile coordinates")
+    
+    service = get_parcel_discovery_service()
+    if not service.token:
+        raise HTTPException(status_code=503, detail="Parcel tiles are not configured")
+    
+    # Private: authenticated responses must not be served from shared caches
+    cache_headers = {"Cache-Control": f"private, max-age={settings.PARCEL_TILE_MAX_AGE_SECONDS}"}
+    
+    # Parcels are not drawn below the tileserver's minimum useful zoom
+    if z < service.min_zoom:
+        return Response(status_code=204, headers=cache_headers)
+    
+    field_set = None
+    if fields:
+        field_set = tuple(sorted({f.strip() for f in fields.split(",") if f.strip()}))
+    
+    try:
+        content, etag = await service.get_map_tile(mercantile.Tile(x=x, y=y, z=z), field_set)
+    except TileFetchError as e:
+        # Not an empty tile - don't let the browser cache it as one
+        logger.warning(f"⚠️ Parcel tile {z}/{x}/{y} unavailable: {e}")
+        raise HTTPException(status_code=502, detail="Parcel tile unavailable")
+    
+    # Weak ETag: the compression middleware may re-encode the body
+    headers = {**cache_headers, "ETag": f'W/"{etag}"'}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in if_none_match:
+        return Response(status_code=304, headers=headers)
+    
+    if not content:
+        return Response(status_code=204, headers=headers)
+    
+    return Response(content=content, media_type=MVT_MEDIA_TYPE, headers=headers)
@@ -13,6 +13,7 @@ from shapely.geometry import mapping
 import asyncio
 
 from app.db.base import get_db
+from app.core.fast_json import FastJSONResponse
 from app.models.property import Property
 from app.models.property_business import PropertyBusiness
 from app.models.business import Business
@@ -35,7 +36,7 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
 class PropertyPreviewRequest(BaseModel):
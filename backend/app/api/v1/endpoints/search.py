@@ -20,10 +20,11 @@ from app.core.search_service import (
     search_service, SearchQuery, SearchFilters, SearchType,
     SearchResult, SearchResultParcel, PROPERTY_CATEGORIES
 )
+from app.core.fast_json import FastJSONResponse
 from app.core.search_nlp_service import nlp_search_service
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 
 
 # ============================================================
@@ -1,11 +1,12 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, properties, discovery, usage, settings, scoring_prompts, search, boundaries
+from app.api.v1.endpoints import auth, properties, discovery, usage, settings, scoring_prompts, search, boundaries, parcels
 
 api_router = APIRouter()
 
 # Core endpoints
 api_router.include_router(auth.router, prefix="/auth", tags=["authentication"])
 api_router.include_router(discovery.router, prefix="/discover", tags=["discovery"])
+api_router.include_router(parcels.router, prefix="/parcels", tags=["parcels"])
 
 # Properties (uses /parking-lots URL for frontend compatibility)
 api_router.include_router(properties.router, prefix="/parking-lots", tags=["properties"])
@@ -0,0 +1,277 @@
+"""
+Adaptive Concurrency Limiter
+
+AIMD (additive-increase / multiplicative-decrease) concurrency control for
+upstream APIs (Regrid tiles, Regrid records, Google Static Maps, Google
+Places, Apollo, OpenRouter). Limiters are per process, so every job running
+in it shares them.
+
+- Healthy responses with normal latency grow the limit by ~1 per "round"
+  (limit successes), so throughput ramps up to what the upstream allows.
+- 429 / 5xx / timeouts / latency well above baseline cut the limit
+  multiplicatively (at most once per cooldown window, so a burst of failures
+  from requests already in flight counts as one congestion signal).
+- Retry-After is honored: new requests wait until the upstream's cool-off
+  has passed instead of hammering it.
+
+Current limits and counters are exposed via limiter_metrics() (see
+GET /metrics/limiters).
+
+Usage:
+    limiter = get_limiter("regrid_tiles", initial_limit=15)
+    response = await limiter.run(lambda: client.get(url, params=params))
+"""
+
+import asyncio
+import email.utils
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+# Status codes treated as "back off" signals
+THROTTLE_STATUS_CODES = {429, 503}
+ERROR_STATUS_CODES = {500, 502, 504}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds from now."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter for one upstream."""
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 8,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        backoff_factor: float = 0.5,
+        latency_tolerance: float = 2.5,
+        max_retry_after: float = 60.0,
+    ):
+        self.name = name
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_factor = backoff_factor
+        # Latency above `latency_tolerance` x baseline counts as congestion
+        self.latency_tolerance = latency_tolerance
+        self.max_retry_after = max_retry_after
+
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._blocked_until = 0.0
+        self._last_decrease = 0.0
+
+        # Latency tracking (EWMA of successful requests, seconds)
+        self._latency_ewma: Optional[float] = None
+        self._baseline_latency: Optional[float] = None
+
+        # Counters
+        self.requests = 0
+        self.successes = 0
+        self.throttled = 0
+        self.errors = 0
+        self.cancelled = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Created lazily so the limiter can be built at import time
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    # ============ Acquire / release ============
+
+    async def acquire(self) -> float:
+        """Wait for a free slot (and any Retry-After cool-off). Returns the start time."""
+        condition = self._get_condition()
+        while True:
+            wait = self._blocked_until - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                continue
+            async with condition:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    self.requests += 1
+                    return time.monotonic()
+                try:
+                    # Timeout guards against a missed wake-up after a limit change
+                    await asyncio.wait_for(condition.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(
+        self,
+        started_at: float,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        failed: bool = False,
+        cancelled: bool = False,
+    ) -> None:
+        """
+        Release a slot and feed the outcome into the AIMD controller (a request
+        the caller cancelled says nothing about the upstream and is not fed in).
+        """
+        latency = time.monotonic() - started_at
+
+        if cancelled:
+            self.cancelled += 1
+        elif failed or (status_code is not None and status_code in ERROR_STATUS_CODES):
+            self.errors += 1
+            self._on_congestion(f"error ({status_code or 'exception'})")
+        elif status_code is not None and status_code in THROTTLE_STATUS_CODES:
+            self.throttled += 1
+            if retry_after is not None:
+                self._blocked_until = max(
+                    self._blocked_until,
+                    time.monotonic() + min(retry_after, self.max_retry_after),
+                )
+            self._on_congestion(f"throttled ({status_code})")
+        else:
+            self.successes += 1
+            self._on_success(latency)
+
+        condition = self._get_condition()
+        async with condition:
+            self._in_flight -= 1
+            # Wake only as many waiters as there are free slots (the limit may have grown)
+            free_slots = self.limit - self._in_flight
+            if free_slots > 0:
+                condition.notify(free_slots)
+
+    def _on_success(self, latency: float) -> None:
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            self._latency_ewma = 0.8 * self._latency_ewma + 0.2 * latency
+
+        # Baseline = best smoothed latency seen (slowly forgets old minima)
+        if self._baseline_latency is None or self._latency_ewma < self._baseline_latency:
+            self._baseline_latency = self._latency_ewma
+        else:
+            self._baseline_latency *= 1.001
+
+        if self._latency_ewma > self._baseline_latency * self.latency_tolerance:
+            self._on_congestion("latency")
+            return
+
+        # Additive increase: ~+1 per round of `limit` successful requests
+        self._limit = min(float(self.max_limit), self._limit + 1.0 / max(self._limit, 1.0))
+
+    def _on_congestion(self, reason: str) -> None:
+        now = time.monotonic()
+        cooldown = max(self._latency_ewma or 0.0, 0.5)
+        if now - self._last_decrease < cooldown:
+            return
+        old_limit = self.limit
+        self._limit = max(float(self.min_limit), self._limit * self.backoff_factor)
+        self._last_decrease = now
+        self.decreases += 1
+        logger.info(f"⚠️ [{self.name}] {reason}: concurrency {old_limit} -> {self.limit}")
+
+    # ============ Convenience wrapper ============
+
+    async def run(
+        self,
+        request: Callable[[], Awaitable[httpx.Response]],
+        max_retries: int = 2,
+    ) -> httpx.Response:
+        """
+        Execute an HTTP request under the limiter.
+
+        Throttled responses (429/503) are retried up to `max_retries` times,
+        waiting for Retry-After (or a short backoff) before the next attempt.
+        """
+        attempt = 0
+        while True:
+            started_at = await self.acquire()
+            try:
+                response = await request()
+            except (httpx.TimeoutException, httpx.TransportError):
+                await self.release(started_at, failed=True)
+                raise
+            except asyncio.CancelledError:
+                await self.release(started_at, cancelled=True)
+                raise
+            except BaseException:
+                await self.release(started_at)
+                raise
+
+            retry_after = None
+            if response.status_code in THROTTLE_STATUS_CODES:
+                retry_after = parse_retry_after(response.headers.get("retry-after"))
+                if retry_after is None:
+                    retry_after = min(2.0 ** attempt, self.max_retry_after)
+
+            await self.release(started_at, status_code=response.status_code, retry_after=retry_after)
+
+            if response.status_code in THROTTLE_STATUS_CODES and attempt < max_retries:
+                attempt += 1
+                continue
+            return response
+
+    def snapshot(self) -> Dict[str, Any]:
+        blocked_for = max(0.0, self._blocked_until - time.monotonic())
+        return {
+            "name": self.name,
+            "limit": self.limit,
+            "min_limit": self.min_limit,
+            "max_limit": self.max_limit,
+            "in_flight": self._in_flight,
+            "requests": self.requests,
+            "successes": self.successes,
+            "throttled": self.throttled,
+            "errors": self.errors,
+            "cancelled": self.cancelled,
+            "decreases": self.decreases,
+            "latency_ms": round(self._latency_ewma * 1000, 1) if self._latency_ewma else None,
+            "baseline_latency_ms": round(self._baseline_latency * 1000, 1) if self._baseline_latency else None,
+            "retry_after_remaining_s": round(blocked_for, 2),
+        }
+
+
+# ============ Registry ============
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+
+
+def get_limiter(name: str, **kwargs) -> AdaptiveLimiter:
+    """Get or create the named limiter (kwargs only apply on creation)."""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        limiter = AdaptiveLimiter(name, **kwargs)
+        _limiters[name] = limiter
+    return limiter
+
+
+def limiter_metrics() -> List[Dict[str, Any]]:
+    """Snapshot of all registered limiters (current limit, counters, latency)."""
+    return [limiter.snapshot() for limiter in _limiters.values()]
@@ -16,6 +16,7 @@ import httpx
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 
+from app.core.adaptive_limiter import get_limiter
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -93,6 +94,12 @@ class ApolloEnrichmentService:
     def __init__(self):
         self.api_key = settings.APOLLO_API_KEY
         self._client: Optional[httpx.AsyncClient] = None
+        # Adaptive concurrency (AIMD), shared by every job in the process
+        self._limiter = get_limiter(
+            "apollo",
+            initial_limit=settings.APOLLO_CONCURRENCY_INITIAL,
+            max_limit=settings.APOLLO_CONCURRENCY_MAX,
+        )
         
         if self.api_key:
             logger.info("Apollo Enrichment Service initialized")
@@ -117,6 +124,11 @@ class ApolloEnrichmentService:
             )
         return self._client
     
+    async def _post(self, url: str, payload: Dict[str, Any]) -> httpx.Response:
+        """POST to Apollo under the adaptive concurrency limiter."""
+        client = await self._get_client()
+        return await self._limiter.run(lambda: client.post(url, json=payload))
+    
     async def enrich_property_owner(
         self,
         owner_name: str,
@@ -254,8 +266,6 @@ class ApolloEnrichmentService:
     
     async def _search_organization(self, company_name: str) -> Optional[Dict]:
         """Search for an organization by name."""
-        client = await self._get_client()
-        
         url = f"{self.BASE_URL}/organizations/enrich"
         
         # Try with just the name first
@@ -264,7 +274,7 @@ class ApolloEnrichmentService:
         }
         
         try:
-            response = await client.post(url, json=payload)
+            response = await self._post(url, payload)
             
             if response.status_code == 200:
                 data = response.json()
@@ -277,7 +287,7 @@ class ApolloEnrichmentService:
             simple_name = self._simplify_company_name(company_name)
             if simple_name != company_name:
                 payload["name"] = simple_name
-                response = await client.post(url, json=payload)
+                response = await self._post(url, payload)
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -293,8 +303,6 @@ class ApolloEnrichmentService:
     
     async def _search_people_at_org(self, org_id: str) -> List[Dict]:
         """Search for decision makers at an organization."""
-        client = await self._get_client()
-        
         url = f"{self.BASE_URL}/mixed_people/api_search"
         
         payload = {
@@ -305,7 +313,7 @@ class ApolloEnrichmentService:
         }
         
         try:
-            response = await client.post(url, json=payload)
+            response = await self._post(url, payload)
             
             if response.status_code == 200:
                 data = response.json()
@@ -320,8 +328,6 @@ class ApolloEnrichmentService:
     
     async def _enrich_person(self, person_id: str) -> Optional[Dict]:
         """Enrich a person to get full contact details."""
-        client = await self._get_client()
-        
         url = f"{self.BASE_URL}/people/match"
         
         payload = {
@@ -331,7 +337,7 @@ class ApolloEnrichmentService:
         }
         
         try:
-            response = await client.post(url, json=payload)
+            response = await self._post(url, payload)
             
             if response.status_code == 200:
                 data = response.json()
@@ -455,8 +461,6 @@ class ApolloEnrichmentService:
             logger.warning("Apollo API key not configured")
             return []
         
-        client = await self._get_client()
-        
         # Use default titles if not specified
         if not job_titles:
             job_titles = self.PROPERTY_OWNER_TITLES
@@ -493,7 +497,7 @@ class ApolloEnrichmentService:
         results: List[ContactSearchResult] = []
         
         try:
-            response = await client.post(url, json=payload)
+            response = await self._post(url, payload)
             
             if response.status_code != 200:
                 logger.error(f"  [Apollo] Search failed: {response.status_code} - {response.text}")
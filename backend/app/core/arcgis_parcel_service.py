@@ -5,24 +5,32 @@ Fetches parcel geometries from Regrid's MVT vector tiles.
 Uses tiles endpoint (200k/month quota) NOT records endpoint (2k/month quota).
 
 Tiles include: geometry + address, owner, parcelnumb, ll_uuid
+(+ land-use attributes such as lbcs_* / usedesc when the tile layer carries them)
 Size filtering is done client-side after decoding tiles.
 """
 
 import httpx
+import hashlib
 import logging
 import math
 from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass
-from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import asyncio
 
 import mercantile
+import numpy as np
+import shapely
+from shapely import affinity
 from shapely.geometry import shape, mapping, Polygon, MultiPolygon, Point
-from shapely.ops import transform
-import pyproj
 import mapbox_vector_tile as mvt
 
 from app.core.config import settings
+from app.core.adaptive_limiter import get_limiter
+from app.core.cache import TTLCache
+from app.core.cpu_pool import run_cpu
+from app.core.single_flight import get_single_flight
+from app.core.geo_utils import areas_m2, SQ_METERS_PER_ACRE
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +46,7 @@ class DiscoveryParcel:
     geometry: Dict[str, Any]
     centroid: Dict[str, float]
     owner: Optional[str] = None
+    land_use: Optional[Dict[str, Any]] = None  # LAND_USE_TILE_FIELDS present in the tile
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -52,6 +61,359 @@ class DiscoveryParcel:
         }
 
 
+class TileFetchError(Exception):
+    """A tile could not be fetched (non-200/204 response) - not the same as an empty tile."""
+    
+    def __init__(self, tile: mercantile.Tile, status_code: int):
+        super().__init__(f"Tile {tile.z}/{tile.x}/{tile.y} returned {status_code}")
+        self.tile = tile
+        self.status_code = status_code
+
+
+@dataclass
+class AreaQueryResult:
+    """Parcels for an area plus how much of the area was actually covered"""
+    parcels: List[DiscoveryParcel]
+    tiles_total: int          # Tiles needed to cover the whole area
+    tiles_fetched: int        # Tiles actually fetched and decoded
+    tiles_with_data: int = 0
+    tiles_error: int = 0
+    tiles_skipped: int = 0    # Tiles in the bbox but outside the search area (never fetched)
+    tiles_interior: int = 0   # Tiles fully inside the area (no per-feature tests)
+    truncated: bool = False   # Area needed more than MAX_TILES tiles
+    stopped_early: bool = False  # Enough qualifying parcels found before all tiles were fetched
+    zoom: Optional[int] = None   # Tile zoom chosen for the area
+    
+    @property
+    def coverage(self) -> float:
+        """Fraction of the area's tiles that were searched (0-1) - failed tiles don't count"""
+        if not self.tiles_total:
+            return 1.0
+        return (self.tiles_fetched - self.tiles_error) / self.tiles_total
+    
+    def coverage_dict(self) -> Dict[str, Any]:
+        return {
+            "tiles_total": self.tiles_total,
+            "tiles_fetched": self.tiles_fetched,
+            "tiles_with_data": self.tiles_with_data,
+            "tiles_error": self.tiles_error,
+            "tiles_skipped": self.tiles_skipped,
+            "tiles_interior": self.tiles_interior,
+            "coverage_pct": round(self.coverage * 100, 1),
+            "truncated": self.truncated,
+            "stopped_early": self.stopped_early,
+            "zoom": self.zoom,
+            "complete": self.tiles_fetched >= self.tiles_total and not self.tiles_error,
+        }
+
+
+# ============ Tile parsing (runs in the CPU pool) ============
+#
+# Module-level so it can run in worker processes: inputs are raw tile bytes,
+# tile bounds and WKB; outputs are compact tuples in DiscoveryParcel field order.
+
+ParsedParcel = Tuple[str, str, float, str, str, Dict[str, Any], Dict[str, float], str, Optional[Dict[str, Any]]]
+
+# Land-use attributes kept from tile features when present (custom tile layers
+# can carry them) - used to screen candidates before any records lookup
+LAND_USE_TILE_FIELDS = (
+    "lbcs_activity", "lbcs_structure", "lbcs_function", "usecode", "usedesc", "zoning",
+)
+
+# Point lookups: buffer (~30m) to handle coordinates that land on sidewalks/streets
+POINT_BUFFER_DEGREES = 0.0003  # ~30 meters at mid-latitudes
+
+
+def _decode_tile(content: bytes) -> Tuple[List[Dict[str, Any]], int]:
+    """Decode MVT bytes into the parcels layer's features and extent"""
+    tile_data = mvt.decode(content)
+    
+    # Find parcels layer
+    parcels_layer = tile_data.get('parcels', {})
+    if not parcels_layer:
+        # Try first layer if 'parcels' not found
+        for name, data in tile_data.items():
+            parcels_layer = data
+            break
+    
+    # Get extent from layer (default 4096)
+    return parcels_layer.get('features', []), parcels_layer.get('extent', 4096)
+
+
+def _mvt_to_wgs84(
+    geom: Dict[str, Any],
+    bounds: Tuple[float, float, float, float],
+    extent: int = 4096,
+) -> Optional[Dict[str, Any]]:
+    """Convert MVT tile coordinates to WGS84 lat/lng (bounds: west, south, east, north)"""
+    try:
+        west, south, east, north = bounds
+        
+        def convert_coord(coord: List[float]) -> List[float]:
+            x, y = coord[0], coord[1]
+            
+            # Convert tile coords (0-extent) to 0-1 range
+            px = x / extent
+            py = y / extent
+            
+            # Convert to lng/lat
+            # mapbox_vector_tile uses lower-left origin (Y grows UP)
+            lng = west + (east - west) * px
+            lat = south + (north - south) * py
+            
+            return [lng, lat]
+        
+        def convert_ring(ring: List[List[float]]) -> List[List[float]]:
+            return [convert_coord(c) for c in ring]
+        
+        if geom['type'] == 'Polygon':
+            new_coords = [convert_ring(ring) for ring in geom['coordinates']]
+            return {'type': 'Polygon', 'coordinates': new_coords}
+        
+        elif geom['type'] == 'MultiPolygon':
+            new_coords = [
+                [convert_ring(ring) for ring in polygon]
+                for polygon in geom['coordinates']
+            ]
+            return {'type': 'MultiPolygon', 'coordinates': new_coords}
+        
+        return None
+        
+    except Exception as e:
+        logger.debug(f"Error converting coordinates: {e}")
+        return None
+
+
+def _feature_shape(
+    feature: Dict[str, Any],
+    bounds: Tuple[float, float, float, float],
+    extent: int,
+) -> Optional[Tuple[Dict[str, Any], Polygon | MultiPolygon]]:
+    """WGS84 GeoJSON + (repaired) shapely geometry for a polygon feature"""
+    geom = feature.get('geometry')
+    if not geom or geom.get('type') not in ['Polygon', 'MultiPolygon']:
+        return None
+    
+    # Convert MVT tile coordinates to WGS84
+    wgs84_geom = _mvt_to_wgs84(geom, bounds, extent)
+    if not wgs84_geom:
+        return None
+    
+    try:
+        parcel_shape = shape(wgs84_geom)
+        if not parcel_shape.is_valid:
+            parcel_shape = parcel_shape.buffer(0)
+    except Exception:
+        return None
+    return wgs84_geom, parcel_shape
+
+
+def _to_parsed_parcel(
+    props: Dict[str, Any],
+    wgs84_geom: Dict[str, Any],
+    parcel_shape: Polygon | MultiPolygon,
+    acreage: float,
+) -> Optional[ParsedParcel]:
+    """Build the compact parcel tuple (centroid, ids) for a feature"""
+    # Extract properties
+    address = props.get('address', '') or ''
+    owner = props.get('owner', '') or ''
+    parcelnumb = props.get('parcelnumb', '') or ''
+    ll_uuid = props.get('ll_uuid', '') or ''
+    land_use = {
+        field: props[field] for field in LAND_USE_TILE_FIELDS
+        if props.get(field) not in (None, '')
+    }
+    
+    # Generate ID (stable across worker processes, unlike hash())
+    parcel_id = ll_uuid or parcelnumb or hashlib.sha1(str(wgs84_geom).encode()).hexdigest()[:16]
+    
+    # Calculate centroid
+    centroid = parcel_shape.centroid
+    centroid_lat = centroid.y
+    centroid_lng = centroid.x
+    
+    # Skip parcels with invalid centroids
+    if not (isinstance(centroid_lat, (int, float)) and isinstance(centroid_lng, (int, float))):
+        return None
+    if math.isnan(centroid_lat) or math.isnan(centroid_lng):
+        return None
+    
+    return (
+        parcel_id,
+        address,
+        round(acreage, 2),
+        parcelnumb,
+        ll_uuid,
+        wgs84_geom,
+        {"lat": float(centroid_lat), "lng": float(centroid_lng)},
+        owner,
+        land_use or None,
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_search_shape(search_wkb: bytes) -> Polygon | MultiPolygon:
+    """Search area from WKB, prepared for repeated predicates (cached per worker)"""
+    search_shape = shapely.from_wkb(search_wkb)
+    shapely.prepare(search_shape)
+    return search_shape
+
+
+def parse_tile_parcels(
+    content: bytes,
+    bounds: Tuple[float, float, float, float],
+    search_wkb: Optional[bytes],
+) -> List[ParsedParcel]:
+    """
+    Decode a tile and return the parcels intersecting the search area.
+    
+    search_wkb is None for interior tiles (tile fully inside the search area):
+    every feature is accepted without an intersection test.
+    """
+    features, extent = _decode_tile(content)
+    if not features:
+        return []
+    
+    converted_features = []
+    for feature in features:
+        try:
+            converted = _feature_shape(feature, bounds, extent)
+            if converted:
+                converted_features.append((feature, *converted))
+        except Exception as e:
+            logger.debug(f"Error parsing feature: {e}")
+    
+    # Boundary tile: one vectorized test against the prepared search area
+    if search_wkb is not None and converted_features:
+        search_shape = _load_search_shape(search_wkb)
+        hits = shapely.intersects(search_shape, [c[2] for c in converted_features])
+        converted_features = [c for c, hit in zip(converted_features, hits) if hit]
+    
+    # Acreage for the whole tile in one vectorized pass
+    acreages = areas_m2([c[2] for c in converted_features]) / SQ_METERS_PER_ACRE
+    
+    parcels = []
+    for (feature, wgs84_geom, parcel_shape), acreage in zip(converted_features, acreages):
+        try:
+            parcel = _to_parsed_parcel(feature.get('properties', {}), wgs84_geom, parcel_shape, float(acreage))
+            if parcel:
+                parcels.append(parcel)
+        except Exception as e:
+            logger.debug(f"Error parsing feature: {e}")
+    return parcels
+
+
+def reencode_tile(
+    content: bytes,
+    fields: Optional[Tuple[str, ...]],
+    source: Tuple[int, int, int],
+    target: Tuple[int, int, int],
+) -> bytes:
+    """
+    Re-encode an MVT tile for the map.
+    
+    Keeps only the `fields` attributes (all when None). When `target` (x, y, z)
+    is deeper than `source`, the target's area is cut out of the source tile
+    and rescaled to a full tile (overzoom).
+    """
+    tile_data = mvt.decode(content)
+    sx, sy, sz = source
+    tx, ty, tz = target
+    scale = 2 ** (tz - sz)
+    
+    layers = []
+    layer_options = {}
+    for name, layer in tile_data.items():
+        extent = layer.get('extent', 4096)
+        # Target tile's box in source tile coordinates (lower-left origin)
+        span = extent / scale
+        x0 = (tx - sx * scale) * span
+        y0 = extent - (ty - sy * scale + 1) * span
+        margin = span / 64
+        
+        features = []
+        for feature in layer.get('features', []):
+            try:
+                geom = shape(feature['geometry'])
+                if scale > 1:
+                    geom = shapely.clip_by_rect(geom, x0 - margin, y0 - margin, x0 + span + margin, y0 + span + margin)
+                    if geom.is_empty:
+                        continue
+                    geom = affinity.affine_transform(geom, [scale, 0, 0, scale, -x0 * scale, -y0 * scale])
+            except Exception:
+                continue
+            
+            props = feature.get('properties', {})
+            if fields is not None:
+                props = {k: v for k, v in props.items() if k in fields}
+            
+            encoded = {'geometry': geom, 'properties': props}
+            if feature.get('id') is not None:
+                encoded['id'] = feature['id']
+            features.append(encoded)
+        
+        if features:
+            layers.append({'name': name, 'features': features})
+            layer_options[name] = {'extents': extent}
+    
+    if not layers:
+        return b""
+    return mvt.encode(layers, per_layer_options=layer_options)
+
+
+def match_points_in_tile(
+    content: bytes,
+    bounds: Tuple[float, float, float, float],
+    points: List[Tuple[float, float]],
+) -> List[Optional[ParsedParcel]]:
+    """
+    Decode a tile and find the parcel containing (or nearest, within ~30m)
+    each (lng, lat) point. Returns one entry per point.
+    """
+    features, extent = _decode_tile(content)
+    
+    # Pre-convert all geometries
+    converted_features = []
+    for feature in features:
+        converted = _feature_shape(feature, bounds, extent)
+        if converted:
+            converted_features.append((feature, *converted))
+    
+    matches: List[Optional[ParsedParcel]] = []
+    for lng, lat in points:
+        point = Point(lng, lat)
+        point_buffer = point.buffer(POINT_BUFFER_DEGREES)
+        
+        best_match = None
+        best_distance = float('inf')
+        
+        for feature, wgs84_geom, parcel_shape in converted_features:
+            try:
+                # First check: point inside parcel (exact match)
+                if parcel_shape.contains(point):
+                    best_match = (feature, wgs84_geom, parcel_shape)
+                    best_distance = 0
+                    break
+                
+                # Second check: point buffer intersects parcel (nearby)
+                if parcel_shape.intersects(point_buffer):
+                    distance = parcel_shape.distance(point)
+                    if distance < best_distance:
+                        best_distance = distance
+                        best_match = (feature, wgs84_geom, parcel_shape)
+            except Exception:
+                continue
+        
+        if best_match:
+            feature, wgs84_geom, parcel_shape = best_match
+            acreage = float(areas_m2([parcel_shape])[0]) / SQ_METERS_PER_ACRE
+            matches.append(_to_parsed_parcel(feature.get('properties', {}), wgs84_geom, parcel_shape, acreage))
+        else:
+            matches.append(None)
+    return matches
+
+
 class RegridTileService:
     """
     Fetches parcel geometries from Regrid Tileserver API.
@@ -60,23 +422,44 @@ class RegridTileService:
     Tiles contain: geometry, address, owner, parcelnumb, ll_uuid
     """
     
-    # Optimal zoom level - balance between detail and tile count
+    # Zoom used for point lookups (served from the MAX_ZOOM parent when deeper)
     ZOOM_LEVEL = 15
     
-    # Max tiles to fetch per request
+    # Hard cap on tiles fetched per area query, whatever zoom was chosen
     # 200k tiles/month quota → 300 tiles = ~666 queries/month
     MAX_TILES = 300
     
-    # Max concurrent tile requests
-    MAX_CONCURRENT = 15
+    # Tiles are fetched center-out in waves; after each wave we stop if enough
+    # qualifying parcels were found
+    MIN_WAVE_SIZE = 8
     
     def __init__(self):
         self.client = httpx.AsyncClient(timeout=60.0)
         self.base_url = "https://tiles.regrid.com"
         self.token = settings.REGRID_TILESERVER_TOKEN or settings.REGRID_API_KEY
-        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT)
-        # Cache UTM transformers by zone to speed up acreage calculations
-        self._utm_transformers: Dict[str, pyproj.Transformer] = {}
+        # Zoom range: area queries pick a zoom in [min_zoom, max_zoom] from the area size
+        self.min_zoom = settings.REGRID_TILES_MIN_ZOOM
+        self.max_zoom = max(settings.REGRID_TILES_MAX_ZOOM, self.min_zoom)
+        self.target_tiles = settings.REGRID_TILES_TARGET_COUNT
+        # Raw MVT bytes keyed by (z, x, y) - parents serve overzoomed requests
+        self._tile_cache = TTLCache(
+            maxsize=settings.REGRID_TILE_CACHE_SIZE,
+            ttl_seconds=settings.REGRID_TILE_CACHE_TTL_SECONDS,
+        )
+        # Map tiles as served by the MVT proxy: (bytes, etag) keyed by (z, x, y, fields)
+        self._mvt_cache = TTLCache(
+            maxsize=settings.REGRID_TILE_CACHE_SIZE,
+            ttl_seconds=settings.REGRID_TILE_CACHE_TTL_SECONDS,
+        )
+        # Adaptive concurrency (AIMD) shared by all tile fetches
+        self._limiter = get_limiter(
+            "regrid_tiles",
+            initial_limit=settings.REGRID_TILES_CONCURRENCY_INITIAL,
+            max_limit=settings.REGRID_TILES_CONCURRENCY_MAX,
+        )
+        # Concurrent requests for the same tile share one download
+        self._tile_flight = get_single_flight("regrid_tiles")
+        self._map_tile_flight = get_single_flight("regrid_map_tiles")
         
     async def query_parcels_in_area(
         self,
@@ -84,6 +467,7 @@ class RegridTileService:
         min_acres: Optional[float] = None,
         max_acres: Optional[float] = None,
         limit: int = 500,
+        focus: Optional[Tuple[float, float]] = None,
     ) -> List[DiscoveryParcel]:
         """
         Fetch parcels within the given geometry using Regrid tiles.
@@ -93,81 +477,150 @@ class RegridTileService:
             min_acres: Minimum parcel size (filtered client-side)
             max_acres: Maximum parcel size (filtered client-side)
             limit: Max parcels to return
+            focus: Optional (lng, lat) to search outward from (default: area center)
             
         Returns:
             List of DiscoveryParcel with real geometries
         """
+        result = await self.query_parcels_in_area_with_coverage(
+            geometry, min_acres=min_acres, max_acres=max_acres, limit=limit, focus=focus,
+        )
+        return result.parcels
+    
+    async def query_parcels_in_area_with_coverage(
+        self,
+        geometry: Dict[str, Any],
+        min_acres: Optional[float] = None,
+        max_acres: Optional[float] = None,
+        limit: int = 500,
+        focus: Optional[Tuple[float, float]] = None,
+    ) -> AreaQueryResult:
+        """
+        Like query_parcels_in_area, but also reports how much of the area was searched.
+        
+        Tiles are scheduled in rings outward from the focus point (or the
+        area's center) and fetched in waves. Fetching stops as soon as `limit`
+        qualifying parcels have been collected, so "top N lots here" queries
+        only touch the tiles nearest the center. With a size filter, results
+        are the largest qualifying parcels among the tiles searched.
+        """
         # Debug: Print token status
         print(f"🔍 DISCOVERY: Token configured: {bool(self.token)}")
         
         if not self.token:
             print("❌ DISCOVERY: No REGRID_TILESERVER_TOKEN configured!")
             logger.error("No REGRID_TILESERVER_TOKEN configured")
-            return []
+            return AreaQueryResult(parcels=[], tiles_total=0, tiles_fetched=0)
         
         try:
             search_shape = shape(geometry)
+            shapely.prepare(search_shape)
             bounds = search_shape.bounds  # (minx, miny, maxx, maxy)
             
             print(f"🔍 DISCOVERY: Querying bounds: {bounds}")
             logger.info(f"Querying Regrid tiles for bounds: {bounds}")
             
-            # Calculate tiles that cover the search area
-            tiles = list(mercantile.tiles(
-                bounds[0], bounds[1], bounds[2], bounds[3],
-                zooms=self.ZOOM_LEVEL
-            ))
+            # Pick the zoom from the area size, then the covering tiles nearest the focus first
+            zoom = self._choose_zoom(bounds)
+            if focus is None:
+                center = search_shape.centroid
+                focus = (center.x, center.y)
+            tiles = self._order_tiles_center_out(
+                mercantile.tiles(bounds[0], bounds[1], bounds[2], bounds[3], zooms=zoom),
+                focus,
+                zoom,
+            )
+            
+            # Drop bbox tiles outside the area before downloading; flag interior tiles
+            tiles, interior, tiles_skipped = self._classify_tiles(tiles, search_shape)
             
             total_tiles_needed = len(tiles)
-            print(f"🔍 DISCOVERY: Need {total_tiles_needed} tiles at zoom {self.ZOOM_LEVEL}")
-            logger.info(f"Need {total_tiles_needed} tiles at zoom {self.ZOOM_LEVEL}")
+            print(f"🔍 DISCOVERY: Need {total_tiles_needed} tiles at zoom {zoom} ({len(interior)} interior, {tiles_skipped} outside area skipped)")
+            logger.info(f"Need {total_tiles_needed} tiles at zoom {zoom} ({len(interior)} interior, {tiles_skipped} skipped)")
             
-            if total_tiles_needed > self.MAX_TILES:
-                print(f"⚠️ DISCOVERY: Area requires {total_tiles_needed} tiles, limiting to {self.MAX_TILES}")
-                logger.warning(f"Area requires {total_tiles_needed} tiles, fetching first {self.MAX_TILES} (~{int(self.MAX_TILES/total_tiles_needed*100)}% coverage)")
+            truncated = total_tiles_needed > self.MAX_TILES
+            if truncated:
+                print(f"⚠️ DISCOVERY: Area requires {total_tiles_needed} tiles, limiting to the {self.MAX_TILES} nearest the center")
+                logger.warning(f"Area requires {total_tiles_needed} tiles, fetching the {self.MAX_TILES} nearest the center (~{int(self.MAX_TILES/total_tiles_needed*100)}% coverage)")
                 tiles = tiles[:self.MAX_TILES]
-            else:
-                print(f"✅ DISCOVERY: Fetching all {total_tiles_needed} tiles")
-                logger.info(f"Fetching all {total_tiles_needed} tiles (100% coverage)")
             
-            # Fetch all tiles concurrently
-            all_parcels: List[DiscoveryParcel] = []
-            seen_ids: Set[str] = set()
+            has_size_filter = min_acres is not None or max_acres is not None
             
-            # Batch fetch tiles with progress logging
-            logger.info(f"Fetching {len(tiles)} tiles (max {self.MAX_CONCURRENT} concurrent)...")
+            # Shipped to the CPU pool with every boundary tile (parsed once per worker)
+            search_wkb = shapely.to_wkb(search_shape)
             
-            tasks = [self._fetch_tile(tile, search_shape) for tile in tiles]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            all_parcels: List[DiscoveryParcel] = []
+            qualifying_count = 0
+            seen_ids: Set[str] = set()
             
+            tiles_fetched = 0
             tiles_with_data = 0
             tiles_empty = 0
             tiles_error = 0
-            
-            for result in results:
-                if isinstance(result, Exception):
-                    tiles_error += 1
-                    continue
+            stopped_early = False
+            
+            # Fetch in center-out waves, stopping once we have enough qualifying parcels
+            position = 0
+            while position < len(tiles):
+                wave_size = max(self.MIN_WAVE_SIZE, self._limiter.limit * 2)
+                wave = tiles[position:position + wave_size]
+                position += len(wave)
                 
-                if result:
-                    tiles_with_data += 1
-                else:
-                    tiles_empty += 1
+                results = await asyncio.gather(
+                    *(
+                        self._fetch_tile(tile, None if tile in interior else search_wkb)
+                        for tile in wave
+                    ),
+                    return_exceptions=True,
+                )
+                tiles_fetched += len(wave)
+                
+                for result in results:
+                    if isinstance(result, Exception):
+                        tiles_error += 1
+                        continue
+                    
+                    if result:
+                        tiles_with_data += 1
+                    else:
+                        tiles_empty += 1
                     
-                for parcel in result:
-                    if parcel.id not in seen_ids:
+                    for parcel in result:
+                        if parcel.id in seen_ids:
+                            continue
                         seen_ids.add(parcel.id)
                         all_parcels.append(parcel)
+                        if not has_size_filter or self._matches_size(parcel, min_acres, max_acres):
+                            qualifying_count += 1
+                
+                if qualifying_count >= limit and position < len(tiles):
+                    stopped_early = True
+                    logger.info(f"Collected {qualifying_count} qualifying parcels after {tiles_fetched}/{len(tiles)} tiles - stopping early")
+                    break
             
-            print(f"📊 DISCOVERY: Tiles - {tiles_with_data} with data, {tiles_empty} empty, {tiles_error} errors")
+            print(f"📊 DISCOVERY: Tiles - {tiles_fetched}/{total_tiles_needed} fetched, {tiles_with_data} with data, {tiles_empty} empty, {tiles_error} errors")
             print(f"📊 DISCOVERY: Found {len(all_parcels)} unique parcels")
-            logger.info(f"Tiles: {tiles_with_data} with data, {tiles_empty} empty, {tiles_error} errors")
+            logger.info(f"Tiles: {tiles_fetched}/{total_tiles_needed} fetched, {tiles_with_data} with data, {tiles_empty} empty, {tiles_error} errors")
             logger.info(f"Found {len(all_parcels)} unique parcels")
             
+            result = AreaQueryResult(
+                parcels=[],
+                tiles_total=total_tiles_needed,
+                tiles_fetched=tiles_fetched,
+                tiles_with_data=tiles_with_data,
+                tiles_error=tiles_error,
+                tiles_skipped=tiles_skipped,
+                tiles_interior=len(interior),
+                truncated=truncated,
+                stopped_early=stopped_early,
+                zoom=zoom,
+            )
+            
             # Optimization: If no size filter, just return first N parcels (skip acreage sort)
-            if min_acres is None and max_acres is None:
+            if not has_size_filter:
                 print(f"📊 DISCOVERY: No size filter, returning first {limit} parcels")
-                return all_parcels[:limit]
+                result.parcels = all_parcels[:limit]
+                return result
             
             # Filter by acreage (client-side)
             filtered = self._filter_by_size(all_parcels, min_acres, max_acres)
@@ -177,227 +630,173 @@ class RegridTileService:
             # Sort by acreage descending (largest first) - only when filtering by size
             filtered.sort(key=lambda p: p.acreage, reverse=True)
             
-            return filtered[:limit]
+            result.parcels = filtered[:limit]
+            return result
             
         except Exception as e:
             print(f"❌ DISCOVERY ERROR: {type(e).__name__}: {e}")
             logger.error(f"Error querying Regrid tiles: {e}", exc_info=True)
-            return []
+            return AreaQueryResult(parcels=[], tiles_total=0, tiles_fetched=0)
+    
+    def _choose_zoom(self, bounds: Tuple[float, float, float, float]) -> int:
+        """
+        Deepest zoom in [min_zoom, max_zoom] whose tile count for `bounds` fits
+        the target. Small viewports get small deep tiles; large areas drop to
+        coarser tiles instead of exploding into hundreds of requests.
+        """
+        for zoom in range(self.max_zoom, self.min_zoom - 1, -1):
+            if self._tile_count(bounds, zoom) <= self.target_tiles:
+                return zoom
+        return self.min_zoom
+    
+    @staticmethod
+    def _tile_count(bounds: Tuple[float, float, float, float], zoom: int) -> int:
+        """Number of tiles covering `bounds` at `zoom` (without enumerating them)"""
+        west, south, east, north = bounds
+        top_left = mercantile.tile(west, north, zoom)
+        bottom_right = mercantile.tile(east, south, zoom)
+        return (abs(bottom_right.x - top_left.x) + 1) * (abs(bottom_right.y - top_left.y) + 1)
+    
+    def _source_tile(self, tile: mercantile.Tile) -> mercantile.Tile:
+        """Tile actually requested: overzoomed tiles come from their max_zoom parent"""
+        if tile.z > self.max_zoom:
+            return mercantile.parent(tile, zoom=self.max_zoom)
+        return tile
+    
+    @staticmethod
+    def _classify_tiles(
+        tiles: List[mercantile.Tile],
+        search_shape: Polygon | MultiPolygon,
+    ) -> Tuple[List[mercantile.Tile], Set[mercantile.Tile], int]:
+        """
+        Classify tiles against the (prepared) search area in one vectorized pass.
+        
+        Returns (tiles touching the area in original order, the subset fully
+        inside it, number of exterior tiles dropped).
+        """
+        if not tiles:
+            return [], set(), 0
+        
+        west, south, east, north = np.array([tuple(mercantile.bounds(t)) for t in tiles]).T
+        boxes = shapely.box(west, south, east, north)
+        touches = shapely.intersects(search_shape, boxes)
+        inside = shapely.contains(search_shape, boxes)
+        
+        kept = [tile for tile, hit in zip(tiles, touches) if hit]
+        interior = {tile for tile, hit in zip(tiles, inside) if hit}
+        return kept, interior, len(tiles) - len(kept)
+    
+    def _order_tiles_center_out(
+        self,
+        tiles,
+        focus: Tuple[float, float],
+        zoom: int,
+    ) -> List[mercantile.Tile]:
+        """Order tiles in rings outward from the tile containing the focus (lng, lat)"""
+        center = mercantile.tile(focus[0], focus[1], zoom)
+        
+        def ring_key(tile: mercantile.Tile) -> Tuple[int, int]:
+            dx = tile.x - center.x
+            dy = tile.y - center.y
+            # Ring index (Chebyshev distance), then true distance within the ring
+            return (max(abs(dx), abs(dy)), dx * dx + dy * dy)
+        
+        return sorted(tiles, key=ring_key)
     
     async def _fetch_tile(
         self,
         tile: mercantile.Tile,
-        search_shape: Polygon | MultiPolygon,
+        search_wkb: Optional[bytes],
     ) -> List[DiscoveryParcel]:
-        """Fetch and decode a single MVT tile"""
-        async with self._semaphore:
-            return await self._fetch_tile_internal(tile, search_shape)
+        """Fetch and decode a single MVT tile (search_wkb None = interior tile)"""
+        return await self._fetch_tile_internal(tile, search_wkb)
+    
+    async def _request_tile(self, tile: mercantile.Tile) -> httpx.Response:
+        """GET a raw MVT tile under the adaptive concurrency limiter."""
+        url = f"{self.base_url}/api/v1/parcels/{tile.z}/{tile.x}/{tile.y}.mvt"
+        params = {"token": self.token}
+        return await self._limiter.run(lambda: self.client.get(url, params=params))
+    
+    async def _get_tile_bytes(self, tile: mercantile.Tile) -> bytes:
+        """
+        Raw MVT bytes for a tile (b"" when it has no parcels), via the tile cache.
+        
+        Tiles deeper than max_zoom are never requested - the cached max_zoom
+        parent's bytes are returned instead.
+        """
+        source = self._source_tile(tile)
+        key = (source.z, source.x, source.y)
+        
+        content = self._tile_cache.get(key)
+        if content is not None:
+            return content
+        
+        return await self._tile_flight.do(key, lambda: self._download_tile(source))
+    
+    async def _download_tile(self, source: mercantile.Tile) -> bytes:
+        """Download a tile and cache its bytes (other than 200/204 raises TileFetchError, not cached)"""
+        key = (source.z, source.x, source.y)
+        response = await self._request_tile(source)
+        
+        if response.status_code == 204:
+            # No content - tile has no parcels (coverage gap or empty area)
+            # This is normal, not an error
+            content = b""
+        elif response.status_code != 200:
+            # Auth / rate limit / server errors - the tile was NOT searched (not cached)
+            if response.status_code in [401, 403]:
+                print(f"❌ TILE AUTH ERROR: {response.status_code} - Check token!")
+            logger.debug(f"Tile {source} returned {response.status_code}")
+            raise TileFetchError(source, response.status_code)
+        else:
+            content = response.content or b""
+        
+        self._tile_cache.set(key, content)
+        return content
     
     async def _fetch_tile_internal(
         self,
         tile: mercantile.Tile,
-        search_shape: Polygon | MultiPolygon,
+        search_wkb: Optional[bytes],
     ) -> List[DiscoveryParcel]:
-        """Internal tile fetch with semaphore already acquired"""
+        """
+        Fetch a tile (rate limited, cached) and parse its parcels. Failures
+        are raised, so the caller can count the tile as not searched.
+        """
         try:
-            url = f"{self.base_url}/api/v1/parcels/{tile.z}/{tile.x}/{tile.y}.mvt"
-            params = {"token": self.token}
-            
-            response = await self.client.get(url, params=params)
-            
-            if response.status_code == 204:
-                # No content - tile has no parcels (coverage gap or empty area)
-                # This is normal, not an error
-                return []
-            
-            if response.status_code != 200:
-                # Log non-200 responses (might indicate auth issues)
-                if response.status_code in [401, 403]:
-                    print(f"❌ TILE AUTH ERROR: {response.status_code} - Check token!")
-                logger.debug(f"Tile {tile} returned {response.status_code}")
-                return []
-            
-            if not response.content:
+            source = self._source_tile(tile)
+            content = await self._get_tile_bytes(source)
+            if not content:
                 return []
             
-            # Decode MVT
-            tile_data = mvt.decode(response.content)
-            
-            # Find parcels layer
-            parcels_layer = tile_data.get('parcels', {})
-            if not parcels_layer:
-                # Try first layer if 'parcels' not found
-                for name, data in tile_data.items():
-                    parcels_layer = data
-                    break
-            
-            features = parcels_layer.get('features', [])
-            if not features:
-                return []
-            
-            # Get tile bounds for coordinate conversion
-            tile_bounds = mercantile.bounds(tile)
-            
-            # Get extent from layer (default 4096)
-            extent = parcels_layer.get('extent', 4096)
-            
-            # Parse features
-            parcels = []
-            for feature in features:
-                parcel = self._parse_feature(feature, tile, tile_bounds, search_shape, extent)
-                if parcel:
-                    parcels.append(parcel)
+            # Decode + geometry work runs in the CPU pool as soon as this tile
+            # arrives, while the rest of the wave is still downloading
+            parsed = await run_cpu(
+                parse_tile_parcels, content, tuple(mercantile.bounds(source)), search_wkb,
+            )
+            parcels = [DiscoveryParcel(*p) for p in parsed]
             
             logger.debug(f"Tile {tile}: {len(parcels)} parcels")
             return parcels
             
         except httpx.TimeoutException:
             logger.debug(f"Timeout fetching tile {tile}")
-            return []
+            raise
         except Exception as e:
             logger.debug(f"Error fetching tile {tile}: {type(e).__name__}: {e}")
-            return []
-    
-    def _parse_feature(
-        self,
-        feature: Dict[str, Any],
-        tile: mercantile.Tile,
-        tile_bounds: mercantile.LngLatBbox,
-        search_shape: Polygon | MultiPolygon,
-        extent: int = 4096,
-    ) -> Optional[DiscoveryParcel]:
-        """Parse an MVT feature into a DiscoveryParcel"""
-        try:
-            props = feature.get('properties', {})
-            geom = feature.get('geometry')
-            
-            if not geom:
-                return None
-            
-            geom_type = geom.get('type')
-            if geom_type not in ['Polygon', 'MultiPolygon']:
-                return None
-            
-            # Convert MVT tile coordinates to WGS84
-            wgs84_geom = self._mvt_to_wgs84(geom, tile_bounds, extent)
-            if not wgs84_geom:
-                return None
-            
-            # Check if parcel intersects search area
-            try:
-                parcel_shape = shape(wgs84_geom)
-                if not parcel_shape.is_valid:
-                    parcel_shape = parcel_shape.buffer(0)
-                    
-                if not search_shape.intersects(parcel_shape):
-                    return None
-            except Exception:
-                return None
-            
-            # Calculate acreage from geometry
-            acreage = self._calculate_acreage(parcel_shape)
-            
-            # Extract properties
-            address = props.get('address', '') or ''
-            owner = props.get('owner', '') or ''
-            parcelnumb = props.get('parcelnumb', '') or ''
-            ll_uuid = props.get('ll_uuid', '') or ''
-            
-            # Generate ID
-            parcel_id = ll_uuid or parcelnumb or f"{hash(str(wgs84_geom))}"
-            
-            # Calculate centroid
-            centroid = parcel_shape.centroid
-            centroid_lat = centroid.y
-            centroid_lng = centroid.x
-            
-            # Skip parcels with invalid centroids
-            if not (isinstance(centroid_lat, (int, float)) and isinstance(centroid_lng, (int, float))):
-                return None
-            if math.isnan(centroid_lat) or math.isnan(centroid_lng):
-                return None
-            
-            return DiscoveryParcel(
-                id=parcel_id,
-                address=address,
-                acreage=round(acreage, 2),
-                apn=parcelnumb,
-                regrid_id=ll_uuid,
-                geometry=wgs84_geom,
-                centroid={"lat": float(centroid_lat), "lng": float(centroid_lng)},
-                owner=owner,
-            )
-            
-        except Exception as e:
-            logger.debug(f"Error parsing feature: {e}")
-            return None
+            raise
     
-    def _mvt_to_wgs84(
-        self,
-        geom: Dict[str, Any],
-        bounds: mercantile.LngLatBbox,
-        extent: int = 4096,
-    ) -> Optional[Dict[str, Any]]:
-        """Convert MVT tile coordinates to WGS84 lat/lng"""
-        try:
-            def convert_coord(coord: List[float]) -> List[float]:
-                x, y = coord[0], coord[1]
-                
-                # Convert tile coords (0-extent) to 0-1 range
-                px = x / extent
-                py = y / extent
-                
-                # Convert to lng/lat
-                # mapbox_vector_tile uses lower-left origin (Y grows UP)
-                lng = bounds.west + (bounds.east - bounds.west) * px
-                lat = bounds.south + (bounds.north - bounds.south) * py
-                
-                return [lng, lat]
-            
-            def convert_ring(ring: List[List[float]]) -> List[List[float]]:
-                return [convert_coord(c) for c in ring]
-            
-            if geom['type'] == 'Polygon':
-                new_coords = [convert_ring(ring) for ring in geom['coordinates']]
-                return {'type': 'Polygon', 'coordinates': new_coords}
-            
-            elif geom['type'] == 'MultiPolygon':
-                new_coords = [
-                    [convert_ring(ring) for ring in polygon]
-                    for polygon in geom['coordinates']
-                ]
-                return {'type': 'MultiPolygon', 'coordinates': new_coords}
-            
-            return None
-            
-        except Exception as e:
-            logger.debug(f"Error converting coordinates: {e}")
-            return None
-    
-    def _calculate_acreage(self, geom: Polygon | MultiPolygon) -> float:
-        """Calculate area in acres using appropriate UTM projection (with caching)"""
-        try:
-            centroid = geom.centroid
-            
-            # Determine UTM zone
-            utm_zone = int((centroid.x + 180) / 6) + 1
-            hemisphere = 'north' if centroid.y >= 0 else 'south'
-            cache_key = f"{utm_zone}_{hemisphere}"
-            
-            # Use cached transformer or create new one
-            if cache_key not in self._utm_transformers:
-                wgs84 = pyproj.CRS('EPSG:4326')
-                utm = pyproj.CRS(f'+proj=utm +zone={utm_zone} +{hemisphere} +ellps=WGS84')
-                self._utm_transformers[cache_key] = pyproj.Transformer.from_crs(wgs84, utm, always_xy=True)
-            
-            transformer = self._utm_transformers[cache_key]
-            projected = transform(transformer.transform, geom)
-            
-            # Convert sq meters to acres (1 acre = 4046.86 sq meters)
-            return projected.area / 4046.86
-            
-        except Exception:
-            return 0.0
+    @staticmethod
+    def _matches_size(
+        parcel: DiscoveryParcel,
+        min_acres: Optional[float],
+        max_acres: Optional[float],
+    ) -> bool:
+        if min_acres is not None and parcel.acreage < min_acres:
+            return False
+        if max_acres is not None and parcel.acreage > max_acres:
+            return False
+        return True
     
     def _filter_by_size(
         self,
@@ -406,14 +805,7 @@ class RegridTileService:
         max_acres: Optional[float],
     ) -> List[DiscoveryParcel]:
         """Filter parcels by acreage"""
-        filtered = []
-        for p in parcels:
-            if min_acres is not None and p.acreage < min_acres:
-                continue
-            if max_acres is not None and p.acreage > max_acres:
-                continue
-            filtered.append(p)
-        return filtered
+        return [p for p in parcels if self._matches_size(p, min_acres, max_acres)]
     
     async def get_parcel_at_point(
         self,
@@ -437,101 +829,20 @@ class RegridTileService:
             return None
         
         try:
-            # Get the tile containing this point
-            tile = mercantile.tile(lng, lat, self.ZOOM_LEVEL)
-            tile_bounds = mercantile.bounds(tile)
-            
-            # Create a point shape for intersection check
-            point = Point(lng, lat)
-            
-            # Fetch the tile
-            url = f"{self.base_url}/api/v1/parcels/{tile.z}/{tile.x}/{tile.y}.mvt"
-            params = {"token": self.token}
-            
-            response = await self.client.get(url, params=params)
+            # Get the tile containing this point (served from its cached parent when overzoomed)
+            tile = self._source_tile(mercantile.tile(lng, lat, self.ZOOM_LEVEL))
             
-            if response.status_code == 204 or not response.content:
+            content = await self._get_tile_bytes(tile)
+            if not content:
                 logger.debug(f"No parcel data at ({lat}, {lng})")
                 return None
             
-            if response.status_code != 200:
-                logger.debug(f"Tile fetch error: {response.status_code}")
-                return None
-            
-            # Decode MVT
-            tile_data = mvt.decode(response.content)
-            
-            # Find parcels layer
-            parcels_layer = tile_data.get('parcels', {})
-            if not parcels_layer:
-                for name, data in tile_data.items():
-                    parcels_layer = data
-                    break
-            
-            features = parcels_layer.get('features', [])
-            
-            # Get extent from layer (default 4096)
-            extent = parcels_layer.get('extent', 4096)
-            
-            # Find parcel containing or nearest to the point
-            # Use buffer (~30m) to handle coordinates that land on sidewalks/streets
-            BUFFER_DEGREES = 0.0003  # ~30 meters at mid-latitudes
-            point_buffer = point.buffer(BUFFER_DEGREES)
-            
-            best_match = None
-            best_distance = float('inf')
-            
-            for feature in features:
-                geom = feature.get('geometry')
-                if not geom:
-                    continue
-                
-                geom_type = geom.get('type')
-                if geom_type not in ['Polygon', 'MultiPolygon']:
-                    continue
-                
-                # Convert to WGS84
-                wgs84_geom = self._mvt_to_wgs84(geom, tile_bounds, extent)
-                if not wgs84_geom:
-                    continue
-                
-                try:
-                    parcel_shape = shape(wgs84_geom)
-                    if not parcel_shape.is_valid:
-                        parcel_shape = parcel_shape.buffer(0)
-                    
-                    # First check: point inside parcel (exact match)
-                    if parcel_shape.contains(point):
-                        best_match = (feature, wgs84_geom, parcel_shape)
-                        best_distance = 0
-                        break
-                    
-                    # Second check: point buffer intersects parcel (nearby)
-                    if parcel_shape.intersects(point_buffer):
-                        distance = parcel_shape.distance(point)
-                        if distance < best_distance:
-                            best_distance = distance
-                            best_match = (feature, wgs84_geom, parcel_shape)
-                except Exception:
-                    continue
-            
-            # Return best match found
-            if best_match:
-                feature, wgs84_geom, parcel_shape = best_match
-                props = feature.get('properties', {})
-                acreage = self._calculate_acreage(parcel_shape)
-                centroid = parcel_shape.centroid
-                
-                return DiscoveryParcel(
-                    id=props.get('ll_uuid', '') or props.get('parcelnumb', '') or f"{hash(str(wgs84_geom))}",
-                    address=props.get('address', '') or '',
-                    acreage=round(acreage, 2),
-                    apn=props.get('parcelnumb', '') or '',
-                    regrid_id=props.get('ll_uuid', '') or '',
-                    geometry=wgs84_geom,
-                    centroid={"lat": centroid.y, "lng": centroid.x},
-                    owner=props.get('owner', '') or '',
-                )
+            # Find parcel containing or nearest to the point (off the event loop)
+            matches = await run_cpu(
+                match_points_in_tile, content, tuple(mercantile.bounds(tile)), [(lng, lat)],
+            )
+            if matches[0]:
+                return DiscoveryParcel(*matches[0])
             
             logger.debug(f"No parcel found near point ({lat}, {lng})")
             return None
@@ -560,10 +871,10 @@ class RegridTileService:
             logger.error("No REGRID_TILESERVER_TOKEN configured")
             return [None] * len(points)
         
-        # Group points by tile
+        # Group points by the tile actually fetched (overzoomed tiles share their parent)
         tile_to_points: Dict[Tuple[int, int, int], List[Tuple[int, Dict]]] = {}
         for idx, point in enumerate(points):
-            tile = mercantile.tile(point['lng'], point['lat'], self.ZOOM_LEVEL)
+            tile = self._source_tile(mercantile.tile(point['lng'], point['lat'], self.ZOOM_LEVEL))
             key = (tile.x, tile.y, tile.z)
             if key not in tile_to_points:
                 tile_to_points[key] = []
@@ -579,101 +890,27 @@ class RegridTileService:
         async def process_tile(tile_key: Tuple[int, int, int], point_indices: List[Tuple[int, Dict]]):
             x, y, z = tile_key
             tile = mercantile.Tile(x=x, y=y, z=z)
-            tile_bounds = mercantile.bounds(tile)
             
             try:
-                url = f"{self.base_url}/api/v1/parcels/{z}/{x}/{y}.mvt"
-                params = {"token": self.token}
-                
-                async with self._semaphore:
-                    response = await self.client.get(url, params=params)
-                
-                if response.status_code == 204 or not response.content:
-                    print(f"   📭 Tile {z}/{x}/{y}: No data (204)")
-                    return
+                content = await self._get_tile_bytes(tile)
                 
-                if response.status_code != 200:
-                    print(f"   ❌ Tile {z}/{x}/{y}: Error {response.status_code}")
+                if not content:
+                    print(f"   📭 Tile {z}/{x}/{y}: No data")
                     return
                 
-                # Decode MVT
-                tile_data = mvt.decode(response.content)
-                
-                parcels_layer = tile_data.get('parcels', {})
-                if not parcels_layer:
-                    for name, data in tile_data.items():
-                        parcels_layer = data
-                        break
-                
-                features = parcels_layer.get('features', [])
-                
-                # Get extent from layer (default 4096)
-                extent = parcels_layer.get('extent', 4096)
+                print(f"   📦 Tile {z}/{x}/{y}: checking {len(point_indices)} points")
                 
-                print(f"   📦 Tile {z}/{x}/{y}: {len(features)} features, checking {len(point_indices)} points")
-                
-                # Pre-convert all geometries
-                converted_features = []
-                for feature in features:
-                    geom = feature.get('geometry')
-                    if not geom or geom.get('type') not in ['Polygon', 'MultiPolygon']:
-                        continue
-                    
-                    wgs84_geom = self._mvt_to_wgs84(geom, tile_bounds, extent)
-                    if wgs84_geom:
-                        try:
-                            parcel_shape = shape(wgs84_geom)
-                            if not parcel_shape.is_valid:
-                                parcel_shape = parcel_shape.buffer(0)
-                            converted_features.append((feature, wgs84_geom, parcel_shape))
-                        except:
-                            continue
-                
-                # Match each point to a parcel
-                # Use buffer (~30m) to handle Google Places coordinates that land on sidewalks/streets
-                BUFFER_DEGREES = 0.0003  # ~30 meters at mid-latitudes
+                # Match each point to a parcel (decode + geometry in the CPU pool)
+                matches = await run_cpu(
+                    match_points_in_tile,
+                    content,
+                    tuple(mercantile.bounds(tile)),
+                    [(point_data['lng'], point_data['lat']) for _, point_data in point_indices],
+                )
                 
-                for idx, point_data in point_indices:
-                    point = Point(point_data['lng'], point_data['lat'])
-                    point_buffer = point.buffer(BUFFER_DEGREES)
-                    
-                    best_match = None
-                    best_distance = float('inf')
-                    
-                    for feature, wgs84_geom, parcel_shape in converted_features:
-                        try:
-                            # First check: point inside parcel (exact match)
-                            if parcel_shape.contains(point):
-                                best_match = (feature, wgs84_geom, parcel_shape)
-                                best_distance = 0
-                                break
-                            
-                            # Second check: point buffer intersects parcel (nearby)
-                            if parcel_shape.intersects(point_buffer):
-                                distance = parcel_shape.distance(point)
-                                if distance < best_distance:
-                                    best_distance = distance
-                                    best_match = (feature, wgs84_geom, parcel_shape)
-                        except:
-                            continue
-                    
-                    # Use best match found
-                    if best_match:
-                        feature, wgs84_geom, parcel_shape = best_match
-                        props = feature.get('properties', {})
-                        acreage = self._calculate_acreage(parcel_shape)
-                        centroid = parcel_shape.centroid
-                        
-                        results[idx] = DiscoveryParcel(
-                            id=props.get('ll_uuid', '') or props.get('parcelnumb', '') or f"{hash(str(wgs84_geom))}",
-                            address=props.get('address', '') or '',
-                            acreage=round(acreage, 2),
-                            apn=props.get('parcelnumb', '') or '',
-                            regrid_id=props.get('ll_uuid', '') or '',
-                            geometry=wgs84_geom,
-                            centroid={"lat": centroid.y, "lng": centroid.x},
-                            owner=props.get('owner', '') or '',
-                        )
+                for (idx, _), match in zip(point_indices, matches):
+                    if match:
+                        results[idx] = DiscoveryParcel(*match)
                             
             except Exception as e:
                 logger.debug(f"Error processing tile {tile_key}: {e}")
@@ -688,6 +925,47 @@ class RegridTileService:
         
         return results
     
+    async def get_map_tile(
+        self,
+        tile: mercantile.Tile,
+        fields: Optional[Tuple[str, ...]] = None,
+    ) -> Tuple[bytes, str]:
+        """
+        MVT bytes for the map tile proxy, with an ETag.
+        
+        Tiles within the zoom range are passed through untouched (no decode);
+        only attribute filtering or overzoom (z > max_zoom) re-encodes, in the
+        CPU pool. Results are cached by (z, x, y, fields). Empty tiles give b"".
+        """
+        key = (tile.z, tile.x, tile.y, fields)
+        cached = self._mvt_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        return await self._map_tile_flight.do(key, lambda: self._build_map_tile(tile, fields))
+    
+    async def _build_map_tile(
+        self,
+        tile: mercantile.Tile,
+        fields: Optional[Tuple[str, ...]],
+    ) -> Tuple[bytes, str]:
+        key = (tile.z, tile.x, tile.y, fields)
+        source = self._source_tile(tile)
+        content = await self._get_tile_bytes(source)
+        
+        if content and (fields is not None or source != tile):
+            content = await run_cpu(
+                reencode_tile,
+                content,
+                fields,
+                (source.x, source.y, source.z),
+                (tile.x, tile.y, tile.z),
+            )
+        
+        etag = hashlib.sha1(content).hexdigest()[:20]
+        self._mvt_cache.set(key, (content, etag))
+        return content, etag
+    
     async def close(self):
         """Close HTTP client"""
         await self.client.aclose()
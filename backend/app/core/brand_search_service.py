@@ -17,6 +17,7 @@ from dataclasses import dataclass
 import httpx
 
 from app.core.config import settings
+from app.core.geo_utils import bounds_radius_m
 from app.core.search_service import SearchResultParcel
 
 logger = logging.getLogger(__name__)
@@ -116,12 +117,9 @@ class BrandSearchService:
         center_lat = (viewport["minLat"] + viewport["maxLat"]) / 2
         center_lng = (viewport["minLng"] + viewport["maxLng"]) / 2
         
-        # Calculate radius (approximate, in meters)
-        lat_diff = viewport["maxLat"] - viewport["minLat"]
-        lng_diff = viewport["maxLng"] - viewport["minLng"]
-        # Rough conversion: 1 degree lat ≈ 111km
+        # Calculate radius (in meters)
         radius_m = min(
-            max(lat_diff * 111000 / 2, lng_diff * 111000 / 2),
+            bounds_radius_m((viewport["minLng"], viewport["minLat"], viewport["maxLng"], viewport["maxLat"])),
             50000  # Max 50km radius
         )
         
@@ -8,6 +8,7 @@ from geoalchemy2.shape import from_shape
 import uuid
 
 from app.core.config import settings
+from app.core.geo_utils import bounds_radius_m
 from app.models.business import Business
 
 logger = logging.getLogger(__name__)
@@ -172,12 +173,7 @@ class BusinessDataService:
         centroid = poly.centroid
         
         # Calculate radius from polygon bounds
-        bounds = poly.bounds
-        radius = max(
-            abs(bounds[2] - bounds[0]) * 111000,  # lng to meters
-            abs(bounds[3] - bounds[1]) * 111000   # lat to meters
-        ) / 2
-        radius = min(radius, 50000)  # Google max radius
+        radius = min(bounds_radius_m(poly.bounds), 50000)  # Google max radius
         
         # Search for commercial businesses that likely have parking lots
         # For small limits, only search a few categories to reduce API calls
@@ -8,6 +8,7 @@ This is the first step in the business-first discovery pipeline:
 1. Find businesses by type → 2. Find their parking lots → 3. Evaluate condition
 """
 
+import asyncio
 import logging
 import httpx
 from typing import List, Dict, Any, Optional
@@ -15,7 +16,9 @@ from dataclasses import dataclass, field
 from enum import Enum
 from shapely.geometry import Point
 
+from app.core.adaptive_limiter import get_limiter
 from app.core.config import settings
+from app.core.geo_utils import bounds_radius_m
 
 logger = logging.getLogger(__name__)
 
@@ -159,6 +162,20 @@ class BusinessFirstDiscoveryService:
     def __init__(self):
         self.google_places_key = settings.GOOGLE_PLACES_KEY
         self.base_url = "https://maps.googleapis.com/maps/api/place"
+        self._client: Optional[httpx.AsyncClient] = None
+        # Adaptive concurrency (AIMD) - details lookups for a page run in parallel
+        self._limiter = get_limiter(
+            "google_places",
+            initial_limit=settings.GOOGLE_PLACES_CONCURRENCY_INITIAL,
+            max_limit=settings.GOOGLE_PLACES_CONCURRENCY_MAX,
+        )
+    
+    async def _get(self, url: str, params: Dict[str, Any]) -> httpx.Response:
+        """GET a Places endpoint under the adaptive concurrency limiter."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=30.0)
+        client = self._client
+        return await self._limiter.run(lambda: client.get(url, params=params))
     
     async def discover_businesses(
         self,
@@ -194,57 +211,42 @@ class BusinessFirstDiscoveryService:
         
         # Determine which queries to use
         if business_type_ids:
-            # Use specific business types
+            # Use specific business types, in tier order (premium first)
             tier_queries = get_queries_for_type_ids(business_type_ids)
-            # Search in tier order (premium first)
-            search_order = [BusinessTier.PREMIUM, BusinessTier.HIGH, BusinessTier.STANDARD]
-            
-            for tier in search_order:
-                if len(all_businesses) >= max_total:
-                    break
-                
-                if tier not in tier_queries:
-                    continue
-                
-                tier_businesses = await self._search_tier(
-                    center_lat=center_lat,
-                    center_lng=center_lng,
-                    radius_meters=radius_meters,
-                    tier=tier,
-                    queries=tier_queries[tier],
-                    max_results=max_per_tier,
-                    seen_place_ids=seen_place_ids,
-                )
-                
-                for business in tier_businesses:
-                    if len(all_businesses) >= max_total:
-                        break
-                    all_businesses.append(business)
-                    seen_place_ids.add(business.places_id)
+            search_order = [
+                (tier, tier_queries[tier])
+                for tier in [BusinessTier.PREMIUM, BusinessTier.HIGH, BusinessTier.STANDARD]
+                if tier in tier_queries
+            ]
         else:
             # Use tiers (default: all)
             if tiers is None:
                 tiers = [BusinessTier.PREMIUM, BusinessTier.HIGH, BusinessTier.STANDARD]
-            
-            for tier in tiers:
+            search_order = [(tier, get_queries_for_tier(tier)) for tier in tiers]
+        
+        # Tiers are searched concurrently, then merged in priority order
+        # (a place found by two tiers stays with the higher one)
+        tier_results = await asyncio.gather(*(
+            self._search_tier(
+                center_lat=center_lat,
+                center_lng=center_lng,
+                radius_meters=radius_meters,
+                tier=tier,
+                queries=queries,
+                max_results=max_per_tier,
+                seen_place_ids=set(),
+            )
+            for tier, queries in search_order
+        ))
+        
+        for tier_businesses in tier_results:
+            for business in tier_businesses:
                 if len(all_businesses) >= max_total:
                     break
-                
-                tier_businesses = await self._search_tier(
-                    center_lat=center_lat,
-                    center_lng=center_lng,
-                    radius_meters=radius_meters,
-                    tier=tier,
-                    queries=get_queries_for_tier(tier),
-                    max_results=max_per_tier,
-                    seen_place_ids=seen_place_ids,
-                )
-                
-                for business in tier_businesses:
-                    if len(all_businesses) >= max_total:
-                        break
-                    all_businesses.append(business)
-                    seen_place_ids.add(business.places_id)
+                if business.places_id in seen_place_ids:
+                    continue
+                all_businesses.append(business)
+                seen_place_ids.add(business.places_id)
         
         logger.info(
             f"Discovered {len(all_businesses)} businesses: "
@@ -289,24 +291,22 @@ class BusinessFirstDiscoveryService:
                 pages_fetched = 1
                 
                 while True:
+                    places = []
                     for place in results:
                         place_id = place.get("place_id")
                         if not place_id or place_id in seen_place_ids:
                             continue
-                        
-                        if len(tier_businesses) >= max_results:
+                        if len(tier_businesses) + len(places) >= max_results:
                             break
-                        
-                        # Get detailed info including phone/website
-                        business = await self._create_business_from_place(
-                            place=place,
-                            tier=tier,
-                            query=query,
-                        )
-                        
-                        if business:
-                            tier_businesses.append(business)
-                            seen_place_ids.add(place_id)
+                        seen_place_ids.add(place_id)
+                        places.append(place)
+                    
+                    # Get detailed info including phone/website (the page's lookups run concurrently)
+                    businesses = await asyncio.gather(*(
+                        self._create_business_from_place(place=place, tier=tier, query=query)
+                        for place in places
+                    ))
+                    tier_businesses.extend(business for business in businesses if business)
                     
                     # Check if we have enough or need more
                     if len(tier_businesses) >= max_results:
@@ -345,8 +345,6 @@ class BusinessFirstDiscoveryService:
             Tuple of (results, next_page_token)
             next_page_token is None if no more pages
         """
-        import asyncio
-        
         url = f"{self.base_url}/textsearch/json"
         
         params = {
@@ -363,24 +361,23 @@ class BusinessFirstDiscoveryService:
             params["location"] = f"{center_lat},{center_lng}"
             params["radius"] = radius_meters
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
-            
-            if response.status_code != 200:
-                logger.error(f"Places API error: {response.status_code}")
-                return [], None
-            
-            data = response.json()
-            
-            if data.get("status") != "OK":
-                if data.get("status") != "ZERO_RESULTS":
-                    logger.warning(f"Places API status: {data.get('status')}")
-                return [], None
-            
-            results = data.get("results", [])
-            token = data.get("next_page_token")
-            
-            return results, token
+        response = await self._get(url, params)
+        
+        if response.status_code != 200:
+            logger.error(f"Places API error: {response.status_code}")
+            return [], None
+        
+        data = response.json()
+        
+        if data.get("status") != "OK":
+            if data.get("status") != "ZERO_RESULTS":
+                logger.warning(f"Places API status: {data.get('status')}")
+            return [], None
+        
+        results = data.get("results", [])
+        token = data.get("next_page_token")
+        
+        return results, token
     
     async def _get_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
         """Get detailed place info including phone and website."""
@@ -393,18 +390,17 @@ class BusinessFirstDiscoveryService:
             "key": self.google_places_key,
         }
         
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(url, params=params)
-            
-            if response.status_code != 200:
-                return None
-            
-            data = response.json()
-            
-            if data.get("status") != "OK":
-                return None
-            
-            return data.get("result")
+        response = await self._get(url, params)
+        
+        if response.status_code != 200:
+            return None
+        
+        data = response.json()
+        
+        if data.get("status") != "OK":
+            return None
+        
+        return data.get("result")
     
     async def _create_business_from_place(
         self,
@@ -480,15 +476,8 @@ class BusinessFirstDiscoveryService:
         polygon = ShapelyPolygon(polygon_coords)
         centroid = polygon.centroid
         
-        # Calculate radius from polygon bounds
-        bounds = polygon.bounds  # (minx, miny, maxx, maxy)
-        lat_range = bounds[3] - bounds[1]
-        lng_range = bounds[2] - bounds[0]
-        
-        # Convert to meters (approximate)
-        radius_lat = lat_range * 111000 / 2
-        radius_lng = lng_range * 111000 / 2
-        radius_meters = int(max(radius_lat, radius_lng) * 1.2)  # 20% buffer
+        # Calculate radius from polygon bounds (minx, miny, maxx, maxy)
+        radius_meters = int(bounds_radius_m(polygon.bounds) * 1.2)  # 20% buffer
         
         # Search
         businesses = await self.discover_businesses(
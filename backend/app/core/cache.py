@@ -0,0 +1,81 @@
+"""
+In-Process TTL Cache
+
+Small LRU cache with per-entry expiry, used to avoid repeating identical
+upstream lookups (Regrid owner searches, tiles) within and across jobs.
+
+Single event loop / single process only - each worker keeps its own copy.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    LRU cache whose entries expire `ttl_seconds` after being set.
+
+    Usage:
+        cache = TTLCache(maxsize=1024, ttl_seconds=3600)
+        value = cache.get(key)
+        if value is None:
+            value = await fetch()
+            cache.set(key, value)
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl_seconds: float = 3600):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[1]
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+        }
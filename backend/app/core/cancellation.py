@@ -0,0 +1,90 @@
+"""
+Cooperative Cancellation
+
+Discovery work is asyncio tasks awaiting upstream calls (httpx, the OpenAI
+SDK). The task itself is the cancellation token: cancelling it raises
+CancelledError inside whichever call is pending, which closes that request's
+connection instead of waiting for the response, and unwinds the pipeline
+through its finally blocks (buffered writes flushed, limiter slots freed).
+
+- cancel_when(): cancel a task once a condition turns true (a cancel request
+  in the job store, a disconnected client), checked every
+  DISCOVERY_CANCEL_POLL_SECONDS unless the caller sets its own interval.
+  Conditions that block (DB reads) must run themselves in a thread
+- stream_until_disconnected(): relay an SSE generator and stop it - mid-call -
+  when request.is_disconnected() reports the client has gone
+
+Code that handles a cancellation it asked for (rather than re-raising) calls
+resume_after_cancel() so the task can carry on (e.g. to send a final event).
+"""
+
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Awaitable, Callable, Optional
+
+from starlette.requests import Request
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def cancel_when(
+    condition: Callable[[], Awaitable[bool]],
+    task: Optional[asyncio.Task] = None,
+    poll_seconds: Optional[float] = None,
+) -> asyncio.Task:
+    """
+    Cancel `task` (default: the calling task) as soon as `condition()` is true.
+    Returns the watcher - cancel it once the work is done; fired() tells
+    whether it was the watcher that cancelled the task.
+    """
+    target = task or asyncio.current_task()
+    interval = poll_seconds or settings.DISCOVERY_CANCEL_POLL_SECONDS
+
+    async def watch() -> bool:
+        while not target.done():
+            await asyncio.sleep(interval)
+            try:
+                if await condition():
+                    target.cancel()
+                    return True
+            except Exception as e:
+                logger.warning(f"⚠️ Cancellation check failed: {e}")
+        return False
+
+    return asyncio.ensure_future(watch())
+
+
+def fired(watcher: asyncio.Task) -> bool:
+    """The watcher (from cancel_when) cancelled its task."""
+    return watcher.done() and not watcher.cancelled() and watcher.result() is True
+
+
+def resume_after_cancel() -> None:
+    """Withdraw the handled cancellation, so later awaits in this task run normally."""
+    task = asyncio.current_task()
+    if task is not None and hasattr(task, "uncancel"):  # Python 3.11+
+        task.uncancel()
+
+
+async def stream_until_disconnected(
+    request: Request,
+    events: AsyncGenerator[Any, None],
+) -> AsyncGenerator[Any, None]:
+    """
+    Relay `events` (an SSE body) until the client disconnects, then cancel it
+    where it is - a pending upstream call is aborted, not waited for.
+    """
+    watcher = cancel_when(request.is_disconnected)
+    try:
+        async for event in events:
+            yield event
+    except asyncio.CancelledError:
+        if not fired(watcher):
+            raise
+        resume_after_cancel()
+        logger.info("🔌 Client disconnected - stream stopped")
+    finally:
+        watcher.cancel()
+        await events.aclose()
@@ -0,0 +1,189 @@
+"""
+Value-First Candidate Ranking
+
+Regrid returns parcels in its own order, and discovery used to spend imagery
+and VLM calls on the first max_lots of them. Here candidates are ranked by
+cheap signals already in the parcel data, so a capped job spends that work
+on the likeliest leads first:
+
+- Size: paved area grows with the lot - log-scaled acreage (saturates ~20 acres)
+- Category (classify_property): multi-family / retail / HOA lots are the best
+  customers, single-family homes the worst
+- Units: larger multifamily complexes (num_units / LBCS structure 12xx)
+- LBCS site: developed sites with buildings or structures ahead of natural,
+  developing or agricultural land
+- LBCS activity: no-human-activity / natural-resource parcels pushed back
+- Owner: corporate owners (LLC, INC, PROPERTIES ...) ahead of individuals;
+  public ownership (LBCS ownership 4xxx) pushed back
+
+Scores are relative (higher = process first); they only order candidates,
+they never drop one.
+"""
+
+import math
+import re
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.core.property_classifier import (
+    PropertyCategory,
+    classify_by_lbcs_activity,
+    classify_by_lbcs_structure,
+    classify_property,
+    get_unit_count_from_lbcs,
+)
+
+logger = logging.getLogger(__name__)
+
+
+# Points per signal
+SIZE_POINTS = 30.0
+SIZE_SATURATION_ACRES = 20.0
+UNIT_POINTS = 10.0  # Reached at 100+ units
+CATEGORY_POINTS = {
+    PropertyCategory.MULTI_FAMILY: 25.0,
+    PropertyCategory.RETAIL: 25.0,
+    PropertyCategory.HOA: 25.0,
+    PropertyCategory.INSTITUTIONAL: 20.0,
+    PropertyCategory.OFFICE: 18.0,
+    PropertyCategory.INDUSTRIAL: 15.0,
+    PropertyCategory.UNKNOWN: 8.0,
+    PropertyCategory.SINGLE_FAMILY: 0.0,
+}
+# LBCS site (development status) - (min, max, points)
+SITE_POINTS = [
+    (6000, 6999, 10.0),  # Developed site - with buildings
+    (5000, 5999, 8.0),  # Developed site - nonbuilding structures
+    (4000, 4999, 4.0),  # Developed site - no buildings or structures
+    (1000, 3999, -15.0),  # Natural state, developing, crops / grazing / forestry
+]
+# LBCS activity - (min, max, points)
+ACTIVITY_POINTS = [
+    (8000, 8999, -10.0),  # Natural resources-related
+    (9000, 9999, -10.0),  # No human activity or unclassifiable
+]
+CORPORATE_OWNER_POINTS = 8.0
+PUBLIC_OWNER_POINTS = -10.0
+
+CORPORATE_OWNER_PATTERN = re.compile(
+    r"\b(LLC|L\.L\.C|INC|CORP|CORPORATION|CO|LP|LLP|LTD|TRUST|PARTNERS|PARTNERSHIP|HOLDINGS|"
+    r"PROPERTIES|PROPERTY|APARTMENTS|REALTY|INVESTMENTS|MANAGEMENT|ASSOCIATION|ASSN|HOA|REIT)\b",
+    re.IGNORECASE,
+)
+
+
+@dataclass
+class RankedParcel:
+    """A candidate parcel with its classification and priority."""
+    parcel: Any  # Regrid PropertyParcel
+    category: str  # PropertyCategory value
+    priority: float
+
+
+def _int(value: Any) -> Optional[int]:
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _range_points(code: Optional[int], ranges: List[tuple]) -> float:
+    if code is None:
+        return 0.0
+    for low, high, points in ranges:
+        if low <= code <= high:
+            return points
+    return 0.0
+
+
+def candidate_priority(
+    acres: Optional[float],
+    category: PropertyCategory,
+    lbcs_site: Optional[int] = None,
+    lbcs_activity: Optional[int] = None,
+    lbcs_ownership: Optional[int] = None,
+    owner: Optional[str] = None,
+    num_units: Optional[int] = None,
+) -> float:
+    """Priority of one candidate from its cheap signals (higher = process first)."""
+    score = 0.0
+
+    if acres and acres > 0:
+        score += SIZE_POINTS * min(1.0, math.log1p(acres) / math.log1p(SIZE_SATURATION_ACRES))
+
+    score += CATEGORY_POINTS.get(category, CATEGORY_POINTS[PropertyCategory.UNKNOWN])
+    if num_units:
+        score += UNIT_POINTS * min(1.0, num_units / 100)
+
+    score += _range_points(lbcs_site, SITE_POINTS)
+    score += _range_points(lbcs_activity, ACTIVITY_POINTS)
+
+    if lbcs_ownership is not None and 4000 <= lbcs_ownership <= 4999:
+        score += PUBLIC_OWNER_POINTS
+    elif owner and CORPORATE_OWNER_PATTERN.search(owner):
+        score += CORPORATE_OWNER_POINTS
+
+    return score
+
+
+def rank_parcels(parcels: List[Any]) -> List[RankedParcel]:
+    """
+    Classify Regrid parcels and order them highest priority first (ties keep
+    Regrid's order).
+    """
+    ranked = []
+    for parcel in parcels:
+        category = classify_property(
+            lbcs_structure=parcel.lbcs_structure,
+            lbcs_activity=parcel.lbcs_activity,
+            lbcs_function=parcel.lbcs_function,
+            usecode=parcel.land_use,
+            usedesc=parcel.land_use,
+            zoning=parcel.zoning,
+            zoning_description=parcel.zoning_description,
+            struct_style=parcel.struct_style,
+        )
+        ranked.append(RankedParcel(
+            parcel=parcel,
+            category=category.value,
+            priority=candidate_priority(
+                acres=parcel.area_acres,
+                category=category,
+                lbcs_site=parcel.lbcs_site,
+                lbcs_activity=parcel.lbcs_activity,
+                lbcs_ownership=parcel.lbcs_ownership,
+                owner=parcel.owner,
+                num_units=parcel.num_units or get_unit_count_from_lbcs(parcel.lbcs_structure),
+            ),
+        ))
+    ranked.sort(key=lambda candidate: candidate.priority, reverse=True)
+
+    if ranked:
+        logger.info(
+            f"   📊 Ranked {len(ranked)} candidates value-first "
+            f"(priority {ranked[0].priority:.0f} .. {ranked[-1].priority:.0f})"
+        )
+    return ranked
+
+
+def tile_parcel_priority(tile_parcel: Any) -> float:
+    """
+    Priority of a tile candidate (DiscoveryParcel) - acreage, owner and
+    whatever LBCS codes the tile carries; no record needed.
+    """
+    land_use: Dict[str, Any] = tile_parcel.land_use or {}
+    lbcs_structure = _int(land_use.get("lbcs_structure"))
+    lbcs_activity = _int(land_use.get("lbcs_activity"))
+    category = (
+        classify_by_lbcs_structure(lbcs_structure)
+        or classify_by_lbcs_activity(lbcs_activity)
+        or PropertyCategory.UNKNOWN
+    )
+    return candidate_priority(
+        acres=tile_parcel.acreage,
+        category=category,
+        lbcs_activity=lbcs_activity,
+        owner=tile_parcel.owner,
+        num_units=get_unit_count_from_lbcs(lbcs_structure),
+    )
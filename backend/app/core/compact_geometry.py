@@ -0,0 +1,114 @@
+"""
+Compact Parcel Geometry Encoding
+
+Shrinks viewport parcel payloads (POST /discover/viewport with
+encoding="compact") by roughly an order of magnitude vs GeoJSON:
+
+- Rings are simplified for the map zoom (~half a screen pixel)
+- Coordinates are quantized to `precision` degrees (default 1e-5, ~1 m)
+  as integers relative to a shared origin
+- Rings are delta-encoded and flattened; the closing point is dropped
+- Only the parcel id is sent - details are fetched on click
+
+Payload:
+    {
+      "precision": 1e-05,
+      "origin": [lng0, lat0],
+      "parcels": [[id, [polygon, ...]], ...]   # polygon = [ring, ...]
+    }
+    ring = [dx0, dy0, dx1, dy1, ...]  (first pair relative to origin)
+
+Decoding a ring (client):
+    x = y = 0
+    for i in range(0, len(ring), 2):
+        x += ring[i]; y += ring[i + 1]
+        point = [origin[0] + x * precision, origin[1] + y * precision]
+"""
+
+import logging
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_PRECISION_DEG = 1e-5  # ~1.1 m of latitude
+
+
+def zoom_for_bounds(min_lng: float, max_lng: float, viewport_px: int = 1024) -> float:
+    """Approximate web map zoom for a bbox shown `viewport_px` wide"""
+    width = max(max_lng - min_lng, 1e-9)
+    return max(0.0, math.log2(360.0 * viewport_px / (256.0 * width)))
+
+
+def simplify_tolerance(zoom: float, precision: float = DEFAULT_PRECISION_DEG) -> float:
+    """Half a screen pixel at `zoom` (in degrees), never below the quantization step"""
+    pixel_deg = 360.0 / (256.0 * 2 ** zoom)
+    return max(pixel_deg / 2, precision)
+
+
+def _encode_ring(coords: np.ndarray, origin: np.ndarray, precision: float) -> Optional[List[int]]:
+    quantized = np.round((coords[:-1] - origin) / precision).astype(np.int64)
+    if len(quantized) > 1:
+        # Drop consecutive points that collapse onto the same grid cell
+        keep = np.ones(len(quantized), dtype=bool)
+        keep[1:] = np.any(quantized[1:] != quantized[:-1], axis=1)
+        quantized = quantized[keep]
+    if len(quantized) < 3:
+        return None
+    deltas = np.diff(quantized, axis=0, prepend=np.zeros((1, 2), dtype=np.int64))
+    return deltas.ravel().tolist()
+
+
+def encode_parcels_compact(
+    parcels: Sequence[Tuple[str, Dict[str, Any]]],
+    zoom: float,
+    precision: float = DEFAULT_PRECISION_DEG,
+) -> Dict[str, Any]:
+    """
+    Encode (id, GeoJSON geometry) pairs into the compact payload above.
+
+    Module-level and picklable-in/picklable-out, so it can run in the CPU pool.
+    """
+    if not parcels:
+        return {"precision": precision, "origin": [0.0, 0.0], "parcels": []}
+
+    ids = [parcel_id for parcel_id, _ in parcels]
+    geoms = np.empty(len(parcels), dtype=object)
+    geoms[:] = [shape(geometry) for _, geometry in parcels]
+    geoms = shapely.simplify(geoms, simplify_tolerance(zoom, precision), preserve_topology=True)
+
+    bounds = shapely.total_bounds(geoms)
+    origin = np.floor(bounds[:2] / precision) * precision
+
+    encoded_parcels: List[List[Any]] = []
+    for parcel_id, geom in zip(ids, geoms):
+        if geom is None or geom.is_empty:
+            continue
+        polygons = geom.geoms if geom.geom_type == "MultiPolygon" else [geom]
+        encoded_polygons = []
+        for polygon in polygons:
+            if polygon.geom_type != "Polygon":
+                continue
+            # A polygon whose exterior collapses at this precision isn't drawn
+            exterior = _encode_ring(np.asarray(polygon.exterior.coords)[:, :2], origin, precision)
+            if not exterior:
+                continue
+            rings = [exterior]
+            for ring in polygon.interiors:
+                encoded = _encode_ring(np.asarray(ring.coords)[:, :2], origin, precision)
+                if encoded:
+                    rings.append(encoded)
+            encoded_polygons.append(rings)
+        if encoded_polygons:
+            encoded_parcels.append([parcel_id, encoded_polygons])
+
+    return {
+        "precision": precision,
+        "origin": [float(origin[0]), float(origin[1])],
+        "parcels": encoded_parcels,
+    }
@@ -0,0 +1,126 @@
+"""
+Response Compression Middleware
+
+Compresses JSON / GeoJSON responses (parcel layers, boundaries, search results)
+with brotli when the client accepts it, gzip otherwise.
+
+Unlike Starlette's GZipMiddleware this only touches complete JSON bodies:
+streaming responses (SSE progress streams, image downloads) pass through
+untouched so they are never buffered.
+"""
+
+import gzip
+import logging
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+
+COMPRESSIBLE_CONTENT_TYPES = (
+    "application/json",
+    "application/geo+json",
+    "application/vnd.geo+json",
+    "application/vnd.mapbox-vector-tile",
+)
+
+
+class JSONCompressionMiddleware:
+    """Pure ASGI middleware compressing single-message JSON responses."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = self._choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def _choose_encoding(self, accept_encoding: str) -> Optional[str]:
+        accepted = {
+            part.split(";")[0].strip().lower()
+            for part in accept_encoding.split(",")
+            if part.strip()
+        }
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted:
+            return "gzip"
+        return None
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level)
+
+
+class _CompressingResponder:
+    """Holds the response start until we know whether the body is compressible."""
+
+    def __init__(self, middleware: JSONCompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+            if content_type in COMPRESSIBLE_CONTENT_TYPES and "content-encoding" not in headers:
+                self.start_message = message
+            else:
+                self.passthrough = True
+                await self._send(message)
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        # Streaming or tiny body: send as-is
+        if more_body or len(body) < self.middleware.minimum_size:
+            self.passthrough = True
+            await self._send(self.start_message)
+            await self._send(message)
+            return
+
+        compressed = self.middleware.compress(body, self.encoding)
+
+        headers = MutableHeaders(raw=self.start_message["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+
+        await self._send(self.start_message)
+        await self._send({"type": "http.response.body", "body": compressed})
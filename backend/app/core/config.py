@@ -34,11 +34,44 @@ class Settings(BaseSettings):
     # API docs: https://regrid.com/api
     REGRID_API_KEY: Optional[str] = None
     REGRID_API_URL: str = "https://app.regrid.com/api/v2"
+    REGRID_OWNER_SEARCH_CONCURRENCY: int = 8  # Companies searched at once (contact-first) - results stream into analysis
+    REGRID_OWNER_CACHE_TTL_SECONDS: int = 6 * 3600  # Owner search results cache
+    REGRID_RECORDS_BATCH_SIZE: int = 25  # ll_uuids per batched records query (tile-first)
+    TILE_FIRST_SHORTLIST_FACTOR: int = 3  # Tile-screened candidates kept per requested lead
+    DISCOVERY_CANDIDATE_POOL_FACTOR: int = 2  # New parcels ranked per requested lead - the best max_lots are processed (regrid/tile-first)
     
     # Regrid Tileserver API (for free parcel geometry tiles)
     # API docs: https://support.regrid.com/api/using-the-tileserver-api
     REGRID_TILESERVER_TOKEN: Optional[str] = None
     REGRID_TILESERVER_URL: str = "https://tiles.regrid.com"
+    # Zoom range used for parcel tiles. Area queries pick the deepest zoom whose
+    # tile count fits REGRID_TILES_TARGET_COUNT; tiles deeper than MAX_ZOOM are
+    # cut from the cached MAX_ZOOM parent instead of being requested
+    REGRID_TILES_MIN_ZOOM: int = 13
+    REGRID_TILES_MAX_ZOOM: int = 16
+    REGRID_TILES_TARGET_COUNT: int = 64
+    REGRID_TILE_CACHE_SIZE: int = 512  # Raw MVT tiles kept in memory
+    REGRID_TILE_CACHE_TTL_SECONDS: int = 3600
+    PARCEL_TILE_MAX_AGE_SECONDS: int = 86400  # Browser cache lifetime for /parcels/tiles
+    
+    # CPU pool for tile decoding / geometry work (kept off the event loop)
+    CPU_POOL_MODE: str = "process"  # "process" or "thread"
+    CPU_POOL_WORKERS: int = 0  # 0 = min(4, CPU count)
+    
+    # Adaptive (AIMD) upstream concurrency - starting and maximum in-flight requests
+    # Limits grow while latency/error rates are healthy and back off on 429/5xx
+    REGRID_TILES_CONCURRENCY_INITIAL: int = 15
+    REGRID_TILES_CONCURRENCY_MAX: int = 64
+    REGRID_RECORDS_CONCURRENCY_INITIAL: int = 4
+    REGRID_RECORDS_CONCURRENCY_MAX: int = 16
+    GOOGLE_STATIC_MAPS_CONCURRENCY_INITIAL: int = 8
+    GOOGLE_STATIC_MAPS_CONCURRENCY_MAX: int = 32
+    GOOGLE_PLACES_CONCURRENCY_INITIAL: int = 8  # Text search + place details (business-first)
+    GOOGLE_PLACES_CONCURRENCY_MAX: int = 32
+    APOLLO_CONCURRENCY_INITIAL: int = 4
+    APOLLO_CONCURRENCY_MAX: int = 16
+    OPENROUTER_CONCURRENCY_INITIAL: int = 8  # VLM scoring + LLM enrichment calls
+    OPENROUTER_CONCURRENCY_MAX: int = 32
     
     # Computer Vision (Roboflow hosted API)
     # API docs: https://docs.roboflow.com/deploy/serverless/object-detection
@@ -95,6 +128,40 @@ class Settings(BaseSettings):
     DEFAULT_MAX_CONDITION_SCORE: float = 70.0  # Lower = worse condition
     DEFAULT_MIN_MATCH_SCORE: float = 50.0  # Minimum business match confidence
     
+    # Discovery pipeline workers per stage (parcel lookup → imagery → VLM → enrichment)
+    # Each stage has a bounded queue in front of it, so the slowest stage sets the pace
+    DISCOVERY_PARCEL_WORKERS: int = 4
+    DISCOVERY_IMAGERY_WORKERS: int = 8
+    DISCOVERY_VLM_WORKERS: int = 4
+    DISCOVERY_ENRICHMENT_WORKERS: int = 6
+    
+    # Discovery property writes are buffered and written in batches, one commit per batch
+    DISCOVERY_WRITE_BATCH_SIZE: int = 50  # Rows per batch (also parcels claimed per INSERT)
+    DISCOVERY_WRITE_FLUSH_SECONDS: float = 2.0  # A partial batch is written at most this long after its first row
+    
+    # Discovery job state (status/progress/results) - "postgres" is shared by all
+    # workers and survives restarts; "memory" is per-process (tests, single worker)
+    DISCOVERY_JOB_STORE: str = "postgres"
+    DISCOVERY_JOB_TTL_HOURS: int = 24  # Jobs expire this long after their last update
+    
+    # Resuming checkpointed (regrid-first / tile-first) jobs after a crash or redeploy
+    DISCOVERY_JOB_STALE_SECONDS: int = 600  # A running job silent this long is considered interrupted
+    DISCOVERY_RESUME_SWEEP_SECONDS: int = 300  # How often each worker looks for interrupted jobs (0 = off)
+    
+    # Cancelling jobs (POST /discover/jobs/{job_id}/cancel) and SSE streams whose client left
+    DISCOVERY_CANCEL_POLL_SECONDS: float = 0.5  # How often an SSE stream checks for a client disconnect
+    DISCOVERY_CANCEL_CHECK_SECONDS: float = 2.0  # How often a running job checks the job store for a cancel request
+    
+    # Where discovery work runs - "inline": in the API process that received the job;
+    # "queue": enqueued on Postgres (discovery_tasks) and run by `python -m app.worker` processes
+    DISCOVERY_EXECUTION: str = "inline"
+    DISCOVERY_WORKER_CONCURRENCY: int = 4  # Whole jobs (or resumes) one worker process runs at once
+    DISCOVERY_WORKER_PARCEL_CONCURRENCY: int = 8  # Parcel-level tasks (enrichment) per worker, separate slots
+    DISCOVERY_WORKER_POLL_SECONDS: float = 2.0  # Idle wait between queue polls
+    DISCOVERY_TASK_LEASE_SECONDS: int = 120  # Extended by heartbeats; an expired lease is reclaimed
+    DISCOVERY_TASK_MAX_ATTEMPTS: int = 3
+    DISCOVERY_TASK_RETRY_BASE_SECONDS: int = 30  # Backoff: base * 2^(attempt - 1)
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -5,15 +5,28 @@ Provides US county data for search:
 - Autocomplete search for counties
 - County boundary GeoJSON retrieval
 - FIPS code mapping
+- FIPS resolution from county name, point or polygon (for narrow Regrid queries)
 
-Data source: US Census Bureau TIGER/Line
+Data source: US Census Bureau TIGER/Line (+ local PostGIS boundaries table).
+The Census county list is snapshotted to data/census_counties.json (a
+2020 snapshot is committed, refreshed after each successful fetch) and used
+when the API is down; failed fetches back off instead of being retried on
+every lookup.
 """
 
+import asyncio
+import json
 import logging
-from typing import Optional, List, Dict, Any
+import re
+import time
+import unicodedata
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 import httpx
 
+from app.core.fast_json import loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,7 +38,33 @@ class County:
     state: str          # State abbreviation
     state_fips: str     # 2-digit state FIPS
     full_name: str      # "County Name, ST"
+
+
+@dataclass
+class GeoScope:
+    """Smallest valid geography for a Regrid query (ZIP > county > state)."""
+    zip_code: Optional[str] = None
+    county_fips: Optional[str] = None
+    state_code: Optional[str] = None
     
+    @property
+    def level(self) -> str:
+        if self.zip_code:
+            return "zip"
+        if self.county_fips:
+            return "county"
+        if self.state_code:
+            return "state"
+        return "none"
+    
+    def describe(self) -> str:
+        if self.zip_code:
+            return f"ZIP {self.zip_code}"
+        if self.county_fips:
+            return f"county {self.county_fips}"
+        if self.state_code:
+            return self.state_code
+        return "selected area"
 
 # US States with their FIPS codes
 US_STATES = {
@@ -58,6 +97,86 @@ STATE_NAMES = {
     "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming", "PR": "Puerto Rico",
 }
 
+# Major counties, so the busiest markets resolve without the Census API or PostGIS
+# (state abbr, county name) -> 5-digit FIPS
+COMMON_COUNTY_FIPS = {
+    ("TX", "Dallas"): "48113",
+    ("TX", "Harris"): "48201",
+    ("TX", "Tarrant"): "48439",
+    ("TX", "Bexar"): "48029",
+    ("TX", "Travis"): "48453",
+    ("CA", "Los Angeles"): "06037",
+    ("CA", "San Diego"): "06073",
+    ("CA", "Orange"): "06059",
+    ("FL", "Miami-Dade"): "12086",
+    ("FL", "Broward"): "12011",
+    ("FL", "Palm Beach"): "12099",
+    ("NY", "New York"): "36061",
+    ("NY", "Kings"): "36047",
+    ("IL", "Cook"): "17031",
+    ("AZ", "Maricopa"): "04013",
+    ("GA", "Fulton"): "13121",
+    ("NC", "Mecklenburg"): "37119",
+    ("NC", "Wake"): "37183",
+    ("TN", "Davidson"): "47037",
+    ("CO", "Denver"): "08031",
+    ("WA", "King"): "53033",
+    ("NV", "Clark"): "32003",
+}
+
+# Last good Census county list (written after every successful fetch)
+COUNTY_SNAPSHOT_PATH = Path(__file__).resolve().parents[2] / "data" / "census_counties.json"
+
+STATE_FIPS = {abbr: fips for fips, abbr in US_STATES.items()}
+_STATE_NAME_TO_ABBR = {name.upper(): abbr for abbr, name in STATE_NAMES.items()}
+
+# County-equivalent suffixes, longest first ("City and Borough" before "Borough").
+# Independent cities ("Richmond city", "Baltimore city") keep their "city" suffix
+# so they don't collide with the county of the same name.
+_COUNTY_SUFFIXES = (
+    " CITY AND BOROUGH",
+    " CENSUS AREA",
+    " MUNICIPALITY",
+    " MUNICIPIO",
+    " BOROUGH",
+    " COUNTY",
+    " PARISH",
+)
+
+
+def normalize_state(state: Optional[str]) -> Optional[str]:
+    """Normalize a state abbreviation, full name or 2-digit FIPS to its abbreviation."""
+    if not state:
+        return None
+    value = state.strip().upper()
+    if value in STATE_FIPS:
+        return value
+    if value in _STATE_NAME_TO_ABBR:
+        return _STATE_NAME_TO_ABBR[value]
+    if value.zfill(2) in US_STATES:
+        return US_STATES[value.zfill(2)]
+    return None
+
+
+def normalize_county_name(name: str) -> str:
+    """
+    Normalize a county name to a lookup key.
+    
+    "St. Louis County" / "Saint Louis" -> "SAINTLOUIS"
+    "Miami-Dade County" / "Miami Dade"  -> "MIAMIDADE"
+    "DeKalb" / "De Kalb"                -> "DEKALB"
+    """
+    # Strip accents ("Doña Ana" -> "DONA ANA")
+    ascii_name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    key = " " + ascii_name.strip().upper()
+    for suffix in _COUNTY_SUFFIXES:
+        if key.endswith(suffix):
+            key = key[: -len(suffix)]
+            break
+    key = re.sub(r"\bSTE\.?\s", "SAINTE ", key)
+    key = re.sub(r"\bST\.?\s", "SAINT ", key)
+    return re.sub(r"[^A-Z0-9]", "", key)
+
 
 class CountyService:
     """
@@ -66,70 +185,140 @@ class CountyService:
     Uses Census Bureau TIGERweb API for county data and boundaries.
     """
     
-    def __init__(self):
+    # Backoff after a failed Census fetch (doubles per failure, capped)
+    RETRY_MIN_SECONDS = 60
+    RETRY_MAX_SECONDS = 3600
+    
+    def __init__(self, snapshot_path: Path = COUNTY_SNAPSHOT_PATH):
+        self.snapshot_path = snapshot_path
         self._counties_cache: Optional[List[County]] = None
+        self._fallback_cache: Optional[List[County]] = None
+        self._fetch_lock = asyncio.Lock()
+        self._retry_at = 0.0  # monotonic time before which the Census API isn't retried
+        self._retry_seconds = 0.0
         self._boundaries_cache: Dict[str, Dict] = {}
+        self._name_index: Dict[Tuple[str, str], str] = {}
+        self._name_index_source: Optional[List[County]] = None
+        self._fips_cache: Dict[Tuple, Optional[str]] = {}
     
     async def get_all_counties(self) -> List[County]:
         """
         Get list of all US counties.
         
         Uses Census Bureau API to fetch county list.
-        Results are cached after first call.
+        Results are cached after first call. When the API fails, the last
+        snapshot is used and the API isn't retried until the backoff expires.
         """
         if self._counties_cache:
             return self._counties_cache
+        if time.monotonic() < self._retry_at:
+            return await self._get_fallback_counties()
         
-        try:
-            # Fetch from Census Bureau API
-            url = "https://api.census.gov/data/2020/dec/pl?get=NAME&for=county:*"
+        async with self._fetch_lock:
+            # Another caller may have fetched (or failed) while we waited
+            if self._counties_cache:
+                return self._counties_cache
+            if time.monotonic() < self._retry_at:
+                return await self._get_fallback_counties()
             
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
-                
-                if response.status_code != 200:
-                    logger.warning(f"Census API error: {response.status_code}")
-                    return self._get_fallback_counties()
-                
-                data = response.json()
-                
-                # Parse response: [["NAME", "state", "county"], ["Autauga County, Alabama", "01", "001"], ...]
-                counties = []
-                for row in data[1:]:  # Skip header row
-                    name_full = row[0]  # "County Name, State Name"
-                    state_fips = row[1]
-                    county_fips = row[2]
-                    
-                    # Parse name
-                    parts = name_full.split(", ")
-                    county_name = parts[0] if parts else name_full
-                    
-                    state_abbr = US_STATES.get(state_fips, "")
-                    fips = f"{state_fips}{county_fips}"
-                    
-                    counties.append(County(
-                        fips=fips,
-                        name=county_name,
-                        state=state_abbr,
-                        state_fips=state_fips,
-                        full_name=f"{county_name}, {state_abbr}",
-                    ))
-                
-                # Sort by state, then county name
-                counties.sort(key=lambda c: (c.state, c.name))
-                
-                self._counties_cache = counties
-                logger.info(f"Loaded {len(counties)} US counties from Census API")
-                return counties
-                
+            try:
+                counties = await self._fetch_counties()
+            except Exception as e:
+                self._retry_seconds = min(
+                    max(self._retry_seconds * 2, self.RETRY_MIN_SECONDS), self.RETRY_MAX_SECONDS
+                )
+                self._retry_at = time.monotonic() + self._retry_seconds
+                logger.error(f"Failed to fetch counties from Census API (retry in {self._retry_seconds:.0f}s): {e}")
+                return await self._get_fallback_counties()
+            
+            self._counties_cache = counties
+            self._retry_seconds = 0.0
+            logger.info(f"Loaded {len(counties)} US counties from Census API")
+            await asyncio.to_thread(self._write_snapshot, counties)
+            return counties
+    
+    async def _fetch_counties(self) -> List[County]:
+        """Fetch the county list from the Census Bureau API (raises on failure)."""
+        url = "https://api.census.gov/data/2020/dec/pl?get=NAME&for=county:*"
+        
+        async with httpx.AsyncClient(timeout=10.0) as client:
+            response = await client.get(url)
+        
+        if response.status_code != 200:
+            raise RuntimeError(f"Census API error: {response.status_code}")
+        
+        data = loads(response.content)
+        
+        # Parse response: [["NAME", "state", "county"], ["Autauga County, Alabama", "01", "001"], ...]
+        counties = []
+        for row in data[1:]:  # Skip header row
+            name_full = row[0]  # "County Name, State Name"
+            state_fips = row[1]
+            county_fips = row[2]
+            
+            # Parse name
+            parts = name_full.split(", ")
+            county_name = parts[0] if parts else name_full
+            
+            state_abbr = US_STATES.get(state_fips, "")
+            fips = f"{state_fips}{county_fips}"
+            
+            counties.append(County(
+                fips=fips,
+                name=county_name,
+                state=state_abbr,
+                state_fips=state_fips,
+                full_name=f"{county_name}, {state_abbr}",
+            ))
+        
+        if not counties:
+            raise RuntimeError("Census API returned no counties")
+        
+        # Sort by state, then county name
+        counties.sort(key=lambda c: (c.state, c.name))
+        return counties
+    
+    def _write_snapshot(self, counties: List[County]) -> None:
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps([[c.fips, c.name] for c in counties]))
+            tmp_path.replace(self.snapshot_path)
+            self._fallback_cache = None
         except Exception as e:
-            logger.error(f"Failed to fetch counties from Census API: {e}")
-            return self._get_fallback_counties()
+            logger.warning(f"⚠️ Could not write county snapshot {self.snapshot_path}: {e}")
     
-    def _get_fallback_counties(self) -> List[County]:
-        """Return a minimal fallback list of major counties."""
-        # Just return empty for now - will load from API
-        return []
+    async def _get_fallback_counties(self) -> List[County]:
+        """The last Census snapshot on disk, else the built-in major counties."""
+        if self._fallback_cache is None:
+            self._fallback_cache = await asyncio.to_thread(self._load_fallback_counties)
+        return self._fallback_cache
+    
+    def _load_fallback_counties(self) -> List[County]:
+        rows: List[Tuple[str, str]] = []
+        try:
+            rows = [tuple(row) for row in json.loads(self.snapshot_path.read_text())]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ Could not read county snapshot {self.snapshot_path}: {e}")
+        if rows:
+            logger.info(f"Using {len(rows)} counties from snapshot {self.snapshot_path.name}")
+        else:
+            rows = [(fips, name) for (_, name), fips in COMMON_COUNTY_FIPS.items()]
+        
+        counties = []
+        for fips, name in rows:
+            state_abbr = US_STATES.get(fips[:2], "")
+            counties.append(County(
+                fips=fips,
+                name=name,
+                state=state_abbr,
+                state_fips=fips[:2],
+                full_name=f"{name}, {state_abbr}",
+            ))
+        counties.sort(key=lambda c: (c.state, c.name))
+        return counties
     
     async def search_counties(
         self,
@@ -222,7 +411,7 @@ class CountyService:
                     logger.warning(f"TIGERweb boundary fetch failed: {response.status_code}")
                     return None
                 
-                data = response.json()
+                data = loads(response.content)
                 
                 features = data.get("features", [])
                 if not features:
@@ -251,6 +440,221 @@ class CountyService:
         
         return None
 
+    
+    # ============================================================
+    # FIPS RESOLUTION (scopes Regrid queries to a single county)
+    # ============================================================
+    
+    async def _get_name_index(self) -> Dict[Tuple[str, str], str]:
+        """
+        (state abbr, normalized county name) -> 5-digit FIPS, built from the
+        Census list (rebuilt when the list changes, e.g. from fallback to live).
+        """
+        counties = await self.get_all_counties()
+        if counties is not self._name_index_source:
+            index: Dict[Tuple[str, str], str] = {}
+            for county in counties:
+                index.setdefault((county.state, normalize_county_name(county.name)), county.fips)
+            for (state, name), fips in COMMON_COUNTY_FIPS.items():
+                index.setdefault((state, normalize_county_name(name)), fips)
+            self._name_index = index
+            self._name_index_source = counties
+        return self._name_index
+    
+    async def resolve_fips_by_name(self, county: str, state: str) -> Optional[str]:
+        """
+        Resolve a county name + state to its FIPS code.
+        
+        Uses the Census county list (or its snapshot / the built-in major
+        counties), falling back to the local boundaries table.
+        """
+        state_abbr = normalize_state(state)
+        if not county or not state_abbr:
+            return None
+        
+        key = normalize_county_name(county)
+        index = await self._get_name_index()
+        fips = index.get((state_abbr, key))
+        if fips:
+            return fips
+        
+        # Fallback: local PostGIS counties layer (name + geoid)
+        state_fips = STATE_FIPS[state_abbr]
+        try:
+            from app.core.boundary_service import get_boundary_service
+            results = await asyncio.to_thread(
+                get_boundary_service().search_boundaries, "counties", county.strip(), 50
+            )
+        except Exception as e:
+            logger.debug(f"Boundary county lookup failed for {county}, {state_abbr}: {e}")
+            return None
+        
+        for result in results:
+            geoid = self._feature_fips(result)
+            if geoid and geoid.startswith(state_fips) and normalize_county_name(result.get("name") or "") == key:
+                return geoid
+        return None
+    
+    async def resolve_fips_at_point(self, lat: float, lng: float) -> Optional[str]:
+        """Resolve the county containing a point (PostGIS counties layer)."""
+        try:
+            from app.core.boundary_service import get_boundary_service
+            feature = await asyncio.to_thread(
+                get_boundary_service().get_boundary_at_point, "counties", lat, lng
+            )
+        except Exception as e:
+            logger.debug(f"County point lookup failed at ({lat}, {lng}): {e}")
+            return None
+        
+        if not feature:
+            return None
+        return self._feature_fips(feature)
+    
+    async def resolve_fips_for_geometry(self, geometry: Dict[str, Any]) -> List[str]:
+        """
+        Resolve all counties intersecting a GeoJSON geometry.
+        
+        Returns FIPS codes ordered by overlap area (largest first).
+        """
+        from shapely.geometry import shape
+        
+        try:
+            search_shape = shape(geometry)
+            if not search_shape.is_valid:
+                search_shape = search_shape.buffer(0)
+        except Exception as e:
+            logger.debug(f"Invalid geometry for county lookup: {e}")
+            return []
+        
+        try:
+            from app.core.boundary_service import get_boundary_service
+            features = await asyncio.to_thread(
+                get_boundary_service().get_features_intersecting, "counties", search_shape
+            )
+        except Exception as e:
+            logger.debug(f"County polygon lookup failed: {e}")
+            return []
+        
+        overlaps = []
+        for feature in features:
+            fips = self._feature_fips(feature)
+            if not fips:
+                continue
+            try:
+                overlap = shape(feature["geometry"]).intersection(search_shape).area
+            except Exception:
+                overlap = 0.0
+            overlaps.append((overlap, fips))
+        
+        overlaps.sort(key=lambda x: -x[0])
+        return [fips for _, fips in overlaps]
+    
+    async def resolve_fips(
+        self,
+        county: Optional[str] = None,
+        state: Optional[str] = None,
+        city: Optional[str] = None,
+        lat: Optional[float] = None,
+        lng: Optional[float] = None,
+        geometry: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """
+        Resolve a single county FIPS from whatever location info is available.
+        
+        Order: county name > point > polygon (only if it lies in one county) > city.
+        Returns None when the location spans several counties or can't be resolved.
+        """
+        if county and state:
+            fips = await self.resolve_fips_by_name(county, state)
+            if fips:
+                return fips
+        
+        if lat is not None and lng is not None:
+            fips = await self.resolve_fips_at_point(lat, lng)
+            if fips:
+                return fips
+        
+        if geometry:
+            fips_list = await self.resolve_fips_for_geometry(geometry)
+            if len(fips_list) == 1:
+                return fips_list[0]
+            return None
+        
+        if city and state:
+            return await self._resolve_fips_for_city(city, state)
+        
+        return None
+    
+    async def _resolve_fips_for_city(self, city: str, state: str) -> Optional[str]:
+        """Geocode a city and resolve the county containing it (cached per city)."""
+        state_abbr = normalize_state(state)
+        if not state_abbr:
+            return None
+        
+        cache_key = ("city", city.strip().upper(), state_abbr)
+        if cache_key in self._fips_cache:
+            return self._fips_cache[cache_key]
+        
+        fips = None
+        try:
+            from app.core.geocoding_service import geocoding_service
+            center = await geocoding_service._geocode_address(f"{city}, {state_abbr}, USA")
+            if center:
+                fips = await self.resolve_fips_at_point(center["lat"], center["lng"])
+        except Exception as e:
+            logger.debug(f"City geocode failed for {city}, {state_abbr}: {e}")
+        
+        # A geocoded point in the wrong state means a bad match
+        if fips and not fips.startswith(STATE_FIPS[state_abbr]):
+            fips = None
+        
+        self._fips_cache[cache_key] = fips
+        return fips
+    
+    async def resolve_scope(
+        self,
+        area_geometry: Optional[Dict[str, Any]] = None,
+        zip_code: Optional[str] = None,
+        county_fips: Optional[str] = None,
+        state: Optional[str] = None,
+        city: Optional[str] = None,
+    ) -> GeoScope:
+        """
+        Build the smallest valid Regrid query scope for a discovery area.
+        
+        Explicit filters win; missing county/state are filled in from the area
+        polygon (or city) so queries never fall back to a whole state when a
+        single county is known.
+        """
+        state_code = normalize_state(state)
+        
+        if not county_fips and (area_geometry or (city and state_code)):
+            county_fips = await self.resolve_fips(
+                state=state_code,
+                city=city,
+                geometry=area_geometry,
+            )
+        
+        if county_fips:
+            county_state = US_STATES.get(county_fips[:2])
+            if state_code and county_state and county_state != state_code:
+                # Inconsistent filters would make Regrid return nothing
+                logger.warning(f"County {county_fips} is not in {state_code} - ignoring county filter")
+                county_fips = None
+            elif not state_code:
+                state_code = county_state
+        
+        return GeoScope(zip_code=zip_code, county_fips=county_fips, state_code=state_code)
+    
+    @staticmethod
+    def _feature_fips(feature: Dict[str, Any]) -> Optional[str]:
+        props = feature.get("properties", {})
+        for value in (props.get("geoid"), props.get("code")):
+            value = str(value or "")
+            if len(value) == 5 and value.isdigit():
+                return value
+        return None
+
 
 # Singleton
 county_service = CountyService()
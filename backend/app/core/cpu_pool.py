@@ -0,0 +1,78 @@
+"""
+CPU Worker Pool
+
+Shared executor for CPU-heavy work that must not run on the event loop
+(MVT tile decoding, shapely geometry processing). While one user pans a
+dense city, other requests keep being served.
+
+- "process" (default): a small ProcessPoolExecutor - true parallelism, the
+  work functions must be module-level and their args/results picklable
+- "thread": a ThreadPoolExecutor - no pickling, but shares the GIL
+
+The pool is created lazily on first use, so API startup stays light.
+
+Usage:
+    result = await run_cpu(parse_tile_parcels, content, bounds, search_wkb)
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+_executor: Optional[Executor] = None
+
+
+def _create_executor() -> Executor:
+    workers = settings.CPU_POOL_WORKERS or min(4, os.cpu_count() or 1)
+    if settings.CPU_POOL_MODE == "process":
+        try:
+            # spawn: never fork a process that has a running event loop and threads
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(f"⚙️ CPU pool: {workers} worker processes")
+            return executor
+        except (OSError, NotImplementedError) as e:
+            logger.warning(f"⚠️ Process pool unavailable ({e}) - using threads")
+    logger.info(f"⚙️ CPU pool: {workers} worker threads")
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="cpu-pool")
+
+
+def get_cpu_executor() -> Executor:
+    """Get or create the shared CPU executor"""
+    global _executor
+    if _executor is None:
+        _executor = _create_executor()
+    return _executor
+
+
+async def run_cpu(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run `fn(*args, **kwargs)` in the CPU pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    call = functools.partial(fn, *args, **kwargs)
+    try:
+        return await loop.run_in_executor(get_cpu_executor(), call)
+    except BrokenProcessPool:
+        # A worker died (e.g. OOM-killed) - rebuild the pool once and retry
+        logger.warning("⚠️ CPU pool broken - restarting")
+        shutdown_cpu_pool(wait=False)
+        return await loop.run_in_executor(get_cpu_executor(), call)
+
+
+def shutdown_cpu_pool(wait: bool = True) -> None:
+    """Shut down the shared executor (called on app shutdown)."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=wait, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,105 @@
+"""
+Discovery De-duplication Queries
+
+Bulk "already processed?" checks for discovery candidates, answered by the
+database instead of loading every id a user owns into Python sets:
+
+- new_regrid_ids(): anti-join of a batch of parcel ids (unnest) against the
+  user's properties
+- processed_places_ids(): Google Places ids whose business already has a property
+- claim_parcel_properties(): one multi-row INSERT ... ON CONFLICT DO NOTHING
+  on (user_id, regrid_id) per batch, so two jobs can never create the same
+  parcel twice
+
+Each check is one round-trip per candidate batch, indexed on
+(user_id, regrid_id) - cost does not grow with the size of the account.
+See migrations/add_regrid_id_dedup_index.sql.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import String, and_, cast, exists, func, select
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.orm import Session
+
+from app.models.business import Business
+from app.models.property import Property, PARCEL_KEYED_SOURCES
+from app.models.property_business import PropertyBusiness
+
+logger = logging.getLogger(__name__)
+
+
+def _candidates(ids: List[str], name: str):
+    """Batch of ids as a one-column table: unnest(CAST(:ids AS varchar[])) AS candidates(name)"""
+    return func.unnest(cast(ids, ARRAY(String))).table_valued(name).render_derived(name="candidates")
+
+
+def _unique(ids: Iterable[Optional[str]]) -> List[str]:
+    return list(dict.fromkeys(i for i in ids if i))
+
+
+def new_regrid_ids(db: Session, user_id: UUID, regrid_ids: Iterable[Optional[str]]) -> List[str]:
+    """
+    Parcel ids from the batch the user has no property for yet (input order kept).
+    """
+    ids = _unique(regrid_ids)
+    if not ids:
+        return []
+
+    candidates = _candidates(ids, "regrid_id")
+    stmt = select(candidates.c.regrid_id).where(
+        ~exists().where(
+            Property.user_id == user_id,
+            Property.regrid_id == candidates.c.regrid_id,
+        )
+    )
+    new_ids = {row[0] for row in db.execute(stmt)}
+    return [i for i in ids if i in new_ids]
+
+
+def processed_places_ids(db: Session, places_ids: Iterable[Optional[str]]) -> Set[str]:
+    """
+    Places ids from the batch whose business already has an associated property.
+    """
+    ids = _unique(places_ids)
+    if not ids:
+        return set()
+
+    candidates = _candidates(ids, "places_id")
+    stmt = select(candidates.c.places_id).where(
+        exists()
+        .where(Business.places_id == candidates.c.places_id)
+        .where(PropertyBusiness.business_id == Business.id)
+    )
+    return {row[0] for row in db.execute(stmt)}
+
+
+def claim_parcel_properties(db: Session, rows: List[Dict[str, Any]]) -> Dict[str, UUID]:
+    """
+    Insert parcel-keyed property rows (each must include user_id, regrid_id
+    and a discovery_source from PARCEL_KEYED_SOURCES) in one statement.
+
+    Returns regrid_id -> new property id for the rows inserted. Parcels the
+    user already has a parcel-keyed property for (e.g. another job got there
+    first) are left out.
+    """
+    if not rows:
+        return {}
+
+    # A multi-row VALUES needs the same columns in every row
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    stmt = (
+        insert(Property)
+        .values([{column: row.get(column) for column in columns} for row in rows])
+        .on_conflict_do_nothing(
+            index_elements=[Property.user_id, Property.regrid_id],
+            index_where=and_(
+                Property.regrid_id.isnot(None),
+                Property.discovery_source.in_(PARCEL_KEYED_SOURCES),
+            ),
+        )
+        .returning(Property.id, Property.regrid_id)
+    )
+    return {row.regrid_id: row.id for row in db.execute(stmt)}
@@ -0,0 +1,483 @@
+"""
+Discovery Job Store
+
+Where discovery job state (status, progress, results) lives, so any API
+worker can answer "how is job X doing?" - not just the one running it.
+
+- "postgres" (default): the discovery_jobs table - shared by all workers and
+  replicas, survives restarts
+- "memory": a per-process dict - for tests and single-worker setups
+
+Every save pushes `expires_at` forward by DISCOVERY_JOB_TTL_HOURS. Expired
+jobs are never returned and are purged opportunistically on writes, so
+abandoned jobs (e.g. the worker died mid-run) clean themselves up.
+
+Checkpoints: a resumable pipeline stores what it needs to pick up where it
+left off (request, page cursor, shortlisted parcels) with save_checkpoint(),
+and small set_checkpoint_items() writes as items clear stages (batched with
+the pipeline's property writes, see discovery_writes.py).
+claim_for_resume() hands an interrupted job to exactly one worker.
+
+Cancellation: request_cancel() flags a job (a queued one is marked cancelled
+right away); the process running it polls is_cancel_requested() and stops it
+(see cancel_job in discovery_orchestrator.py). Job saves never clear the flag.
+
+Jobs are passed in and out in the orchestrator's shape:
+    {"status": DiscoveryStep, "progress": DiscoveryProgress, "user_id": str,
+     "mode": str, "started_at": datetime, "completed_at": datetime,
+     "error": str, "result": dict, "tiers": [...], "business_type_ids": [...],
+     "scoring_prompt": str}
+Datetimes are naive UTC, like the rest of the orchestrator.
+
+Store methods are blocking (the Postgres store does a DB round trip per
+call): async code runs them in a thread - the orchestrator sends writes of
+`blocking` stores through one background writer thread, in order.
+
+See migrations/create_discovery_jobs.sql.
+"""
+
+import copy
+import logging
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from sqlalchemy import Text, case, cast, func, or_, select, update
+from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, insert
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.discovery_job import DiscoveryJob
+from app.schemas.discovery import DiscoveryProgress, DiscoveryStep
+
+logger = logging.getLogger(__name__)
+
+
+# Job keys stored in the params column
+_PARAM_KEYS = ("tiers", "business_type_ids", "scoring_prompt")
+
+# Purge expired rows at most this often (per process)
+_PURGE_INTERVAL_SECONDS = 600
+
+# Statuses of jobs that are over - never resumed or cancelled
+_FINISHED_STATUSES = (DiscoveryStep.COMPLETED.value, DiscoveryStep.FAILED.value, DiscoveryStep.CANCELLED.value)
+
+
+def _naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _aware_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _serialize(job: Dict[str, Any]) -> Dict[str, Any]:
+    """Orchestrator job dict -> JSON-safe record"""
+    status = job.get("status", DiscoveryStep.QUEUED)
+    progress = job.get("progress")
+    return {
+        "user_id": job.get("user_id"),
+        "mode": job.get("mode"),
+        "status": status.value if isinstance(status, DiscoveryStep) else status,
+        "progress": progress.model_dump(mode="json") if progress is not None else None,
+        "params": {key: job.get(key) for key in _PARAM_KEYS},
+        "result": job.get("result"),
+        "error": job.get("error"),
+        "started_at": job.get("started_at"),
+        "completed_at": job.get("completed_at"),
+    }
+
+
+def _deserialize(record: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-safe record -> orchestrator job dict"""
+    job = {
+        "status": DiscoveryStep(record["status"]),
+        "progress": DiscoveryProgress(**record["progress"]) if record.get("progress") else None,
+        "user_id": str(record["user_id"]) if record.get("user_id") else None,
+        "mode": record.get("mode"),
+        "result": record.get("result"),
+        "started_at": _naive_utc(record.get("started_at")),
+    }
+    job.update(record.get("params") or {})
+    if record.get("error"):
+        job["error"] = record["error"]
+    if record.get("completed_at"):
+        job["completed_at"] = _naive_utc(record["completed_at"])
+    return job
+
+
+class DiscoveryJobStore(ABC):
+    """Interface of job state backends."""
+
+    # Calls do I/O - keep them off the event loop
+    blocking = False
+
+    def __init__(self, ttl_hours: int):
+        self.ttl = timedelta(hours=ttl_hours)
+
+    def check(self) -> None:
+        """Raise if the store can't be used (e.g. its table is missing)."""
+
+    @abstractmethod
+    def save(self, job_key: str, job: Dict[str, Any]) -> None:
+        """Create or replace a job's state (and refresh its expiry)."""
+
+    @abstractmethod
+    def get(self, job_key: str) -> Optional[Dict[str, Any]]:
+        """Current state of a job, or None if unknown / expired."""
+
+    @abstractmethod
+    def delete_expired(self, completed_before: Optional[datetime] = None) -> int:
+        """Remove expired jobs (and finished jobs older than `completed_before`)."""
+
+    @abstractmethod
+    def save_checkpoint(self, job_key: str, checkpoint: Dict[str, Any]) -> None:
+        """Replace a job's resume checkpoint (must contain an "items" dict)."""
+
+    @abstractmethod
+    def set_checkpoint_items(self, job_key: str, items: Dict[str, Dict[str, Any]]) -> None:
+        """Record items' states (item key -> state) in the checkpoint without rewriting the rest."""
+
+    @abstractmethod
+    def get_checkpoint(self, job_key: str) -> Optional[Dict[str, Any]]:
+        ...
+
+    @abstractmethod
+    def find_interrupted(self, stale_after: timedelta, limit: int = 10) -> List[str]:
+        """Checkpointed jobs that are still "running" but haven't been updated for `stale_after`."""
+
+    @abstractmethod
+    def claim_for_resume(self, job_key: str, stale_after: timedelta, include_failed: bool = False) -> bool:
+        """
+        Atomically take over an interrupted job: checkpointed, not completed, and
+        silent for `stale_after` (or failed, with include_failed). Resets it to
+        queued, so a second claim fails until the resumed run has started and
+        gone silent again.
+        """
+
+    @abstractmethod
+    def request_cancel(self, job_key: str) -> bool:
+        """
+        Ask for a job to stop (a queued job is marked cancelled at once).
+        Returns False if the job is unknown or already finished.
+        """
+
+    @abstractmethod
+    def is_cancel_requested(self, job_key: str) -> bool:
+        ...
+
+
+class MemoryJobStore(DiscoveryJobStore):
+    """Per-process store. Jobs are copied in and out, like a real backend."""
+
+    def __init__(self, ttl_hours: int):
+        super().__init__(ttl_hours)
+        self._records: Dict[str, Dict[str, Any]] = {}
+
+    def save(self, job_key: str, job: Dict[str, Any]) -> None:
+        record = copy.deepcopy(_serialize(job))
+        record["updated_at"] = datetime.utcnow()
+        record["expires_at"] = record["updated_at"] + self.ttl
+        previous = self._records.get(job_key, {})
+        record["checkpoint"] = previous.get("checkpoint")
+        record["cancel_requested_at"] = previous.get("cancel_requested_at")
+        self._records[job_key] = record
+        self.delete_expired()
+
+    def get(self, job_key: str) -> Optional[Dict[str, Any]]:
+        record = self._records.get(job_key)
+        if not record or record["expires_at"] <= datetime.utcnow():
+            return None
+        return _deserialize(copy.deepcopy(record))
+
+    def delete_expired(self, completed_before: Optional[datetime] = None) -> int:
+        now = datetime.utcnow()
+        expired = [
+            job_key for job_key, record in self._records.items()
+            if record["expires_at"] <= now
+            or (completed_before and record.get("completed_at") and record["completed_at"] < completed_before)
+        ]
+        for job_key in expired:
+            del self._records[job_key]
+        return len(expired)
+
+    def save_checkpoint(self, job_key: str, checkpoint: Dict[str, Any]) -> None:
+        record = self._records.get(job_key)
+        if record:
+            record["checkpoint"] = copy.deepcopy(checkpoint)
+            record["updated_at"] = datetime.utcnow()
+
+    def set_checkpoint_items(self, job_key: str, items: Dict[str, Dict[str, Any]]) -> None:
+        record = self._records.get(job_key)
+        if record and record.get("checkpoint"):
+            record["checkpoint"]["items"].update(copy.deepcopy(items))
+            record["updated_at"] = datetime.utcnow()
+
+    def get_checkpoint(self, job_key: str) -> Optional[Dict[str, Any]]:
+        record = self._records.get(job_key)
+        return copy.deepcopy(record.get("checkpoint")) if record else None
+
+    def _resumable(self, record: Dict[str, Any], stale_after: timedelta, include_failed: bool) -> bool:
+        if not record.get("checkpoint") or record["expires_at"] <= datetime.utcnow():
+            return False
+        if record["status"] in (DiscoveryStep.COMPLETED.value, DiscoveryStep.CANCELLED.value):
+            return False
+        if record.get("cancel_requested_at"):
+            return False
+        if include_failed and record["status"] == DiscoveryStep.FAILED.value:
+            return True
+        # Queued jobs are waiting for a worker, not interrupted
+        return (
+            record["status"] not in (DiscoveryStep.FAILED.value, DiscoveryStep.QUEUED.value)
+            and record["updated_at"] < datetime.utcnow() - stale_after
+        )
+
+    def find_interrupted(self, stale_after: timedelta, limit: int = 10) -> List[str]:
+        return [
+            job_key for job_key, record in self._records.items()
+            if self._resumable(record, stale_after, include_failed=False)
+        ][:limit]
+
+    def claim_for_resume(self, job_key: str, stale_after: timedelta, include_failed: bool = False) -> bool:
+        record = self._records.get(job_key)
+        if not record or not self._resumable(record, stale_after, include_failed):
+            return False
+        record.update(status=DiscoveryStep.QUEUED.value, error=None, completed_at=None, updated_at=datetime.utcnow())
+        return True
+
+    def request_cancel(self, job_key: str) -> bool:
+        record = self._records.get(job_key)
+        now = datetime.utcnow()
+        if not record or record["expires_at"] <= now or record["status"] in _FINISHED_STATUSES:
+            return False
+        record.update(cancel_requested_at=now, updated_at=now)
+        if record["status"] == DiscoveryStep.QUEUED.value:
+            # Nothing is running it yet
+            record.update(status=DiscoveryStep.CANCELLED.value, completed_at=now)
+        return True
+
+    def is_cancel_requested(self, job_key: str) -> bool:
+        record = self._records.get(job_key)
+        return bool(record and record.get("cancel_requested_at"))
+
+
+class PostgresJobStore(DiscoveryJobStore):
+    """discovery_jobs table - one short session per call, so it never touches a pipeline's session."""
+
+    blocking = True
+
+    def __init__(self, ttl_hours: int):
+        super().__init__(ttl_hours)
+        self._last_purge = 0.0
+
+    def check(self) -> None:
+        db = SessionLocal()
+        try:
+            db.execute(select(DiscoveryJob.id).limit(1))
+        except ProgrammingError as e:
+            raise RuntimeError(
+                "discovery_jobs table is missing - run migrations/create_discovery_jobs.sql "
+                "(and the later discovery_job migrations), or set DISCOVERY_JOB_STORE=memory"
+            ) from e
+        finally:
+            db.close()
+
+    def save(self, job_key: str, job: Dict[str, Any]) -> None:
+        record = _serialize(job)
+        record["expires_at"] = func.now() + self.ttl
+        record["completed_at"] = _aware_utc(record["completed_at"])
+        started_at = _aware_utc(record.pop("started_at") or datetime.utcnow())
+
+        stmt = insert(DiscoveryJob).values(id=UUID(job_key), started_at=started_at, **record)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DiscoveryJob.id],
+            set_={
+                **{key: stmt.excluded[key] for key in record if key != "user_id"},
+                "updated_at": func.now(),
+            },
+        )
+
+        self._execute(stmt)
+
+        if time.monotonic() - self._last_purge > _PURGE_INTERVAL_SECONDS:
+            self._last_purge = time.monotonic()
+            try:
+                self.delete_expired()
+            except Exception as e:
+                logger.warning(f"⚠️ Could not purge expired discovery jobs: {e}")
+
+    def _execute(self, stmt) -> List[Any]:
+        """Run one write in its own session; returns RETURNING rows (if any)."""
+        db = SessionLocal()
+        try:
+            result = db.execute(stmt)
+            rows = result.fetchall() if result.returns_rows else []
+            db.commit()
+            return rows
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def get(self, job_key: str) -> Optional[Dict[str, Any]]:
+        db = SessionLocal()
+        try:
+            row = db.query(DiscoveryJob).filter(
+                DiscoveryJob.id == UUID(job_key),
+                DiscoveryJob.expires_at > func.now(),
+            ).first()
+            if not row:
+                return None
+            return _deserialize({
+                "user_id": row.user_id,
+                "mode": row.mode,
+                "status": row.status,
+                "progress": row.progress,
+                "params": row.params,
+                "result": row.result,
+                "error": row.error,
+                "started_at": row.started_at,
+                "completed_at": row.completed_at,
+            })
+        finally:
+            db.close()
+
+    def delete_expired(self, completed_before: Optional[datetime] = None) -> int:
+        db = SessionLocal()
+        try:
+            condition = DiscoveryJob.expires_at <= func.now()
+            if completed_before:
+                condition = condition | (DiscoveryJob.completed_at < _aware_utc(completed_before))
+            removed = db.query(DiscoveryJob).filter(condition).delete(synchronize_session=False)
+            db.commit()
+            if removed:
+                logger.info(f"🧹 Purged {removed} expired discovery jobs")
+            return removed
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def save_checkpoint(self, job_key: str, checkpoint: Dict[str, Any]) -> None:
+        self._execute(
+            update(DiscoveryJob)
+            .where(DiscoveryJob.id == UUID(job_key))
+            .values(checkpoint=checkpoint, updated_at=func.now())
+        )
+
+    def set_checkpoint_items(self, job_key: str, items: Dict[str, Dict[str, Any]]) -> None:
+        if not items:
+            return
+        # jsonb_set touches the items map only - the (possibly large) parcel list isn't resent
+        self._execute(
+            update(DiscoveryJob)
+            .where(DiscoveryJob.id == UUID(job_key), DiscoveryJob.checkpoint.isnot(None))
+            .values(
+                checkpoint=func.jsonb_set(
+                    DiscoveryJob.checkpoint,
+                    cast(["items"], ARRAY(Text)),
+                    func.coalesce(DiscoveryJob.checkpoint["items"], cast({}, JSONB)).op("||")(cast(items, JSONB)),
+                    True,
+                ),
+                updated_at=func.now(),
+            )
+        )
+
+    def get_checkpoint(self, job_key: str) -> Optional[Dict[str, Any]]:
+        db = SessionLocal()
+        try:
+            return db.execute(
+                select(DiscoveryJob.checkpoint).where(DiscoveryJob.id == UUID(job_key))
+            ).scalar()
+        finally:
+            db.close()
+
+    def _resumable(self, stale_after: timedelta, include_failed: bool):
+        # Queued jobs are waiting for a worker, not interrupted
+        stale = (
+            DiscoveryJob.status.notin_([DiscoveryStep.FAILED.value, DiscoveryStep.QUEUED.value])
+            & (DiscoveryJob.updated_at < func.now() - stale_after)
+        )
+        return (
+            DiscoveryJob.checkpoint.isnot(None),
+            DiscoveryJob.cancel_requested_at.is_(None),
+            DiscoveryJob.expires_at > func.now(),
+            DiscoveryJob.status.notin_([DiscoveryStep.COMPLETED.value, DiscoveryStep.CANCELLED.value]),
+            or_(stale, DiscoveryJob.status == DiscoveryStep.FAILED.value) if include_failed else stale,
+        )
+
+    def find_interrupted(self, stale_after: timedelta, limit: int = 10) -> List[str]:
+        db = SessionLocal()
+        try:
+            rows = db.execute(
+                select(DiscoveryJob.id)
+                .where(*self._resumable(stale_after, include_failed=False))
+                .order_by(DiscoveryJob.updated_at)
+                .limit(limit)
+            ).all()
+            return [str(row[0]) for row in rows]
+        finally:
+            db.close()
+
+    def claim_for_resume(self, job_key: str, stale_after: timedelta, include_failed: bool = False) -> bool:
+        # Row lock + re-checked WHERE: of two concurrent claims only one matches
+        rows = self._execute(
+            update(DiscoveryJob)
+            .where(DiscoveryJob.id == UUID(job_key), *self._resumable(stale_after, include_failed))
+            .values(status=DiscoveryStep.QUEUED.value, error=None, completed_at=None, updated_at=func.now())
+            .returning(DiscoveryJob.id)
+        )
+        return bool(rows)
+
+    def request_cancel(self, job_key: str) -> bool:
+        queued = DiscoveryJob.status == DiscoveryStep.QUEUED.value
+        rows = self._execute(
+            update(DiscoveryJob)
+            .where(
+                DiscoveryJob.id == UUID(job_key),
+                DiscoveryJob.expires_at > func.now(),
+                DiscoveryJob.status.notin_(_FINISHED_STATUSES),
+            )
+            .values(
+                cancel_requested_at=func.now(),
+                # Nothing is running a queued job yet
+                status=case((queued, DiscoveryStep.CANCELLED.value), else_=DiscoveryJob.status),
+                completed_at=case((queued, func.now()), else_=DiscoveryJob.completed_at),
+                updated_at=func.now(),
+            )
+            .returning(DiscoveryJob.id)
+        )
+        return bool(rows)
+
+    def is_cancel_requested(self, job_key: str) -> bool:
+        db = SessionLocal()
+        try:
+            return bool(db.execute(
+                select(DiscoveryJob.cancel_requested_at.isnot(None)).where(DiscoveryJob.id == UUID(job_key))
+            ).scalar())
+        finally:
+            db.close()
+
+
+_store: Optional[DiscoveryJobStore] = None
+
+
+def get_job_store() -> DiscoveryJobStore:
+    """Get or create the configured job store"""
+    global _store
+    if _store is None:
+        if settings.DISCOVERY_JOB_STORE == "memory":
+            _store = MemoryJobStore(settings.DISCOVERY_JOB_TTL_HOURS)
+        else:
+            _store = PostgresJobStore(settings.DISCOVERY_JOB_TTL_HOURS)
+        logger.info(f"🗂️ Discovery job store: {settings.DISCOVERY_JOB_STORE}")
+    return _store
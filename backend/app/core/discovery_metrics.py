@@ -0,0 +1,181 @@
+"""
+Discovery Stage Metrics
+
+Per-stage latency of discovery jobs (Regrid paging, tile screening, record
+batches, Places / Apollo searches, imagery, VLM, enrichment), so a slow job
+shows where its time goes instead of only how many items it has counted:
+
+- StageTimer: per-item durations for one job's stages; summary() gives
+  count, total, p50 / p95 / max per stage. The orchestrator copies it into
+  DiscoveryProgress.stage_timings whenever it saves the job, and the SSE
+  stream sends it with its events
+- save_job_metrics(): when a job finishes, one discovery_job_metrics row
+  per stage (plus a "job" row with its wall time)
+- summarize(): daily per-stage rollup over many jobs, for capacity planning
+  and spotting regressions (GET /metrics/discovery)
+
+See migrations/create_discovery_job_metrics.sql.
+"""
+
+import logging
+import math
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Dict, Iterator, List, Optional, TypeVar
+from uuid import UUID
+
+from sqlalchemy import cast, Date, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.db.base import SessionLocal
+from app.models.discovery_job_metric import DiscoveryJobMetric
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Stage name of the whole-job row (count 1, total = wall time)
+JOB_STAGE = "job"
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return ordered[max(0, min(len(ordered) - 1, math.ceil(q * len(ordered)) - 1))]
+
+
+class StageTimer:
+    """Per-item latencies of one job's stages (seconds)."""
+
+    def __init__(self):
+        self._samples: Dict[str, List[float]] = {}
+        self._started = time.perf_counter()
+
+    def elapsed(self) -> float:
+        """Seconds since the timer was created (the job's wall time)."""
+        return time.perf_counter() - self._started
+
+    def record(self, stage: str, seconds: float) -> None:
+        self._samples.setdefault(stage, []).append(seconds)
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """Time the block as one item of `stage` (failed or cancelled items count too)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    async def timed(self, stage: str, awaitable: Awaitable[T]) -> T:
+        """Await `awaitable`, timing it as one item of `stage`."""
+        with self.time(stage):
+            return await awaitable
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """stage -> {count, total_seconds, p50_seconds, p95_seconds, max_seconds}"""
+        summary = {}
+        for stage, samples in self._samples.items():
+            ordered = sorted(samples)
+            summary[stage] = {
+                "count": len(ordered),
+                "total_seconds": round(sum(ordered), 3),
+                "p50_seconds": round(_percentile(ordered, 0.5), 3),
+                "p95_seconds": round(_percentile(ordered, 0.95), 3),
+                "max_seconds": round(ordered[-1], 3),
+            }
+        return summary
+
+
+def save_job_metrics(
+    job_id: UUID,
+    user_id: Optional[UUID],
+    mode: Optional[str],
+    status: str,
+    stages: Dict[str, Dict[str, Any]],
+    job_seconds: Optional[float] = None,
+) -> None:
+    """Store a finished job's stage summary (a resumed job's rows are replaced)."""
+    if job_seconds is not None:
+        seconds = round(job_seconds, 3)
+        stages = {**stages, JOB_STAGE: {
+            "count": 1,
+            "total_seconds": seconds,
+            "p50_seconds": seconds,
+            "p95_seconds": seconds,
+            "max_seconds": seconds,
+        }}
+    if not stages:
+        return
+
+    rows = [
+        {"job_id": job_id, "user_id": user_id, "mode": mode, "status": status, "stage": stage, **values}
+        for stage, values in stages.items()
+    ]
+    stmt = insert(DiscoveryJobMetric).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_discovery_job_metrics_job_stage",
+        set_={
+            **{key: stmt.excluded[key] for key in rows[0] if key not in ("job_id", "stage")},
+            "recorded_at": func.now(),
+        },
+    )
+
+    db = SessionLocal()
+    try:
+        db.execute(stmt)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def summarize(days: int = 30, mode: Optional[str] = None, stage: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Per day and stage over the last `days`: jobs, items, mean latency and the
+    median / 95th percentile of the jobs' p50 and p95 (per-job percentiles
+    can't be merged exactly - these track how typical jobs move over time).
+    """
+    since = datetime.now(timezone.utc) - timedelta(days=days)
+    day = cast(DiscoveryJobMetric.recorded_at, Date).label("day")
+    query = (
+        select(
+            day,
+            DiscoveryJobMetric.stage,
+            func.count().label("jobs"),
+            func.sum(DiscoveryJobMetric.count).label("items"),
+            func.sum(DiscoveryJobMetric.total_seconds).label("total_seconds"),
+            func.percentile_cont(0.5).within_group(DiscoveryJobMetric.p50_seconds).label("p50_seconds"),
+            func.percentile_cont(0.95).within_group(DiscoveryJobMetric.p95_seconds).label("p95_seconds"),
+            func.max(DiscoveryJobMetric.max_seconds).label("max_seconds"),
+        )
+        .where(DiscoveryJobMetric.recorded_at >= since)
+        .group_by(day, DiscoveryJobMetric.stage)
+        .order_by(day, DiscoveryJobMetric.stage)
+    )
+    if mode:
+        query = query.where(DiscoveryJobMetric.mode == mode)
+    if stage:
+        query = query.where(DiscoveryJobMetric.stage == stage)
+
+    db = SessionLocal()
+    try:
+        rows = db.execute(query).all()
+    finally:
+        db.close()
+
+    return [
+        {
+            "day": row.day.isoformat(),
+            "stage": row.stage,
+            "jobs": row.jobs,
+            "items": int(row.items or 0),
+            "mean_seconds": round(row.total_seconds / row.items, 3) if row.items else None,
+            "p50_seconds": round(row.p50_seconds, 3) if row.p50_seconds is not None else None,
+            "p95_seconds": round(row.p95_seconds, 3) if row.p95_seconds is not None else None,
+            "max_seconds": round(row.max_seconds, 3) if row.max_seconds is not None else None,
+        }
+        for row in rows
+    ]
@@ -1,18 +1,18 @@
+import copy
 import logging
 import asyncio
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, List, Set, Callable, Tuple, AsyncIterator
 from datetime import datetime, timedelta
-from uuid import UUID
+from uuid import UUID, uuid4
 from enum import Enum
 from sqlalchemy.orm import Session
 from shapely.geometry import shape
-from geoalchemy2.shape import to_shape, from_shape
+from geoalchemy2.shape import from_shape
 
 from app.models.property import Property
-from app.models.business import Business
-from app.models.property_business import PropertyBusiness
-from app.schemas.discovery import DiscoveryStep, DiscoveryProgress, DiscoveryFilters
-from app.core.business_data_service import business_data_service
+from app.schemas.discovery import DiscoveryStep, DiscoveryProgress, DiscoveryFilters, StageTiming
 from app.core.usage_tracking_service import usage_tracking_service
 from app.core.business_first_discovery_service import (
     business_first_discovery_service,
@@ -20,16 +20,30 @@ from app.core.business_first_discovery_service import (
     DiscoveredBusiness,
 )
 from app.core.apollo_enrichment_service import apollo_enrichment_service, ContactSearchResult
-from app.core.lead_enrichment_service import lead_enrichment_service
 from app.core.llm_enrichment_service import llm_enrichment_service
 from app.core.config import settings
 
 # Clean property imagery pipeline
 from app.core.property_imagery_pipeline import property_imagery_pipeline
-from app.core.regrid_service import regrid_service
+from app.core.regrid_service import regrid_service, normalize_owner_name, PropertyParcel
+from app.core.county_service import county_service, GeoScope
+from app.core.cancellation import cancel_when, fired, resume_after_cancel
+from app.core.discovery_job_store import get_job_store
+from app.core.discovery_queue import DISCOVERY_JOB, RESUME_JOB, ENRICH_PROPERTY, cancel_job_tasks, enqueue, run_task
+from app.core.discovery_dedup import new_regrid_ids, processed_places_ids, claim_parcel_properties
+from app.core.candidate_ranking import RankedParcel, rank_parcels, tile_parcel_priority
+from app.core.discovery_metrics import StageTimer, save_job_metrics
+from app.core.geo_utils import bounds_radius_m
+from app.core.discovery_writes import (
+    PropertyWriter,
+    insert_properties,
+    link_businesses,
+    primary_properties,
+    upsert_businesses,
+)
+from app.core.staged_pipeline import StagedPipeline, Stage
 from app.core.vlm_analysis_service import vlm_analysis_service
-import os
-import math
+from app.db.base import SessionLocal
 
 
 class DiscoveryMode(str, Enum):
@@ -37,17 +51,57 @@ class DiscoveryMode(str, Enum):
     BUSINESS_FIRST = "business_first"  # Find businesses via Google Places → analyze property with Regrid + VLM
     CONTACT_FIRST = "contact_first"  # Find contacts via Apollo → find their properties via Regrid → VLM
     REGRID_FIRST = "regrid_first"  # Query Regrid directly by LBCS codes → VLM scoring → Enrichment
+    TILE_FIRST = "tile_first"  # Screen parcels from Regrid tiles → batch-fetch shortlisted records → VLM → Enrichment
+
+@dataclass
+class _LeadItem:
+    """One candidate moving through the staged discovery pipeline."""
+    index: int
+    parcel: Any = None  # Regrid PropertyParcel (once known)
+    business: Optional[DiscoveredBusiness] = None  # business_first
+    business_id: Optional[UUID] = None  # business_first (stored Business row)
+    contact: Optional[ContactSearchResult] = None  # contact_first
+    property_id: Optional[UUID] = None
+    imagery: Any = None  # Imagery result, released after VLM
+    property_type: Optional[str] = None
+    resume_stage: Optional[str] = None  # Last stage cleared before an interruption (checkpoint)
+
+
+# Checkpointed item stages after which a resumed job has nothing left to do
+_FINISHED_STAGES = ("enrichment", "failed", "skipped")
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
 
+def _with_boundary(ranked: List[RankedParcel], limit: int) -> List[RankedParcel]:
+    """
+    The best `limit` ranked candidates whose boundary polygon can be built.
+    Polygons are only built for candidates reached, not the whole pool.
+    """
+    kept = []
+    for candidate in ranked:
+        if len(kept) >= limit:
+            break
+        if candidate.parcel.polygon is not None:
+            kept.append(candidate)
+        else:
+            logger.info(f"   ⚠️ Parcel {candidate.parcel.parcel_id} has no usable boundary, skipping")
+    return kept
+
+
 class DiscoveryOrchestrator:
     """Orchestrates the complete parking lot discovery pipeline."""
     
-    # In-memory job storage (use Redis in production)
+    # Live state of jobs running in this process - every update is written to
+    # the job store (see discovery_job_store.py), which is what status reads use
     _jobs: Dict[str, Dict[str, Any]] = {}
+    _background_tasks: Dict[str, "asyncio.Task"] = {}  # Inline jobs / resumes started by this process
+    _timers: Dict[str, StageTimer] = {}  # Per-stage latency of the live jobs (see discovery_metrics.py)
+    # Blocking job store writes (and the queue tasks that follow them) run here, one at a time, in order
+    _store_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="discovery-job-store")
     
     def initialize_job(self, job_id: UUID, user_id: UUID) -> None:
         """Initialize job status before starting background task."""
@@ -61,6 +115,72 @@ class DiscoveryOrchestrator:
             "started_at": datetime.utcnow(),
             "user_id": str(user_id),
         }
+        self._timers[job_key] = StageTimer()
+        self._save_job(job_key)
+    
+    async def submit_job(
+        self,
+        job_id: UUID,
+        user_id: UUID,
+        area_polygon: Dict[str, Any],
+        filters: DiscoveryFilters,
+        mode: DiscoveryMode = DiscoveryMode.BUSINESS_FIRST,
+        **params: Any,
+    ) -> None:
+        """
+        Accept a discovery job and return at once. With DISCOVERY_EXECUTION="queue"
+        it goes on the work queue for any worker; otherwise it runs as a
+        background task of this process. `params` are start_discovery's
+        keyword arguments (tiers, scoring_prompt, city, property_categories, ...).
+        """
+        job_key = str(job_id)
+        self.initialize_job(job_id, user_id)
+        self._jobs[job_key]["mode"] = mode.value
+        self._save_job(job_key)
+        
+        payload = {
+            "job_id": job_key,
+            "user_id": str(user_id),
+            "area_polygon": area_polygon,
+            "filters": filters.model_dump(mode="json"),
+            "mode": mode.value,
+            "params": params,
+        }
+        if settings.DISCOVERY_EXECUTION == "queue":
+            # Runs on a worker - the job store has its state from here on
+            self._jobs.pop(job_key, None)
+            self._timers.pop(job_key, None)
+            await self._enqueue(DISCOVERY_JOB, payload, job_id)
+        else:
+            self._spawn(job_key, self._in_background(self.run_job_payload, payload))
+    
+    async def run_job_payload(self, payload: Dict[str, Any], db: Session) -> None:
+        """Run a submitted job. A retried job that already checkpointed resumes instead."""
+        job_id = UUID(payload["job_id"])
+        job_key = str(job_id)
+        if await asyncio.to_thread(self._cancel_requested, job_key):
+            logger.info(f"🛑 Discovery job {job_id} was cancelled before it started")
+            if job_key not in self._jobs:
+                job = await asyncio.to_thread(get_job_store().get, job_key)
+                if job is not None:
+                    self._jobs[job_key] = job
+            self._mark_cancelled(job_key)
+            self._finish_job(job_key)
+            return
+        if await asyncio.to_thread(get_job_store().get_checkpoint, job_key):
+            # An earlier attempt died mid-run - don't pay for its work twice
+            await self.resume_job(job_id, db)
+            return
+        
+        await self.start_discovery(
+            job_id,
+            UUID(payload["user_id"]),
+            payload["area_polygon"],
+            DiscoveryFilters(**payload["filters"]),
+            db,
+            mode=DiscoveryMode(payload["mode"]),
+            **payload["params"],
+        )
     
     async def start_discovery(
         self,
@@ -115,7 +235,9 @@ class DiscoveryOrchestrator:
         self._jobs[job_key]["tiers"] = tiers
         self._jobs[job_key]["business_type_ids"] = business_type_ids
         self._jobs[job_key]["scoring_prompt"] = scoring_prompt
+        self._save_job(job_key)
         
+        watcher = self._watch_for_cancel(job_key)
         try:
             if mode == DiscoveryMode.CONTACT_FIRST:
                 await self._run_contact_first_pipeline(
@@ -126,13 +248,14 @@ class DiscoveryOrchestrator:
                     industries=industries,
                     scoring_prompt=scoring_prompt,
                 )
-            elif mode == DiscoveryMode.REGRID_FIRST:
+            elif mode in (DiscoveryMode.REGRID_FIRST, DiscoveryMode.TILE_FIRST):
                 await self._run_regrid_first_pipeline(
                     job_id, user_id, area_polygon, filters, db,
                     property_categories=property_categories,
                     scoring_prompt=scoring_prompt,
                     min_acres=min_acres,
                     max_acres=max_acres,
+                    tile_first=mode == DiscoveryMode.TILE_FIRST,
                 )
             else:
                 await self._run_business_first_pipeline(
@@ -141,11 +264,19 @@ class DiscoveryOrchestrator:
                     business_type_ids=business_type_ids,
                     scoring_prompt=scoring_prompt,
                 )
+        except asyncio.CancelledError:
+            if not fired(watcher):
+                raise  # Not a cancel request (e.g. shutdown) - leave the job as it was
+            resume_after_cancel()
+            self._mark_cancelled(job_key)
         except Exception as e:
             logger.error(f"❌ Discovery pipeline failed: {e}")
             import traceback
             traceback.print_exc()
             self._update_job(job_key, DiscoveryStep.FAILED, error=str(e))
+        finally:
+            watcher.cancel()
+            self._finish_job(job_key)
     
     async def stream_discovery(
         self,
@@ -169,10 +300,16 @@ class DiscoveryOrchestrator:
         """
         Stream discovery progress via async generator.
         Yields user-friendly progress messages as the discovery runs.
+        Stops - keeping what it stored - when the job is cancelled or the
+        consumer is cancelled (e.g. the SSE client disconnected).
         """
         job_key = str(job_id)
         self.initialize_job(job_id, user_id)
+        self._jobs[job_key]["mode"] = mode.value
+        self._jobs[job_key]["scoring_prompt"] = scoring_prompt
+        self._save_job(job_key)
         
+        watcher = self._watch_for_cancel(job_key)
         try:
             if mode == DiscoveryMode.REGRID_FIRST:
                 async for progress in self._stream_regrid_first_pipeline(
@@ -183,6 +320,15 @@ class DiscoveryOrchestrator:
                     max_acres=max_acres,
                 ):
                     yield progress
+            elif mode == DiscoveryMode.TILE_FIRST:
+                # Fallback to non-streaming for now
+                yield {"type": "started", "message": "Starting tile-first discovery..."}
+                await self._run_regrid_first_pipeline(
+                    job_id, user_id, area_polygon, filters, db,
+                    property_categories=property_categories, scoring_prompt=scoring_prompt,
+                    min_acres=min_acres, max_acres=max_acres, tile_first=True,
+                )
+                yield {"type": "complete", "message": "Discovery complete!", "timings": self._stage_timer(job_key).summary()}
             elif mode == DiscoveryMode.CONTACT_FIRST:
                 # Fallback to non-streaming for now
                 yield {"type": "started", "message": "Starting contact-first discovery..."}
@@ -191,7 +337,7 @@ class DiscoveryOrchestrator:
                     city=city, state=state, job_titles=job_titles, industries=industries,
                     scoring_prompt=scoring_prompt,
                 )
-                yield {"type": "complete", "message": "Discovery complete!"}
+                yield {"type": "complete", "message": "Discovery complete!", "timings": self._stage_timer(job_key).summary()}
             else:
                 # Fallback to non-streaming for business-first
                 yield {"type": "started", "message": "Starting business-first discovery..."}
@@ -199,13 +345,26 @@ class DiscoveryOrchestrator:
                     job_id, user_id, area_polygon, filters, db,
                     tiers=tiers, business_type_ids=business_type_ids, scoring_prompt=scoring_prompt,
                 )
-                yield {"type": "complete", "message": "Discovery complete!"}
+                yield {"type": "complete", "message": "Discovery complete!", "timings": self._stage_timer(job_key).summary()}
+        except GeneratorExit:
+            # Consumer stopped reading between events (e.g. the client disconnected)
+            self._mark_cancelled(job_key)
+            raise
+        except asyncio.CancelledError:
+            self._mark_cancelled(job_key)
+            if not fired(watcher):
+                raise  # Consumer cancelled - nobody left to tell
+            resume_after_cancel()
+            yield {"type": "cancelled", "message": "Discovery cancelled", "result": self._jobs[job_key].get("result")}
         except Exception as e:
             logger.error(f"Discovery pipeline failed: {e}")
             import traceback
             traceback.print_exc()
             self._update_job(job_key, DiscoveryStep.FAILED, error=str(e))
             yield {"type": "error", "message": f"Discovery failed: {str(e)}"}
+        finally:
+            watcher.cancel()
+            self._finish_job(job_key)
     
     async def _stream_regrid_first_pipeline(
         self,
@@ -223,11 +382,11 @@ class DiscoveryOrchestrator:
         Streaming version of Regrid-First Discovery Pipeline.
         Yields progress messages for real-time UI updates.
         """
-        from app.schemas.discovery import PROPERTY_CATEGORY_LBCS_RANGES, PropertyCategoryEnum, PROPERTY_CATEGORY_LBCS_CONFIG
-        from app.core.property_classifier import classify_property, PropertyCategory
+        from app.schemas.discovery import PropertyCategoryEnum, PROPERTY_CATEGORY_LBCS_CONFIG
         
         job_key = str(job_id)
         start_time = datetime.utcnow()
+        timer = self._stage_timer(job_key)
         
         # Format category names for display
         category_display = ", ".join([c.replace("_", " ").title() for c in (property_categories or ["multi_family"])])
@@ -273,21 +432,12 @@ class DiscoveryOrchestrator:
             self._update_job(job_key, DiscoveryStep.FAILED, error="No valid property categories")
             return
         
-        # Extract geographic filters
-        zip_code = None
-        state_code = None
-        county_fips = None
-        location_desc = "selected area"
-        
-        if area_polygon and area_polygon.get("properties"):
-            props = area_polygon["properties"]
-            zip_code = props.get("zip_code")
-            state_code = props.get("state")
-            county_fips = props.get("county_fips")
-            if zip_code:
-                location_desc = f"ZIP {zip_code}"
-            elif state_code:
-                location_desc = state_code
+        # Extract geographic filters (narrowed to the smallest valid geography)
+        scope = await self._resolve_search_scope(area_polygon)
+        zip_code = scope.zip_code
+        state_code = scope.state_code
+        county_fips = scope.county_fips
+        location_desc = scope.describe()
         
         # ============ Step 2: Query Regrid with Pagination ============
         msg = {
@@ -301,26 +451,19 @@ class DiscoveryOrchestrator:
         
         self._update_job(job_key, DiscoveryStep.QUERYING_REGRID)
         
-        # Get existing parcel IDs to filter out
-        existing_regrid_ids = set(
-            row[0] for row in db.query(Property.regrid_id).filter(
-                Property.user_id == user_id,
-                Property.regrid_id.isnot(None)
-            ).all()
-        )
-        
-        # Pagination loop - keep fetching until we have enough NEW parcels
+        # Pagination loop - keep fetching until the candidate pool is full
+        # (ranked value-first below; the best max_lots are processed)
         batch_size = max(filters.max_lots * 2, 20)  # Fetch more per batch
         max_pages = 10  # Safety limit to prevent infinite loops
+        pool_size = filters.max_lots * max(1, settings.DISCOVERY_CANDIDATE_POOL_FACTOR)
         current_offset = 0
         new_parcels = []
         seen_parcel_ids = set()
         total_fetched = 0
         total_skipped = 0
-        exhausted_regrid = False
         
         for page in range(max_pages):
-            if len(new_parcels) >= filters.max_lots:
+            if len(new_parcels) >= pool_size:
                 break
             
             # Fetch next batch from each LBCS field
@@ -329,7 +472,7 @@ class DiscoveryOrchestrator:
                 if len(batch_parcels) >= batch_size:
                     break
                 
-                field_parcels = await regrid_service.search_parcels_by_lbcs(
+                field_parcels = await timer.timed("regrid_query", regrid_service.search_parcels_by_lbcs(
                     lbcs_ranges=ranges,
                     county_fips=county_fips,
                     state_code=state_code,
@@ -339,7 +482,7 @@ class DiscoveryOrchestrator:
                     min_acres=min_acres,
                     max_acres=max_acres,
                     offset=current_offset,
-                )
+                ))
                 
                 for parcel in field_parcels:
                     if parcel.parcel_id not in seen_parcel_ids:
@@ -348,17 +491,17 @@ class DiscoveryOrchestrator:
             
             if not batch_parcels:
                 # No more results from Regrid
-                exhausted_regrid = True
                 logger.info(f"[Stream] Regrid exhausted after {total_fetched} parcels")
                 break
             
             total_fetched += len(batch_parcels)
             
-            # Filter out existing parcels
+            # Filter out existing parcels (one anti-join per page)
+            unseen_ids = set(new_regrid_ids(db, user_id, [p.parcel_id for p in batch_parcels]))
             for parcel in batch_parcels:
-                if parcel.parcel_id not in existing_regrid_ids:
+                if parcel.parcel_id in unseen_ids:
                     new_parcels.append(parcel)
-                    if len(new_parcels) >= filters.max_lots:
+                    if len(new_parcels) >= pool_size:
                         break
                 else:
                     total_skipped += 1
@@ -397,18 +540,19 @@ class DiscoveryOrchestrator:
                     usedesc_patterns.extend(["warehouse", "industrial"])
             
             if usedesc_patterns:
-                fallback_parcels = await regrid_service.search_parcels_by_usedesc(
+                fallback_parcels = await timer.timed("regrid_query", regrid_service.search_parcels_by_usedesc(
                     patterns=usedesc_patterns,
                     county_fips=county_fips,
                     state_code=state_code,
                     zip_code=zip_code,
                     max_results=filters.max_lots * 2,
-                )
+                ))
                 # Filter fallback results too
+                unseen_ids = set(new_regrid_ids(db, user_id, [p.parcel_id for p in fallback_parcels]))
                 for parcel in fallback_parcels:
-                    if parcel.parcel_id not in existing_regrid_ids:
+                    if parcel.parcel_id in unseen_ids:
                         new_parcels.append(parcel)
-                        if len(new_parcels) >= filters.max_lots:
+                        if len(new_parcels) >= pool_size:
                             break
         
         # Check final results
@@ -418,22 +562,24 @@ class DiscoveryOrchestrator:
                 msg = {
                     "type": "complete",
                     "message": f"All {total_fetched} matching properties already processed",
-                    "stats": {"found": total_fetched, "new": 0, "skipped": total_skipped}
+                    "stats": {"found": total_fetched, "new": 0, "skipped": total_skipped},
+                    "timings": timer.summary(),
                 }
             else:
                 msg = {
                     "type": "complete",
                     "message": "No properties found matching criteria",
-                    "stats": {"found": 0, "processed": 0, "enriched": 0}
+                    "stats": {"found": 0, "processed": 0, "enriched": 0},
+                    "timings": timer.summary(),
                 }
             logger.info(f"[Stream] Sending: {msg['type']} - {msg['message']}")
             yield msg
             self._update_job(job_key, DiscoveryStep.COMPLETED)
             return
         
-        # Trim to max_lots if we got more
-        if len(new_parcels) > filters.max_lots:
-            new_parcels = new_parcels[:filters.max_lots]
+        # Value-first: rank the pool and process the best max_lots, best first
+        ranked = _with_boundary(rank_parcels(new_parcels), filters.max_lots)
+        new_parcels = [candidate.parcel for candidate in ranked]
         
         msg = {
             "type": "found",
@@ -461,236 +607,240 @@ class DiscoveryOrchestrator:
         analyzed_count = 0
         enriched_count = 0
         vlm_total_cost = 0.0
+        writes = self._property_writer(job_key, db)
+        claimed: Dict[str, UUID] = {}
+        categories: Dict[str, str] = {candidate.parcel.parcel_id: candidate.category for candidate in ranked}
         
-        for idx, parcel in enumerate(new_parcels):
-            try:
-                processed_count += 1
-                short_address = (parcel.address or "Unknown")[:35]
-                
-                yield {
-                    "type": "processing",
-                    "message": f"Processing: {short_address}",
-                    "current": idx + 1,
-                    "total": len(new_parcels),
-                    "address": parcel.address,
-                    "owner": parcel.owner
-                }
-                await asyncio.sleep(0.05)
-                
-                centroid = parcel.centroid
-                
-                # Create property record
-                db_property = Property(
-                    user_id=user_id,
-                    centroid=from_shape(centroid, srid=4326),
-                    address=parcel.address,
-                    discovery_source="regrid_first",
-                    status="discovered",
-                )
-                db.add(db_property)
-                db.flush()
-                property_ids.append(db_property.id)
-                
-                # Store Regrid data
-                db_property.regrid_id = parcel.parcel_id
-                db_property.regrid_apn = parcel.apn
-                db_property.regrid_owner = parcel.owner
-                db_property.regrid_owner2 = parcel.owner2
-                db_property.regrid_owner_type = parcel.owner_type
-                db_property.regrid_owner_address = parcel.mail_address
-                db_property.regrid_owner_city = parcel.mail_city
-                db_property.regrid_owner_state = parcel.mail_state
-                db_property.regrid_land_use = parcel.land_use
-                db_property.regrid_zoning = parcel.zoning
-                db_property.regrid_zoning_desc = parcel.zoning_description
-                db_property.regrid_year_built = str(parcel.year_built) if parcel.year_built else None
-                db_property.regrid_area_acres = parcel.area_acres
-                db_property.regrid_num_units = parcel.num_units
-                db_property.regrid_num_stories = parcel.num_stories
-                db_property.regrid_struct_style = parcel.struct_style
-                db_property.lbcs_structure = parcel.lbcs_structure
-                db_property.lbcs_structure_desc = parcel.lbcs_structure_desc
-                db_property.lbcs_activity = parcel.lbcs_activity
-                db_property.lbcs_function = parcel.lbcs_function
-                db_property.lbcs_ownership = parcel.lbcs_ownership
-                db_property.lbcs_site = parcel.lbcs_site
-                
-                # Classify property
-                classification = classify_property(
-                    usecode=parcel.land_use or "",
-                    usedesc=parcel.land_use or "",  # land_use contains usedesc
-                    zoning=parcel.zoning or "",
-                    lbcs_structure=parcel.lbcs_structure,
-                    lbcs_activity=parcel.lbcs_activity,
-                )
-                db_property.property_category = classification.value
-                
-                # Store polygon if available
-                if parcel.polygon:
+        try:
+            for idx, parcel in enumerate(new_parcels):
+                if idx % writes.batch_size == 0:
+                    # Claim the next batch of parcels in one INSERT (ON CONFLICT DO NOTHING -
+                    # a concurrent job may own some), with their Regrid data and classification
+                    rows = []
+                    for batch_parcel in new_parcels[idx:idx + writes.batch_size]:
+                        # Classified when ranked
+                        rows.append({
+                            "user_id": user_id,
+                            "centroid": from_shape(batch_parcel.centroid, srid=4326),
+                            "address": batch_parcel.address,
+                            "discovery_source": "regrid_first",
+                            "status": "discovered",
+                            "property_category": categories[batch_parcel.parcel_id],
+                            **self._regrid_parcel_values(batch_parcel),
+                        })
                     try:
-                        db_property.regrid_polygon = from_shape(parcel.polygon, srid=4326)
-                    except Exception:
-                        pass
-                
-                # Fetch satellite imagery
-                yield {
-                    "type": "imagery",
-                    "message": "Capturing satellite view...",
-                    "current": idx + 1,
-                    "total": len(new_parcels)
-                }
-                await asyncio.sleep(0.05)
+                        claimed.update(claim_parcel_properties(db, rows))
+                        db.commit()
+                    except Exception as e:
+                        logger.error(f"Error claiming parcels: {e}")
+                        db.rollback()
                 
                 try:
-                    imagery_result = await property_imagery_pipeline.get_property_image(
-                        lat=centroid.y,
-                        lng=centroid.x,
-                        address=parcel.address,
-                    )
+                    processed_count += 1
+                    short_address = (parcel.address or "Unknown")[:35]
                     
-                    if imagery_result and imagery_result.success:
-                        # Access metadata dict for zoom and area
-                        metadata = imagery_result.metadata or {}
-                        db_property.satellite_zoom_level = metadata.get("zoom_level", 20)
-                        db_property.satellite_area_m2 = metadata.get("area_m2")
-                        
-                        # Run VLM analysis
-                        yield {
-                            "type": "analyzing",
-                            "message": "AI analyzing property...",
-                            "current": idx + 1,
-                            "total": len(new_parcels)
-                        }
-                        await asyncio.sleep(0.05)
+                    yield {
+                        "type": "processing",
+                        "message": f"Processing: {short_address}",
+                        "current": idx + 1,
+                        "total": len(new_parcels),
+                        "address": parcel.address,
+                        "owner": parcel.owner,
+                        "timings": timer.summary(),
+                    }
+                    await asyncio.sleep(0.05)
+                    
+                    centroid = parcel.centroid
+                    
+                    property_id = claimed.get(parcel.parcel_id)
+                    if property_id is None:
+                        logger.info(f"[Stream] Parcel {parcel.parcel_id} already claimed, skipping")
+                        continue
+                    property_ids.append(property_id)
+                    category = categories[parcel.parcel_id]
+                    
+                    # Column values for this parcel, written with the next batch
+                    values: Dict[str, Any] = {}
+                    
+                    # Fetch satellite imagery
+                    yield {
+                        "type": "imagery",
+                        "message": "Capturing satellite view...",
+                        "current": idx + 1,
+                        "total": len(new_parcels)
+                    }
+                    await asyncio.sleep(0.05)
+                    
+                    try:
+                        imagery_result = await timer.timed("imagery", property_imagery_pipeline.get_property_image(
+                            lat=centroid.y,
+                            lng=centroid.x,
+                            address=parcel.address,
+                        ))
                         
-                        image_base64 = imagery_result.image_base64
-                        if image_base64:
-                            property_context = {
-                                "address": parcel.address,
-                                "area_sqft": (parcel.area_acres or 0) * 43560,
-                                "property_type": classification.value,
-                                "owner": parcel.owner,
-                            }
+                        if imagery_result and imagery_result.success:
+                            # Access metadata dict for zoom and area
+                            metadata = imagery_result.metadata or {}
+                            values["satellite_zoom_level"] = metadata.get("zoom_level", 20)
+                            values["satellite_area_m2"] = metadata.get("area_m2")
                             
-                            vlm_result = await vlm_analysis_service.analyze_property(
-                                image_base64=image_base64,
-                                property_context=property_context,
-                                scoring_prompt=scoring_prompt,
-                                user_api_key=user_api_key,
-                            )
+                            # Run VLM analysis
+                            yield {
+                                "type": "analyzing",
+                                "message": "AI analyzing property...",
+                                "current": idx + 1,
+                                "total": len(new_parcels)
+                            }
+                            await asyncio.sleep(0.05)
                             
-                            if vlm_result and vlm_result.success:
-                                db_property.lead_score = vlm_result.lead_score
-                                db_property.lead_confidence = vlm_result.confidence
-                                db_property.analysis_notes = vlm_result.reasoning
-                                db_property.lead_quality = (
-                                    'high' if vlm_result.lead_score >= 70
-                                    else 'medium' if vlm_result.lead_score >= 40
-                                    else 'low'
-                                )
-                                db_property.analyzed_at = datetime.utcnow()
-                                db_property.status = "analyzed"
-                                if vlm_result.usage:
-                                    vlm_total_cost += vlm_result.usage.cost
-                                analyzed_count += 1
-                                
-                                score = vlm_result.lead_score or 0
-                                score_label = "High" if score >= 70 else "Medium" if score >= 40 else "Low"
-                                
-                                yield {
-                                    "type": "scoring",
-                                    "message": f"Lead score: {score}/100 ({score_label})",
-                                    "score": score,
-                                    "current": idx + 1,
-                                    "total": len(new_parcels)
+                            image_base64 = imagery_result.image_base64
+                            if image_base64:
+                                property_context = {
+                                    "address": parcel.address,
+                                    "area_sqft": (parcel.area_acres or 0) * 43560,
+                                    "property_type": category,
+                                    "owner": parcel.owner,
                                 }
-                                await asyncio.sleep(0.05)
                                 
-                                # Enrichment
-                                yield {
-                                    "type": "enriching",
-                                    "message": "Finding property manager...",
-                                    "current": idx + 1,
-                                    "total": len(new_parcels)
-                                }
-                                await asyncio.sleep(0.05)
+                                vlm_result = await timer.timed("vlm", vlm_analysis_service.analyze_property(
+                                    image_base64=image_base64,
+                                    property_context=property_context,
+                                    scoring_prompt=scoring_prompt,
+                                    user_api_key=user_api_key,
+                                ))
                                 
-                                try:
-                                    enrichment_result = await llm_enrichment_service.enrich(
-                                        address=parcel.address or "",
-                                        property_type=classification.value,
-                                        owner_name=parcel.owner,
-                                        lbcs_code=int(parcel.lbcs_structure) if parcel.lbcs_structure else None,
+                                if vlm_result and vlm_result.success:
+                                    values.update(
+                                        lead_score=vlm_result.lead_score,
+                                        lead_confidence=vlm_result.confidence,
+                                        analysis_notes=vlm_result.reasoning,
+                                        lead_quality=(
+                                            'high' if vlm_result.lead_score >= 70
+                                            else 'medium' if vlm_result.lead_score >= 40
+                                            else 'low'
+                                        ),
+                                        analyzed_at=datetime.utcnow(),
+                                        status="analyzed",
                                     )
+                                    if vlm_result.usage:
+                                        vlm_total_cost += vlm_result.usage.cost
+                                    analyzed_count += 1
                                     
-                                    # Store enrichment steps
-                                    import json
-                                    if enrichment_result.detailed_steps:
-                                        db_property.enrichment_steps = json.dumps([
-                                            step.to_dict() for step in enrichment_result.detailed_steps
-                                        ])
+                                    score = vlm_result.lead_score or 0
+                                    score_label = "High" if score >= 70 else "Medium" if score >= 40 else "Low"
                                     
-                                    if enrichment_result.success and enrichment_result.contact:
-                                        contact = enrichment_result.contact
-                                        db_property.contact_name = contact.name
-                                        db_property.contact_first_name = contact.first_name
-                                        db_property.contact_last_name = contact.last_name
-                                        db_property.contact_email = contact.email
-                                        db_property.contact_phone = contact.phone
-                                        db_property.contact_title = contact.title
-                                        db_property.contact_company = enrichment_result.management_company
-                                        db_property.contact_company_website = enrichment_result.management_website
-                                        db_property.enrichment_source = "llm_enrichment"
-                                        db_property.enrichment_status = "success"
-                                        db_property.enriched_at = datetime.utcnow()
-                                        enriched_count += 1
+                                    yield {
+                                        "type": "scoring",
+                                        "message": f"Lead score: {score}/100 ({score_label})",
+                                        "score": score,
+                                        "current": idx + 1,
+                                        "total": len(new_parcels)
+                                    }
+                                    await asyncio.sleep(0.05)
+                                    
+                                    # Enrichment
+                                    yield {
+                                        "type": "enriching",
+                                        "message": "Finding property manager...",
+                                        "current": idx + 1,
+                                        "total": len(new_parcels)
+                                    }
+                                    await asyncio.sleep(0.05)
+                                    
+                                    try:
+                                        enrichment_result = await timer.timed("enrichment", llm_enrichment_service.enrich(
+                                            address=parcel.address or "",
+                                            property_type=category,
+                                            owner_name=parcel.owner,
+                                            lbcs_code=int(parcel.lbcs_structure) if parcel.lbcs_structure else None,
+                                        ))
                                         
-                                        phone_display = contact.phone[:15] + "..." if contact.phone and len(contact.phone) > 15 else contact.phone
-                                        contact_msg = f"Contact found: {phone_display or contact.email or enrichment_result.management_company}"
-                                        logger.info(f"[Stream] Sending: contact_found - {contact_msg}")
-                                        yield {
-                                            "type": "contact_found",
-                                            "message": contact_msg,
-                                            "phone": contact.phone,
-                                            "email": contact.email,
-                                            "company": enrichment_result.management_company,
-                                            "current": idx + 1,
-                                            "total": len(new_parcels)
-                                        }
-                                        await asyncio.sleep(0.05)
-                                    else:
-                                        db_property.enrichment_status = "not_found"
-                                        logger.info(f"[Stream] Sending: progress - No contact info found for {parcel.address}")
-                                        yield {
-                                            "type": "progress",
-                                            "message": "No contact info found",
-                                            "current": idx + 1,
-                                            "total": len(new_parcels)
-                                        }
-                                        await asyncio.sleep(0.05)
+                                        # Store enrichment steps
+                                        import json
+                                        if enrichment_result.detailed_steps:
+                                            values["enrichment_steps"] = json.dumps([
+                                                step.to_dict() for step in enrichment_result.detailed_steps
+                                            ])
                                         
-                                except Exception as enrich_err:
-                                    logger.warning(f"Enrichment error: {enrich_err}")
-                                    db_property.enrichment_status = "error"
-                                
-                except Exception as img_err:
-                    logger.warning(f"Imagery/VLM error: {img_err}")
-                    db_property.status = "imagery_failed"
-                
-                db.commit()
-                
-            except Exception as e:
-                logger.error(f"Error processing parcel: {e}")
-                db.rollback()
-                continue
+                                        if enrichment_result.success and enrichment_result.contact:
+                                            contact = enrichment_result.contact
+                                            values.update(
+                                                contact_name=contact.name,
+                                                contact_first_name=contact.first_name,
+                                                contact_last_name=contact.last_name,
+                                                contact_email=contact.email,
+                                                contact_phone=contact.phone,
+                                                contact_title=contact.title,
+                                                contact_company=enrichment_result.management_company,
+                                                contact_company_website=enrichment_result.management_website,
+                                                enrichment_source="llm_enrichment",
+                                                enrichment_status="success",
+                                                enriched_at=datetime.utcnow(),
+                                            )
+                                            enriched_count += 1
+                                            
+                                            phone_display = contact.phone[:15] + "..." if contact.phone and len(contact.phone) > 15 else contact.phone
+                                            contact_msg = f"Contact found: {phone_display or contact.email or enrichment_result.management_company}"
+                                            logger.info(f"[Stream] Sending: contact_found - {contact_msg}")
+                                            yield {
+                                                "type": "contact_found",
+                                                "message": contact_msg,
+                                                "phone": contact.phone,
+                                                "email": contact.email,
+                                                "company": enrichment_result.management_company,
+                                                "current": idx + 1,
+                                                "total": len(new_parcels)
+                                            }
+                                            await asyncio.sleep(0.05)
+                                        else:
+                                            values["enrichment_status"] = "not_found"
+                                            logger.info(f"[Stream] Sending: progress - No contact info found for {parcel.address}")
+                                            yield {
+                                                "type": "progress",
+                                                "message": "No contact info found",
+                                                "current": idx + 1,
+                                                "total": len(new_parcels)
+                                            }
+                                            await asyncio.sleep(0.05)
+                                            
+                                    except Exception as enrich_err:
+                                        logger.warning(f"Enrichment error: {enrich_err}")
+                                        values["enrichment_status"] = "error"
+                                    
+                    except Exception as img_err:
+                        logger.warning(f"Imagery/VLM error: {img_err}")
+                        values["status"] = "imagery_failed"
+                    
+                    if values:
+                        writes.update(property_id, values)
+                    
+                except Exception as e:
+                    logger.error(f"Error processing parcel: {e}")
+                    db.rollback()
+                    continue
+        except (asyncio.CancelledError, GeneratorExit):
+            # Job cancelled or the client went away - report what it got to
+            self._keep_partial_result(job_key, {
+                "property_ids": [str(pid) for pid in property_ids],
+                "analyzed": analyzed_count,
+                "enriched": enriched_count,
+                "vlm_total_cost": round(vlm_total_cost, 4),
+            })
+            raise
+        finally:
+            writes.close()
         
         # ============ Complete ============
         duration = (datetime.utcnow() - start_time).total_seconds()
         
-        self._update_job(job_key, DiscoveryStep.COMPLETED)
         self._jobs[job_key]["progress"].parking_lots_found = processed_count
         self._jobs[job_key]["progress"].parking_lots_evaluated = analyzed_count
-        self._jobs[job_key]["completed_at"] = datetime.utcnow()
+        self._update_job(job_key, DiscoveryStep.COMPLETED, result={
+            "property_ids": [str(pid) for pid in property_ids],
+            "analyzed": analyzed_count,
+            "enriched": enriched_count,
+            "vlm_total_cost": round(vlm_total_cost, 4),
+        })
         
         # Log usage
         usage_tracking_service.log_discovery_job(
@@ -713,7 +863,8 @@ class DiscoveryOrchestrator:
                 "enriched": enriched_count,
                 "duration": f"{duration:.1f}s",
                 "cost": f"${vlm_total_cost:.4f}"
-            }
+            },
+            "timings": timer.summary(),
         }
         logger.info(f"[Stream] Sending: complete - {processed_count} found, {analyzed_count} analyzed, {enriched_count} enriched")
         yield complete_msg
@@ -745,6 +896,7 @@ class DiscoveryOrchestrator:
         """
         job_key = str(job_id)
         start_time = datetime.utcnow()
+        timer = self._stage_timer(job_key)
         
         # Get user to check for their own API key
         from app.models.user import User
@@ -785,9 +937,7 @@ class DiscoveryOrchestrator:
         bounds = poly.bounds  # (minx, miny, maxx, maxy)
         
         # Calculate search radius from bounds
-        lat_range = bounds[3] - bounds[1]
-        lng_range = bounds[2] - bounds[0]
-        radius_meters = int(max(lat_range, lng_range) * 111000 / 2 * 1.2)
+        radius_meters = int(bounds_radius_m(bounds) * 1.2)
         radius_meters = min(radius_meters, 50000)  # Cap at 50km
         
         # ============ Step 1: Discover businesses by type ============
@@ -796,43 +946,47 @@ class DiscoveryOrchestrator:
         self._update_job(job_key, DiscoveryStep.LOADING_BUSINESSES)
         
         # SMART FETCHING: Keep fetching until we have enough NEW businesses
-        # Google Places allows up to 60 results per query (3 pages x 20 each)
-        # If no new businesses found, expand the search radius
-        max_fetch_attempts = 3
+        # Google Places allows up to 60 results per query (3 pages x 20 each),
+        # and the same query always returns the same places - so each radius is
+        # searched once. The area and its expansions (radius x1.5, up to three
+        # times) are independent searches: they run concurrently and are taken
+        # nearest first; the wider ones are cancelled once there are enough.
         max_radius_expansions = 3  # How many times to expand radius
         fetch_batch_size = max(30, filters.max_lots * 3)  # Fetch 3x what we need per batch
         
+        radii = []
+        current_radius = radius_meters
+        for _ in range(max_radius_expansions + 1):
+            if current_radius not in radii:
+                radii.append(current_radius)
+            current_radius = min(int(current_radius * 1.5), 50000)  # Cap at 50km
+        
+        searches = [
+            asyncio.ensure_future(timer.timed("places_search", business_first_discovery_service.discover_businesses(
+                center_lat=centroid.y,
+                center_lng=centroid.x,
+                radius_meters=radius,
+                tiers=tier_enums,
+                business_type_ids=business_type_ids,
+                max_per_tier=max(20, fetch_batch_size // 2),  # More per tier for pagination
+                max_total=fetch_batch_size,
+            )))
+            for radius in radii
+        ]
+        
         discovered_businesses = []
         total_skipped = 0
         all_seen_place_ids = set()
-        current_radius = radius_meters
         
-        for radius_expansion in range(max_radius_expansions + 1):
-            if len(discovered_businesses) >= filters.max_lots:
-                break
-            
-            if radius_expansion > 0:
-                # Expand radius by 50% each time
-                current_radius = int(current_radius * 1.5)
-                current_radius = min(current_radius, 50000)  # Cap at 50km
-                logger.info(f"   🔄 Expanding search radius to {current_radius/1000:.1f}km")
-            
-            found_new_in_radius = False
-            
-            for attempt in range(max_fetch_attempts):
+        try:
+            for radius, search in zip(radii, searches):
                 if len(discovered_businesses) >= filters.max_lots:
                     break
                 
-                # Fetch a batch of businesses
-                batch = await business_first_discovery_service.discover_businesses(
-            center_lat=centroid.y,
-            center_lng=centroid.x,
-                    radius_meters=current_radius,
-            tiers=tier_enums,
-            business_type_ids=business_type_ids,
-                    max_per_tier=max(20, fetch_batch_size // 2),  # More per tier for pagination
-                    max_total=fetch_batch_size,
-                )
+                if radius != radius_meters:
+                    logger.info(f"   🔄 Expanding search radius to {radius/1000:.1f}km")
+                
+                batch = await search
                 
                 # Check for new businesses we haven't seen in this session
                 new_in_batch = [b for b in batch if b.places_id not in all_seen_place_ids]
@@ -840,8 +994,8 @@ class DiscoveryOrchestrator:
                     all_seen_place_ids.add(b.places_id)
                 
                 if not new_in_batch:
-                    logger.info(f"   📭 No more businesses in area (radius: {current_radius/1000:.1f}km)")
-                    break
+                    logger.info(f"   📭 No more businesses in area (radius: {radius/1000:.1f}km)")
+                    continue
                 
                 # Check which ones are already processed in DB
                 already_processed = self._get_already_processed_places_ids(
@@ -855,27 +1009,17 @@ class DiscoveryOrchestrator:
                 total_skipped += batch_skipped
                 
                 # Add new businesses to our result list
-                for business in new_businesses:
-                    if len(discovered_businesses) >= filters.max_lots:
-                        break
-                    discovered_businesses.append(business)
-                    found_new_in_radius = True
+                discovered_businesses.extend(new_businesses[:filters.max_lots - len(discovered_businesses)])
                 
-                logger.info(f"   📥 Batch {attempt + 1}: {len(new_in_batch)} found, {len(new_businesses)} new, {batch_skipped} skipped")
-                
-                # If we got less than expected, we've likely exhausted results at this radius
-                if len(new_in_batch) < fetch_batch_size // 2:
-                    break
-            
-            # If we found new businesses at this radius, don't expand further unless needed
-            if found_new_in_radius and len(discovered_businesses) >= filters.max_lots:
-                break
-            
-            # If no new businesses found at current radius, try expanding
-            if not found_new_in_radius and radius_expansion < max_radius_expansions:
-                continue
-            elif not found_new_in_radius:
-                logger.info(f"   ⚠️ No new businesses found even after expanding radius to {current_radius/1000:.1f}km")
+                logger.info(f"   📥 Radius {radius/1000:.1f}km: {len(new_in_batch)} found, {len(new_businesses)} new, {batch_skipped} skipped")
+        finally:
+            # Enough businesses (or the job failed) - stop the wider searches
+            for search in searches:
+                search.cancel()
+        
+        if len(discovered_businesses) < filters.max_lots:
+            logger.info(f"   ⚠️ Only {len(discovered_businesses)} new businesses found even after expanding radius to {radii[-1]/1000:.1f}km")
+        
         
         skipped_count = total_skipped
         
@@ -902,7 +1046,7 @@ class DiscoveryOrchestrator:
                 logger.warning(f"   ⚠️  All {skipped_count} businesses in this area already processed")
                 logger.info(f"   💡 Tip: Try a different area or expand the search radius")
             else:
-            logger.warning("   ⚠️  No businesses found in area")
+                logger.warning("   ⚠️  No businesses found in area")
             self._update_job(job_key, DiscoveryStep.COMPLETED)
             return
         
@@ -917,332 +1061,315 @@ class DiscoveryOrchestrator:
         vlm_total_cost = 0.0  # Actual cost from OpenRouter
         parking_lot_ids: List[UUID] = []
         
-        for idx, business in enumerate(discovered_businesses):
-            try:
-                logger.info(f"   [{idx+1}/{len(discovered_businesses)}] {business.name} ({business.tier.value})")
-                
-                # Save business to database
-                existing_business = db.query(Business).filter(
-                    Business.places_id == business.places_id
-                ).first()
-                
-                if existing_business:
-                    db_business = existing_business
-                    # Update contact info if we have new data
-                    if business.phone and not existing_business.phone:
-                        existing_business.phone = business.phone
-                    if business.website and not existing_business.website:
-                        existing_business.website = business.website
-                else:
-                    db_business = Business(
-                        user_id=user_id,
-                        places_id=business.places_id,
-                        name=business.name,
-                        address=business.address,
-                        phone=business.phone,
-                        website=business.website,
-                        category=business.business_type,
-                        business_type=business.tier.value,
-                        location=from_shape(business.location, srid=4326),
-                        raw_data=business.raw_data,
-                    )
-                    db.add(db_business)
-                    db.flush()
-                
-                # Check if parking lot already exists for this business
-                existing_lot = None
-                if existing_business:
-                    # Check for existing parking lot via association
-                    existing_assoc = db.query(PropertyBusiness).filter(
-                        PropertyBusiness.business_id == db_business.id,
-                        PropertyBusiness.is_primary == True
-                    ).first()
-                    if existing_assoc:
-                        existing_lot = db.query(Property).filter(
-                            Property.id == existing_assoc.parking_lot_id
-                        ).first()
-                
-                if existing_lot:
-                    # Use existing parking lot, skip re-analysis
-                    db_property = existing_lot
-                    logger.info(f"      ♻️  Using existing parking lot (already analyzed)")
-                    parking_lot_ids.append(db_property.id)
-                    
-                    # Skip to next business if already evaluated
-                    if db_property.status == "analyzed":
-                        logger.info(f"      ✅ Already evaluated, skipping")
-                        continue
-                else:
-                    # Create placeholder parking lot (actual area will come from SAM analysis)
-                    from shapely.geometry import Point
-                    business_point = Point(business.longitude, business.latitude)
-                    
-                    db_property = Property(
-                        user_id=user_id,
-                        centroid=from_shape(business_point, srid=4326),
-                        address=business.address,
-                        business_type_tier=business.tier.value,
-                        discovery_source="business_first",
-                        status="discovered",
-                    )
-                    db.add(db_property)
-                    db.flush()
-                    
-                    parking_lot_ids.append(db_property.id)
-                    
-                    # Create association
-                    association = PropertyBusiness(
-                        property_id=db_property.id,
-                        business_id=db_business.id,
-                        match_score=95.0,  # High score since we found business first
-                        distance_meters=0,  # Property is for this business
-                        is_primary=True,
-                        relationship_type="tenant",
-                    )
-                    db.add(association)
-                    db.flush()
-                
-                processed_count += 1
-                
-                # ============ Step 1: Get Property Boundary from Regrid ============
-                # Use ADDRESS-based lookup (more accurate than point lookup)
-                logger.info(f"      🗺️  Fetching property boundary from Regrid by ADDRESS...")
-                
-                property_boundary = None
-                regrid_parcel = None
-                
-                try:
-                    # Use validated parcel lookup (point-in-polygon validation)
-                    regrid_parcel = await regrid_service.get_validated_parcel(
-                        lat=business.latitude,
-                        lng=business.longitude,
-                        address=business.address
-                    )
+        # Businesses that resolve to the same parcel (a shopping center's
+        # tenants) share one lead instead of each getting imagery, VLM and
+        # enrichment: regrid parcel id -> property analyzing it
+        parcel_properties: Dict[str, UUID] = {}
+        placeholder_ids: Set[UUID] = set()  # Placeholders created by this run
+        merged_ids: Set[UUID] = set()  # Placeholders folded into another business's property
+        
+        writes = self._property_writer(job_key, db)
+        
+        async def stored_items() -> AsyncIterator[_LeadItem]:
+            """
+            Store businesses, their placeholder properties and associations a
+            batch at a time (a few bulk statements per batch) as the pipeline pulls them.
+            """
+            nonlocal processed_count
+            for start in range(0, len(discovered_businesses), writes.batch_size):
+                batch = discovered_businesses[start:start + writes.batch_size]
+                
+                # Save businesses (existing ones only get missing contact info filled in)
+                business_ids = upsert_businesses(db, [
+                    {
+                        "user_id": user_id,
+                        "places_id": business.places_id,
+                        "name": business.name,
+                        "address": business.address,
+                        "phone": business.phone,
+                        "website": business.website,
+                        "category": business.business_type,
+                        "business_type": business.tier.value,
+                        "location": from_shape(business.location, srid=4326),
+                        "raw_data": business.raw_data,
+                    }
+                    for business in batch
+                ])
+                
+                # Parking lots that already exist for these businesses (via primary association)
+                existing_lots = primary_properties(db, list(business_ids.values()))
+                
+                items = []
+                new_properties = []
+                associations = []
+                for offset, business in enumerate(batch):
+                    business_id = business_ids[business.places_id]
+                    item = _LeadItem(index=start + offset, business=business, business_id=business_id)
                     
-                    if regrid_parcel and regrid_parcel.has_valid_geometry:
-                        property_boundary = regrid_parcel.polygon
-                        logger.info(f"      ✅ Got Regrid boundary: {regrid_parcel.area_m2:,.0f} m²")
-                        logger.info(f"         Owner: {regrid_parcel.owner}")
-                        logger.info(f"         Regrid Address: {regrid_parcel.address}")
-                        logger.info(f"         Business Address: {business.address[:50]}...")
-                    else:
-                        logger.warning(f"      ❌ No Regrid parcel found - SKIPPING (need exact boundary)")
-                except Exception as e:
-                    logger.warning(f"      ❌ Regrid lookup failed: {e} - SKIPPING")
-                
-                # ============ Step 2: REQUIRE Regrid Boundary ============
-                # Without exact property boundary, we can't accurately detect private asphalt
-                if not property_boundary:
-                    logger.warning(f"      ⏭️  Skipping {business.name} - no Regrid coverage in this area")
-                    # Mark as skipped but keep in DB for potential future analysis
-                    db_property.status = "skipped_no_boundary"
-                    db_property.status_error = "Regrid has no parcel data for this location"
-                    db.commit()
-                    continue
-                
-                # ============ Step 3: Get Property Satellite Image ============
-                logger.info(f"      🎯 Fetching property satellite imagery...")
-                
-                imagery_result = await property_imagery_pipeline.get_property_image(
-                    lat=business.latitude,
-                    lng=business.longitude,
-                    address=business.address,
-                    zoom=20,
-                    draw_boundary=True,
-                    save_debug=True,
-                )
-                
-                if imagery_result.success:
-                    # Store Regrid data directly on parking lot
-                    if regrid_parcel:
-                        db_property.regrid_id = regrid_parcel.parcel_id
-                        db_property.regrid_apn = regrid_parcel.apn
-                        db_property.regrid_owner = regrid_parcel.owner
-                        db_property.regrid_owner2 = regrid_parcel.owner2
-                        db_property.regrid_owner_type = regrid_parcel.owner_type
-                        db_property.regrid_owner_address = regrid_parcel.mail_address
-                        db_property.regrid_owner_city = regrid_parcel.mail_city
-                        db_property.regrid_owner_state = regrid_parcel.mail_state
-                        db_property.regrid_land_use = regrid_parcel.land_use
-                        db_property.regrid_zoning = regrid_parcel.zoning
-                        db_property.regrid_zoning_desc = regrid_parcel.zoning_description
-                        db_property.regrid_year_built = str(regrid_parcel.year_built) if regrid_parcel.year_built else None
-                        db_property.regrid_area_acres = regrid_parcel.area_acres
-                        db_property.regrid_num_units = regrid_parcel.num_units
-                        db_property.regrid_num_stories = regrid_parcel.num_stories
-                        db_property.regrid_struct_style = regrid_parcel.struct_style
-                        db_property.regrid_fetched_at = datetime.utcnow()
+                    if business_id in existing_lots:
+                        # Use existing parking lot, skip re-analysis
+                        item.property_id, status = existing_lots[business_id]
+                        parking_lot_ids.append(item.property_id)
+                        logger.info(f"   [{item.index + 1}/{len(discovered_businesses)}] {business.name}: ♻️  Using existing parking lot (already analyzed)")
                         
-                        # Store LBCS codes (Premium tier - standardized classification)
-                        db_property.lbcs_activity = regrid_parcel.lbcs_activity
-                        db_property.lbcs_activity_desc = regrid_parcel.lbcs_activity_desc
-                        db_property.lbcs_function = regrid_parcel.lbcs_function
-                        db_property.lbcs_function_desc = regrid_parcel.lbcs_function_desc
-                        db_property.lbcs_structure = regrid_parcel.lbcs_structure
-                        db_property.lbcs_structure_desc = regrid_parcel.lbcs_structure_desc
-                        db_property.lbcs_site = regrid_parcel.lbcs_site
-                        db_property.lbcs_site_desc = regrid_parcel.lbcs_site_desc
-                        db_property.lbcs_ownership = regrid_parcel.lbcs_ownership
-                        db_property.lbcs_ownership_desc = regrid_parcel.lbcs_ownership_desc
-                        
-                        # Log LBCS codes for debugging
-                        if regrid_parcel.lbcs_structure:
-                            logger.info(f"      🏷️  LBCS Structure: {regrid_parcel.lbcs_structure} ({regrid_parcel.lbcs_structure_desc or 'N/A'})")
-                        if regrid_parcel.num_units:
-                            logger.info(f"      🏢 Units: {regrid_parcel.num_units}")
+                        # Skip to next business if already evaluated
+                        if status == "analyzed":
+                            logger.info(f"      ✅ Already evaluated, skipping")
+                            continue
+                    else:
+                        # Create placeholder parking lot (actual area will come from SAM analysis)
+                        from shapely.geometry import Point
+                        business_point = Point(business.longitude, business.latitude)
                         
-                        # Store polygon as Geography
-                        if regrid_parcel.polygon:
-                            db_property.regrid_polygon = from_shape(regrid_parcel.polygon, srid=4326)
-                    
-                    # Store satellite image (base64 for quick display)
-                    db_property.satellite_image_base64 = imagery_result.image_base64
-                    db_property.satellite_zoom_level = str(imagery_result.metadata.get('zoom', 20))
-                    
-                    # Update parking lot with property area
-                    db_property.area_m2 = imagery_result.area_sqm
-                    db_property.area_sqft = imagery_result.area_sqft
-                    db_property.status = "imagery_captured"
-                    db_property.satellite_fetched_at = datetime.utcnow()
-                    
-                    evaluated_count += 1
-                    
-                    logger.info(f"      ✅ Imagery captured: {imagery_result.image_size[0]}x{imagery_result.image_size[1]} px")
-                    logger.info(f"         Property area: {imagery_result.area_sqft:,.0f} sqft")
-                    logger.info(f"         Regrid owner: {regrid_parcel.owner if regrid_parcel else 'N/A'}")
-                    logger.info(f"         Land use: {regrid_parcel.land_use if regrid_parcel else 'N/A'}")
-                    
-                    # ============ Step 4: VLM Analysis for Lead Scoring ============
-                    logger.info(f"      🤖 Running VLM analysis for lead scoring...")
-                    
-                    vlm_result = await vlm_analysis_service.analyze_property(
-                        image_base64=imagery_result.image_base64,
-                        scoring_prompt=scoring_prompt,
-                        property_context={
+                        item.property_id = uuid4()
+                        placeholder_ids.add(item.property_id)
+                        new_properties.append({
+                            "id": item.property_id,
+                            "user_id": user_id,
+                            "centroid": from_shape(business_point, srid=4326),
                             "address": business.address,
-                            "owner": regrid_parcel.owner if regrid_parcel else None,
-                            "land_use": regrid_parcel.land_use if regrid_parcel else None,
-                            "area_acres": regrid_parcel.area_acres if regrid_parcel else None,
-                            "business_name": business.name,
-                            "business_type": business.tier.value,
-                        },
-                        user_api_key=user_openrouter_key,  # Use user's key if enabled
-                    )
-                    
-                    if vlm_result.success:
-                        # Store VLM results
-                        db_property.lead_score = vlm_result.lead_score
-                        db_property.lead_quality = (
-                            'high' if vlm_result.lead_score >= 70 
-                            else 'medium' if vlm_result.lead_score >= 40 
-                            else 'low'
-                        )
-                        db_property.analysis_notes = vlm_result.reasoning
-                        db_property.analyzed_at = datetime.utcnow()
-                        db_property.status = "analyzed"
-                        
-                        # Store surface breakdown if available
-                        if vlm_result.observations:
-                            db_property.paved_percentage = vlm_result.observations.paved_area_pct
-                            db_property.building_percentage = vlm_result.observations.building_pct
-                            db_property.landscaping_percentage = vlm_result.observations.landscaping_pct
-                            db_property.asphalt_condition_score = (
-                                90 if vlm_result.observations.condition == 'critical' else
-                                70 if vlm_result.observations.condition == 'poor' else
-                                50 if vlm_result.observations.condition == 'fair' else
-                                30 if vlm_result.observations.condition == 'good' else
-                                10  # excellent
-                            )
-                        
-                        vlm_analyzed_count += 1
-                        if vlm_result.usage:
-                            vlm_total_cost += vlm_result.usage.cost
-                        logger.info(f"      🎯 VLM Score: {vlm_result.lead_score}/100 ({db_property.lead_quality})")
-                        logger.info(f"         Confidence: {vlm_result.confidence}%")
-                        logger.info(f"         Reasoning: {vlm_result.reasoning[:100]}...")
-                        if vlm_result.observations:
-                            logger.info(f"         Paved: {vlm_result.observations.paved_area_pct}% | Buildings: {vlm_result.observations.building_pct}%")
-                            if vlm_result.observations.visible_issues:
-                                logger.info(f"         Issues: {', '.join(vlm_result.observations.visible_issues[:3])}")
-                        
-                        # ============ Step 5: LLM-Powered Lead Enrichment ============
-                        # Use LLM to intelligently find Property Manager contact data
-                        logger.info(f"      📇 LLM-powered enrichment to find Property Manager...")
-                        
-                        # Determine property type from LBCS or business type
-                        prop_type = business.tier.value
-                        if regrid_parcel and regrid_parcel.lbcs_structure:
-                            if 1200 <= regrid_parcel.lbcs_structure < 1300:
-                                prop_type = "multi_family"
-                            elif 2100 <= regrid_parcel.lbcs_structure < 2200:
-                                prop_type = "office"
-                            elif 2200 <= regrid_parcel.lbcs_structure < 2300:
-                                prop_type = "retail"
+                            "business_type_tier": business.tier.value,
+                            "discovery_source": "business_first",
+                            "status": "discovered",
+                        })
+                        parking_lot_ids.append(item.property_id)
                         
-                        enrichment_result = await llm_enrichment_service.enrich(
-                            address=business.address,
-                            property_type=prop_type,
-                            owner_name=regrid_parcel.owner if regrid_parcel else None,
-                            lbcs_code=regrid_parcel.lbcs_structure if regrid_parcel else None,
-                        )
-                        
-                        # Store enrichment steps for UI (always save detailed steps with URLs)
-                        import json
-                        if enrichment_result.detailed_steps:
-                            # Store detailed steps as JSON (includes URL, source, confidence)
-                            db_property.enrichment_steps = json.dumps([
-                                step.to_dict() for step in enrichment_result.detailed_steps
-                            ])
-                            # Log simple flow for console
-                            flow_parts = [step.to_simple_string() for step in enrichment_result.detailed_steps]
-                            logger.info(f"         Flow: {' → '.join(flow_parts)}")
-                        elif enrichment_result.steps:
-                            # Fallback to simple steps if no detailed steps
-                            db_property.enrichment_steps = json.dumps(enrichment_result.steps)
-                            logger.info(f"         Flow: {' → '.join(enrichment_result.steps)}")
-                        
-                        if enrichment_result.success and enrichment_result.contact:
-                            contact = enrichment_result.contact
-                            db_property.contact_name = contact.name
-                            db_property.contact_first_name = contact.first_name
-                            db_property.contact_last_name = contact.last_name
-                            db_property.contact_email = contact.email
-                            db_property.contact_phone = contact.phone
-                            db_property.contact_title = contact.title
-                            db_property.contact_company = enrichment_result.management_company
-                            db_property.contact_company_website = enrichment_result.management_website
-                            db_property.enriched_at = datetime.utcnow()
-                            db_property.enrichment_source = "llm_enrichment"
-                            db_property.enrichment_status = "success"
-                            
-                            logger.info(f"      ✅ Contact found: {contact.name or contact.phone or contact.email}")
-                            logger.info(f"         Confidence: {enrichment_result.confidence:.0%}")
-                            if enrichment_result.management_company:
-                                logger.info(f"         Company: {enrichment_result.management_company}")
-                else:
-                            db_property.enrichment_status = "not_found"
-                            if enrichment_result.error_message:
-                                logger.info(f"      ⚠️ Enrichment: {enrichment_result.error_message}")
-                    else:
-                        logger.warning(f"      ⚠️ VLM analysis failed: {vlm_result.error_message}")
-                else:
-                    logger.warning(f"      ❌ Imagery failed: {imagery_result.error_message}")
-                    db_property.status_error = imagery_result.error_message
-                    db_property.status = "failed"
-                
+                        # Create association
+                        associations.append({
+                            "property_id": item.property_id,
+                            "business_id": business_id,
+                            "match_score": 95.0,  # High score since we found business first
+                            "distance_meters": 0,  # Property is for this business
+                            "is_primary": True,
+                            "relationship_type": "tenant",
+                        })
+                    items.append(item)
+                
+                insert_properties(db, new_properties)
+                link_businesses(db, associations)
                 db.commit()
-                self._jobs[job_key]["progress"].parking_lots_evaluated = evaluated_count
                 
-                # Small delay to avoid rate limiting
-                await asyncio.sleep(0.3)
+                processed_count += len(items)
+                for item in items:
+                    yield item
+        
+        async def resolve_parcel(item: _LeadItem) -> Optional[_LeadItem]:
+            business = item.business
+            logger.info(f"   [{item.index + 1}/{len(discovered_businesses)}] {business.name} ({business.tier.value})")
+            
+            # ============ Step 1: Get Property Boundary from Regrid ============
+            # Use ADDRESS-based lookup (more accurate than point lookup)
+            logger.info(f"      🗺️  Fetching property boundary from Regrid by ADDRESS...")
+            
+            property_boundary = None
+            regrid_parcel = None
+            
+            try:
+                # Use validated parcel lookup (point-in-polygon validation)
+                regrid_parcel = await regrid_service.get_validated_parcel(
+                    lat=business.latitude,
+                    lng=business.longitude,
+                    address=business.address
+                )
                 
+                if regrid_parcel and regrid_parcel.has_valid_geometry:
+                    property_boundary = regrid_parcel.polygon
+                    logger.info(f"      ✅ Got Regrid boundary: {regrid_parcel.area_m2:,.0f} m²")
+                    logger.info(f"         Owner: {regrid_parcel.owner}")
+                    logger.info(f"         Regrid Address: {regrid_parcel.address}")
+                    logger.info(f"         Business Address: {business.address[:50]}...")
+                else:
+                    logger.warning(f"      ❌ No Regrid parcel found - SKIPPING (need exact boundary)")
             except Exception as e:
-                logger.error(f"      ❌ Error processing business: {e}")
-                import traceback
-                traceback.print_exc()
-                db.rollback()
+                logger.warning(f"      ❌ Regrid lookup failed: {e} - SKIPPING")
+            
+            # ============ Step 2: REQUIRE Regrid Boundary ============
+            # Without exact property boundary, we can't accurately detect private asphalt
+            if not property_boundary:
+                logger.warning(f"      ⏭️  Skipping {business.name} - no Regrid coverage in this area")
+                # Mark as skipped but keep in DB for potential future analysis
+                writes.update(item.property_id, {
+                    "status": "skipped_no_boundary",
+                    "status_error": "Regrid has no parcel data for this location",
+                })
+                return None
+            
+            # Another business on this parcel (in this run, or an earlier one) already has its lead
+            shared_property_id = parcel_properties.get(regrid_parcel.parcel_id)
+            if shared_property_id is None and item.property_id in placeholder_ids:
+                shared_property_id = db.query(Property.id).filter(
+                    Property.user_id == user_id,
+                    Property.regrid_id == regrid_parcel.parcel_id,
+                    Property.discovery_source == "business_first",
+                ).limit(1).scalar()
+                db.commit()
+            if shared_property_id is None or shared_property_id == item.property_id:
+                parcel_properties[regrid_parcel.parcel_id] = item.property_id
+            elif item.property_id in placeholder_ids:
+                logger.info(f"      🔗 Same parcel as another business - sharing its lead")
+                self._merge_business_property(db, item, shared_property_id)
+                merged_ids.add(item.property_id)
+                if shared_property_id not in parking_lot_ids:
+                    parking_lot_ids.append(shared_property_id)
+                return None
+            
+            item.parcel = regrid_parcel
+            return item
         
-        self._jobs[job_key]["progress"].parking_lots_found = processed_count
+        async def capture_imagery(item: _LeadItem) -> Optional[_LeadItem]:
+            nonlocal evaluated_count
+            business, regrid_parcel = item.business, item.parcel
+            
+            # ============ Step 3: Get Property Satellite Image ============
+            logger.info(f"      🎯 Fetching property satellite imagery: {business.name}")
+            
+            imagery_result = await property_imagery_pipeline.get_property_image(
+                lat=business.latitude,
+                lng=business.longitude,
+                address=business.address,
+                zoom=20,
+                draw_boundary=True,
+                save_debug=True,
+            )
+            
+            if not imagery_result.success:
+                logger.warning(f"      ❌ Imagery failed: {imagery_result.error_message}")
+                writes.update(item.property_id, {"status": "failed", "status_error": imagery_result.error_message})
+                return None
+            
+            # Store Regrid data directly on parking lot, with the satellite image and property area
+            writes.update(item.property_id, {
+                **self._regrid_parcel_values(regrid_parcel),
+                **self._imagery_values(imagery_result),
+            })
+            
+            # Log LBCS codes for debugging
+            if regrid_parcel.lbcs_structure:
+                logger.info(f"      🏷️  LBCS Structure: {regrid_parcel.lbcs_structure} ({regrid_parcel.lbcs_structure_desc or 'N/A'})")
+            if regrid_parcel.num_units:
+                logger.info(f"      🏢 Units: {regrid_parcel.num_units}")
+            
+            evaluated_count += 1
+            self._jobs[job_key]["progress"].parking_lots_evaluated = evaluated_count
+            
+            logger.info(f"      ✅ Imagery captured: {imagery_result.image_size[0]}x{imagery_result.image_size[1]} px")
+            logger.info(f"         Property area: {imagery_result.area_sqft:,.0f} sqft")
+            logger.info(f"         Regrid owner: {regrid_parcel.owner}")
+            logger.info(f"         Land use: {regrid_parcel.land_use}")
+            item.imagery = imagery_result
+            return item
+        
+        async def analyze(item: _LeadItem) -> Optional[_LeadItem]:
+            nonlocal vlm_analyzed_count, vlm_total_cost
+            business, regrid_parcel = item.business, item.parcel
+            if item.property_id in writes.failed:
+                return None
+            
+            # ============ Step 4: VLM Analysis for Lead Scoring ============
+            logger.info(f"      🤖 Running VLM analysis for lead scoring: {business.name}")
+            
+            vlm_result = await vlm_analysis_service.analyze_property(
+                image_base64=item.imagery.image_base64,
+                scoring_prompt=scoring_prompt,
+                property_context={
+                    "address": business.address,
+                    "owner": regrid_parcel.owner,
+                    "land_use": regrid_parcel.land_use,
+                    "area_acres": regrid_parcel.area_acres,
+                    "business_name": business.name,
+                    "business_type": business.tier.value,
+                },
+                user_api_key=user_openrouter_key,  # Use user's key if enabled
+            )
+            item.imagery = None
+            
+            if not vlm_result.success:
+                logger.warning(f"      ⚠️ VLM analysis failed: {vlm_result.error_message}")
+                return None
+            
+            # Store VLM results
+            vlm_values = self._vlm_result_values(vlm_result)
+            if vlm_result.observations:
+                vlm_values["asphalt_condition_score"] = (
+                    90 if vlm_result.observations.condition == 'critical' else
+                    70 if vlm_result.observations.condition == 'poor' else
+                    50 if vlm_result.observations.condition == 'fair' else
+                    30 if vlm_result.observations.condition == 'good' else
+                    10  # excellent
+                )
+            writes.update(item.property_id, vlm_values)
+            
+            vlm_analyzed_count += 1
+            if vlm_result.usage:
+                vlm_total_cost += vlm_result.usage.cost
+            logger.info(f"      🎯 VLM Score: {vlm_result.lead_score}/100 ({vlm_values['lead_quality']})")
+            logger.info(f"         Confidence: {vlm_result.confidence}%")
+            logger.info(f"         Reasoning: {vlm_result.reasoning[:100]}...")
+            if vlm_result.observations:
+                logger.info(f"         Paved: {vlm_result.observations.paved_area_pct}% | Buildings: {vlm_result.observations.building_pct}%")
+                if vlm_result.observations.visible_issues:
+                    logger.info(f"         Issues: {', '.join(vlm_result.observations.visible_issues[:3])}")
+            return item
+        
+        async def enrich(item: _LeadItem) -> Optional[_LeadItem]:
+            business, regrid_parcel = item.business, item.parcel
+            if item.property_id in writes.failed:
+                return None
+            
+            # ============ Step 5: LLM-Powered Lead Enrichment ============
+            # Use LLM to intelligently find Property Manager contact data
+            logger.info(f"      📇 LLM-powered enrichment to find Property Manager: {business.name}")
+            
+            # Determine property type from LBCS or business type
+            prop_type = business.tier.value
+            if regrid_parcel.lbcs_structure:
+                if 1200 <= regrid_parcel.lbcs_structure < 1300:
+                    prop_type = "multi_family"
+                elif 2100 <= regrid_parcel.lbcs_structure < 2200:
+                    prop_type = "office"
+                elif 2200 <= regrid_parcel.lbcs_structure < 2300:
+                    prop_type = "retail"
+            
+            enrichment_result = await llm_enrichment_service.enrich(
+                address=business.address,
+                property_type=prop_type,
+                owner_name=regrid_parcel.owner,
+                lbcs_code=regrid_parcel.lbcs_structure,
+            )
+            
+            values, _ = self._enrichment_values(enrichment_result)
+            writes.update(item.property_id, values)
+            return item
+        
+        pipeline = StagedPipeline(
+            "business_first",
+            [
+                Stage("parcel", resolve_parcel, workers=settings.DISCOVERY_PARCEL_WORKERS),
+                Stage("imagery", capture_imagery, workers=settings.DISCOVERY_IMAGERY_WORKERS),
+                Stage("vlm", analyze, workers=settings.DISCOVERY_VLM_WORKERS),
+                Stage("enrichment", enrich, workers=settings.DISCOVERY_ENRICHMENT_WORKERS),
+            ],
+            on_error=self._pipeline_error_handler(db, writes),
+            record_latency=timer.record,
+        )
+        try:
+            await pipeline.run(stored_items())
+        except asyncio.CancelledError:
+            # Job cancelled - report what it got to
+            self._keep_partial_result(job_key, {
+                "property_ids": [str(pid) for pid in parking_lot_ids if pid not in merged_ids],
+                "analyzed": vlm_analyzed_count,
+                "vlm_total_cost": round(vlm_total_cost, 4),
+            })
+            raise
+        finally:
+            writes.close()
+        
+        parking_lot_ids = [pid for pid in parking_lot_ids if pid not in merged_ids]
+        if merged_ids:
+            logger.info(f"   🔗 {len(merged_ids)} businesses shared a parcel with another business")
+        
+        self._jobs[job_key]["progress"].parking_lots_found = len(parking_lot_ids)
         self._jobs[job_key]["progress"].associations_made = processed_count
         
         # ============ Step 4: Count high-value leads ============
@@ -1256,8 +1383,12 @@ class DiscoveryOrchestrator:
         logger.info(f"   ✅ Found {high_value_count} high-value leads")
         
         # ============ Complete ============
-        self._update_job(job_key, DiscoveryStep.COMPLETED)
-        self._jobs[job_key]["completed_at"] = datetime.utcnow()
+        self._update_job(job_key, DiscoveryStep.COMPLETED, result={
+            "property_ids": [str(pid) for pid in parking_lot_ids],
+            "analyzed": vlm_analyzed_count,
+            "high_value_leads": high_value_count,
+            "vlm_total_cost": round(vlm_total_cost, 4),
+        })
         
         elapsed = (datetime.utcnow() - start_time).total_seconds()
         
@@ -1344,6 +1475,7 @@ class DiscoveryOrchestrator:
         """
         job_key = str(job_id)
         start_time = datetime.utcnow()
+        timer = self._stage_timer(job_key)
         
         # Get user to check for their own API key
         from app.models.user import User
@@ -1376,13 +1508,13 @@ class DiscoveryOrchestrator:
         # Search for more contacts than we need (we'll filter by matched properties)
         max_contacts = min(filters.max_lots * 3, 50)  # Get 3x what we need, max 50 (free tier limit)
         
-        contacts = await apollo_enrichment_service.search_contacts_by_location(
+        contacts = await timer.timed("apollo_search", apollo_enrichment_service.search_contacts_by_location(
             city=city,
             state=state,
             job_titles=job_titles,
             industries=industries,
             max_results=max_contacts,
-        )
+        ))
         
         if not contacts:
             logger.warning("   ⚠️ No contacts found in Apollo")
@@ -1402,240 +1534,276 @@ class DiscoveryOrchestrator:
         
         logger.info(f"   📊 Contacts grouped into {len(companies)} unique companies")
         
-        # ============ Step 2: Search Regrid for properties owned by each company ============
+        # ============ Step 2: Search Regrid for each company's properties, analyzing as they arrive ============
         logger.info("")
-        logger.info("🗺️  STEP 2: Searching Regrid for properties by owner...")
+        logger.info("🗺️  STEP 2: Searching Regrid for properties by owner (analyzing as results arrive)...")
         self._update_job(job_key, DiscoveryStep.SEARCHING_PROPERTIES)
         
-        # Get county FIPS for more targeted search
-        county_fips = None
-        if city and state:
-            # Try to get county FIPS (for better performance)
-            county_fips = await regrid_service.get_county_fips(city=city, state=state)
+        # Get county FIPS for more targeted search (falls back to state-wide)
+        scope = await county_service.resolve_scope(city=city, state=state)
+        county_fips = scope.county_fips
+        state = scope.state_code or state
+        logger.info(f"   📍 Owner search scope: {scope.describe()}")
         
-        all_leads = []  # List of (contact, parcel) tuples
+        # Collapse name variants ("ABC Properties LLC" / "ABC PROPERTIES, INC.")
+        # so each owner is queried once
+        owner_groups = self._collapse_company_names(list(companies.keys()))
+        logger.info(f"   📊 {len(companies)} companies collapsed into {len(owner_groups)} owner searches")
+        
+        progress = self._jobs[job_key]["progress"]
         companies_searched = 0
+        properties_found = 0
+        analyzed_count = 0
+        vlm_total_cost = 0.0
+        property_ids = []
+        writes = self._property_writer(job_key, db)
         
-        for company_name, company_contacts in companies.items():
-            if len(all_leads) >= filters.max_lots:
-                break
-            
-            logger.info(f"   [{companies_searched + 1}/{len(companies)}] Searching: {company_name}")
-            
-            # Search Regrid for properties owned by this company
-            parcels = await regrid_service.search_parcels_by_owner(
-                owner_name=company_name,
+        async def search_owner(owner_query: str) -> List:
+            return await timer.timed("owner_search", regrid_service.search_parcels_by_owner(
+                owner_name=owner_query,
                 county_fips=county_fips,
                 state_code=state,
                 max_results=10,  # Limit per company
+                prefix_match=True,
+            ))
+        
+        async def stored_items() -> AsyncIterator[_LeadItem]:
+            """
+            Run owner searches REGRID_OWNER_SEARCH_CONCURRENCY at a time and turn
+            each company's matches into stored leads as soon as its search
+            finishes (one lookup and one INSERT per company), so imagery and
+            VLM start on the first company's properties while later companies
+            are still being searched. Searches are cached across jobs.
+            """
+            nonlocal companies_searched, properties_found
+            queries = iter(owner_groups)
+            searches: Dict[asyncio.Task, str] = {}
+            seen_parcel_ids = set()
+            
+            def start_search() -> None:
+                owner_query = next(queries, None)
+                if owner_query is not None:
+                    searches[asyncio.ensure_future(search_owner(owner_query))] = owner_query
+            
+            for _ in range(max(1, settings.REGRID_OWNER_SEARCH_CONCURRENCY)):
+                start_search()
+            
+            try:
+                while searches and properties_found < filters.max_lots:
+                    done, _ = await asyncio.wait(searches, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        owner_query = searches.pop(task)
+                        start_search()
+                        companies_searched += len(owner_groups[owner_query])
+                        progress.companies_searched = companies_searched
+                        
+                        if task.exception() is not None:
+                            logger.warning(f"      ⚠️ Owner search failed for {owner_query}: {task.exception()}")
+                            continue
+                        parcels = task.result()
+                        if not parcels:
+                            logger.info(f"      ❌ No properties found for {owner_query}")
+                            continue
+                        
+                        logger.info(f"      ✅ {owner_query}: {len(parcels)} properties")
+                        
+                        # Get the best contact for this owner (first one, usually has highest rank)
+                        contact = companies[owner_groups[owner_query][0]][0]
+                        
+                        leads = []
+                        for parcel in parcels:
+                            if properties_found + len(leads) >= filters.max_lots:
+                                break
+                            if parcel.parcel_id in seen_parcel_ids:
+                                continue
+                            seen_parcel_ids.add(parcel.parcel_id)
+                            if parcel.polygon is None:
+                                logger.info(f"      ⚠️ Parcel {parcel.parcel_id} has no usable boundary, skipping")
+                                continue
+                            leads.append(parcel)
+                        if not leads:
+                            continue
+                        
+                        # Properties that already exist for these parcels
+                        existing = {
+                            row.regrid_id: row.id for row in db.query(Property.id, Property.regrid_id).filter(
+                                Property.user_id == user_id,
+                                Property.regrid_id.in_([parcel.parcel_id for parcel in leads]),
+                            )
+                        }
+                        
+                        items = []
+                        new_properties = []
+                        for parcel in leads:
+                            item = _LeadItem(index=properties_found, contact=contact, parcel=parcel)
+                            properties_found += 1
+                            values = {
+                                # Contact info (GUARANTEED from Apollo)
+                                "contact_name": contact.name,
+                                "contact_first_name": contact.first_name,
+                                "contact_last_name": contact.last_name,
+                                "contact_email": contact.email,
+                                "contact_phone": contact.phone,
+                                "contact_title": contact.title,
+                                "contact_linkedin_url": contact.linkedin_url,
+                                "enriched_at": datetime.utcnow(),
+                                "enrichment_source": "apollo",
+                                "enrichment_status": "success",
+                                # Regrid parcel data
+                                **self._regrid_parcel_values(parcel),
+                            }
+                            
+                            if parcel.parcel_id in existing:
+                                item.property_id = existing[parcel.parcel_id]
+                                writes.update(item.property_id, values)
+                            else:
+                                # Create new property
+                                from shapely.geometry import Point
+                                centroid = parcel.centroid if parcel.centroid else Point(0, 0)
+                                
+                                item.property_id = uuid4()
+                                new_properties.append({
+                                    "id": item.property_id,
+                                    "user_id": user_id,
+                                    "centroid": from_shape(centroid, srid=4326),
+                                    "address": parcel.address,
+                                    "discovery_source": "contact_first",
+                                    "status": "discovered",
+                                    **values,
+                                })
+                            property_ids.append(item.property_id)
+                            items.append(item)
+                        
+                        insert_properties(db, new_properties)
+                        db.commit()
+                        progress.properties_found = properties_found
+                        
+                        for item in items:
+                            yield item
+            finally:
+                # Enough leads (or the run stopped) - drop the searches still in flight
+                for task in searches:
+                    task.cancel()
+            
+            if properties_found:
+                # Searching is over; the pipeline finishes analyzing what it has
+                logger.info(f"   ✅ Total: {properties_found} property-contact matches")
+                self._update_job(job_key, DiscoveryStep.ANALYZING_PROPERTIES)
+        
+        # ============ Step 3: Get imagery and VLM score for each property (fed by step 2) ============
+        async def capture_imagery(item: _LeadItem) -> Optional[_LeadItem]:
+            contact, parcel = item.contact, item.parcel
+            logger.info(f"   [{item.index + 1}] {parcel.address or parcel.parcel_id}")
+            logger.info(f"      Contact: {contact.name} ({contact.email})")
+            logger.info(f"      Company: {contact.company_name}")
+            
+            # Get satellite imagery
+            logger.info(f"      📷 Fetching satellite imagery...")
+            
+            imagery_result = await property_imagery_pipeline.get_property_image(
+                lat=parcel.centroid.y if parcel.centroid else 0,
+                lng=parcel.centroid.x if parcel.centroid else 0,
+                address=parcel.address,
+                zoom=20,
+                draw_boundary=True,
+                save_debug=True,
             )
             
-            companies_searched += 1
+            if not imagery_result.success:
+                logger.warning(f"      ⚠️ Imagery failed: {imagery_result.error_message}")
+                writes.update(item.property_id, {"status": "failed", "status_error": imagery_result.error_message})
+                return None
             
-            if not parcels:
-                logger.info(f"      ❌ No properties found")
-                continue
+            writes.update(item.property_id, self._imagery_values(imagery_result))
             
-            logger.info(f"      ✅ Found {len(parcels)} properties")
+            logger.info(f"      ✅ Imagery captured: {imagery_result.image_size[0]}x{imagery_result.image_size[1]} px")
+            item.imagery = imagery_result
+            return item
+        
+        async def analyze(item: _LeadItem) -> Optional[_LeadItem]:
+            nonlocal analyzed_count, vlm_total_cost
+            contact, parcel = item.contact, item.parcel
+            if item.property_id in writes.failed:
+                return None
             
-            # Get the best contact for this company (first one, usually has highest rank)
-            primary_contact = company_contacts[0]
+            # Run VLM analysis
+            logger.info(f"      🤖 Running VLM analysis: {parcel.address or parcel.parcel_id}")
             
-            # Create leads (contact + parcel pairs)
-            for parcel in parcels:
-                if len(all_leads) >= filters.max_lots:
-                    break
-                all_leads.append((primary_contact, parcel))
-        
-        self._jobs[job_key]["progress"].companies_searched = companies_searched
-        self._jobs[job_key]["progress"].properties_found = len(all_leads)
+            vlm_result = await vlm_analysis_service.analyze_property(
+                image_base64=item.imagery.image_base64,
+                scoring_prompt=scoring_prompt,
+                property_context={
+                    "address": parcel.address,
+                    "owner": parcel.owner,
+                    "land_use": parcel.land_use,
+                    "area_acres": parcel.area_acres,
+                    "contact_name": contact.name,
+                    "contact_company": contact.company_name,
+                },
+                user_api_key=user_openrouter_key,
+            )
+            item.imagery = None
+            
+            if not vlm_result.success:
+                logger.warning(f"      ⚠️ VLM analysis failed: {vlm_result.error_message}")
+                return None
+            
+            vlm_values = self._vlm_result_values(vlm_result)
+            writes.update(item.property_id, vlm_values)
+            
+            analyzed_count += 1
+            if vlm_result.usage:
+                vlm_total_cost += vlm_result.usage.cost
+            self._jobs[job_key]["progress"].properties_analyzed = analyzed_count
+            
+            logger.info(f"      🎯 VLM Score: {vlm_result.lead_score}/100 ({vlm_values['lead_quality']})")
+            return item
+        
+        # Contacts come from Apollo, so there is no enrichment stage
+        pipeline = StagedPipeline(
+            "contact_first",
+            [
+                Stage("imagery", capture_imagery, workers=settings.DISCOVERY_IMAGERY_WORKERS),
+                Stage("vlm", analyze, workers=settings.DISCOVERY_VLM_WORKERS),
+            ],
+            on_error=self._pipeline_error_handler(db, writes),
+            record_latency=timer.record,
+        )
+        try:
+            await pipeline.run(stored_items())
+        except asyncio.CancelledError:
+            # Job cancelled - report what it got to
+            self._keep_partial_result(job_key, {
+                "property_ids": [str(pid) for pid in property_ids],
+                "analyzed": analyzed_count,
+                "vlm_total_cost": round(vlm_total_cost, 4),
+            })
+            raise
+        finally:
+            writes.close()
         
-        if not all_leads:
+        if not property_ids:
             logger.warning("   ⚠️ No properties found for any contacts")
             self._update_job(job_key, DiscoveryStep.COMPLETED)
             return
         
-        logger.info(f"   ✅ Total: {len(all_leads)} property-contact matches")
-        
-        # ============ Step 3: Get imagery and VLM score for each property ============
+        # ============ Step 4: Count high-value leads ============
         logger.info("")
-        logger.info("🎯 STEP 3: Analyzing properties...")
-        self._update_job(job_key, DiscoveryStep.ANALYZING_PROPERTIES)
+        logger.info("🎯 STEP 4: Counting high-value leads...")
+        self._update_job(job_key, DiscoveryStep.FILTERING)
         
-        analyzed_count = 0
-        vlm_total_cost = 0.0
-        property_ids = []
-        
-        for idx, (contact, parcel) in enumerate(all_leads):
-            try:
-                logger.info(f"   [{idx+1}/{len(all_leads)}] {parcel.address or parcel.parcel_id}")
-                logger.info(f"      Contact: {contact.name} ({contact.email})")
-                logger.info(f"      Company: {contact.company_name}")
-                
-                # Check if property already exists
-                existing_property = db.query(Property).filter(
-                    Property.regrid_id == parcel.parcel_id,
-                    Property.user_id == user_id,
-                ).first()
-                
-                if existing_property:
-                    logger.info(f"      ♻️ Property already exists, updating contact info")
-                    db_property = existing_property
-                    else:
-                    # Create new property
-                    from shapely.geometry import Point
-                    centroid = parcel.centroid if parcel.centroid else Point(0, 0)
-                    
-                    db_property = Property(
-                        user_id=user_id,
-                        centroid=from_shape(centroid, srid=4326),
-                        address=parcel.address,
-                        discovery_source="contact_first",
-                        status="discovered",
-                    )
-                    db.add(db_property)
-                    db.flush()
-                
-                property_ids.append(db_property.id)
-                
-                # Store contact info (GUARANTEED from Apollo)
-                db_property.contact_name = contact.name
-                db_property.contact_first_name = contact.first_name
-                db_property.contact_last_name = contact.last_name
-                db_property.contact_email = contact.email
-                db_property.contact_phone = contact.phone
-                db_property.contact_title = contact.title
-                db_property.contact_linkedin_url = contact.linkedin_url
-                db_property.enriched_at = datetime.utcnow()
-                db_property.enrichment_source = "apollo"
-                db_property.enrichment_status = "success"
-                
-                # Store Regrid parcel data
-                db_property.regrid_id = parcel.parcel_id
-                db_property.regrid_apn = parcel.apn
-                db_property.regrid_owner = parcel.owner
-                db_property.regrid_owner2 = parcel.owner2
-                db_property.regrid_owner_type = parcel.owner_type
-                db_property.regrid_owner_address = parcel.mail_address
-                db_property.regrid_owner_city = parcel.mail_city
-                db_property.regrid_owner_state = parcel.mail_state
-                db_property.regrid_land_use = parcel.land_use
-                db_property.regrid_zoning = parcel.zoning
-                db_property.regrid_zoning_desc = parcel.zoning_description
-                db_property.regrid_year_built = str(parcel.year_built) if parcel.year_built else None
-                db_property.regrid_area_acres = parcel.area_acres
-                db_property.regrid_num_units = parcel.num_units
-                db_property.regrid_num_stories = parcel.num_stories
-                db_property.regrid_struct_style = parcel.struct_style
-                db_property.regrid_fetched_at = datetime.utcnow()
-                
-                # Store LBCS codes (Premium tier - standardized classification)
-                db_property.lbcs_activity = parcel.lbcs_activity
-                db_property.lbcs_activity_desc = parcel.lbcs_activity_desc
-                db_property.lbcs_function = parcel.lbcs_function
-                db_property.lbcs_function_desc = parcel.lbcs_function_desc
-                db_property.lbcs_structure = parcel.lbcs_structure
-                db_property.lbcs_structure_desc = parcel.lbcs_structure_desc
-                db_property.lbcs_site = parcel.lbcs_site
-                db_property.lbcs_site_desc = parcel.lbcs_site_desc
-                db_property.lbcs_ownership = parcel.lbcs_ownership
-                db_property.lbcs_ownership_desc = parcel.lbcs_ownership_desc
-                
-                if parcel.polygon:
-                    db_property.regrid_polygon = from_shape(parcel.polygon, srid=4326)
-                
-                # Get satellite imagery
-                logger.info(f"      📷 Fetching satellite imagery...")
-                
-                imagery_result = await property_imagery_pipeline.get_property_image(
-                    lat=parcel.centroid.y if parcel.centroid else 0,
-                    lng=parcel.centroid.x if parcel.centroid else 0,
-                    address=parcel.address,
-                    zoom=20,
-                    draw_boundary=True,
-                    save_debug=True,
-                )
-                
-                if imagery_result.success:
-                    db_property.satellite_image_base64 = imagery_result.image_base64
-                    db_property.satellite_zoom_level = str(imagery_result.metadata.get('zoom', 20))
-                    db_property.area_m2 = imagery_result.area_sqm
-                    db_property.area_sqft = imagery_result.area_sqft
-                    db_property.satellite_fetched_at = datetime.utcnow()
-                    db_property.status = "imagery_captured"
-                    
-                    logger.info(f"      ✅ Imagery captured: {imagery_result.image_size[0]}x{imagery_result.image_size[1]} px")
-                    
-                    # Run VLM analysis
-                    logger.info(f"      🤖 Running VLM analysis...")
-                    
-                    vlm_result = await vlm_analysis_service.analyze_property(
-                        image_base64=imagery_result.image_base64,
-                        scoring_prompt=scoring_prompt,
-                        property_context={
-                            "address": parcel.address,
-                            "owner": parcel.owner,
-                            "land_use": parcel.land_use,
-                            "area_acres": parcel.area_acres,
-                            "contact_name": contact.name,
-                            "contact_company": contact.company_name,
-                        },
-                        user_api_key=user_openrouter_key,
-                    )
-                    
-                    if vlm_result.success:
-                        db_property.lead_score = vlm_result.lead_score
-                        db_property.lead_quality = (
-                            'high' if vlm_result.lead_score >= 70 
-                            else 'medium' if vlm_result.lead_score >= 40 
-                            else 'low'
-                        )
-                        db_property.analysis_notes = vlm_result.reasoning
-                        db_property.analyzed_at = datetime.utcnow()
-                        db_property.status = "analyzed"
-                        
-                        if vlm_result.observations:
-                            db_property.paved_percentage = vlm_result.observations.paved_area_pct
-                            db_property.building_percentage = vlm_result.observations.building_pct
-                            db_property.landscaping_percentage = vlm_result.observations.landscaping_pct
-                        
-                        analyzed_count += 1
-                        if vlm_result.usage:
-                            vlm_total_cost += vlm_result.usage.cost
-                        
-                        logger.info(f"      🎯 VLM Score: {vlm_result.lead_score}/100 ({db_property.lead_quality})")
-                else:
-                        logger.warning(f"      ⚠️ VLM analysis failed: {vlm_result.error_message}")
-                else:
-                    logger.warning(f"      ⚠️ Imagery failed: {imagery_result.error_message}")
-                    db_property.status = "failed"
-                    db_property.status_error = imagery_result.error_message
-                
-                db.commit()
-                self._jobs[job_key]["progress"].properties_analyzed = analyzed_count
-                
-                # Rate limiting
-                await asyncio.sleep(0.3)
-                
-            except Exception as e:
-                logger.error(f"      ❌ Error processing property: {e}")
-                import traceback
-                traceback.print_exc()
-                db.rollback()
-        
-        # ============ Step 4: Count high-value leads ============
-        logger.info("")
-        logger.info("🎯 STEP 4: Counting high-value leads...")
-        self._update_job(job_key, DiscoveryStep.FILTERING)
-        
-        high_value_count = self._count_high_value_leads(property_ids, filters, db)
-        self._jobs[job_key]["progress"].high_value_leads = high_value_count
+        high_value_count = self._count_high_value_leads(property_ids, filters, db)
+        self._jobs[job_key]["progress"].high_value_leads = high_value_count
         
         logger.info(f"   ✅ Found {high_value_count} high-value leads")
         
         # ============ Complete ============
-        self._update_job(job_key, DiscoveryStep.COMPLETED)
-        self._jobs[job_key]["completed_at"] = datetime.utcnow()
+        self._update_job(job_key, DiscoveryStep.COMPLETED, result={
+            "property_ids": [str(pid) for pid in property_ids],
+            "analyzed": analyzed_count,
+            "high_value_leads": high_value_count,
+            "vlm_total_cost": round(vlm_total_cost, 4),
+        })
         
         elapsed = (datetime.utcnow() - start_time).total_seconds()
         
@@ -1646,7 +1814,7 @@ class DiscoveryOrchestrator:
         logger.info(f"   Duration: {elapsed:.1f} seconds")
         logger.info(f"   Contacts found: {len(contacts)}")
         logger.info(f"   Companies searched: {companies_searched}")
-        logger.info(f"   Properties found: {len(all_leads)}")
+        logger.info(f"   Properties found: {properties_found}")
         logger.info(f"   Properties analyzed: {analyzed_count}")
         logger.info(f"   VLM total cost: ${vlm_total_cost:.4f}")
         logger.info(f"   High-value leads: {high_value_count}")
@@ -1658,7 +1826,7 @@ class DiscoveryOrchestrator:
             db=db,
             user_id=user_id,
             job_id=job_id,
-            properties_found=len(all_leads),
+            properties_found=properties_found,
             properties_with_imagery=analyzed_count,
             properties_analyzed=analyzed_count,
             businesses_loaded=0,
@@ -1685,6 +1853,8 @@ class DiscoveryOrchestrator:
         scoring_prompt: Optional[str] = None,
         min_acres: Optional[float] = None,
         max_acres: Optional[float] = None,
+        tile_first: bool = False,
+        checkpoint: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Regrid-First Discovery Pipeline.
@@ -1697,16 +1867,43 @@ class DiscoveryOrchestrator:
         
         This is ideal when you want to find ALL properties of a certain type
         in an area, not just ones with Google Places listings.
+        
+        With tile_first, step 1 screens candidates from Regrid MVT tiles
+        (acreage, land use, already-known parcels) and full records are only
+        fetched, in batches, for the shortlist (see _collect_tile_first_parcels).
+        
+        Progress is checkpointed to the job store: the Regrid page cursor while
+        collecting, then the shortlisted parcels, then each parcel's last
+        cleared stage. Passing that `checkpoint` back (see resume_job) skips
+        every Regrid page, image, VLM call and enrichment already paid for.
         """
-        from app.schemas.discovery import PROPERTY_CATEGORY_LBCS_RANGES, PropertyCategoryEnum
-        from app.core.property_classifier import classify_property, PropertyCategory
+        from app.schemas.discovery import PropertyCategoryEnum
+        from app.core.property_classifier import classify_property
         
         job_key = str(job_id)
         start_time = datetime.utcnow()
+        timer = self._stage_timer(job_key)
+        
+        if checkpoint is None:
+            checkpoint = {
+                "request": {
+                    "area_polygon": area_polygon,
+                    "filters": filters.model_dump(mode="json"),
+                    "property_categories": property_categories,
+                    "scoring_prompt": scoring_prompt,
+                    "min_acres": min_acres,
+                    "max_acres": max_acres,
+                    "tile_first": tile_first,
+                },
+                "collection": None,  # Page cursor while collecting, then totals
+                "parcels": None,  # Shortlisted Regrid features, once collected
+                "items": {},  # regrid_id -> {"property_id", "stage"}
+            }
+            self._save_checkpoint(job_key, checkpoint)
         
         logger.info("")
         logger.info("=" * 60)
-        logger.info("🏢 REGRID-FIRST DISCOVERY PIPELINE STARTED")
+        logger.info(f"🏢 {'TILE' if tile_first else 'REGRID'}-FIRST DISCOVERY PIPELINE STARTED")
         logger.info(f"   Job ID: {job_id}")
         logger.info(f"   User ID: {user_id}")
         logger.info(f"   Max results: {filters.max_lots}")
@@ -1754,17 +1951,11 @@ class DiscoveryOrchestrator:
             self._update_job(job_key, DiscoveryStep.FAILED, error="No valid property categories")
             return
         
-        # Extract ZIP code from area_polygon if available
-        zip_code = None
-        state_code = None
-        county_fips = None
-        
-        # Try to get geographic filter from polygon properties
-        if area_polygon and area_polygon.get("properties"):
-            props = area_polygon["properties"]
-            zip_code = props.get("zip_code")
-            state_code = props.get("state")
-            county_fips = props.get("county_fips")
+        # Geographic filter from polygon properties, narrowed to the smallest valid geography
+        scope = await self._resolve_search_scope(area_polygon)
+        zip_code = scope.zip_code
+        state_code = scope.state_code
+        county_fips = scope.county_fips
         
         logger.info(f"   📍 Geographic filter: ZIP={zip_code}, State={state_code}, FIPS={county_fips}")
         
@@ -1772,72 +1963,101 @@ class DiscoveryOrchestrator:
         logger.info("")
         logger.info("🗺️ STEP 2: Querying Regrid for parcels (with pagination)...")
         
-        # Get existing parcel IDs to filter out
-        existing_regrid_ids = set(
-            row[0] for row in db.query(Property.regrid_id).filter(
-                Property.user_id == user_id,
-                Property.regrid_id.isnot(None)
-            ).all()
-        )
-        
-        # Pagination loop - keep fetching until we have enough NEW parcels
-        batch_size = max(filters.max_lots * 2, 20)  # Fetch more per batch
-        max_pages = 10  # Safety limit
-        current_offset = 0
-        new_parcels = []
-        seen_parcel_ids = set()
-        total_fetched = 0
-        total_skipped = 0
-        
-        for page in range(max_pages):
-            if len(new_parcels) >= filters.max_lots:
-                break
+        # Candidates collected for value-first ranking (the best max_lots are processed)
+        pool_size = filters.max_lots * max(1, settings.DISCOVERY_CANDIDATE_POOL_FACTOR)
+        
+        collected = checkpoint.get("parcels")
+        if collected is not None:
+            # Resumed after collection - no Regrid request is repeated
+            new_parcels = [PropertyParcel(feature) for feature in collected]
+            total_fetched = checkpoint["collection"]["total_fetched"]
+            total_skipped = checkpoint["collection"]["total_skipped"]
+            logger.info(f"   ♻️ Resuming with {len(new_parcels)} parcels collected before the interruption")
+        elif tile_first:
+            # Screen candidates from tiles, then fetch records only for the shortlist
+            new_parcels, total_fetched, total_skipped = await self._collect_tile_first_parcels(
+                area_polygon,
+                lbcs_queries,
+                db,
+                user_id,
+                max_lots=filters.max_lots,
+                min_acres=min_acres,
+                max_acres=max_acres,
+                timer=timer,
+            )
+        else:
+            # Pagination loop - keep fetching until the candidate pool is full
+            # (DISCOVERY_CANDIDATE_POOL_FACTOR x max_lots NEW parcels, ranked below)
+            batch_size = max(filters.max_lots * 2, 20)  # Fetch more per batch
+            max_pages = 10  # Safety limit
             
-            # Fetch next batch from each LBCS field
-            batch_parcels = []
-            for lbcs_field, ranges in lbcs_queries.items():
-                if len(batch_parcels) >= batch_size:
+            # Pick up from the last checkpointed page, if any
+            cursor = checkpoint.get("collection") or {}
+            current_offset = cursor.get("offset", 0)
+            new_parcels = [PropertyParcel(feature) for feature in cursor.get("parcels", [])]
+            seen_parcel_ids = {parcel.parcel_id for parcel in new_parcels}
+            total_fetched = cursor.get("total_fetched", 0)
+            total_skipped = cursor.get("total_skipped", 0)
+            
+            for page in range(cursor.get("page", 0), max_pages):
+                if len(new_parcels) >= pool_size:
                     break
                 
-                logger.info(f"   Querying {lbcs_field} with ranges: {ranges} (offset: {current_offset})")
+                # Fetch next batch from each LBCS field
+                batch_parcels = []
+                for lbcs_field, ranges in lbcs_queries.items():
+                    if len(batch_parcels) >= batch_size:
+                        break
+                    
+                    logger.info(f"   Querying {lbcs_field} with ranges: {ranges} (offset: {current_offset})")
+                    
+                    field_parcels = await timer.timed("regrid_query", regrid_service.search_parcels_by_lbcs(
+                        lbcs_ranges=ranges,
+                        county_fips=county_fips,
+                        state_code=state_code,
+                        zip_code=zip_code,
+                        max_results=batch_size,
+                        lbcs_field=lbcs_field,
+                        min_acres=min_acres,
+                        max_acres=max_acres,
+                        offset=current_offset,
+                    ))
+                    
+                    for parcel in field_parcels:
+                        if parcel.parcel_id not in seen_parcel_ids:
+                            seen_parcel_ids.add(parcel.parcel_id)
+                            batch_parcels.append(parcel)
                 
-                field_parcels = await regrid_service.search_parcels_by_lbcs(
-                    lbcs_ranges=ranges,
-                    county_fips=county_fips,
-                    state_code=state_code,
-                    zip_code=zip_code,
-                    max_results=batch_size,
-                    lbcs_field=lbcs_field,
-                    min_acres=min_acres,
-                    max_acres=max_acres,
-                    offset=current_offset,
-                )
+                if not batch_parcels:
+                    logger.info(f"   Regrid exhausted after {total_fetched} parcels")
+                    break
                 
-                for parcel in field_parcels:
-                    if parcel.parcel_id not in seen_parcel_ids:
-                        seen_parcel_ids.add(parcel.parcel_id)
-                        batch_parcels.append(parcel)
-            
-            if not batch_parcels:
-                logger.info(f"   Regrid exhausted after {total_fetched} parcels")
-                break
-            
-            total_fetched += len(batch_parcels)
-            
-            # Filter out existing parcels
-            batch_new = 0
-            for parcel in batch_parcels:
-                if parcel.parcel_id not in existing_regrid_ids:
-                    new_parcels.append(parcel)
-                    batch_new += 1
-                    if len(new_parcels) >= filters.max_lots:
-                        break
-                else:
-                    total_skipped += 1
+                total_fetched += len(batch_parcels)
+                
+                # Filter out existing parcels (one anti-join per page)
+                unseen_ids = set(new_regrid_ids(db, user_id, [p.parcel_id for p in batch_parcels]))
+                batch_new = 0
+                for parcel in batch_parcels:
+                    if parcel.parcel_id in unseen_ids:
+                        new_parcels.append(parcel)
+                        batch_new += 1
+                        if len(new_parcels) >= pool_size:
+                            break
+                    else:
+                        total_skipped += 1
+                
+                logger.info(f"   Page {page+1}: fetched {len(batch_parcels)}, new={batch_new}, total_new={len(new_parcels)}, skipped={total_skipped}")
+                current_offset += batch_size
+                
+                checkpoint["collection"] = {
+                    "page": page + 1,
+                    "offset": current_offset,
+                    "total_fetched": total_fetched,
+                    "total_skipped": total_skipped,
+                    "parcels": [parcel.raw_data for parcel in new_parcels],
+                }
+                self._save_checkpoint(job_key, checkpoint)
             
-            logger.info(f"   Page {page+1}: fetched {len(batch_parcels)}, new={batch_new}, total_new={len(new_parcels)}, skipped={total_skipped}")
-            current_offset += batch_size
-        
         # Fallback to usedesc search if no LBCS results
         if not new_parcels and total_fetched == 0:
             logger.info("   ⚠️ No LBCS results, trying usedesc text search...")
@@ -1856,17 +2076,18 @@ class DiscoveryOrchestrator:
                     usedesc_patterns.extend(["church", "school", "hospital"])
             
             if usedesc_patterns:
-                fallback_parcels = await regrid_service.search_parcels_by_usedesc(
+                fallback_parcels = await timer.timed("regrid_query", regrid_service.search_parcels_by_usedesc(
                     patterns=usedesc_patterns,
                     county_fips=county_fips,
                     state_code=state_code,
                     zip_code=zip_code,
                     max_results=filters.max_lots * 2,
-                )
+                ))
+                unseen_ids = set(new_regrid_ids(db, user_id, [p.parcel_id for p in fallback_parcels]))
                 for parcel in fallback_parcels:
-                    if parcel.parcel_id not in existing_regrid_ids:
+                    if parcel.parcel_id in unseen_ids:
                         new_parcels.append(parcel)
-                        if len(new_parcels) >= filters.max_lots:
+                        if len(new_parcels) >= pool_size:
                             break
         
         if not new_parcels:
@@ -1877,23 +2098,48 @@ class DiscoveryOrchestrator:
             self._update_job(job_key, DiscoveryStep.COMPLETED)
             return
         
-        # Limit to max_lots NEW parcels
-        if len(new_parcels) > filters.max_lots:
-            new_parcels = new_parcels[:filters.max_lots]
+        # Value-first: rank the pool and process the best max_lots, best first
+        # (a resumed job already has its ranked list)
+        categories: Dict[str, str] = {}
+        if collected is None:
+            ranked = _with_boundary(rank_parcels(new_parcels), filters.max_lots)
+            new_parcels = [candidate.parcel for candidate in ranked]
+            categories = {candidate.parcel.parcel_id: candidate.category for candidate in ranked}
         
         logger.info(f"   ✅ Found {len(new_parcels)} NEW parcels to process (fetched {total_fetched}, skipped {total_skipped})")
         self._jobs[job_key]["progress"].properties_found = len(new_parcels)
         
+        if collected is None:
+            checkpoint["collection"] = {"total_fetched": total_fetched, "total_skipped": total_skipped}
+            checkpoint["parcels"] = [parcel.raw_data for parcel in new_parcels]
+            self._save_checkpoint(job_key, checkpoint)
+        
         # ============ Step 3: Process each parcel ============
         logger.info("")
         logger.info(f"📷 STEP 3: Processing {len(new_parcels)} parcels...")
         self._update_job(job_key, DiscoveryStep.PROCESSING_PARCELS)
         
+        # Items checkpointed before an interruption resume after their last cleared stage
+        items_state = checkpoint["items"]
+        lead_items = []
         property_ids = []
-        processed_count = 0
-        analyzed_count = 0
-        enriched_count = 0
-        vlm_total_cost = 0.0
+        for idx, parcel in enumerate(new_parcels):
+            state = items_state.get(parcel.parcel_id) or {}
+            item = _LeadItem(index=idx, parcel=parcel, resume_stage=state.get("stage"))
+            if state.get("property_id"):
+                item.property_id = UUID(state["property_id"])
+                property_ids.append(item.property_id)
+            if item.resume_stage not in _FINISHED_STAGES:
+                lead_items.append(item)
+        
+        cleared = [state.get("stage") for state in items_state.values()]
+        # Unfinished items count again as they pass through capture below
+        processed_count = sum(1 for stage in cleared if stage in _FINISHED_STAGES and stage != "skipped")
+        analyzed_count = sum(1 for stage in cleared if stage in ("vlm", "enrichment"))
+        enriched_count = sum(1 for state in items_state.values() if state.get("enriched"))
+        vlm_total_cost = 0.0  # This run only - usage is logged per run
+        if items_state:
+            logger.info(f"   ♻️ {len(new_parcels) - len(lead_items)} parcels already finished, {len(lead_items)} to go")
         
         # Get user's OpenRouter API key if available
         from app.models.user import User
@@ -1903,211 +2149,235 @@ class DiscoveryOrchestrator:
             user_api_key = user.openrouter_api_key
             logger.info("   🔑 Using user's OpenRouter API key")
         
-        for idx, parcel in enumerate(new_parcels):
-            try:
-                processed_count += 1
-                logger.info(f"")
-                logger.info(f"   [{idx + 1}/{len(new_parcels)}] {parcel.address or parcel.parcel_id}")
-                logger.info(f"      Owner: {parcel.owner or 'Unknown'}")
-                logger.info(f"      LBCS Structure: {parcel.lbcs_structure} ({parcel.lbcs_structure_desc or 'N/A'})")
-                
-                centroid = parcel.centroid
+        # ============ Steps 3-5: Imagery → VLM → Enrichment (staged) ============
+        discovery_source = "tile_first" if tile_first else "regrid_first"
+        writes = self._property_writer(job_key, db)
+        
+        def item_state(item: _LeadItem, stage: str, **extra: Any) -> Tuple[str, Dict[str, Any]]:
+            return item.parcel.parcel_id, {
+                "property_id": str(item.property_id) if item.property_id else None,
+                "stage": stage,
+                **extra,
+            }
+        
+        async def claimed_items() -> AsyncIterator[_LeadItem]:
+            """Claim parcels a batch at a time (one INSERT ... ON CONFLICT per batch) as the pipeline pulls them."""
+            for start in range(0, len(lead_items), writes.batch_size):
+                batch = lead_items[start:start + writes.batch_size]
+                to_claim = [item for item in batch if item.property_id is None]
+                rows = []
+                for item in to_claim:
+                    parcel = item.parcel
+                    item.property_type = categories.get(parcel.parcel_id) or classify_property(
+                        lbcs_structure=parcel.lbcs_structure,
+                        lbcs_activity=parcel.lbcs_activity,
+                        lbcs_function=parcel.lbcs_function,
+                        usecode=parcel.land_use,
+                        usedesc=parcel.land_use,
+                        zoning=parcel.zoning,
+                        zoning_description=parcel.zoning_description,
+                        struct_style=parcel.struct_style,
+                    ).value
+                    rows.append({
+                        "user_id": user_id,
+                        "centroid": from_shape(parcel.centroid, srid=4326),
+                        "address": parcel.address,
+                        "discovery_source": discovery_source,
+                        "status": "discovered",
+                        "property_category": item.property_type,
+                        # Store all Regrid data + classification with the claim
+                        **self._regrid_parcel_values(parcel),
+                    })
+                
+                # Claim the parcels (ON CONFLICT DO NOTHING - a concurrent job may own some)
+                claimed = claim_parcel_properties(db, rows)
+                db.commit()
                 
-                # Create property record
-                db_property = Property(
-                    user_id=user_id,
-                    centroid=from_shape(centroid, srid=4326),
-                    address=parcel.address,
-                    discovery_source="regrid_first",
-                    status="discovered",
+                states = {}
+                for item in to_claim:
+                    item.property_id = claimed.get(item.parcel.parcel_id)
+                    if item.property_id is None:
+                        logger.info(f"      ♻️ Parcel {item.parcel.parcel_id} already claimed, skipping")
+                        states.update([item_state(item, "skipped")])
+                        continue
+                    property_ids.append(item.property_id)
+                    states.update([item_state(item, "claimed")])
+                if states:
+                    self._checkpoint_items(job_key, states)
+                
+                for item in batch:
+                    if item.property_id is not None:
+                        yield item
+        
+        async def capture_imagery(item: _LeadItem) -> Optional[_LeadItem]:
+            nonlocal processed_count
+            parcel = item.parcel
+            if item.resume_stage in ("imagery", "vlm"):
+                # Image was captured (and stored on the property) before the interruption
+                processed_count += 1
+                self._jobs[job_key]["progress"].properties_found = processed_count
+                return item
+            
+            logger.info(f"")
+            logger.info(f"   [{item.index + 1}/{len(new_parcels)}] {parcel.address or parcel.parcel_id}")
+            logger.info(f"      Owner: {parcel.owner or 'Unknown'}")
+            logger.info(f"      LBCS Structure: {parcel.lbcs_structure} ({parcel.lbcs_structure_desc or 'N/A'})")
+            
+            centroid = parcel.centroid
+            processed_count += 1
+            
+            # ============ Fetch Satellite Imagery ============
+            logger.info(f"      📷 Fetching satellite imagery...")
+            
+            imagery_result = await property_imagery_pipeline.get_property_image(
+                lat=centroid.y,
+                lng=centroid.x,
+                address=parcel.address,
+            )
+            
+            if not imagery_result.success:
+                logger.warning(f"      ⚠️ Imagery failed: {imagery_result.error_message}")
+                writes.update(
+                    item.property_id,
+                    {"status": "failed", "status_error": imagery_result.error_message},
+                    checkpoint=item_state(item, "failed"),
                 )
-                db.add(db_property)
-                db.flush()
-                property_ids.append(db_property.id)
-                
-                # Store all Regrid data
-                db_property.regrid_id = parcel.parcel_id
-                db_property.regrid_apn = parcel.apn
-                db_property.regrid_owner = parcel.owner
-                db_property.regrid_owner2 = parcel.owner2
-                db_property.regrid_owner_type = parcel.owner_type
-                db_property.regrid_owner_address = parcel.mail_address
-                db_property.regrid_owner_city = parcel.mail_city
-                db_property.regrid_owner_state = parcel.mail_state
-                db_property.regrid_land_use = parcel.land_use
-                db_property.regrid_zoning = parcel.zoning
-                db_property.regrid_zoning_desc = parcel.zoning_description
-                db_property.regrid_year_built = str(parcel.year_built) if parcel.year_built else None
-                db_property.regrid_area_acres = parcel.area_acres
-                db_property.regrid_num_units = parcel.num_units
-                db_property.regrid_num_stories = parcel.num_stories
-                db_property.regrid_struct_style = parcel.struct_style
-                db_property.regrid_fetched_at = datetime.utcnow()
-                
-                # Store LBCS codes
-                db_property.lbcs_activity = parcel.lbcs_activity
-                db_property.lbcs_activity_desc = parcel.lbcs_activity_desc
-                db_property.lbcs_function = parcel.lbcs_function
-                db_property.lbcs_function_desc = parcel.lbcs_function_desc
-                db_property.lbcs_structure = parcel.lbcs_structure
-                db_property.lbcs_structure_desc = parcel.lbcs_structure_desc
-                db_property.lbcs_site = parcel.lbcs_site
-                db_property.lbcs_site_desc = parcel.lbcs_site_desc
-                db_property.lbcs_ownership = parcel.lbcs_ownership
-                db_property.lbcs_ownership_desc = parcel.lbcs_ownership_desc
-                
-                # Store polygon
-                if parcel.polygon:
-                    db_property.regrid_polygon = from_shape(parcel.polygon, srid=4326)
-                
-                # Classify property
-                category = classify_property(
-                    lbcs_structure=parcel.lbcs_structure,
-                    lbcs_activity=parcel.lbcs_activity,
-                    lbcs_function=parcel.lbcs_function,
-                    usecode=parcel.land_use,
-                    usedesc=parcel.land_use,
-                    zoning=parcel.zoning,
-                    zoning_description=parcel.zoning_description,
-                    struct_style=parcel.struct_style,
+                return None
+            
+            writes.update(item.property_id, self._imagery_values(imagery_result), checkpoint=item_state(item, "imagery"))
+            self._jobs[job_key]["progress"].properties_found = processed_count
+            
+            logger.info(f"      ✅ Imagery captured: {imagery_result.image_size[0]}x{imagery_result.image_size[1]} px")
+            logger.info(f"         Property area: {imagery_result.area_sqft:,.0f} sqft")
+            item.imagery = imagery_result
+            return item
+        
+        async def analyze(item: _LeadItem) -> Optional[_LeadItem]:
+            nonlocal analyzed_count, vlm_total_cost
+            parcel = item.parcel
+            if item.resume_stage == "vlm":
+                return item
+            if item.property_id in writes.failed:
+                return None
+            
+            if item.imagery is not None:
+                image_base64, area_sqft = item.imagery.image_base64, item.imagery.area_sqft
+            else:
+                # Resumed: use the image stored before the interruption
+                db_property = db.get(Property, item.property_id)
+                image_base64, area_sqft = db_property.satellite_image_base64, db_property.area_sqft
+                db.commit()
+            
+            # ============ VLM Analysis ============
+            logger.info(f"      🤖 Running VLM analysis: {parcel.address or parcel.parcel_id}")
+            
+            vlm_result = await vlm_analysis_service.analyze_property(
+                image_base64=image_base64,
+                scoring_prompt=scoring_prompt,
+                property_context={
+                    "address": parcel.address,
+                    "area_sqft": area_sqft,
+                    "owner": parcel.owner,
+                    "land_use": parcel.land_use,
+                },
+                user_api_key=user_api_key,
+            )
+            # The image isn't needed past this stage
+            item.imagery = None
+            
+            if not vlm_result.success:
+                logger.warning(f"      ⚠️ VLM analysis failed: {vlm_result.error_message}")
+                writes.checkpoint(*item_state(item, "failed"))
+                return None
+            
+            vlm_values = self._vlm_result_values(vlm_result)
+            writes.update(item.property_id, vlm_values, checkpoint=item_state(item, "vlm"))
+            
+            analyzed_count += 1
+            if vlm_result.usage:
+                vlm_total_cost += vlm_result.usage.cost
+            self._jobs[job_key]["progress"].properties_analyzed = analyzed_count
+            
+            logger.info(f"      🎯 VLM Score: {vlm_result.lead_score}/100 ({vlm_values['lead_quality']})")
+            return item
+        
+        async def enrich(item: _LeadItem) -> Optional[_LeadItem]:
+            nonlocal enriched_count
+            parcel = item.parcel
+            if item.property_id in writes.failed:
+                return None
+            if item.property_type is None:
+                # Resumed: classified when the parcel was claimed
+                item.property_type = db.get(Property, item.property_id).property_category
+                db.commit()
+            
+            # ============ LLM-Powered Enrichment ============
+            # Use LLM to intelligently find Property Manager contact data
+            logger.info(f"      📇 LLM-powered enrichment to find Property Manager: {parcel.address or parcel.parcel_id}")
+            if self._jobs[job_key]["status"] != DiscoveryStep.ENRICHING_LEADS:
+                self._update_job(job_key, DiscoveryStep.ENRICHING_LEADS)
+            
+            if settings.DISCOVERY_EXECUTION == "queue":
+                # Parcel-level task: whichever worker is free runs (and stores) the enrichment
+                result = await run_task(
+                    ENRICH_PROPERTY,
+                    {"property_id": str(item.property_id)},
+                    job_id=job_id,
                 )
-                db_property.property_category = category.value
-                
-                # ============ Fetch Satellite Imagery ============
-                logger.info(f"      📷 Fetching satellite imagery...")
-                
-                imagery_result = await property_imagery_pipeline.get_property_image(
-                    lat=centroid.y,
-                    lng=centroid.x,
-                    address=parcel.address,
+                enriched = bool(result and result.get("enriched"))
+                writes.checkpoint(*item_state(item, "enrichment", enriched=enriched))
+            else:
+                enrichment_result = await llm_enrichment_service.enrich(
+                    address=parcel.address or "",
+                    property_type=item.property_type,
+                    owner_name=parcel.owner,
+                    lbcs_code=parcel.lbcs_structure,
                 )
                 
-                if imagery_result.success:
-                    db_property.satellite_image_base64 = imagery_result.image_base64
-                    db_property.satellite_zoom_level = str(imagery_result.metadata.get('zoom', 20))
-                    db_property.satellite_fetched_at = datetime.utcnow()
-                    db_property.area_m2 = imagery_result.area_sqm
-                    db_property.area_sqft = imagery_result.area_sqft
-                    db_property.status = "imagery_captured"
-                    
-                    self._jobs[job_key]["progress"].properties_found = processed_count
-                    
-                    logger.info(f"      ✅ Imagery captured: {imagery_result.image_size[0]}x{imagery_result.image_size[1]} px")
-                    logger.info(f"         Property area: {imagery_result.area_sqft:,.0f} sqft")
-                    
-                    # ============ VLM Analysis ============
-                    logger.info(f"      🤖 Running VLM analysis...")
-                    
-                    vlm_result = await vlm_analysis_service.analyze_property(
-                        image_base64=imagery_result.image_base64,
-                        scoring_prompt=scoring_prompt,
-                        property_context={
-                            "address": parcel.address,
-                            "area_sqft": imagery_result.area_sqft,
-                            "owner": parcel.owner,
-                            "land_use": parcel.land_use,
-                        },
-                        user_api_key=user_api_key,
-                    )
-                    
-                    if vlm_result.success:
-                        db_property.lead_score = vlm_result.lead_score
-                        db_property.lead_quality = (
-                            'high' if vlm_result.lead_score >= 70 
-                            else 'medium' if vlm_result.lead_score >= 40 
-                            else 'low'
-                        )
-                        db_property.analysis_notes = vlm_result.reasoning
-                        db_property.analyzed_at = datetime.utcnow()
-                        db_property.status = "analyzed"
-                        
-                        if vlm_result.observations:
-                            db_property.paved_percentage = vlm_result.observations.paved_area_pct
-                            db_property.building_percentage = vlm_result.observations.building_pct
-                            db_property.landscaping_percentage = vlm_result.observations.landscaping_pct
-                        
-                        analyzed_count += 1
-                        if vlm_result.usage:
-                            vlm_total_cost += vlm_result.usage.cost
-                        
-                        logger.info(f"      🎯 VLM Score: {vlm_result.lead_score}/100 ({db_property.lead_quality})")
-                        
-                        # ============ LLM-Powered Enrichment ============
-                        # Use LLM to intelligently find Property Manager contact data
-                        logger.info(f"      📇 LLM-powered enrichment to find Property Manager...")
-                        self._update_job(job_key, DiscoveryStep.ENRICHING_LEADS)
-                        
-                        enrichment_result = await llm_enrichment_service.enrich(
-                            address=parcel.address or "",
-                            property_type=category.value,
-                            owner_name=parcel.owner,
-                            lbcs_code=parcel.lbcs_structure,
-                        )
-                        
-                        # Store enrichment steps for UI (detailed steps with URLs)
-                        import json
-                        if enrichment_result.detailed_steps:
-                            # Store detailed steps as JSON (includes URL, source, confidence)
-                            db_property.enrichment_steps = json.dumps([
-                                step.to_dict() for step in enrichment_result.detailed_steps
-                            ])
-                            flow_parts = [step.to_simple_string() for step in enrichment_result.detailed_steps]
-                            logger.info(f"         Flow: {' → '.join(flow_parts)}")
-                        elif enrichment_result.steps:
-                            # Fallback to simple steps if no detailed steps
-                            db_property.enrichment_steps = json.dumps(enrichment_result.steps)
-                            logger.info(f"         Flow: {' → '.join(enrichment_result.steps)}")
-                        
-                        if enrichment_result.success and enrichment_result.contact:
-                            contact = enrichment_result.contact
-                            db_property.contact_name = contact.name
-                            db_property.contact_first_name = contact.first_name
-                            db_property.contact_last_name = contact.last_name
-                            db_property.contact_email = contact.email
-                            db_property.contact_phone = contact.phone
-                            db_property.contact_title = contact.title
-                            db_property.contact_company = enrichment_result.management_company
-                            db_property.contact_company_website = enrichment_result.management_website
-                            db_property.enriched_at = datetime.utcnow()
-                            db_property.enrichment_source = "llm_enrichment"
-                            db_property.enrichment_status = "success"
-                            enriched_count += 1
-                            logger.info(f"      ✅ Found contact: {contact.name or contact.phone or contact.email}")
-                            logger.info(f"         Confidence: {enrichment_result.confidence:.0%}")
-                            if enrichment_result.management_company:
-                                logger.info(f"         Company: {enrichment_result.management_company}")
-                        else:
-                            db_property.enrichment_status = "not_found"
-                            if enrichment_result.error_message:
-                                logger.info(f"      ⚠️ Enrichment: {enrichment_result.error_message}")
-                    else:
-                        logger.warning(f"      ⚠️ VLM analysis failed: {vlm_result.error_message}")
-                else:
-                    logger.warning(f"      ⚠️ Imagery failed: {imagery_result.error_message}")
-                    db_property.status = "failed"
-                    db_property.status_error = imagery_result.error_message
-                
-                db.commit()
-                self._jobs[job_key]["progress"].properties_analyzed = analyzed_count
-                
-                # Rate limiting
-                await asyncio.sleep(0.3)
-                
-            except Exception as e:
-                logger.error(f"      ❌ Error processing parcel: {e}")
-                import traceback
-                traceback.print_exc()
-                db.rollback()
+                values, enriched = self._enrichment_values(enrichment_result)
+                writes.update(item.property_id, values, checkpoint=item_state(item, "enrichment", enriched=enriched))
+            
+            if enriched:
+                enriched_count += 1
+            return item
+        
+        pipeline = StagedPipeline(
+            discovery_source,
+            [
+                Stage("imagery", capture_imagery, workers=settings.DISCOVERY_IMAGERY_WORKERS),
+                Stage("vlm", analyze, workers=settings.DISCOVERY_VLM_WORKERS),
+                Stage("enrichment", enrich, workers=settings.DISCOVERY_ENRICHMENT_WORKERS),
+            ],
+            on_error=self._pipeline_error_handler(db, writes),
+            record_latency=timer.record,
+        )
+        try:
+            await pipeline.run(claimed_items())
+        except asyncio.CancelledError:
+            # Job cancelled - report what it got to
+            self._keep_partial_result(job_key, {
+                "property_ids": [str(pid) for pid in property_ids],
+                "analyzed": analyzed_count,
+                "enriched": enriched_count,
+                "vlm_total_cost": round(vlm_total_cost, 4),
+            })
+            raise
+        finally:
+            writes.close()
         
         # ============ Complete ============
-        self._update_job(job_key, DiscoveryStep.COMPLETED)
-        self._jobs[job_key]["completed_at"] = datetime.utcnow()
+        self._update_job(job_key, DiscoveryStep.COMPLETED, result={
+            "property_ids": [str(pid) for pid in property_ids],
+            "analyzed": analyzed_count,
+            "enriched": enriched_count,
+            "vlm_total_cost": round(vlm_total_cost, 4),
+        })
         
         elapsed = (datetime.utcnow() - start_time).total_seconds()
         
         logger.info("")
         logger.info("=" * 60)
-        logger.info(f"✅ REGRID-FIRST DISCOVERY COMPLETED")
+        logger.info(f"✅ {'TILE' if tile_first else 'REGRID'}-FIRST DISCOVERY COMPLETED")
         logger.info(f"   Job ID: {job_id}")
         logger.info(f"   Duration: {elapsed:.1f} seconds")
         logger.info(f"   Categories: {property_categories}")
@@ -2130,7 +2400,7 @@ class DiscoveryOrchestrator:
             businesses_loaded=0,
             vlm_total_cost=vlm_total_cost,
             metadata={
-                "mode": "regrid_first",
+                "mode": "tile_first" if tile_first else "regrid_first",
                 "property_categories": property_categories,
                 "parcels_processed": processed_count,
                 "leads_enriched": enriched_count,
@@ -2138,6 +2408,368 @@ class DiscoveryOrchestrator:
             }
         )
     
+    async def _collect_tile_first_parcels(
+        self,
+        area_polygon: Optional[Dict[str, Any]],
+        lbcs_queries: Dict[str, List[tuple]],
+        db: Session,
+        user_id: UUID,
+        max_lots: int,
+        min_acres: Optional[float] = None,
+        max_acres: Optional[float] = None,
+        timer: Optional[StageTimer] = None,
+    ) -> tuple:
+        """
+        Tile-first candidate collection for the regrid-first pipeline.
+        
+        1. Pull parcels for the area from Regrid MVT tiles (tiles quota, not records)
+        2. Screen on the tile data: acreage, already-known regrid ids, and land
+           use when the tiles carry LBCS codes (parcels without codes are kept
+           and checked against their record)
+        3. Fetch full records for the shortlist in batches, round by round,
+           until max_lots verified parcels are collected. Every verified
+           record of a round is kept (they are paid for) - the caller ranks
+           them and processes the best max_lots
+        
+        Returns (new parcels, records fetched, known parcels skipped). The tile
+        query and record batches are timed on `timer` (tile_screening /
+        regrid_records).
+        """
+        from app.core.arcgis_parcel_service import get_parcel_discovery_service
+        
+        timer = timer or StageTimer()
+        geometry = None
+        if area_polygon:
+            geometry = area_polygon.get("geometry") if area_polygon.get("type") == "Feature" else area_polygon
+        if not geometry or not geometry.get("coordinates"):
+            logger.warning("   ⚠️ Tile-first discovery needs a search polygon")
+            return [], 0, 0
+        
+        shortlist_size = max_lots * settings.TILE_FIRST_SHORTLIST_FACTOR
+        
+        # Tiles are cheap - over-collect so the shortlist survives screening
+        area_result = await timer.timed("tile_screening", get_parcel_discovery_service().query_parcels_in_area_with_coverage(
+            geometry,
+            min_acres=min_acres,
+            max_acres=max_acres,
+            limit=max(shortlist_size * 4, 100),
+        ))
+        
+        # Known parcels: one anti-join for all tile candidates
+        unseen_ids = set(new_regrid_ids(db, user_id, [p.regrid_id for p in area_result.parcels]))
+        
+        matched = []
+        unknown = []
+        skipped_known = 0
+        skipped_land_use = 0
+        skipped_no_id = 0
+        for tile_parcel in area_result.parcels:
+            if not tile_parcel.regrid_id:
+                skipped_no_id += 1
+                continue
+            if tile_parcel.regrid_id not in unseen_ids:
+                skipped_known += 1
+                continue
+            verdict = self._lbcs_matches(tile_parcel.land_use or {}, lbcs_queries)
+            if verdict is False:
+                skipped_land_use += 1
+            elif verdict:
+                matched.append(tile_parcel)
+            else:
+                unknown.append(tile_parcel)
+        
+        # Parcels whose tile land use already matches go first, each group value-first
+        matched.sort(key=tile_parcel_priority, reverse=True)
+        unknown.sort(key=tile_parcel_priority, reverse=True)
+        shortlist = (matched + unknown)[:shortlist_size]
+        
+        logger.info(f"   🧩 Tiles: {len(area_result.parcels)} parcels ({area_result.coverage * 100:.0f}% of area searched)")
+        logger.info(f"      Skipped: {skipped_known} known, {skipped_land_use} land use, {skipped_no_id} without ll_uuid")
+        logger.info(f"      Shortlist: {len(shortlist)} ({len(matched)} land-use matches, {len(unknown)} unverified)")
+        
+        new_parcels = []
+        records_fetched = 0
+        position = 0
+        batch_size = max(1, settings.REGRID_RECORDS_BATCH_SIZE)
+        
+        while position < len(shortlist) and len(new_parcels) < max_lots:
+            # Size each round by how many leads are still missing
+            needed = max_lots - len(new_parcels)
+            round_size = max(batch_size, needed * 2)
+            round_parcels = shortlist[position:position + round_size]
+            position += len(round_parcels)
+            
+            records = await timer.timed("regrid_records", regrid_service.get_parcels_by_ids(
+                [tile_parcel.regrid_id for tile_parcel in round_parcels],
+                batch_size=batch_size,
+            ))
+            records_fetched += len(records)
+            records_by_id = {record.parcel_id: record for record in records}
+            
+            # Keep shortlist order; records confirm land use for unverified parcels
+            for tile_parcel in round_parcels:
+                record = records_by_id.get(tile_parcel.regrid_id)
+                if record is None:
+                    continue
+                record_values = {field: getattr(record, field) for field in lbcs_queries}
+                if not self._lbcs_matches(record_values, lbcs_queries):
+                    continue
+                if record.polygon is None:
+                    logger.info(f"   ⚠️ Parcel {record.parcel_id} has no usable boundary, skipping")
+                    continue
+                new_parcels.append(record)
+        
+        logger.info(f"   ✅ Tile-first: {len(new_parcels)} parcels from {records_fetched} records ({len(area_result.parcels)} tile candidates)")
+        return new_parcels, records_fetched, skipped_known
+    
+    @staticmethod
+    def _lbcs_matches(values: Dict[str, Any], lbcs_queries: Dict[str, List[tuple]]) -> Optional[bool]:
+        """
+        Whether LBCS codes in `values` fall in any queried range.
+        
+        None when none of the queried fields has a usable code (unknown).
+        """
+        known = False
+        for field, ranges in lbcs_queries.items():
+            try:
+                code = int(float(values.get(field)))
+            except (TypeError, ValueError):
+                continue
+            known = True
+            if any(low <= code <= high for low, high in ranges):
+                return True
+        return False if known else None
+    
+    # ============ Staged pipeline helpers ============
+    
+    @staticmethod
+    def _regrid_parcel_values(parcel: Any) -> Dict[str, Any]:
+        """Property columns for Regrid parcel fields (owner, land use, LBCS codes, boundary)."""
+        values = {
+            "regrid_id": parcel.parcel_id,
+            "regrid_apn": parcel.apn,
+            "regrid_owner": parcel.owner,
+            "regrid_owner2": parcel.owner2,
+            "regrid_owner_type": parcel.owner_type,
+            "regrid_owner_address": parcel.mail_address,
+            "regrid_owner_city": parcel.mail_city,
+            "regrid_owner_state": parcel.mail_state,
+            "regrid_land_use": parcel.land_use,
+            "regrid_zoning": parcel.zoning,
+            "regrid_zoning_desc": parcel.zoning_description,
+            "regrid_year_built": str(parcel.year_built) if parcel.year_built else None,
+            "regrid_area_acres": parcel.area_acres,
+            "regrid_num_units": parcel.num_units,
+            "regrid_num_stories": parcel.num_stories,
+            "regrid_struct_style": parcel.struct_style,
+            "regrid_fetched_at": datetime.utcnow(),
+            
+            # LBCS codes (Premium tier - standardized classification)
+            "lbcs_activity": parcel.lbcs_activity,
+            "lbcs_activity_desc": parcel.lbcs_activity_desc,
+            "lbcs_function": parcel.lbcs_function,
+            "lbcs_function_desc": parcel.lbcs_function_desc,
+            "lbcs_structure": parcel.lbcs_structure,
+            "lbcs_structure_desc": parcel.lbcs_structure_desc,
+            "lbcs_site": parcel.lbcs_site,
+            "lbcs_site_desc": parcel.lbcs_site_desc,
+            "lbcs_ownership": parcel.lbcs_ownership,
+            "lbcs_ownership_desc": parcel.lbcs_ownership_desc,
+        }
+        if parcel.polygon:
+            values["regrid_polygon"] = from_shape(parcel.polygon, srid=4326)
+        return values
+    
+    @staticmethod
+    def _imagery_values(imagery_result: Any) -> Dict[str, Any]:
+        """Property columns for a captured satellite image."""
+        return {
+            "satellite_image_base64": imagery_result.image_base64,
+            "satellite_zoom_level": str(imagery_result.metadata.get('zoom', 20)),
+            "satellite_fetched_at": datetime.utcnow(),
+            "area_m2": imagery_result.area_sqm,
+            "area_sqft": imagery_result.area_sqft,
+            "status": "imagery_captured",
+        }
+    
+    @staticmethod
+    def _vlm_result_values(vlm_result: Any) -> Dict[str, Any]:
+        """Property columns for a successful VLM lead score and surface breakdown."""
+        values = {
+            "lead_score": vlm_result.lead_score,
+            "lead_quality": (
+                'high' if vlm_result.lead_score >= 70 
+                else 'medium' if vlm_result.lead_score >= 40 
+                else 'low'
+            ),
+            "analysis_notes": vlm_result.reasoning,
+            "analyzed_at": datetime.utcnow(),
+            "status": "analyzed",
+        }
+        if vlm_result.observations:
+            values["paved_percentage"] = vlm_result.observations.paved_area_pct
+            values["building_percentage"] = vlm_result.observations.building_pct
+            values["landscaping_percentage"] = vlm_result.observations.landscaping_pct
+        return values
+    
+    @staticmethod
+    def _enrichment_values(enrichment_result: Any) -> Tuple[Dict[str, Any], bool]:
+        """Property columns for LLM enrichment steps / contact, and whether a contact was found."""
+        import json
+        values: Dict[str, Any] = {}
+        # Store enrichment steps for UI (detailed steps with URLs)
+        if enrichment_result.detailed_steps:
+            values["enrichment_steps"] = json.dumps([
+                step.to_dict() for step in enrichment_result.detailed_steps
+            ])
+            flow_parts = [step.to_simple_string() for step in enrichment_result.detailed_steps]
+            logger.info(f"         Flow: {' → '.join(flow_parts)}")
+        elif enrichment_result.steps:
+            # Fallback to simple steps if no detailed steps
+            values["enrichment_steps"] = json.dumps(enrichment_result.steps)
+            logger.info(f"         Flow: {' → '.join(enrichment_result.steps)}")
+        
+        if enrichment_result.success and enrichment_result.contact:
+            contact = enrichment_result.contact
+            values.update(
+                contact_name=contact.name,
+                contact_first_name=contact.first_name,
+                contact_last_name=contact.last_name,
+                contact_email=contact.email,
+                contact_phone=contact.phone,
+                contact_title=contact.title,
+                contact_company=enrichment_result.management_company,
+                contact_company_website=enrichment_result.management_website,
+                enriched_at=datetime.utcnow(),
+                enrichment_source="llm_enrichment",
+                enrichment_status="success",
+            )
+            logger.info(f"      ✅ Found contact: {contact.name or contact.phone or contact.email}")
+            logger.info(f"         Confidence: {enrichment_result.confidence:.0%}")
+            if enrichment_result.management_company:
+                logger.info(f"         Company: {enrichment_result.management_company}")
+            return values, True
+        
+        values["enrichment_status"] = "not_found"
+        if enrichment_result.error_message:
+            logger.info(f"      ⚠️ Enrichment: {enrichment_result.error_message}")
+        return values, False
+    
+    @staticmethod
+    def _merge_business_property(db: Session, item: _LeadItem, property_id: UUID) -> None:
+        """Make another business's property this business's primary one and drop its placeholder."""
+        try:
+            link_businesses(db, [{
+                "property_id": property_id,
+                "business_id": item.business_id,
+                "match_score": 95.0,
+                "distance_meters": 0,
+                "is_primary": True,
+                "relationship_type": "tenant",
+            }])
+            # The placeholder's own association goes with it (ON DELETE CASCADE)
+            db.query(Property).filter(Property.id == item.property_id).delete(synchronize_session=False)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+    
+    @staticmethod
+    def _pipeline_error_handler(db: Session, writes: PropertyWriter) -> Callable[[str, Any, Exception], None]:
+        """
+        on_error for StagedPipeline: roll back the failed item's pending
+        changes and mark its property failed (with the next write batch).
+        """
+        def on_error(stage: str, item: _LeadItem, error: Exception) -> None:
+            import traceback
+            traceback.print_exc()
+            db.rollback()
+            if item.property_id is not None:
+                writes.update(item.property_id, {"status": "failed", "status_error": f"{stage}: {error}"})
+        
+        return on_error
+    
+    def _property_writer(self, job_key: str, db: Session) -> PropertyWriter:
+        """Batched property writes for a job; each batch also checkpoints its items and saves progress."""
+        def on_flush(checkpoints: Dict[str, Dict[str, Any]]) -> None:
+            if checkpoints:
+                self._checkpoint_items(job_key, checkpoints)
+            self._save_job(job_key)
+        
+        return PropertyWriter(db, on_flush=on_flush)
+    
+    def _collapse_company_names(self, company_names: List[str]) -> Dict[str, List[str]]:
+        """
+        Collapse company name variants into the minimal set of owner searches.
+        
+        Names are grouped by their normalized form (legal suffix, case and
+        punctuation removed). Within a `_simplify_company_name` bucket, a name
+        that extends a shorter one ("ABC PROPERTIES MANAGEMENT" vs
+        "ABC PROPERTIES") is covered by the shorter prefix search. Each
+        search uses the group's cleaned original spelling, since Regrid
+        stores owners as spelled ("O'BRIEN", "MIAMI-DADE", "SMITH & SONS").
+        
+        Returns:
+            Owner query -> company names it covers (in original order)
+        """
+        by_key: Dict[str, List[str]] = {}
+        spelling: Dict[str, str] = {}
+        for name in company_names:
+            if not name:
+                continue
+            clean = apollo_enrichment_service._clean_company_name(name).rstrip(" ,.")
+            key = normalize_owner_name(clean)
+            if len(key) >= 2:
+                by_key.setdefault(key, []).append(name)
+                spelling.setdefault(key, clean)
+        
+        buckets: Dict[str, List[str]] = {}
+        for key in by_key:
+            simple = normalize_owner_name(apollo_enrichment_service._simplify_company_name(spelling[key]))
+            buckets.setdefault(simple, []).append(key)
+        
+        groups: Dict[str, List[str]] = {}
+        for keys in buckets.values():
+            queries: List[str] = []
+            for key in sorted(keys, key=len):
+                covering = next((q for q in queries if key.startswith(q + " ")), None)
+                if covering:
+                    groups[spelling[covering]].extend(by_key[key])
+                else:
+                    queries.append(key)
+                    groups[spelling[key]] = list(by_key[key])
+        
+        return groups
+    
+    async def _resolve_search_scope(self, area_polygon: Optional[Dict[str, Any]]) -> GeoScope:
+        """
+        Resolve the Regrid query scope for a discovery area.
+        
+        Uses explicit ZIP / state / county_fips properties when present and
+        otherwise resolves the county from the polygon itself, so queries are
+        scoped to a single county instead of a whole state whenever possible.
+        """
+        if not area_polygon:
+            return GeoScope()
+        
+        props = area_polygon.get("properties") or {}
+        geometry = area_polygon.get("geometry") if area_polygon.get("type") == "Feature" else area_polygon
+        
+        try:
+            return await county_service.resolve_scope(
+                area_geometry=geometry if geometry and geometry.get("coordinates") else None,
+                zip_code=props.get("zip_code"),
+                county_fips=props.get("county_fips"),
+                state=props.get("state"),
+            )
+        except Exception as e:
+            logger.warning(f"   ⚠️ Could not resolve search scope: {e}")
+            return GeoScope(
+                zip_code=props.get("zip_code"),
+                county_fips=props.get("county_fips"),
+                state_code=props.get("state"),
+            )
+    
     def _get_already_processed_places_ids(
         self,
         places_ids: List[str],
@@ -2152,18 +2784,8 @@ class DiscoveryOrchestrator:
         
         This allows re-discovering businesses that failed or were skipped.
         """
-        if not places_ids:
-            return set()
-        
-        # Query businesses that have associated parking lots
-        processed = db.query(Business.places_id).join(
-            PropertyBusiness,
-            Business.id == PropertyBusiness.business_id
-        ).filter(
-            Business.places_id.in_(places_ids)
-        ).all()
-        
-        return {row[0] for row in processed}
+        # One anti-join style EXISTS query for the whole batch
+        return processed_places_ids(db, places_ids)
     
     def _count_high_value_leads(
         self,
@@ -2184,13 +2806,91 @@ class DiscoveryOrchestrator:
         
         return query.count()
     
+    def _save_job(self, job_key: str) -> None:
+        """Write the job's current state to the job store."""
+        job = self._jobs.get(job_key)
+        if job is None:
+            return
+        timer = self._timers.get(job_key)
+        if timer is not None and job.get("progress") is not None:
+            job["progress"].stage_timings = {
+                stage: StageTiming(**timing) for stage, timing in timer.summary().items()
+            }
+        # Status reporting must never break the discovery run itself
+        self._store_write(f"save discovery job {job_key}", get_job_store().save, job_key, job)
+    
+    def _save_checkpoint(self, job_key: str, checkpoint: Dict[str, Any]) -> None:
+        """Replace the job's resume checkpoint."""
+        self._store_write(f"checkpoint discovery job {job_key}", get_job_store().save_checkpoint, job_key, checkpoint)
+    
+    def _checkpoint_items(self, job_key: str, items: Dict[str, Dict[str, Any]]) -> None:
+        """Record the last stage each item cleared (item key -> state)."""
+        self._store_write(
+            f"checkpoint {len(items)} items of job {job_key}", get_job_store().set_checkpoint_items, job_key, items,
+        )
+    
+    def _store_write(self, what: str, write: Callable[..., None], job_key: str, value: Dict[str, Any]) -> None:
+        """
+        Run a job store write, logging (not raising) failures. Writes to a
+        blocking store (postgres) go to the writer thread with a snapshot of
+        `value`, so the event loop never waits on the database.
+        """
+        def run(snapshot: Dict[str, Any]) -> None:
+            try:
+                write(job_key, snapshot)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not {what}: {e}")
+        
+        if get_job_store().blocking:
+            self._store_writer.submit(run, copy.deepcopy(value))
+        else:
+            run(value)
+    
+    def _finish_job(self, job_key: str) -> None:
+        """Save final state (and stage metrics) and drop the job from this process's live jobs."""
+        self._save_job(job_key)
+        self._save_job_metrics(job_key)
+        self._jobs.pop(job_key, None)
+        self._timers.pop(job_key, None)
+    
+    def _stage_timer(self, job_key: str) -> StageTimer:
+        """The job's stage latency recorder (created on first use)."""
+        return self._timers.setdefault(job_key, StageTimer())
+    
+    def _save_job_metrics(self, job_key: str) -> None:
+        """Persist a finished job's stage latencies to discovery_job_metrics."""
+        job = self._jobs.get(job_key)
+        timer = self._timers.get(job_key)
+        if job is None or timer is None:
+            return
+        status = job.get("status")
+        if status not in (DiscoveryStep.COMPLETED, DiscoveryStep.FAILED, DiscoveryStep.CANCELLED):
+            return  # Interrupted (e.g. shutdown) - the resumed run records it
+        
+        def run(user_id: Optional[UUID], mode: Optional[str], stages: Dict[str, Dict[str, Any]], job_seconds: float) -> None:
+            try:
+                save_job_metrics(UUID(job_key), user_id, mode, status.value, stages, job_seconds=job_seconds)
+            except Exception as e:
+                # Metrics must never break the discovery run itself
+                logger.warning(f"⚠️ Could not save metrics of discovery job {job_key}: {e}")
+        
+        # Always a database write - keep it off the event loop
+        self._store_writer.submit(
+            run,
+            UUID(job["user_id"]) if job.get("user_id") else None,
+            job.get("mode"),
+            timer.summary(),
+            timer.elapsed(),
+        )
+    
     def _update_job(
         self,
         job_key: str,
         step: DiscoveryStep,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        result: Optional[Dict[str, Any]] = None,
     ) -> None:
-        """Update job status."""
+        """Update job status (and persist it)."""
         if job_key not in self._jobs:
             return
         
@@ -2216,24 +2916,216 @@ class DiscoveryOrchestrator:
         if error:
             self._jobs[job_key]["error"] = error
             self._jobs[job_key]["progress"].errors.append(error)
+        
+        if result is not None:
+            self._jobs[job_key]["result"] = result
+        
+        if step in (DiscoveryStep.COMPLETED, DiscoveryStep.FAILED, DiscoveryStep.CANCELLED):
+            self._jobs[job_key]["completed_at"] = datetime.utcnow()
+        
+        self._save_job(job_key)
     
     def get_job_status(self, job_id: UUID) -> Optional[Dict[str, Any]]:
-        """Get current job status."""
+        """Get current job status (from any worker - read from the job store)."""
         job_key = str(job_id)
-        return self._jobs.get(job_key)
+        try:
+            return get_job_store().get(job_key)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not load discovery job {job_key}: {e}")
+            return None
     
-    def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
-        """Remove old completed jobs from memory."""
-        cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
-        removed = 0
+    async def resume_job(self, job_id: UUID, db: Session) -> None:
+        """
+        Continue a checkpointed regrid-first / tile-first job where it stopped.
+        The job must have been claimed first (see request_resume / resume_interrupted_jobs).
+        """
+        job_key = str(job_id)
+        store = get_job_store()
+        job = await asyncio.to_thread(store.get, job_key)
+        checkpoint = await asyncio.to_thread(store.get_checkpoint, job_key)
+        if not job or not checkpoint:
+            logger.warning(f"⚠️ Discovery job {job_key} has no checkpoint to resume from")
+            return
+        if await asyncio.to_thread(self._cancel_requested, job_key):
+            logger.info(f"🛑 Discovery job {job_key} was cancelled - not resuming it")
+            return
         
-        for job_key in list(self._jobs.keys()):
-            job = self._jobs[job_key]
-            if job.get("completed_at") and job["completed_at"] < cutoff:
-                del self._jobs[job_key]
-                removed += 1
+        request = checkpoint["request"]
+        job.pop("error", None)
+        job.pop("completed_at", None)
+        self._jobs[job_key] = job
+        self._timers[job_key] = StageTimer()  # Times the resumed run - its metrics replace the first run's
+        logger.info(f"♻️ Resuming discovery job {job_key} ({len(checkpoint['items'])} parcels checkpointed)")
         
-        return removed
+        watcher = self._watch_for_cancel(job_key)
+        try:
+            await self._run_regrid_first_pipeline(
+                job_id, UUID(job["user_id"]), request["area_polygon"], DiscoveryFilters(**request["filters"]), db,
+                property_categories=request["property_categories"],
+                scoring_prompt=request["scoring_prompt"],
+                min_acres=request["min_acres"],
+                max_acres=request["max_acres"],
+                tile_first=request["tile_first"],
+                checkpoint=checkpoint,
+            )
+        except asyncio.CancelledError:
+            if not fired(watcher):
+                raise
+            resume_after_cancel()
+            self._mark_cancelled(job_key)
+        except Exception as e:
+            logger.error(f"❌ Resumed discovery job failed: {e}")
+            import traceback
+            traceback.print_exc()
+            self._update_job(job_key, DiscoveryStep.FAILED, error=str(e))
+        finally:
+            watcher.cancel()
+            self._finish_job(job_key)
+    
+    async def _in_background(self, run: Callable[..., Any], *args: Any) -> None:
+        """Run `run(*args, db)` with its own session (it outlives the request that started it)."""
+        db = SessionLocal()
+        try:
+            await run(*args, db)
+        finally:
+            db.close()
+    
+    def _spawn(self, job_key: str, coro: Any) -> None:
+        # Keep a reference so the task isn't garbage collected mid-run
+        task = asyncio.ensure_future(coro)
+        self._background_tasks[job_key] = task
+        task.add_done_callback(lambda _: self._background_tasks.pop(job_key, None))
+    
+    async def _enqueue(self, kind: str, payload: Dict[str, Any], job_id: UUID) -> None:
+        """Queue a task off the event loop, after any job store write already submitted for it."""
+        await asyncio.wrap_future(self._store_writer.submit(enqueue, kind, payload, job_id=job_id))
+    
+    async def _start_resume(self, job_id: UUID) -> None:
+        if settings.DISCOVERY_EXECUTION == "queue":
+            await self._enqueue(RESUME_JOB, {"job_id": str(job_id)}, job_id)
+        else:
+            self._spawn(str(job_id), self._in_background(self.resume_job, job_id))
+    
+    def _is_local(self, job_key: str) -> bool:
+        """Job is running (or about to run) in this process."""
+        return job_key in self._jobs or job_key in self._background_tasks
+    
+    async def request_resume(self, job_id: UUID) -> bool:
+        """
+        Resume an interrupted or failed job in this worker (API entry point).
+        Returns False if it is running somewhere, completed, or has no checkpoint.
+        """
+        job_key = str(job_id)
+        stale_after = timedelta(seconds=settings.DISCOVERY_JOB_STALE_SECONDS)
+        if self._is_local(job_key) or not await asyncio.to_thread(
+            get_job_store().claim_for_resume, job_key, stale_after, True
+        ):
+            return False
+        await self._start_resume(job_id)
+        return True
+    
+    def cancel_job(self, job_id: UUID) -> bool:
+        """
+        Stop a queued or running job (API entry point). Whichever process runs
+        it notices within DISCOVERY_CANCEL_POLL_SECONDS, aborts its in-flight
+        upstream calls and records the partial result. Returns False if the
+        job already finished.
+        """
+        job_key = str(job_id)
+        if not get_job_store().request_cancel(job_key):
+            return False
+        if settings.DISCOVERY_EXECUTION == "queue":
+            try:
+                cancel_job_tasks(job_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Could not cancel queued tasks of job {job_key}: {e}")
+        logger.info(f"🛑 Cancel requested for discovery job {job_key}")
+        return True
+    
+    def _cancel_requested(self, job_key: str) -> bool:
+        try:
+            return get_job_store().is_cancel_requested(job_key)
+        except Exception as e:
+            logger.warning(f"⚠️ Could not check discovery job {job_key} for cancellation: {e}")
+            return False
+    
+    def _watch_for_cancel(self, job_key: str) -> "asyncio.Task":
+        """Cancel the calling task (the job's run) once the job is asked to stop."""
+        async def cancel_requested() -> bool:
+            # Job store reads are blocking DB calls - keep them off the event loop
+            return await asyncio.to_thread(self._cancel_requested, job_key)
+        return cancel_when(cancel_requested, poll_seconds=settings.DISCOVERY_CANCEL_CHECK_SECONDS)
+    
+    def _keep_partial_result(self, job_key: str, result: Dict[str, Any]) -> None:
+        """A pipeline was stopped mid-run - keep what it got to (reported by _mark_cancelled)."""
+        if job_key in self._jobs:
+            self._jobs[job_key]["result"] = result
+    
+    def _mark_cancelled(self, job_key: str) -> None:
+        """Record a stopped job with whatever its pipeline got to (see the pipelines' partial results)."""
+        if job_key not in self._jobs or self._jobs[job_key]["status"] in (DiscoveryStep.COMPLETED, DiscoveryStep.FAILED):
+            return
+        result = {**(self._jobs[job_key].get("result") or {}), "cancelled": True}
+        self._update_job(job_key, DiscoveryStep.CANCELLED, result=result)
+        logger.info(f"🛑 Discovery job {job_key} cancelled")
+    
+    async def resume_interrupted_jobs(self) -> int:
+        """Claim and resume jobs whose worker went away mid-run. Returns how many were started."""
+        store = get_job_store()
+        stale_after = timedelta(seconds=settings.DISCOVERY_JOB_STALE_SECONDS)
+        started = 0
+        for job_key in await asyncio.to_thread(store.find_interrupted, stale_after):
+            if self._is_local(job_key) or not await asyncio.to_thread(store.claim_for_resume, job_key, stale_after):
+                continue
+            await self._start_resume(UUID(job_key))
+            started += 1
+        return started
+    
+    async def enrich_property(self, property_id: UUID, db: Session) -> bool:
+        """
+        LLM contact enrichment for one stored property (the parcel-level queue task).
+        Returns True if a contact was found.
+        """
+        db_property = db.get(Property, property_id)
+        if db_property is None:
+            logger.warning(f"⚠️ Property {property_id} not found for enrichment")
+            return False
+        address = db_property.address or ""
+        property_type = db_property.property_category
+        owner = db_property.regrid_owner
+        lbcs_code = int(db_property.lbcs_structure) if db_property.lbcs_structure is not None else None
+        db.commit()
+        
+        logger.info(f"      📇 LLM-powered enrichment to find Property Manager: {address or property_id}")
+        enrichment_result = await llm_enrichment_service.enrich(
+            address=address,
+            property_type=property_type,
+            owner_name=owner,
+            lbcs_code=lbcs_code,
+        )
+        
+        values, enriched = self._enrichment_values(enrichment_result)
+        writes = PropertyWriter(db)
+        writes.update(property_id, values)
+        writes.close()
+        return enriched
+    
+    async def run_resume_sweeper(self) -> None:
+        """Periodically resume interrupted jobs (runs for the app's lifetime)."""
+        while True:
+            # Sleep first - keeps startup free of DB work
+            await asyncio.sleep(settings.DISCOVERY_RESUME_SWEEP_SECONDS)
+            try:
+                started = await self.resume_interrupted_jobs()
+                if started:
+                    logger.info(f"♻️ Resumed {started} interrupted discovery jobs")
+            except Exception as e:
+                logger.warning(f"⚠️ Discovery resume sweep failed: {e}")
+    
+    def cleanup_old_jobs(self, max_age_hours: int = 24) -> int:
+        """Remove jobs completed more than `max_age_hours` ago (expired jobs are purged automatically)."""
+        cutoff = datetime.utcnow() - timedelta(hours=max_age_hours)
+        return get_job_store().delete_expired(completed_before=cutoff)
 
 
 # Singleton instance
@@ -0,0 +1,288 @@
+"""
+Discovery Work Queue
+
+A Postgres-backed task queue (the discovery_tasks table), so discovery work
+can run on any number of worker processes (`python -m app.worker`) instead
+of inside the API process that received the request. Nothing beyond the
+app's own Postgres is needed - a local Postgres is enough to run it.
+
+- enqueue(): insert a task and return at once
+- claim(): `UPDATE ... WHERE id IN (SELECT ... FOR UPDATE SKIP LOCKED)` -
+  concurrent workers never block on or double-claim the same task
+- Leases: a claimed task is leased for DISCOVERY_TASK_LEASE_SECONDS and the
+  worker heartbeats to extend it. If the worker dies, the lease expires and
+  the task is claimed again (counting as an attempt)
+- fail(): retried with exponential backoff until max_attempts, then failed
+- run_task(): enqueue + wait for the result - fans a parcel-level task out
+  to whichever worker is free
+- cancel_job_tasks(): a cancelled job's queued tasks are never claimed, and
+  workers stop its running parcel-level tasks (see cancelled())
+
+Task kinds and their handlers are wired up in app/worker.py.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy import and_, func, or_, select, update
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models.discovery_task import DiscoveryTask
+
+logger = logging.getLogger(__name__)
+
+
+# Task kinds
+DISCOVERY_JOB = "discovery_job"  # Run a whole orchestrator job
+RESUME_JOB = "resume_job"  # Resume a checkpointed job
+ENRICH_PROPERTY = "enrich_property"  # Parcel-level: LLM contact enrichment for one property
+
+# Job-level tasks may wait on parcel-level ones, so workers run the two in
+# separate slot pools - parcel tasks can never be starved by waiting jobs
+JOB_KINDS = (DISCOVERY_JOB, RESUME_JOB)
+PARCEL_KINDS = (ENRICH_PROPERTY,)
+
+
+class TaskFailed(Exception):
+    """A task awaited with run_task() failed permanently."""
+
+
+@dataclass
+class QueuedTask:
+    """A task claimed by a worker."""
+    id: UUID
+    kind: str
+    payload: Dict[str, Any]
+    job_id: Optional[UUID]
+    attempts: int
+    max_attempts: int
+
+
+def _execute(stmt) -> List[Any]:
+    """Run one statement in its own short session; returns RETURNING rows (if any)."""
+    db = SessionLocal()
+    try:
+        result = db.execute(stmt)
+        rows = result.fetchall() if result.returns_rows else []
+        db.commit()
+        return rows
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def enqueue(
+    kind: str,
+    payload: Dict[str, Any],
+    job_id: Optional[UUID] = None,
+    max_attempts: Optional[int] = None,
+) -> UUID:
+    """Add a task to the queue. Payload must be JSON-serializable."""
+    db = SessionLocal()
+    try:
+        task = DiscoveryTask(
+            kind=kind,
+            payload=payload,
+            job_id=job_id,
+            status="queued",
+            attempts=0,
+            max_attempts=max_attempts or settings.DISCOVERY_TASK_MAX_ATTEMPTS,
+        )
+        db.add(task)
+        db.commit()
+        logger.info(f"📥 Enqueued {kind} task {task.id}" + (f" (job {job_id})" if job_id else ""))
+        return task.id
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+def claim(worker_id: str, kinds: Sequence[str], limit: int = 1) -> List[QueuedTask]:
+    """
+    Lease up to `limit` runnable tasks of the given kinds: queued ones whose
+    backoff has passed, and running ones whose lease expired (their worker
+    went away).
+    """
+    lease = timedelta(seconds=settings.DISCOVERY_TASK_LEASE_SECONDS)
+    runnable = (
+        select(DiscoveryTask.id)
+        .where(DiscoveryTask.kind.in_(kinds))
+        .where(or_(
+            and_(DiscoveryTask.status == "queued", DiscoveryTask.run_after <= func.now()),
+            and_(
+                DiscoveryTask.status == "running",
+                DiscoveryTask.lease_expires_at < func.now(),
+                DiscoveryTask.attempts < DiscoveryTask.max_attempts,
+            ),
+        ))
+        .order_by(DiscoveryTask.run_after)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    rows = _execute(
+        update(DiscoveryTask)
+        .where(DiscoveryTask.id.in_(runnable.scalar_subquery()))
+        .values(
+            status="running",
+            attempts=DiscoveryTask.attempts + 1,
+            locked_by=worker_id,
+            lease_expires_at=func.now() + lease,
+            heartbeat_at=func.now(),
+            started_at=func.now(),
+        )
+        .returning(
+            DiscoveryTask.id,
+            DiscoveryTask.kind,
+            DiscoveryTask.payload,
+            DiscoveryTask.job_id,
+            DiscoveryTask.attempts,
+            DiscoveryTask.max_attempts,
+        )
+    )
+    return [
+        QueuedTask(
+            id=row.id,
+            kind=row.kind,
+            payload=row.payload,
+            job_id=row.job_id,
+            attempts=row.attempts,
+            max_attempts=row.max_attempts,
+        )
+        for row in rows
+    ]
+
+
+def heartbeat(task_ids: List[UUID], worker_id: str) -> int:
+    """Extend the leases this worker still holds. Returns how many were extended."""
+    if not task_ids:
+        return 0
+    lease = timedelta(seconds=settings.DISCOVERY_TASK_LEASE_SECONDS)
+    rows = _execute(
+        update(DiscoveryTask)
+        .where(
+            DiscoveryTask.id.in_(task_ids),
+            DiscoveryTask.status == "running",
+            DiscoveryTask.locked_by == worker_id,
+        )
+        .values(lease_expires_at=func.now() + lease, heartbeat_at=func.now())
+        .returning(DiscoveryTask.id)
+    )
+    return len(rows)
+
+
+def complete(task_id: UUID, worker_id: str, result: Optional[Dict[str, Any]] = None) -> None:
+    _execute(
+        update(DiscoveryTask)
+        .where(
+            DiscoveryTask.id == task_id,
+            DiscoveryTask.locked_by == worker_id,
+            DiscoveryTask.status != "cancelled",  # Cancelled while running - keep it cancelled
+        )
+        .values(status="done", result=result, lease_expires_at=None, finished_at=func.now())
+    )
+
+
+def fail(task: QueuedTask, worker_id: str, error: str) -> bool:
+    """
+    Record a failed attempt. Requeues with exponential backoff while attempts
+    remain; returns True if the task will be retried.
+    """
+    retry = task.attempts < task.max_attempts
+    backoff = timedelta(seconds=settings.DISCOVERY_TASK_RETRY_BASE_SECONDS * 2 ** (task.attempts - 1))
+    values: Dict[str, Any] = {"last_error": error[:2000], "lease_expires_at": None, "locked_by": None}
+    if retry:
+        values.update(status="queued", run_after=func.now() + backoff)
+    else:
+        values.update(status="failed", finished_at=func.now())
+    _execute(
+        update(DiscoveryTask)
+        .where(
+            DiscoveryTask.id == task.id,
+            DiscoveryTask.locked_by == worker_id,
+            DiscoveryTask.status != "cancelled",
+        )
+        .values(**values)
+    )
+    return retry
+
+
+def reap_abandoned() -> int:
+    """Fail running tasks whose lease expired with no attempts left (their worker kept dying)."""
+    rows = _execute(
+        update(DiscoveryTask)
+        .where(
+            DiscoveryTask.status == "running",
+            DiscoveryTask.lease_expires_at < func.now(),
+            DiscoveryTask.attempts >= DiscoveryTask.max_attempts,
+        )
+        .values(status="failed", last_error="Lease expired on the final attempt", finished_at=func.now())
+        .returning(DiscoveryTask.id)
+    )
+    return len(rows)
+
+
+def cancel_job_tasks(job_id: UUID) -> int:
+    """Cancel a job's queued and running tasks. Returns how many were cancelled."""
+    rows = _execute(
+        update(DiscoveryTask)
+        .where(DiscoveryTask.job_id == job_id, DiscoveryTask.status.in_(("queued", "running")))
+        .values(status="cancelled", lease_expires_at=None, finished_at=func.now())
+        .returning(DiscoveryTask.id)
+    )
+    return len(rows)
+
+
+def cancelled(task_ids: List[UUID]) -> List[UUID]:
+    """Which of these tasks have been cancelled."""
+    if not task_ids:
+        return []
+    rows = _execute(
+        select(DiscoveryTask.id).where(DiscoveryTask.id.in_(task_ids), DiscoveryTask.status == "cancelled")
+    )
+    return [row.id for row in rows]
+
+
+def get_task(task_id: UUID) -> Optional[Dict[str, Any]]:
+    db = SessionLocal()
+    try:
+        row = db.execute(
+            select(DiscoveryTask.status, DiscoveryTask.result, DiscoveryTask.last_error)
+            .where(DiscoveryTask.id == task_id)
+        ).first()
+        return {"status": row.status, "result": row.result, "error": row.last_error} if row else None
+    finally:
+        db.close()
+
+
+async def run_task(
+    kind: str,
+    payload: Dict[str, Any],
+    job_id: Optional[UUID] = None,
+    poll_seconds: float = 2.0,
+) -> Optional[Dict[str, Any]]:
+    """
+    Enqueue a task and wait for a worker to finish it (waiting holds no
+    connection and no worker slot). Raises TaskFailed if it fails for good.
+    The queue calls run in a thread so polling never blocks the event loop.
+    """
+    task_id = await asyncio.to_thread(enqueue, kind, payload, job_id=job_id)
+    while True:
+        await asyncio.sleep(poll_seconds)
+        task = await asyncio.to_thread(get_task, task_id)
+        if task is None:
+            raise TaskFailed(f"{kind} task {task_id} disappeared")
+        if task["status"] == "done":
+            return task["result"]
+        if task["status"] == "failed":
+            raise TaskFailed(task["error"] or f"{kind} task {task_id} failed")
+        if task["status"] == "cancelled":
+            raise TaskFailed(f"{kind} task {task_id} was cancelled")
@@ -0,0 +1,214 @@
+"""
+Batched Discovery Writes
+
+Discovery pipelines used to flush and commit once per parcel and issue a
+separate UPDATE after every stage (imagery, VLM, enrichment) - about ten
+round-trips per lead. Here the writes are buffered and go out in batches:
+
+- PropertyWriter.update(): column values for an existing property, merged
+  per property and written with one executemany UPDATE per column set
+  (psycopg2 execute_batch - one round-trip per page of rows), one commit
+  per batch
+- PropertyWriter.checkpoint(): resume-checkpoint states, written with the
+  batch they describe - only after its commit, so a checkpoint never claims
+  more than the database has
+- upsert_businesses() / primary_properties() / insert_properties() /
+  link_businesses(): the business-first bookkeeping for a whole batch of
+  businesses in four statements instead of lookups and inserts per business
+
+A batch is written when it reaches DISCOVERY_WRITE_BATCH_SIZE rows or
+DISCOVERY_WRITE_FLUSH_SECONDS after its first row, and by close().
+
+Partial failure: if a batch statement fails, the batch is rolled back and
+its rows are written one by one; a row that still fails marks its property
+failed (and checkpoints it so) without losing the rest of the batch.
+
+Database sessions: flush() is synchronous and ends in commit() / rollback(),
+like every other staged-pipeline section (see staged_pipeline.py).
+"""
+
+import asyncio
+import logging
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.business import Business
+from app.models.property import Property
+from app.models.property_business import PropertyBusiness
+
+logger = logging.getLogger(__name__)
+
+
+class PropertyWriter:
+    """Buffers property UPDATEs (and the checkpoints that depend on them) for a pipeline run."""
+
+    def __init__(
+        self,
+        db: Session,
+        on_flush: Optional[Callable[[Dict[str, Dict[str, Any]]], None]] = None,
+        batch_size: Optional[int] = None,
+        flush_seconds: Optional[float] = None,
+    ):
+        self.db = db
+        self.on_flush = on_flush  # Receives the batch's checkpoint states once it is committed
+        self.batch_size = max(1, batch_size or settings.DISCOVERY_WRITE_BATCH_SIZE)
+        self.flush_seconds = flush_seconds if flush_seconds is not None else settings.DISCOVERY_WRITE_FLUSH_SECONDS
+        self.failed: Set[UUID] = set()  # Properties whose write failed - later writes are dropped
+        self._updates: Dict[UUID, Dict[str, Any]] = {}
+        self._checkpoints: List[Tuple[Optional[UUID], str, Dict[str, Any]]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def update(
+        self,
+        property_id: UUID,
+        values: Dict[str, Any],
+        checkpoint: Optional[Tuple[str, Dict[str, Any]]] = None,
+    ) -> None:
+        """Buffer column values for a property (merged with any still pending for it)."""
+        if property_id in self.failed:
+            return
+        self._updates.setdefault(property_id, {}).update(values)
+        if checkpoint:
+            self._checkpoints.append((property_id, *checkpoint))
+        self._schedule()
+
+    def checkpoint(self, item_key: str, state: Dict[str, Any]) -> None:
+        """Buffer a checkpoint state that has no property write of its own."""
+        self._checkpoints.append((None, item_key, state))
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if len(self._updates) + len(self._checkpoints) >= self.batch_size:
+            self.flush()
+        elif self._timer is None:
+            try:
+                self._timer = asyncio.get_running_loop().call_later(self.flush_seconds, self.flush)
+            except RuntimeError:
+                # No event loop (sync caller) - write now
+                self.flush()
+
+    def flush(self) -> None:
+        """Write and commit everything buffered."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        updates, self._updates = self._updates, {}
+        checkpoints, self._checkpoints = self._checkpoints, []
+        if not updates and not checkpoints:
+            return
+
+        if updates:
+            try:
+                self._write(updates)
+                self.db.commit()
+            except Exception as e:
+                self.db.rollback()
+                logger.warning(f"   ⚠️ Batch write of {len(updates)} properties failed ({e}) - writing one by one")
+                for property_id, values in updates.items():
+                    self._write_one(property_id, values)
+
+        states = {
+            item_key: (
+                {"property_id": str(property_id), "stage": "failed"} if property_id in self.failed else state
+            )
+            for property_id, item_key, state in checkpoints
+        }
+        if self.on_flush:
+            try:
+                self.on_flush(states)
+            except Exception as e:
+                logger.warning(f"   ⚠️ Post-write hook failed: {e}")
+
+    def close(self) -> None:
+        """Write whatever is still buffered (end of the run)."""
+        self.flush()
+
+    def _write_one(self, property_id: UUID, values: Dict[str, Any]) -> None:
+        try:
+            self._write({property_id: values})
+            self.db.commit()
+        except Exception as e:
+            self.db.rollback()
+            self.failed.add(property_id)
+            logger.error(f"   ❌ Could not write property {property_id}: {e}")
+            try:
+                self._write({property_id: {"status": "failed", "status_error": f"write: {e}"[:500]}})
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+
+    def _write(self, updates: Dict[UUID, Dict[str, Any]]) -> None:
+        """One executemany UPDATE per distinct set of columns."""
+        table = Property.__table__
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = defaultdict(list)
+        for property_id, values in updates.items():
+            columns = tuple(sorted(values))
+            groups[columns].append({"_id": property_id, **{f"_{c}": values[c] for c in columns}})
+
+        for columns, rows in groups.items():
+            stmt = (
+                table.update()
+                .where(table.c.id == bindparam("_id"))
+                .values({column: bindparam(f"_{column}", type_=table.c[column].type) for column in columns})
+            )
+            self.db.execute(stmt, rows)
+
+
+def upsert_businesses(db: Session, rows: List[Dict[str, Any]]) -> Dict[str, UUID]:
+    """
+    Insert businesses (keyed on places_id) in one statement; ones already
+    stored only get their missing phone / website filled in.
+    Returns places_id -> business id.
+    """
+    # ON CONFLICT DO UPDATE can't touch the same row twice in one statement
+    rows = list({row["places_id"]: {"id": uuid.uuid4(), **row} for row in rows}.values())
+    if not rows:
+        return {}
+
+    stmt = insert(Business).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Business.places_id],
+        set_={
+            "phone": func.coalesce(Business.phone, stmt.excluded.phone),
+            "website": func.coalesce(Business.website, stmt.excluded.website),
+        },
+    ).returning(Business.id, Business.places_id)
+    return {row.places_id: row.id for row in db.execute(stmt)}
+
+
+def primary_properties(db: Session, business_ids: List[UUID]) -> Dict[UUID, Tuple[UUID, Optional[str]]]:
+    """business id -> (property id, status) of each business's primary property."""
+    if not business_ids:
+        return {}
+    stmt = (
+        select(PropertyBusiness.business_id, Property.id, Property.status)
+        .join(Property, Property.id == PropertyBusiness.property_id)
+        .where(PropertyBusiness.business_id.in_(business_ids), PropertyBusiness.is_primary == True)
+    )
+    return {row.business_id: (row.id, row.status) for row in db.execute(stmt)}
+
+
+def insert_properties(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """Insert new properties in one statement (rows carry their own ids)."""
+    if not rows:
+        return
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    db.execute(insert(Property).values([{column: row.get(column) for column in columns} for row in rows]))
+
+
+def link_businesses(db: Session, rows: List[Dict[str, Any]]) -> None:
+    """Insert property <-> business associations, skipping ones that exist."""
+    if not rows:
+        return
+    db.execute(
+        insert(PropertyBusiness)
+        .values([{"id": uuid.uuid4(), **row} for row in rows])
+        .on_conflict_do_nothing(constraint="uq_property_business")
+    )
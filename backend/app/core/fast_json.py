@@ -0,0 +1,81 @@
+"""
+Fast JSON Handling
+
+orjson-backed helpers for the large payloads that move through the API:
+Regrid / search upstream responses, boundary layers and parcel GeoJSON.
+
+- loads(): decode bytes/str (use with `response.content`, not `response.json()`)
+- dumps(): encode to bytes, with Decimal / UUID / datetime support
+- FastJSONResponse: drop-in JSONResponse for the map endpoints
+
+Falls back to the stdlib json module if orjson is not installed.
+"""
+
+import datetime
+import decimal
+import json
+import logging
+import uuid
+from typing import Any
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _default(obj: Any) -> Any:
+    """Encode types orjson / json don't handle natively."""
+    if isinstance(obj, decimal.Decimal):
+        # Keep integral values as ints (e.g. NUMERIC ids), everything else as float
+        return int(obj) if obj == obj.to_integral_value() else float(obj)
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    # numpy scalars / arrays (geo helpers return these)
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def loads(data: Any) -> Any:
+        """Decode JSON from bytes / str."""
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object to JSON bytes."""
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+else:
+    logger.warning("orjson not installed - falling back to stdlib json")
+
+    def loads(data: Any) -> Any:
+        """Decode JSON from bytes / str."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Encode an object to JSON bytes."""
+        return json.dumps(
+            obj, default=_default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
+
+def dumps_str(obj: Any) -> str:
+    """Encode an object to a JSON string (e.g. for SQL parameters)."""
+    return dumps(obj).decode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (Decimal / UUID / datetime aware)."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,138 @@
+"""
+Geodesic Geometry Utilities
+
+Shared area / distance math for WGS84 (lng/lat) geometries, so parcel
+acreage and distances agree across services (tile discovery, Regrid records,
+imagery, property association).
+
+- areas_m2(): areas for a batch of geometries in one pass - geometries are
+  grouped into 6-degree cells and projected with one vectorized
+  shapely.transform call per cell into an equal-area projection
+- area_m2() / acres(): single-geometry convenience wrappers
+- haversine_m(): great-circle distance, scalars or numpy arrays
+- meters_per_degree(): local degree -> meter scale (WGS84), for offsets
+  and bounding boxes
+- geometry_distance_m() / bounds_radius_m(): distances between lng/lat
+  geometries and search radii for bounding boxes
+"""
+
+import logging
+from functools import lru_cache
+from typing import Any, Sequence, Tuple
+
+import numpy as np
+import pyproj
+import shapely
+from shapely.ops import nearest_points
+
+logger = logging.getLogger(__name__)
+
+
+SQ_METERS_PER_ACRE = 4046.8564224
+EARTH_RADIUS_M = 6371000.0
+
+
+# Geometries are projected in 6x6 degree cells (same width as UTM zones)
+_CELL_DEGREES = 6
+
+
+@lru_cache(maxsize=64)
+def _equal_area_transformer(cell_x: int, cell_y: int) -> pyproj.Transformer:
+    """Lambert azimuthal equal-area projection centered on a grid cell"""
+    lon_0 = cell_x * _CELL_DEGREES + _CELL_DEGREES / 2 - 180
+    lat_0 = cell_y * _CELL_DEGREES + _CELL_DEGREES / 2 - 90
+    laea = pyproj.CRS(f'+proj=laea +lat_0={lat_0} +lon_0={lon_0} +ellps=WGS84 +units=m')
+    return pyproj.Transformer.from_crs(pyproj.CRS('EPSG:4326'), laea, always_xy=True)
+
+
+def areas_m2(geoms: Sequence[Any]) -> np.ndarray:
+    """
+    Areas in square meters for a batch of lng/lat geometries.
+
+    Each geometry is projected into an ellipsoidal equal-area projection
+    centered on its centroid's grid cell, so areas match geodesic areas
+    (pyproj Geod) to well under 0.01%. Missing, empty or invalid geometries
+    give 0.
+    """
+    geoms_array = np.empty(len(geoms), dtype=object)
+    geoms_array[:] = list(geoms)
+    result = np.zeros(len(geoms_array), dtype=float)
+
+    present = np.flatnonzero(~shapely.is_missing(geoms_array) & ~shapely.is_empty(geoms_array))
+    if not len(present):
+        return result
+
+    centroids = shapely.centroid(geoms_array[present])
+    lngs = shapely.get_x(centroids)
+    lats = shapely.get_y(centroids)
+    valid = np.isfinite(lngs) & np.isfinite(lats)
+
+    indices = present[valid]
+    cell_x = np.clip((lngs[valid] + 180) // _CELL_DEGREES, 0, 360 // _CELL_DEGREES - 1).astype(int)
+    cell_y = np.clip((lats[valid] + 90) // _CELL_DEGREES, 0, 180 // _CELL_DEGREES - 1).astype(int)
+    keys = cell_x * 1000 + cell_y
+
+    for key in np.unique(keys):
+        group = indices[keys == key]
+        transformer = _equal_area_transformer(int(key // 1000), int(key % 1000))
+
+        def project(coords: np.ndarray) -> np.ndarray:
+            x, y = transformer.transform(coords[:, 0], coords[:, 1])
+            return np.column_stack([x, y])
+
+        projected = shapely.transform(geoms_array[group], project)
+        result[group] = shapely.area(projected)
+
+    return np.nan_to_num(result)
+
+
+def area_m2(geom: Any) -> float:
+    """Area of a single lng/lat geometry in square meters"""
+    return float(areas_m2([geom])[0])
+
+
+def acres(geom: Any) -> float:
+    """Area of a single lng/lat geometry in acres"""
+    return area_m2(geom) / SQ_METERS_PER_ACRE
+
+
+def haversine_m(lat1: Any, lng1: Any, lat2: Any, lng2: Any) -> Any:
+    """
+    Great-circle distance in meters. Accepts scalars or numpy arrays
+    (broadcast), returning a float or an array accordingly.
+    """
+    lat1, lng1, lat2, lng2 = (np.radians(np.asarray(v, dtype=float)) for v in (lat1, lng1, lat2, lng2))
+
+    a = (np.sin((lat2 - lat1) / 2) ** 2 +
+         np.cos(lat1) * np.cos(lat2) * np.sin((lng2 - lng1) / 2) ** 2)
+    distance = 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+    return float(distance) if distance.ndim == 0 else distance
+
+
+def meters_per_degree(lat: float) -> Tuple[float, float]:
+    """
+    Meters per degree of latitude and of longitude at `lat` on the WGS84
+    ellipsoid (series expansion, accurate to centimeters).
+    """
+    phi = np.radians(lat)
+    m_lat = 111132.92 - 559.82 * np.cos(2 * phi) + 1.175 * np.cos(4 * phi) - 0.0023 * np.cos(6 * phi)
+    m_lng = 111412.84 * np.cos(phi) - 93.5 * np.cos(3 * phi) + 0.118 * np.cos(5 * phi)
+    return float(m_lat), float(m_lng)
+
+
+def geometry_distance_m(geom1: Any, geom2: Any) -> float:
+    """Great-circle distance in meters between the nearest points of two lng/lat geometries (0 if they touch)"""
+    if geom1.intersects(geom2):
+        return 0.0
+    point1, point2 = nearest_points(geom1, geom2)
+    return haversine_m(point1.y, point1.x, point2.y, point2.x)
+
+
+def bounds_radius_m(bounds: Sequence[float]) -> float:
+    """Half the longer side, in meters, of a (min_lng, min_lat, max_lng, max_lat) box"""
+    min_lng, min_lat, max_lng, max_lat = bounds
+    center_lat = (min_lat + max_lat) / 2
+    height = haversine_m(min_lat, min_lng, max_lat, min_lng)
+    width = haversine_m(center_lat, min_lng, center_lat, max_lng)
+    return max(width, height) / 2
@@ -15,6 +15,8 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, asdict
 
 from app.core.config import settings
+from app.core.fast_json import dumps
+from app.core.single_flight import get_single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +79,9 @@ class GooglePlacesService:
             fields.extend(self.ENTERPRISE_FIELDS)
         self.field_mask = ",".join(fields)
         
+        # Identical concurrent searches share one (paginated) request chain
+        self._search_flight = get_single_flight("google_places_search")
+        
     async def search_places(
         self,
         query: str,
@@ -104,6 +109,30 @@ class GooglePlacesService:
             logger.error("GOOGLE_PLACES_KEY not configured")
             return []
         
+        key = (
+            query,
+            dumps(location_restriction) if location_restriction else None,
+            dumps(location_bias) if location_bias else None,
+            max_results,
+            included_type,
+        )
+        results = await self._search_flight.do(
+            key,
+            lambda: self._search_places(
+                query, location_restriction, location_bias, max_results, included_type,
+            ),
+        )
+        # Shared result - give each caller its own list
+        return list(results)
+    
+    async def _search_places(
+        self,
+        query: str,
+        location_restriction: Optional[Dict[str, Any]],
+        location_bias: Optional[Dict[str, Any]],
+        max_results: int,
+        included_type: Optional[str],
+    ) -> List[PlaceResult]:
         all_results: List[PlaceResult] = []
         next_page_token: Optional[str] = None
         page_count = 0
@@ -20,6 +20,7 @@ from dataclasses import dataclass, field, asdict
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse, quote_plus
 
+from app.core.adaptive_limiter import get_limiter
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -354,6 +355,12 @@ class LLMEnrichmentService:
         self._client: Optional[httpx.AsyncClient] = None
         self.model = "openai/gpt-4o-mini"
         self.api_key = settings.OPENROUTER_API_KEY
+        # OpenRouter calls share the VLM service's adaptive concurrency limit
+        self._llm_limiter = get_limiter(
+            "openrouter",
+            initial_limit=settings.OPENROUTER_CONCURRENCY_INITIAL,
+            max_limit=settings.OPENROUTER_CONCURRENCY_MAX,
+        )
         
     @property
     def is_configured(self) -> bool:
@@ -1466,7 +1473,7 @@ class LLMEnrichmentService:
         try:
             client = await self._get_client()
             
-            response = await client.post(
+            response = await self._llm_limiter.run(lambda: client.post(
                 "https://openrouter.ai/api/v1/chat/completions",
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
@@ -1478,7 +1485,7 @@ class LLMEnrichmentService:
                     "temperature": 0.1,
                     "max_tokens": 1000,
                 }
-            )
+            ))
             
             if response.status_code != 200:
                 logger.error(f"  [LLM] API error: {response.status_code}")
@@ -26,6 +26,9 @@ import httpx
 import math
 
 from app.core.config import settings
+from app.core.adaptive_limiter import get_limiter
+from app.core.geo_utils import area_m2
+from app.core.single_flight import get_single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +57,14 @@ class PolygonImageryService:
         # Transformer for converting lat/lng to Web Mercator
         self.transformer = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
         self._http_client = None
+        # Adaptive concurrency (AIMD) for Google Static Maps
+        self._static_maps_limiter = get_limiter(
+            "google_static_maps",
+            initial_limit=settings.GOOGLE_STATIC_MAPS_CONCURRENCY_INITIAL,
+            max_limit=settings.GOOGLE_STATIC_MAPS_CONCURRENCY_MAX,
+        )
+        # Concurrent requests for the same image share one download
+        self._static_maps_flight = get_single_flight("google_static_maps")
     
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -206,7 +217,14 @@ class PolygonImageryService:
         logger.info(f"Fetching Google Static Maps: center={center_lat:.6f},{center_lng:.6f}, zoom={actual_zoom}")
         
         client = await self._get_client()
-        response = await client.get(self.GOOGLE_STATIC_MAPS_URL, params=params)
+        # Each caller decodes its own PIL image from the shared response bytes
+        flight_key = (params["center"], actual_zoom, params["size"], params["scale"])
+        response = await self._static_maps_flight.do(
+            flight_key,
+            lambda: self._static_maps_limiter.run(
+                lambda: client.get(self.GOOGLE_STATIC_MAPS_URL, params=params)
+            ),
+        )
         
         if response.status_code != 200:
             error_text = response.text[:200] if response.text else "Unknown error"
@@ -463,11 +481,8 @@ class PolygonImageryService:
         return img
     
     def _calculate_area_sqm(self, polygon: Polygon) -> float:
-        """Calculate approximate area in square meters."""
-        coords = list(polygon.exterior.coords)
-        mercator_coords = [self.transformer.transform(lng, lat) for lng, lat in coords]
-        mercator_polygon = Polygon(mercator_coords)
-        return mercator_polygon.area
+        """Calculate area in square meters (geodesic, not Web Mercator)."""
+        return area_m2(polygon)
 
 
 # Singleton instance
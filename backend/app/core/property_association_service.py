@@ -5,13 +5,13 @@ Filters detected paved surfaces to keep only those that belong to the business.
 Uses spatial analysis to determine connectivity to the business building.
 """
 import logging
-import math
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 from shapely.geometry import Polygon, Point
 from shapely.ops import unary_union
 
 from app.core.asphalt_segmentation_service import DetectedPolygon
+from app.core.geo_utils import area_m2, geometry_distance_m, meters_per_degree
 
 logger = logging.getLogger(__name__)
 
@@ -199,23 +199,8 @@ class PropertyAssociationService:
         return closest
     
     def _distance_between_m(self, poly1: Polygon, poly2: Polygon) -> float:
-        """Calculate distance between two polygons in meters."""
-        # Get distance in degrees
-        distance_deg = poly1.distance(poly2)
-        
-        if distance_deg <= 0:
-            return 0.0  # Polygons touch or overlap
-        
-        # Convert to meters (approximate at equator)
-        # More accurate would use the centroid latitude
-        center1 = poly1.centroid
-        center2 = poly2.centroid
-        avg_lat = (center1.y + center2.y) / 2
-        
-        # 1 degree ≈ 111km, adjusted for latitude
-        m_per_deg = 111000 * math.cos(math.radians(avg_lat))
-        
-        return distance_deg * m_per_deg
+        """Calculate distance between two polygons in meters (0 if they touch or overlap)."""
+        return geometry_distance_m(poly1, poly2)
     
     def _classify_area_type(
         self,
@@ -238,12 +223,13 @@ class PropertyAssociationService:
         width = bounds[2] - bounds[0]  # max_lng - min_lng
         height = bounds[3] - bounds[1]  # max_lat - min_lat
         
-        # Adjust for latitude
-        center_lat = (bounds[1] + bounds[3]) / 2
-        width_adjusted = width * math.cos(math.radians(center_lat))
+        # In meters (a degree of longitude shrinks with latitude)
+        m_per_deg_lat, m_per_deg_lng = meters_per_degree((bounds[1] + bounds[3]) / 2)
+        width_m = width * m_per_deg_lng
+        height_m = height * m_per_deg_lat
         
-        if width_adjusted > 0 and height > 0:
-            aspect_ratio = max(width_adjusted, height) / min(width_adjusted, height)
+        if width_m > 0 and height_m > 0:
+            aspect_ratio = max(width_m, height_m) / min(width_m, height_m)
             
             # Long narrow areas are likely driveways
             if aspect_ratio > 3 and area < 200:
@@ -262,9 +248,9 @@ class PropertyAssociationService:
         width = bounds[2] - bounds[0]
         height = bounds[3] - bounds[1]
         
-        center_lat = (bounds[1] + bounds[3]) / 2
-        width_m = width * 111000 * math.cos(math.radians(center_lat))
-        height_m = height * 111000
+        m_per_deg_lat, m_per_deg_lng = meters_per_degree((bounds[1] + bounds[3]) / 2)
+        width_m = width * m_per_deg_lng
+        height_m = height * m_per_deg_lat
         
         # Long and narrow with typical road width
         short_side = min(width_m, height_m)
@@ -290,13 +276,12 @@ class PropertyAssociationService:
         point = Point(lng, lat)
         
         result = []
-        max_distance_deg = 50 / 111000  # 50 meters in degrees
+        max_distance_m = 50
         
         for surface in surfaces:
-            distance = surface.polygon.distance(point)
-            distance_m = distance * 111000
+            distance_m = geometry_distance_m(surface.polygon, point)
             
-            is_associated = distance <= max_distance_deg
+            is_associated = distance_m <= max_distance_m
             
             result.append(AssociatedAsphaltArea(
                 polygon=surface.polygon,
@@ -422,19 +407,7 @@ class PropertyAssociationService:
     
     def _polygon_area_m2(self, polygon: Polygon) -> float:
         """Calculate area of polygon in square meters."""
-        from pyproj import Geod
-        
-        try:
-            geod = Geod(ellps="WGS84")
-            coords = list(polygon.exterior.coords)
-            area, _ = geod.polygon_area_perimeter(
-                [c[0] for c in coords],
-                [c[1] for c in coords]
-            )
-            return abs(area)
-        except:
-            # Fallback: approximate conversion
-            return polygon.area * (111000 ** 2)
+        return area_m2(polygon)
 
 
 # Singleton instance
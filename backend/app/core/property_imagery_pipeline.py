@@ -20,6 +20,7 @@ from PIL import Image
 from app.core.regrid_service import regrid_service, PropertyParcel
 from app.core.polygon_imagery_service import get_polygon_imagery_service
 from app.core.config import settings
+from app.core.geo_utils import meters_per_degree
 
 logger = logging.getLogger(__name__)
 
@@ -225,10 +226,9 @@ class PropertyImageryPipeline:
     
     def _create_estimated_polygon(self, lat: float, lng: float, size_m: float = 100) -> Polygon:
         """Create an estimated polygon around coordinates."""
-        # 1 degree lat ≈ 111km
-        # 1 degree lng ≈ 85km at mid-latitudes
-        delta_lat = (size_m / 2) / 111000
-        delta_lng = (size_m / 2) / 85000
+        m_per_deg_lat, m_per_deg_lng = meters_per_degree(lat)
+        delta_lat = (size_m / 2) / m_per_deg_lat
+        delta_lng = (size_m / 2) / m_per_deg_lng
         
         return Polygon([
             (lng - delta_lng, lat - delta_lat),
@@ -13,60 +13,229 @@ Key Design:
 API Documentation: https://regrid.com/api
 """
 
+import asyncio
 import logging
-import math
 import httpx
 from typing import Optional, Dict, Any, List
-from dataclasses import dataclass
 from shapely.geometry import shape, Polygon, MultiPolygon, Point
 from shapely.ops import unary_union
 
 from app.core.config import settings
+from app.core.fast_json import loads
+from app.core.cache import TTLCache
+from app.core.adaptive_limiter import get_limiter
+from app.core.geo_utils import area_m2, haversine_m
+from app.core.single_flight import get_single_flight
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+def normalize_owner_name(name: str) -> str:
+    """Uppercase, punctuation as spaces - "O'Brien Properties, LLC" -> "O BRIEN PROPERTIES LLC"."""
+    return " ".join("".join(c if c.isalnum() else " " for c in name.upper()).split())
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so they match literally."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _safe_int(val) -> Optional[int]:
+    if val is None:
+        return None
+    try:
+        return int(val)
+    except (ValueError, TypeError):
+        return None
+
+
+def _safe_float(val) -> Optional[float]:
+    if val is None:
+        return None
+    try:
+        return float(val)
+    except (ValueError, TypeError):
+        return None
+
+
+class _Field:
+    """
+    Read-only PropertyParcel attribute resolved from Regrid fields on access.
+    
+    Keys are tried in order (first truthy value wins, like an `or` chain),
+    and the optional cast is applied to the result.
+    """
+    
+    __slots__ = ("keys", "cast")
+    
+    def __init__(self, *keys: str, cast=None):
+        self.keys = keys
+        self.cast = cast
+    
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        value = None
+        for key in self.keys:
+            value = obj.get(key)
+            if value:
+                break
+        return self.cast(value) if self.cast else value
+
+
 class PropertyParcel:
-    """Property parcel data from Regrid."""
-    parcel_id: str
-    apn: Optional[str]  # Assessor Parcel Number
-    address: Optional[str]
-    owner: Optional[str]
-    polygon: Polygon  # Property boundary
-    centroid: Point
-    area_m2: float
-    area_acres: Optional[float]
-    land_use: Optional[str]  # usedesc or usecode
-    zoning: Optional[str]
-    zoning_description: Optional[str]
-    year_built: Optional[int]
-    raw_data: Dict[str, Any]
+    """
+    Property parcel data from Regrid.
+    
+    Compact, lazily materialized view over a GeoJSON feature. Only the raw
+    feature is kept up front - the shapely polygon, centroid and area are
+    built on first access and cached, and every other attribute is read
+    straight from the feature's fields. Parcels that are skipped or
+    filtered out therefore never pay for geometry construction.
+    """
+    
+    __slots__ = ("raw_data", "_properties", "_fields", "_polygon", "_centroid", "_area_m2")
+    
+    _UNSET = object()
+    
+    def __init__(self, feature: Dict[str, Any]):
+        self.raw_data = feature
+        self._properties: Dict[str, Any] = feature.get("properties") or {}
+        # V2 API stores fields in 'fields' subobject
+        self._fields: Dict[str, Any] = self._properties.get("fields") or {}
+        self._polygon = self._UNSET
+        self._centroid = self._UNSET
+        self._area_m2 = self._UNSET
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """Look up a Regrid field ('fields' take precedence over top-level properties)."""
+        if key in self._fields:
+            return self._fields[key]
+        return self._properties.get(key, default)
+    
+    def __repr__(self) -> str:
+        return f"PropertyParcel(parcel_id={self.parcel_id!r}, address={self.address!r})"
+    
+    # ============ Identity / descriptive fields ============
+    
+    @property
+    def parcel_id(self) -> str:
+        return str(
+            self.get("ll_uuid") or
+            self.get("parcelnumb") or
+            self.raw_data.get("id", "unknown")
+        )
+    
+    apn = _Field("parcelnumb", "apn")  # Assessor Parcel Number
+    address = _Field("address", "situs", "headline")
+    owner = _Field("owner", "ownername")
+    area_acres = _Field("ll_gisacre", "gisacre", cast=_safe_float)
+    land_use = _Field("usedesc", "usecode", "landuse")  # usedesc or usecode
+    zoning = _Field("zoning", "zoning_code")
+    zoning_description = _Field("zoning_description")
+    year_built = _Field("yearbuilt", cast=_safe_int)
     
     # Additional property details (Standard tier)
-    num_units: Optional[int] = None  # Number of living units
-    num_stories: Optional[float] = None
-    struct_style: Optional[str] = None
+    num_units = _Field("numunits", cast=_safe_int)  # Number of living units
+    num_stories = _Field("numstories", cast=_safe_float)
+    struct_style = _Field("structstyle")
     
     # LBCS Standardized Land Use Codes (Premium tier)
     # These provide reliable, standardized classification across all counties
-    lbcs_activity: Optional[int] = None  # What people do (1000=residential, 2000=commercial)
-    lbcs_activity_desc: Optional[str] = None
-    lbcs_function: Optional[int] = None  # Economic function (1100=household, 2320=property mgmt)
-    lbcs_function_desc: Optional[str] = None
-    lbcs_structure: Optional[int] = None  # Building type (1200-1299=multifamily with unit count!)
-    lbcs_structure_desc: Optional[str] = None
-    lbcs_site: Optional[int] = None  # Land development status
-    lbcs_site_desc: Optional[str] = None
-    lbcs_ownership: Optional[int] = None  # Public vs private (1000=private, 4000=public)
-    lbcs_ownership_desc: Optional[str] = None
+    lbcs_activity = _Field("lbcs_activity", cast=_safe_int)  # What people do (1000=residential, 2000=commercial)
+    lbcs_activity_desc = _Field("lbcs_activity_desc")
+    lbcs_function = _Field("lbcs_function", cast=_safe_int)  # Economic function (1100=household, 2320=property mgmt)
+    lbcs_function_desc = _Field("lbcs_function_desc")
+    lbcs_structure = _Field("lbcs_structure", cast=_safe_int)  # Building type (1200-1299=multifamily with unit count!)
+    lbcs_structure_desc = _Field("lbcs_structure_desc")
+    lbcs_site = _Field("lbcs_site", cast=_safe_int)  # Land development status
+    lbcs_site_desc = _Field("lbcs_site_desc")
+    lbcs_ownership = _Field("lbcs_ownership", cast=_safe_int)  # Public vs private (1000=private, 4000=public)
+    lbcs_ownership_desc = _Field("lbcs_ownership_desc")
     
     # Owner details
-    owner2: Optional[str] = None  # Secondary owner (often management company)
-    owner_type: Optional[str] = None
-    mail_address: Optional[str] = None  # Owner mailing address
-    mail_city: Optional[str] = None
-    mail_state: Optional[str] = None
+    owner2 = _Field("owner2")  # Secondary owner (often management company)
+    owner_type = _Field("owntype")
+    mail_city = _Field("mail_city")
+    mail_state = _Field("mail_state2")
+    
+    @property
+    def mail_address(self) -> Optional[str]:
+        """Owner mailing address, built from components if the full address is missing."""
+        mail_address = self.get("mailadd")
+        if mail_address:
+            return mail_address
+        mail_parts = [
+            self.get("mail_addno", ""),
+            self.get("mail_addpref", ""),
+            self.get("mail_addstr", ""),
+            self.get("mail_addsttyp", ""),
+            self.get("mail_addstsuf", ""),
+        ]
+        return " ".join(p for p in mail_parts if p).strip() or None
+    
+    # ============ Lazily built geometry ============
+    
+    @property
+    def has_geometry(self) -> bool:
+        """Cheap structural check that the feature carries a (multi)polygon with a non-empty ring."""
+        geometry = self.raw_data.get("geometry") or {}
+        coordinates = geometry.get("coordinates")
+        if not coordinates:
+            return False
+        if geometry.get("type") == "Polygon":
+            return bool(coordinates[0])
+        if geometry.get("type") == "MultiPolygon":
+            return any(part and part[0] for part in coordinates)
+        return False
+    
+    @property
+    def polygon(self) -> Optional[Polygon]:
+        """Property boundary (largest part of a MultiPolygon, repaired if invalid)."""
+        if self._polygon is self._UNSET:
+            self._polygon = self._build_polygon()
+        return self._polygon
+    
+    @property
+    def centroid(self) -> Optional[Point]:
+        if self._centroid is self._UNSET:
+            polygon = self.polygon
+            self._centroid = polygon.centroid if polygon is not None else None
+        return self._centroid
+    
+    @property
+    def area_m2(self) -> float:
+        """Geodesic area of the boundary in square meters."""
+        if self._area_m2 is self._UNSET:
+            polygon = self.polygon
+            self._area_m2 = area_m2(polygon) if polygon is not None else 0.0
+        return self._area_m2
+    
+    def _build_polygon(self) -> Optional[Polygon]:
+        if not self.has_geometry:
+            return None
+        try:
+            geom = shape(self.raw_data["geometry"])
+            
+            if isinstance(geom, MultiPolygon):
+                geom = max(geom.geoms, key=lambda g: g.area)
+            
+            if not isinstance(geom, Polygon):
+                return None
+            
+            if not geom.is_valid:
+                geom = geom.buffer(0)
+                # Repairing a self-intersecting ring can split it
+                if isinstance(geom, MultiPolygon):
+                    geom = max(geom.geoms, key=lambda g: g.area)
+            
+            if not isinstance(geom, Polygon) or geom.is_empty:
+                return None
+            
+            return geom
+        except Exception as e:
+            logger.debug(f"Failed to parse geometry: {e}")
+            return None
     
     @property
     def has_valid_geometry(self) -> bool:
@@ -99,6 +268,16 @@ class RegridService:
         self.api_key = settings.REGRID_API_KEY
         self.base_url = settings.REGRID_API_URL
         self._client: Optional[httpx.AsyncClient] = None
+        # Adaptive concurrency (AIMD) for the records API
+        self._limiter = get_limiter(
+            "regrid_records",
+            initial_limit=settings.REGRID_RECORDS_CONCURRENCY_INITIAL,
+            max_limit=settings.REGRID_RECORDS_CONCURRENCY_MAX,
+        )
+        # Concurrent lookups of the same point share one request
+        self._point_flight = get_single_flight("regrid_point")
+        # (owner pattern, county, state) -> (limit, parcels)
+        self._owner_cache = TTLCache(maxsize=2048, ttl_seconds=settings.REGRID_OWNER_CACHE_TTL_SECONDS)
     
     @property
     def is_configured(self) -> bool:
@@ -111,6 +290,11 @@ class RegridService:
             self._client = httpx.AsyncClient(timeout=30.0)
         return self._client
     
+    async def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> httpx.Response:
+        """GET a Regrid records endpoint under the adaptive concurrency limiter."""
+        client = await self._get_client()
+        return await self._limiter.run(lambda: client.get(url, params=params))
+    
     # ============================================================
     # MAIN ENTRY POINT - Use this method
     # ============================================================
@@ -147,6 +331,10 @@ class RegridService:
         # ============ STEP 1: Point Lookup (PRIMARY) ============
         parcel = await self._point_lookup(lat, lng)
         
+        if parcel and parcel.polygon is None:
+            logger.warning(f"   ⚠️ Point lookup returned parcel without a usable boundary - rejecting")
+            parcel = None
+        
         if parcel:
             # Validate: Does parcel contain the business point?
             if parcel.contains_point(lat, lng):
@@ -163,6 +351,10 @@ class RegridService:
             logger.info(f"   🔄 Point lookup failed, trying address search...")
             parcel = await self._address_lookup(address)
             
+            if parcel and parcel.polygon is None:
+                logger.warning(f"   ⚠️ Address lookup returned parcel without a usable boundary - rejecting")
+                parcel = None
+            
             if parcel:
                 # Check if parcel contains the business point (ideal case)
                 if parcel.contains_point(lat, lng):
@@ -173,7 +365,7 @@ class RegridService:
                     # RELAXED VALIDATION: Accept parcels within 150m
                     # Google's business coordinates are often inaccurate (entrance, sign, street)
                     # For large properties like apartment complexes, 50-100m offset is common
-                    dist = self._distance_m(lat, lng, parcel.centroid.y, parcel.centroid.x)
+                    dist = haversine_m(lat, lng, parcel.centroid.y, parcel.centroid.x)
                     MAX_DISTANCE_M = 150  # Accept parcels within 150m
                     
                     if dist <= MAX_DISTANCE_M:
@@ -202,9 +394,14 @@ class RegridService:
         """
         Point lookup using Regrid V2 API.
         Returns the parcel that contains the given coordinates.
+        
+        Concurrent lookups of the same point (~0.1m) share one request.
         """
+        key = (round(lat, 6), round(lng, 6))
+        return await self._point_flight.do(key, lambda: self._fetch_point_lookup(lat, lng))
+    
+    async def _fetch_point_lookup(self, lat: float, lng: float) -> Optional[PropertyParcel]:
         try:
-            client = await self._get_client()
             
             url = "https://app.regrid.com/api/v2/parcels/point"
             params = {
@@ -213,7 +410,7 @@ class RegridService:
                 "token": self.api_key,
             }
             
-            response = await client.get(url, params=params)
+            response = await self._get(url, params=params)
             
             if response.status_code == 401:
                 logger.error("   ❌ Regrid API authentication failed")
@@ -227,7 +424,7 @@ class RegridService:
                 logger.warning(f"   ⚠️ Point lookup failed: {response.status_code}")
                 return None
             
-            data = response.json()
+            data = loads(response.content)
             parcels_data = data.get("parcels", {})
             parcels = self._parse_response(parcels_data)
             
@@ -246,7 +443,6 @@ class RegridService:
         WARNING: This can return wrong parcels - always validate with point-in-polygon!
         """
         try:
-            client = await self._get_client()
             
             # Step 1: Typeahead to find parcel path
             typeahead_url = "https://app.regrid.com/api/v1/typeahead"
@@ -255,12 +451,12 @@ class RegridService:
                 "token": self.api_key,
             }
             
-            response = await client.get(typeahead_url, params=typeahead_params)
+            response = await self._get(typeahead_url, params=typeahead_params)
             
             if response.status_code != 200:
                 return None
             
-            typeahead_data = response.json()
+            typeahead_data = loads(response.content)
             results = typeahead_data if isinstance(typeahead_data, list) else typeahead_data.get("results", [])
             
             if not results:
@@ -292,16 +488,15 @@ class RegridService:
     
     async def _fetch_parcel_by_path(self, parcel_path: str) -> Optional[PropertyParcel]:
         """Fetch parcel details by path, trying v1 then v2 API."""
-        client = await self._get_client()
         
         # Try v1 API first
         detail_url = f"https://app.regrid.com/api/v1/parcel{parcel_path}.json"
         detail_params = {"token": self.api_key}
         
-        response = await client.get(detail_url, params=detail_params)
+        response = await self._get(detail_url, params=detail_params)
         
         if response.status_code == 200:
-            data = response.json()
+            data = loads(response.content)
             parcels = self._parse_response(data)
             if parcels:
                 return parcels[0]
@@ -313,10 +508,10 @@ class RegridService:
             "token": self.api_key,
         }
         
-        response = await client.get(v2_url, params=v2_params)
+        response = await self._get(v2_url, params=v2_params)
         
         if response.status_code == 200:
-            data = response.json()
+            data = loads(response.content)
             parcels_data = data.get("parcels", {})
             parcels = self._parse_response(parcels_data)
             if parcels:
@@ -382,7 +577,9 @@ class RegridService:
         for feature in features:
             try:
                 parcel = self._parse_feature(feature)
-                if parcel and parcel.has_valid_geometry:
+                # Structural check only - callers drop parcels whose polygon can't be
+                # built once they have picked the ones they will use
+                if parcel is not None:
                     parcels.append(parcel)
             except Exception as e:
                 logger.debug(f"Failed to parse parcel feature: {e}")
@@ -390,151 +587,19 @@ class RegridService:
         return parcels
     
     def _parse_feature(self, feature: Dict[str, Any]) -> Optional[PropertyParcel]:
-        """Parse a single GeoJSON feature into PropertyParcel."""
-        geometry = feature.get("geometry")
-        properties = feature.get("properties", {})
+        """
+        Wrap a single GeoJSON feature as a PropertyParcel.
         
-        if not geometry:
+        Geometry and typed fields are materialized lazily by PropertyParcel,
+        so this only does a structural check on the feature.
+        """
+        if not feature.get("geometry"):
             return None
         
-        try:
-            geom = shape(geometry)
-            
-            if isinstance(geom, MultiPolygon):
-                geom = max(geom.geoms, key=lambda g: g.area)
-            
-            if not isinstance(geom, Polygon):
-                return None
-            
-            if not geom.is_valid:
-                geom = geom.buffer(0)
-            
-            if geom.is_empty:
-                return None
-                
-        except Exception as e:
-            logger.debug(f"Failed to parse geometry: {e}")
+        parcel = PropertyParcel(feature)
+        if not parcel.has_geometry:
             return None
-        
-        # V2 API stores fields in 'fields' subobject
-        fields = properties.get("fields", {})
-        all_props = {**properties, **fields}
-        
-        parcel_id = (
-            all_props.get("ll_uuid") or
-            all_props.get("parcelnumb") or
-            properties.get("ll_uuid") or
-            str(feature.get("id", "unknown"))
-        )
-        
-        # Calculate area
-        from pyproj import Geod
-        geod = Geod(ellps="WGS84")
-        coords = list(geom.exterior.coords)
-        area_m2, _ = geod.polygon_area_perimeter(
-            [c[0] for c in coords],
-            [c[1] for c in coords]
-        )
-        area_m2 = abs(area_m2)
-        
-        area_acres = all_props.get("ll_gisacre") or all_props.get("gisacre")
-        if area_acres:
-            try:
-                area_acres = float(area_acres)
-            except:
-                area_acres = None
-        
-        address = (
-            all_props.get("address") or 
-            all_props.get("situs") or
-            properties.get("headline")
-        )
-        
-        owner = (
-            all_props.get("owner") or 
-            all_props.get("ownername")
-        )
-        
-        # Parse numeric fields safely
-        def safe_int(val) -> Optional[int]:
-            if val is None:
-                return None
-            try:
-                return int(val)
-            except (ValueError, TypeError):
-                return None
-        
-        def safe_float(val) -> Optional[float]:
-            if val is None:
-                return None
-            try:
-                return float(val)
-            except (ValueError, TypeError):
-                return None
-        
-        # Build mailing address from components if full address not available
-        mail_address = all_props.get("mailadd")
-        if not mail_address:
-            mail_parts = [
-                all_props.get("mail_addno", ""),
-                all_props.get("mail_addpref", ""),
-                all_props.get("mail_addstr", ""),
-                all_props.get("mail_addsttyp", ""),
-                all_props.get("mail_addstsuf", ""),
-            ]
-            mail_address = " ".join(p for p in mail_parts if p).strip() or None
-        
-        return PropertyParcel(
-            parcel_id=str(parcel_id),
-            apn=all_props.get("parcelnumb") or all_props.get("apn"),
-            address=address,
-            owner=owner,
-            polygon=geom,
-            centroid=geom.centroid,
-            area_m2=area_m2,
-            area_acres=area_acres,
-            land_use=all_props.get("usedesc") or all_props.get("usecode") or all_props.get("landuse"),
-            zoning=all_props.get("zoning") or all_props.get("zoning_code"),
-            zoning_description=all_props.get("zoning_description"),
-            year_built=safe_int(all_props.get("yearbuilt")),
-            raw_data=feature,
-            # Additional property details
-            num_units=safe_int(all_props.get("numunits")),
-            num_stories=safe_float(all_props.get("numstories")),
-            struct_style=all_props.get("structstyle"),
-            # LBCS codes (Premium tier - standardized classification)
-            lbcs_activity=safe_int(all_props.get("lbcs_activity")),
-            lbcs_activity_desc=all_props.get("lbcs_activity_desc"),
-            lbcs_function=safe_int(all_props.get("lbcs_function")),
-            lbcs_function_desc=all_props.get("lbcs_function_desc"),
-            lbcs_structure=safe_int(all_props.get("lbcs_structure")),
-            lbcs_structure_desc=all_props.get("lbcs_structure_desc"),
-            lbcs_site=safe_int(all_props.get("lbcs_site")),
-            lbcs_site_desc=all_props.get("lbcs_site_desc"),
-            lbcs_ownership=safe_int(all_props.get("lbcs_ownership")),
-            lbcs_ownership_desc=all_props.get("lbcs_ownership_desc"),
-            # Owner details
-            owner2=all_props.get("owner2"),
-            owner_type=all_props.get("owntype"),
-            mail_address=mail_address,
-            mail_city=all_props.get("mail_city"),
-            mail_state=all_props.get("mail_state2"),
-        )
-    
-    def _distance_m(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-        """Calculate distance in meters between two points (Haversine)."""
-        R = 6371000
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lng = math.radians(lng2 - lng1)
-        
-        a = (math.sin(delta_lat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        
-        return R * c
+        return parcel
     
     # ============================================================
     # OWNER NAME SEARCH (for Contact-First Discovery)
@@ -546,6 +611,7 @@ class RegridService:
         county_fips: Optional[str] = None,
         state_code: Optional[str] = None,
         max_results: int = 50,
+        prefix_match: bool = False,
     ) -> List[PropertyParcel]:
         """
         Search for parcels by owner name.
@@ -559,9 +625,14 @@ class RegridService:
             county_fips: Optional FIPS code to limit search (e.g., "48113" for Dallas County, TX)
             state_code: Optional state code (e.g., "TX")
             max_results: Maximum number of parcels to return
+            prefix_match: Match any owner starting with the name (covers
+                LLC / INC / CORP variants of the same company in one query)
             
         Returns:
             List of PropertyParcel objects
+        
+        Results are cached per (normalized owner, county, state) for
+        REGRID_OWNER_CACHE_TTL_SECONDS, so repeated owners across jobs are free.
         """
         if not self.is_configured:
             logger.warning("   ⚠️ Regrid API not configured")
@@ -573,15 +644,27 @@ class RegridService:
         
         # Clean up owner name for search
         clean_name = self._clean_owner_name_for_search(owner_name)
+        # Owner names are stored as spelled ("O'BRIEN", "MIAMI-DADE") - query that spelling
+        owner_pattern = _escape_like(clean_name)
+        if prefix_match:
+            owner_pattern += "%"
         
-        logger.info(f"   🔍 Regrid: Searching parcels owned by '{clean_name}'")
+        cache_key = (normalize_owner_name(clean_name), prefix_match, county_fips or "", (state_code or "").upper())
+        cached = self._owner_cache.get(cache_key)
+        if cached is not None:
+            cached_limit, cached_parcels = cached
+            # Usable if it was fetched with a big enough limit (or was exhaustive)
+            if cached_limit >= max_results or len(cached_parcels) < cached_limit:
+                logger.info(f"   ♻️ Regrid: Owner search cache hit for '{owner_pattern}'")
+                return cached_parcels[:max_results]
+        
+        logger.info(f"   🔍 Regrid: Searching parcels owned by '{owner_pattern}'")
         if county_fips:
             logger.info(f"      County FIPS: {county_fips}")
         elif state_code:
             logger.info(f"      State: {state_code}")
         
         try:
-            client = await self._get_client()
             
             # Build query URL with owner filter
             # Regrid V2 Query endpoint: /api/v2/parcels/query
@@ -589,7 +672,7 @@ class RegridService:
             
             params = {
                 "token": self.api_key,
-                "fields[owner][ilike]": clean_name,  # Case-insensitive LIKE search
+                "fields[owner][ilike]": owner_pattern,  # Case-insensitive LIKE search
                 "limit": min(max_results, 1000),
             }
             
@@ -599,7 +682,7 @@ class RegridService:
             elif state_code:
                 params["fields[state2][eq]"] = state_code.upper()
             
-            response = await client.get(url, params=params)
+            response = await self._get(url, params=params)
             
             if response.status_code == 401:
                 logger.error("   ❌ Regrid API authentication failed")
@@ -609,13 +692,14 @@ class RegridService:
                 logger.warning(f"   ⚠️ Regrid owner search failed: {response.status_code}")
                 return []
             
-            data = response.json()
+            data = loads(response.content)
             parcels_data = data.get("parcels", {})
-            parcels = self._parse_response(parcels_data)
+            parcels = self._parse_response(parcels_data)[:max_results]
             
-            logger.info(f"   ✅ Found {len(parcels)} parcels owned by '{clean_name}'")
+            logger.info(f"   ✅ Found {len(parcels)} parcels owned by '{owner_pattern}'")
             
-            return parcels[:max_results]
+            self._owner_cache.set(cache_key, (max_results, parcels))
+            return parcels
             
         except Exception as e:
             logger.error(f"   ❌ Regrid owner search error: {e}")
@@ -650,49 +734,23 @@ class RegridService:
         """
         Get the FIPS code for a county.
         
+        Resolves via the county service (Census county list + local PostGIS
+        boundaries), so any US county works - not just a hardcoded few. When
+        the Census API is down, its last snapshot and the built-in major
+        counties still resolve.
+        
         Args:
             city: City name (will find county containing city)
             state: State code (e.g., "TX")
             county: County name (e.g., "Dallas")
             
         Returns:
-            5-digit FIPS code (e.g., "48113" for Dallas County, TX)
+            5-digit FIPS code (e.g., "48113" for Dallas County, TX),
+            or None if the location can't be narrowed to a single county
         """
-        # Common FIPS codes for major counties (fallback)
-        # Format: State FIPS (2 digits) + County FIPS (3 digits)
-        COMMON_FIPS = {
-            ("TX", "DALLAS"): "48113",
-            ("TX", "HARRIS"): "48201",
-            ("TX", "TARRANT"): "48439",
-            ("TX", "BEXAR"): "48029",
-            ("TX", "TRAVIS"): "48453",
-            ("CA", "LOS ANGELES"): "06037",
-            ("CA", "SAN DIEGO"): "06073",
-            ("CA", "ORANGE"): "06059",
-            ("FL", "MIAMI-DADE"): "12086",
-            ("FL", "BROWARD"): "12011",
-            ("FL", "PALM BEACH"): "12099",
-            ("NY", "NEW YORK"): "36061",
-            ("NY", "KINGS"): "36047",
-            ("IL", "COOK"): "17031",
-            ("AZ", "MARICOPA"): "04013",
-            ("GA", "FULTON"): "13121",
-            ("NC", "MECKLENBURG"): "37119",
-            ("NC", "WAKE"): "37183",
-            ("TN", "DAVIDSON"): "47037",
-            ("CO", "DENVER"): "08031",
-            ("WA", "KING"): "53033",
-            ("NV", "CLARK"): "32003",
-        }
-        
-        if state and county:
-            key = (state.upper(), county.upper())
-            if key in COMMON_FIPS:
-                return COMMON_FIPS[key]
+        from app.core.county_service import county_service
         
-        # If not in common list, would need to query Census API or similar
-        # For now, return None and rely on state-level filtering
-        return None
+        return await county_service.resolve_fips(county=county, state=state, city=city)
     
     # ============================================================
     # LBCS CODE SEARCH (for Regrid-First Discovery)
@@ -757,7 +815,6 @@ class RegridService:
         seen_ids = set()
         
         try:
-            client = await self._get_client()
             
             # Query for each LBCS range
             for lbcs_min, lbcs_max in lbcs_ranges:
@@ -795,7 +852,7 @@ class RegridService:
                 
                 logger.info(f"      Querying {lbcs_field} {lbcs_min}-{lbcs_max}...")
                 
-                response = await client.get(url, params=params)
+                response = await self._get(url, params=params)
                 
                 if response.status_code == 401:
                     logger.error("   ❌ Regrid API authentication failed")
@@ -805,7 +862,7 @@ class RegridService:
                     logger.warning(f"   ⚠️ Regrid LBCS search failed: {response.status_code} - {response.text[:200]}")
                     continue
                 
-                data = response.json()
+                data = loads(response.content)
                 parcels_data = data.get("parcels", {})
                 parcels = self._parse_response(parcels_data)
                 
@@ -863,7 +920,6 @@ class RegridService:
         seen_ids = set()
         
         try:
-            client = await self._get_client()
             
             # Regrid doesn't support text search on usedesc, so we need to:
             # 1. Get commercial properties in the area (usecode approach)
@@ -900,12 +956,12 @@ class RegridService:
                 
                 logger.info(f"      Trying usecode = '{usecode}'...")
                 
-                response = await client.get(url, params=params)
+                response = await self._get(url, params=params)
                 
                 if response.status_code != 200:
                     continue
                 
-                data = response.json()
+                data = loads(response.content)
                 parcels_data = data.get("parcels", {})
                 parcels = self._parse_response(parcels_data)
                 
@@ -946,10 +1002,10 @@ class RegridService:
                 elif state_code:
                     params["fields[state2][eq]"] = state_code.upper()
                 
-                response = await client.get(url, params=params)
+                response = await self._get(url, params=params)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = loads(response.content)
                     parcels_data = data.get("parcels", {})
                     parcels = self._parse_response(parcels_data)
                     
@@ -969,6 +1025,73 @@ class RegridService:
             traceback.print_exc()
             return all_parcels
     
+    # ============================================================
+    # BATCH RECORD LOOKUP (for tile-first discovery)
+    # ============================================================
+    
+    async def get_parcels_by_ids(
+        self,
+        ll_uuids: List[str],
+        batch_size: Optional[int] = None,
+    ) -> List[PropertyParcel]:
+        """
+        Fetch full parcel records for known Regrid ll_uuids, in batches.
+        
+        Tile-first discovery screens candidates from MVT tiles and only pulls
+        records for the shortlist - one query per `batch_size` ids instead of
+        one lookup per parcel. Batches run concurrently under the records
+        limiter. Records come back in no particular order.
+        
+        Args:
+            ll_uuids: Regrid parcel ids (duplicates are ignored)
+            batch_size: Ids per query (default REGRID_RECORDS_BATCH_SIZE)
+        
+        Returns:
+            List of PropertyParcel objects (failed batches are skipped)
+        """
+        if not self.is_configured:
+            logger.warning("   ⚠️ Regrid API not configured")
+            return []
+        
+        ids = list(dict.fromkeys(uuid for uuid in ll_uuids if uuid))
+        if not ids:
+            return []
+        
+        batch_size = max(1, batch_size or settings.REGRID_RECORDS_BATCH_SIZE)
+        batches = [ids[i:i + batch_size] for i in range(0, len(ids), batch_size)]
+        url = "https://app.regrid.com/api/v2/parcels/query"
+        
+        async def fetch_batch(batch: List[str]) -> List[PropertyParcel]:
+            params = {
+                "token": self.api_key,
+                "fields[ll_uuid][in]": ",".join(batch),
+                "limit": len(batch),
+            }
+            try:
+                response = await self._get(url, params=params)
+                if response.status_code != 200:
+                    logger.warning(f"   ⚠️ Regrid batch lookup failed: {response.status_code} - {response.text[:200]}")
+                    return []
+                data = loads(response.content)
+                return self._parse_response(data.get("parcels", {}))
+            except Exception as e:
+                logger.error(f"   ❌ Regrid batch lookup error: {e}")
+                return []
+        
+        logger.info(f"   🔍 Regrid: Fetching {len(ids)} records in {len(batches)} batch(es)")
+        results = await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+        
+        parcels = []
+        seen_ids = set()
+        for batch_parcels in results:
+            for parcel in batch_parcels:
+                if parcel.parcel_id not in seen_ids:
+                    seen_ids.add(parcel.parcel_id)
+                    parcels.append(parcel)
+        
+        logger.info(f"   ✅ Fetched {len(parcels)}/{len(ids)} records")
+        return parcels
+    
     async def close(self):
         """Close the HTTP client."""
         if self._client and not self._client.is_closed:
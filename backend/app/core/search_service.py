@@ -26,6 +26,7 @@ from shapely.geometry import shape, mapping, Polygon, MultiPolygon, Point, box
 from shapely.ops import unary_union
 
 from app.core.regrid_service import RegridService, PropertyParcel
+from app.core.fast_json import loads, dumps
 
 logger = logging.getLogger(__name__)
 
@@ -599,7 +600,7 @@ class SearchService:
                             print(f"Regrid error: {response.text[:300]}")
                             continue
                         
-                        data = response.json()
+                        data = loads(response.content)
                         
                         # /parcels/query returns: {"parcels": {"type": "FeatureCollection", ...}}
                         parcels_data = data.get("parcels", data)  # Handle both formats
@@ -732,7 +733,7 @@ class SearchService:
                         if response.status_code != 200:
                             continue
                         
-                        data = response.json()
+                        data = loads(response.content)
                         parcels_data = data.get("parcels", data)
                         
                         if isinstance(parcels_data, dict):
@@ -859,7 +860,7 @@ class SearchService:
                     print(f"Making Regrid POST /parcels/area request...")
                     response = await client.post(
                         url,
-                        json=body,
+                        content=dumps(body),
                         headers={"Content-Type": "application/json"}
                     )
                     print(f"Regrid response status: {response.status_code}")
@@ -874,7 +875,7 @@ class SearchService:
                     print(f"Regrid error ({response.status_code}): {response.text[:500]}")
                     return []
                 
-                data = response.json()
+                data = loads(response.content)
                 print(f"Response keys: {list(data.keys())}")
                 
                 parcels_data = data.get("parcels", {})
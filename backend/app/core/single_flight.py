@@ -0,0 +1,89 @@
+"""
+Single-Flight Request Coalescing
+
+When several users / jobs ask for the same upstream resource at the same
+moment (same Regrid tile, same parcel point, same Static Maps image, same
+Places query), only the first caller hits the upstream - everyone else with
+the same key awaits that call and gets its result (or its exception).
+
+- The shared call runs as its own task, so a caller being cancelled (e.g. a
+  client disconnect) doesn't cancel it for the others
+- Results are shared objects: treat them as read-only, or copy per caller
+- Keys are forgotten as soon as the call finishes - pair with TTLCache when
+  results should also be reused afterwards
+
+Counters are exposed via single_flight_metrics() (see GET /metrics/single-flight).
+
+Usage:
+    flight = get_single_flight("regrid_tiles")
+    content = await flight.do((z, x, y), lambda: self._download_tile(tile))
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Coalesces concurrent calls with the same key into one."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._in_flight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        # Counters
+        self.calls = 0    # Upstream calls actually made
+        self.shared = 0   # Callers served by another caller's in-flight call
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run `fn()` unless a call for `key` is already in flight; return its result."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+            self.calls += 1
+        else:
+            self.shared += 1
+        # shield: cancelling this caller must not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+    def snapshot(self) -> Dict[str, Any]:
+        total = self.calls + self.shared
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "shared": self.shared,
+            "in_flight": self.in_flight,
+            "shared_rate": round(self.shared / total, 3) if total else 0.0,
+        }
+
+
+# ============ Registry ============
+
+_flights: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Get or create the named single-flight group."""
+    flight = _flights.get(name)
+    if flight is None:
+        flight = SingleFlight(name)
+        _flights[name] = flight
+    return flight
+
+
+def single_flight_metrics() -> List[Dict[str, Any]]:
+    """Snapshot of all single-flight groups (upstream calls vs shared callers)."""
+    return [flight.snapshot() for flight in _flights.values()]
@@ -0,0 +1,199 @@
+"""
+Staged Producer/Consumer Pipeline
+
+Runs discovery items through a chain of async stages (e.g. parcel lookup →
+imagery → VLM → enrichment). Each stage has its own worker pool and a
+bounded queue in front of it, so:
+
+- Stages overlap: while item 1 is in VLM, item 2 is fetching imagery
+- Each stage is sized for its upstream (e.g. 8 imagery, 4 VLM, 6 enrichment)
+- A slow stage fills its queue and blocks the stage before it (backpressure)
+  instead of items piling up in memory
+
+Total time is bounded by the slowest stage, not the sum of all stages.
+
+A handler receives an item and returns the item to pass on (usually the
+same object), or None to drop it. Exceptions are counted, reported to
+`on_error` and drop the item - they never stop the pipeline. Cancelling the
+task awaiting run() cancels every stage worker with it. `record_latency`, if
+given, receives (stage name, seconds) for every handler call.
+
+Database sessions: handlers share one SQLAlchemy session, so every handler
+must keep its session work in synchronous sections that end in commit() /
+rollback() before the next `await` - then interleaved items never see (or
+roll back) each other's pending changes.
+
+Usage:
+    pipeline = StagedPipeline("regrid_first", [
+        Stage("imagery", fetch_imagery, workers=8),
+        Stage("vlm", analyze, workers=4),
+        Stage("enrichment", enrich, workers=6),
+    ])
+    finished = await pipeline.run(items)
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+# End-of-stream marker passed down the queues
+_DONE = object()
+
+
+@dataclass
+class Stage:
+    """One pipeline stage: an async handler and its worker pool size."""
+    name: str
+    handler: Callable[[Any], Awaitable[Optional[Any]]]
+    workers: int = 1
+    queue_size: Optional[int] = None  # Items waiting in front of the stage (default 2 x workers)
+
+
+@dataclass
+class StageStats:
+    """Counters for one stage."""
+    name: str
+    workers: int
+    processed: int = 0   # Handler calls that returned
+    dropped: int = 0     # Items the handler filtered out (returned None)
+    errors: int = 0      # Handler calls that raised
+    busy_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "workers": self.workers,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 2),
+        }
+
+
+class StagedPipeline:
+    """Runs items through bounded queues and per-stage worker pools."""
+
+    def __init__(
+        self,
+        name: str,
+        stages: List[Stage],
+        on_error: Optional[Callable[[str, Any, Exception], None]] = None,
+        record_latency: Optional[Callable[[str, float], None]] = None,
+    ):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.name = name
+        self.stages = stages
+        self.on_error = on_error
+        self.record_latency = record_latency
+        self.stats = [StageStats(name=stage.name, workers=max(1, stage.workers)) for stage in stages]
+        self._stopped = False
+
+    def stop(self) -> None:
+        """Stop feeding new items; items already queued are dropped unprocessed."""
+        self._stopped = True
+
+    @property
+    def stopped(self) -> bool:
+        return self._stopped
+
+    async def run(self, items: Union[Iterable[Any], AsyncIterable[Any]]) -> List[Any]:
+        """Feed `items` through all stages; returns what the last stage passed on."""
+        workers = [max(1, stage.workers) for stage in self.stages]
+        queues = [
+            asyncio.Queue(maxsize=stage.queue_size or count * 2)
+            for stage, count in zip(self.stages, workers)
+        ]
+        remaining = list(workers)
+        finished: List[Any] = []
+
+        async def feed() -> None:
+            cancelled = False
+            try:
+                if hasattr(items, "__aiter__"):
+                    async for item in items:
+                        if self._stopped:
+                            break
+                        await queues[0].put(item)
+                else:
+                    for item in items:
+                        if self._stopped:
+                            break
+                        await queues[0].put(item)
+            except asyncio.CancelledError:
+                # The whole run is being cancelled - no worker is left to take the markers
+                cancelled = True
+                raise
+            finally:
+                if not cancelled:
+                    for _ in range(workers[0]):
+                        await queues[0].put(_DONE)
+
+        async def work(index: int) -> None:
+            stage = self.stages[index]
+            stats = self.stats[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+
+            while True:
+                item = await inbox.get()
+                if item is _DONE:
+                    break
+                if self._stopped:
+                    continue
+
+                started = time.perf_counter()
+                try:
+                    result = await stage.handler(item)
+                except Exception as e:
+                    stats.errors += 1
+                    logger.error(f"   ❌ [{self.name}/{stage.name}] {type(e).__name__}: {e}")
+                    if self.on_error:
+                        try:
+                            self.on_error(stage.name, item, e)
+                        except Exception as handler_error:
+                            logger.error(f"   ❌ [{self.name}/{stage.name}] on_error failed: {handler_error}")
+                    continue
+                finally:
+                    elapsed = time.perf_counter() - started
+                    stats.busy_seconds += elapsed
+                    if self.record_latency:
+                        self.record_latency(stage.name, elapsed)
+
+                stats.processed += 1
+                if result is None:
+                    stats.dropped += 1
+                elif outbox is not None:
+                    await outbox.put(result)
+                else:
+                    finished.append(result)
+
+            # Last worker out closes the next stage
+            remaining[index] -= 1
+            if remaining[index] == 0 and outbox is not None:
+                for _ in range(workers[index + 1]):
+                    await outbox.put(_DONE)
+
+        tasks = [asyncio.ensure_future(feed())]
+        for index, count in enumerate(workers):
+            tasks.extend(asyncio.ensure_future(work(index)) for _ in range(count))
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        logger.info(f"   📊 Pipeline {self.name}: " + ", ".join(
+            f"{s.name} {s.processed - s.dropped}/{s.processed + s.errors}" for s in self.stats
+        ))
+        return finished
+
+    def stats_dict(self) -> List[Dict[str, Any]]:
+        return [stats.to_dict() for stats in self.stats]
@@ -8,13 +8,15 @@ OpenRouter allows access to multiple providers (OpenAI, Anthropic, etc.)
 through a single API with the same OpenAI SDK interface.
 """
 
+import asyncio
 import logging
 import json
 import base64
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
-from openai import AsyncOpenAI
+from openai import APIConnectionError, APIStatusError, AsyncOpenAI
 
+from app.core.adaptive_limiter import get_limiter, parse_retry_after
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
@@ -85,6 +87,12 @@ class VLMAnalysisService:
     
     def __init__(self):
         self.default_client: Optional[AsyncOpenAI] = None
+        # Adaptive concurrency (AIMD) for OpenRouter, shared with LLM enrichment
+        self._limiter = get_limiter(
+            "openrouter",
+            initial_limit=settings.OPENROUTER_CONCURRENCY_INITIAL,
+            max_limit=settings.OPENROUTER_CONCURRENCY_MAX,
+        )
         if settings.OPENROUTER_API_KEY:
             # OpenRouter uses the same OpenAI SDK interface with different base_url
             self.default_client = AsyncOpenAI(
@@ -105,6 +113,27 @@ class VLMAnalysisService:
             )
         return self.default_client
     
+    async def _create_completion(self, client: AsyncOpenAI, **kwargs: Any) -> Any:
+        """Chat completion under the OpenRouter concurrency limiter."""
+        started_at = await self._limiter.acquire()
+        try:
+            response = await client.chat.completions.create(**kwargs)
+        except APIStatusError as e:
+            retry_after = parse_retry_after(e.response.headers.get("retry-after"))
+            await self._limiter.release(started_at, status_code=e.status_code, retry_after=retry_after)
+            raise
+        except APIConnectionError:
+            await self._limiter.release(started_at, failed=True)
+            raise
+        except asyncio.CancelledError:
+            await self._limiter.release(started_at, cancelled=True)
+            raise
+        except BaseException:
+            await self._limiter.release(started_at)
+            raise
+        await self._limiter.release(started_at, status_code=200)
+        return response
+    
     async def analyze_property(
         self,
         image_base64: str,
@@ -175,7 +204,8 @@ Analyze the satellite image and respond with this exact JSON structure:
         try:
             logger.info(f"  [VLM] Sending image to {self.DEFAULT_MODEL} via OpenRouter...")
             
-            response = await client.chat.completions.create(
+            response = await self._create_completion(
+                client,
                 model=self.DEFAULT_MODEL,
                 messages=[
                     {"role": "system", "content": system_prompt},
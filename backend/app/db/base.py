@@ -2,6 +2,7 @@ from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.fast_json import loads as json_loads, dumps_str as json_dumps
 
 database_url = settings.DATABASE_URL
 db_schema = settings.DB_SCHEMA
@@ -28,6 +29,11 @@ pool_config = {
     "pool_pre_ping": True,
     "echo": False,
     "connect_args": connect_args,
+    # json/jsonb columns and ST_AsGeoJSON(...)::json results go through orjson
+    "json_serializer": json_dumps,
+    "json_deserializer": json_loads,
+    # executemany UPDATEs (batched discovery writes) go out as one round-trip per page, not per row
+    "executemany_mode": "values_plus_batch",
 }
 
 if is_supabase_pooler:
@@ -1,14 +1,23 @@
+import asyncio
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request
+from fastapi import Depends, FastAPI, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 import os
 import logging
+from typing import Optional
 
 from app.core.config import settings
 from app.api.v1.router import api_router
 from app.db.base import close_db_pool
+from app.core.compression_middleware import JSONCompressionMiddleware
+from app.core.adaptive_limiter import limiter_metrics
+from app.core.single_flight import single_flight_metrics
+from app.core.discovery_metrics import summarize as summarize_discovery_metrics
+from app.core.cpu_pool import shutdown_cpu_pool
+from app.core.dependencies import get_current_user
+from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
@@ -17,16 +26,43 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Startup and shutdown events - keep lightweight to avoid memory issues on small VMs"""
     logger.info("WorkSight API starting up...")
-    # NO DB work at startup - PostGIS handles everything on-demand
+    # No other DB work at startup - PostGIS handles everything on-demand
+    
+    # The default job store needs its table: fail now rather than 404 every job later
+    if settings.DISCOVERY_JOB_STORE == "postgres":
+        from app.core.discovery_job_store import get_job_store
+        try:
+            await asyncio.to_thread(get_job_store().check)
+        except RuntimeError:
+            raise
+        except Exception as e:
+            logger.warning(f"Could not check the discovery job store at startup: {e}")
+    
+    # Pick up checkpointed discovery jobs interrupted by a crash / redeploy (background loop).
+    # In queue mode a crashed worker's lease expires and the task is retried instead.
+    resume_sweeper = None
+    if (
+        settings.DISCOVERY_RESUME_SWEEP_SECONDS > 0
+        and settings.DISCOVERY_JOB_STORE == "postgres"
+        and settings.DISCOVERY_EXECUTION != "queue"
+    ):
+        from app.core.discovery_orchestrator import discovery_orchestrator
+        resume_sweeper = asyncio.create_task(discovery_orchestrator.run_resume_sweeper())
     
     yield  # App runs here
     
     # Shutdown
     logger.info("Shutting down...")
+    if resume_sweeper:
+        resume_sweeper.cancel()
     try:
         close_db_pool()
     except Exception as e:
         logger.warning(f"Error closing DB pool: {e}")
+    try:
+        shutdown_cpu_pool(wait=False)
+    except Exception as e:
+        logger.warning(f"Error shutting down CPU pool: {e}")
 
 
 app = FastAPI(
@@ -72,6 +108,9 @@ cors_origins = getattr(settings, 'CORS_ORIGINS', [
     "http://localhost:3001",
 ])
 
+# Compress JSON / GeoJSON payloads (parcel layers, boundaries); streams pass through
+app.add_middleware(JSONCompressionMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
@@ -106,6 +145,29 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics/limiters")
+def get_limiter_metrics(current_user: User = Depends(get_current_user)):
+    """Current adaptive concurrency limits and counters per upstream. Signed-in users only."""
+    return {"limiters": limiter_metrics()}
+
+
+@app.get("/metrics/single-flight")
+def get_single_flight_metrics(current_user: User = Depends(get_current_user)):
+    """Upstream calls made vs callers served by an identical in-flight call. Signed-in users only."""
+    return {"single_flight": single_flight_metrics()}
+
+
+@app.get("/metrics/discovery")
+def get_discovery_metrics(
+    days: int = Query(30, ge=1, le=365),
+    mode: Optional[str] = None,
+    stage: Optional[str] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """Per-stage latency of finished discovery jobs, by day (see discovery_metrics.py). Signed-in users only."""
+    return {"days": days, "mode": mode, "stages": summarize_discovery_metrics(days, mode=mode, stage=stage)}
+
+
 app.include_router(api_router, prefix=settings.API_V1_PREFIX)
 
 # Mount static files for CV images
@@ -6,6 +6,9 @@ from app.models.property_business import PropertyBusiness
 from app.models.deal import Deal
 from app.models.usage_log import UsageLog
 from app.models.scoring_prompt import ScoringPrompt
+from app.models.discovery_job import DiscoveryJob
+from app.models.discovery_task import DiscoveryTask
+from app.models.discovery_job_metric import DiscoveryJobMetric
 
 __all__ = [
     "User",
@@ -15,4 +18,7 @@ __all__ = [
     "Deal",
     "UsageLog",
     "ScoringPrompt",
+    "DiscoveryJob",
+    "DiscoveryTask",
+    "DiscoveryJobMetric",
 ]
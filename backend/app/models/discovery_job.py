@@ -0,0 +1,30 @@
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class DiscoveryJob(Base):
+    """Discovery job state (status, progress, results), shared by all API workers."""
+    __tablename__ = "discovery_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True)  # The discovery job_id
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    mode = Column(String(50), nullable=True)  # business_first, contact_first, regrid_first, tile_first
+    status = Column(String(50), nullable=False)  # DiscoveryStep value
+    progress = Column(JSONB, nullable=True)  # DiscoveryProgress
+    params = Column(JSONB, nullable=True)  # tiers, business_type_ids, scoring_prompt
+    result = Column(JSONB, nullable=True)  # Final summary (property ids, counts, cost)
+    error = Column(Text, nullable=True)
+    checkpoint = Column(JSONB, nullable=True)  # Resume state (see discovery_job_store.py)
+    cancel_requested_at = Column(DateTime(timezone=True), nullable=True)  # Set by POST /discover/jobs/{job_id}/cancel
+
+    started_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)  # Refreshed on every update
+
+    def __repr__(self):
+        return f"<DiscoveryJob {self.id} {self.status}>"
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, String, Integer, Float, DateTime, UniqueConstraint
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class DiscoveryJobMetric(Base):
+    """Latency of one stage of a finished discovery job (see app/core/discovery_metrics.py)."""
+    __tablename__ = "discovery_job_metrics"
+    __table_args__ = (
+        UniqueConstraint("job_id", "stage", name="uq_discovery_job_metrics_job_stage"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(UUID(as_uuid=True), nullable=False)  # No FK - metrics outlive the expiring job row
+    user_id = Column(UUID(as_uuid=True), nullable=True)
+
+    mode = Column(String(50), nullable=True)  # business_first, contact_first, regrid_first, tile_first
+    status = Column(String(50), nullable=False)  # completed, failed, cancelled
+    stage = Column(String(50), nullable=False)  # regrid_query, parcel, imagery, vlm, enrichment, ... or "job"
+
+    count = Column(Integer, nullable=False)  # Items timed
+    total_seconds = Column(Float, nullable=False)
+    p50_seconds = Column(Float, nullable=False)
+    p95_seconds = Column(Float, nullable=False)
+    max_seconds = Column(Float, nullable=False)
+
+    recorded_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    def __repr__(self):
+        return f"<DiscoveryJobMetric {self.job_id} {self.stage}>"
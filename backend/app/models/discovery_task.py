@@ -0,0 +1,44 @@
+from sqlalchemy import Column, String, Text, Integer, DateTime, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+import uuid
+
+from app.db.base import Base
+
+
+class DiscoveryTask(Base):
+    """A unit of discovery work on the Postgres work queue (see app/core/discovery_queue.py)."""
+    __tablename__ = "discovery_tasks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String(50), nullable=False)  # discovery_job, resume_job, enrich_property
+    job_id = Column(UUID(as_uuid=True), nullable=True, index=True)  # Discovery job it belongs to
+    payload = Column(JSONB, nullable=False)
+
+    # queued -> running -> done | failed (running again if its lease expires)
+    status = Column(String(20), nullable=False, default="queued")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)  # Retry backoff
+
+    # Lease - the worker holding it heartbeats; an expired lease is reclaimed by another worker
+    locked_by = Column(String(100), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
+
+    result = Column(JSONB, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        # Claim scan: runnable queued tasks in order
+        Index('idx_discovery_tasks_queued', run_after, postgresql_where=(status == 'queued')),
+        # Lease reclaim scan
+        Index('idx_discovery_tasks_running_lease', lease_expires_at, postgresql_where=(status == 'running')),
+    )
+
+    def __repr__(self):
+        return f"<DiscoveryTask {self.kind} {self.id} {self.status}>"
@@ -12,6 +12,11 @@ import uuid
 from app.db.base import Base
 
 
+# Discovery sources that create exactly one property per parcel - unique on
+# (user_id, regrid_id) for these (see app/core/discovery_dedup.py)
+PARCEL_KEYED_SOURCES = ("regrid_first", "tile_first")
+
+
 class Property(Base):
     """Commercial property - the main entity for lead generation."""
     __tablename__ = "properties"
@@ -96,7 +101,7 @@ class Property(Base):
     enrichment_steps = Column(JSONB, nullable=True)  # LLM enrichment process steps for UI visualization
     
     # Discovery metadata
-    discovery_source = Column(String(50), nullable=True)  # business_first, regrid_first
+    discovery_source = Column(String(50), nullable=True)  # business_first, regrid_first, tile_first
     business_type_tier = Column(String(20), nullable=True)  # premium, high, standard
     
     # Status
@@ -121,5 +126,14 @@ class Property(Base):
         Index('idx_properties_regrid_polygon', regrid_polygon, postgresql_using='gist'),
         Index('idx_properties_status', status),
         Index('idx_properties_lead_score', lead_score),
+        # "Already processed?" anti-joins on parcel ids
+        Index('idx_properties_user_regrid_id', user_id, regrid_id, postgresql_where=regrid_id.isnot(None)),
+        Index(
+            'uq_properties_user_regrid_id_parcel_keyed',
+            user_id,
+            regrid_id,
+            unique=True,
+            postgresql_where=regrid_id.isnot(None) & discovery_source.in_(PARCEL_KEYED_SOURCES),
+        ),
     )
 
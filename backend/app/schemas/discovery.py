@@ -16,6 +16,7 @@ class DiscoveryMode(str, Enum):
     BUSINESS_FIRST = "business_first"  # Find businesses via Google Places → analyze property with Regrid + VLM
     CONTACT_FIRST = "contact_first"  # Find contacts via Apollo → find their properties via Regrid → VLM scoring
     REGRID_FIRST = "regrid_first"  # Query Regrid directly by LBCS codes → VLM scoring → Enrichment
+    TILE_FIRST = "tile_first"  # Screen parcels from Regrid tiles → batch-fetch shortlisted records → VLM scoring
 
 
 class PropertyCategoryEnum(str, Enum):
@@ -195,6 +196,16 @@ class DiscoveryStep(str, Enum):
     FILTERING = "filtering"
     COMPLETED = "completed"
     FAILED = "failed"
+    CANCELLED = "cancelled"  # Stopped via the API or by its SSE client leaving - result is partial
+
+
+class StageTiming(BaseModel):
+    """Per-item latency of one discovery stage (see app/core/discovery_metrics.py)."""
+    count: int = 0
+    total_seconds: float = 0.0
+    p50_seconds: float = 0.0
+    p95_seconds: float = 0.0
+    max_seconds: float = 0.0
 
 
 class DiscoveryProgress(BaseModel):
@@ -215,6 +226,8 @@ class DiscoveryProgress(BaseModel):
     # Common metrics
     high_value_leads: int = 0
     errors: List[str] = []
+    # Per-stage latency (regrid_query, parcel, imagery, vlm, enrichment, ...)
+    stage_timings: Dict[str, StageTiming] = {}
 
 
 class DiscoveryJobResponse(BaseModel):
@@ -0,0 +1,203 @@
+"""
+Discovery Worker
+
+Runs discovery work from the Postgres work queue (app/core/discovery_queue.py),
+separately from the API. Start as many as needed, on as many machines as
+needed - each one claims tasks with SKIP LOCKED, so capacity grows with the
+number of workers:
+
+    python -m app.worker
+
+Set DISCOVERY_EXECUTION=queue on the API so jobs are enqueued instead of run
+in-process. Each worker runs up to DISCOVERY_WORKER_CONCURRENCY whole jobs and,
+in separate slots, DISCOVERY_WORKER_PARCEL_CONCURRENCY parcel-level tasks (a
+job's enrichment stage fans out to those), and heartbeats their leases.
+Parcel-level tasks of a cancelled job are stopped mid-call (jobs stop
+themselves, see cancel_job in discovery_orchestrator.py). On SIGTERM it stops claiming and lets running tasks finish (anything still
+unfinished is reclaimed once its lease expires).
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from app.core import discovery_queue
+from app.core.config import settings
+from app.core.discovery_orchestrator import discovery_orchestrator
+from app.core.discovery_queue import QueuedTask
+from app.db.base import SessionLocal, close_db_pool
+
+logger = logging.getLogger(__name__)
+
+
+# Seconds to wait for running tasks on shutdown
+SHUTDOWN_GRACE_SECONDS = 60
+
+
+async def _run_discovery_job(payload: Dict[str, Any], db) -> None:
+    await discovery_orchestrator.run_job_payload(payload, db)
+
+
+async def _resume_job(payload: Dict[str, Any], db) -> None:
+    await discovery_orchestrator.resume_job(uuid.UUID(payload["job_id"]), db)
+
+
+async def _enrich_property(payload: Dict[str, Any], db) -> Dict[str, Any]:
+    enriched = await discovery_orchestrator.enrich_property(uuid.UUID(payload["property_id"]), db)
+    return {"enriched": enriched}
+
+
+HANDLERS: Dict[str, Callable[[Dict[str, Any], Any], Awaitable[Optional[Dict[str, Any]]]]] = {
+    discovery_queue.DISCOVERY_JOB: _run_discovery_job,
+    discovery_queue.RESUME_JOB: _resume_job,
+    discovery_queue.ENRICH_PROPERTY: _enrich_property,
+}
+
+
+class DiscoveryWorker:
+    """Claims queued tasks, runs them and keeps their leases alive."""
+
+    def __init__(self, concurrency: int, parcel_concurrency: int, poll_seconds: float):
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        # kinds -> slots
+        self.pools = [
+            (discovery_queue.JOB_KINDS, max(1, concurrency)),
+            (discovery_queue.PARCEL_KINDS, max(1, parcel_concurrency)),
+        ]
+        self.poll_seconds = poll_seconds
+        self._running: Dict[uuid.UUID, asyncio.Task] = {}
+        self._running_kinds: Dict[uuid.UUID, str] = {}
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        if not self._stopping.is_set():
+            logger.info(f"🛑 Worker {self.worker_id} stopping - finishing {len(self._running)} running tasks")
+            self._stopping.set()
+
+    async def run(self) -> None:
+        logger.info(
+            f"👷 Discovery worker {self.worker_id} started "
+            f"({self.pools[0][1]} job slots, {self.pools[1][1]} parcel slots)"
+        )
+        heartbeats = asyncio.ensure_future(self._heartbeat_loop())
+        cancellations = asyncio.ensure_future(self._cancel_loop())
+
+        try:
+            while not self._stopping.is_set():
+                claimed = []
+                for kinds, slots in self.pools:
+                    busy = sum(1 for kind in self._running_kinds.values() if kind in kinds)
+                    if busy >= slots:
+                        continue
+                    try:
+                        claimed.extend(await asyncio.to_thread(
+                            discovery_queue.claim, self.worker_id, kinds, limit=slots - busy
+                        ))
+                    except Exception as e:
+                        logger.warning(f"⚠️ Could not claim tasks: {e}")
+
+                for task in claimed:
+                    self._running_kinds[task.id] = task.kind
+                    self._running[task.id] = asyncio.ensure_future(self._execute(task))
+
+                if not claimed:
+                    # Idle (or full) - wait for a poll interval or shutdown
+                    try:
+                        await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_seconds)
+                    except asyncio.TimeoutError:
+                        pass
+
+            if self._running:
+                await asyncio.wait(list(self._running.values()), timeout=SHUTDOWN_GRACE_SECONDS)
+        finally:
+            heartbeats.cancel()
+            cancellations.cancel()
+            logger.info(f"👷 Discovery worker {self.worker_id} stopped")
+
+    async def _execute(self, task: QueuedTask) -> None:
+        handler = HANDLERS.get(task.kind)
+        logger.info(f"▶️ {task.kind} task {task.id} (attempt {task.attempts}/{task.max_attempts})")
+        db = SessionLocal()
+        try:
+            if handler is None:
+                raise ValueError(f"No handler for task kind '{task.kind}'")
+            result = await handler(task.payload, db)
+            await asyncio.to_thread(discovery_queue.complete, task.id, self.worker_id, result)
+            logger.info(f"✅ {task.kind} task {task.id} done")
+        except asyncio.CancelledError:
+            # Its job was cancelled (_cancel_loop) - the task row already says so
+            db.rollback()
+            logger.info(f"🛑 {task.kind} task {task.id} cancelled")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"❌ {task.kind} task {task.id} failed: {type(e).__name__}: {e}")
+            try:
+                retried = await asyncio.to_thread(
+                    discovery_queue.fail, task, self.worker_id, f"{type(e).__name__}: {e}"
+                )
+                if retried:
+                    logger.info(f"   🔁 Will retry {task.kind} task {task.id}")
+            except Exception as record_error:
+                # Lease expiry will hand it to another worker
+                logger.error(f"   ❌ Could not record failure: {record_error}")
+        finally:
+            db.close()
+            self._running.pop(task.id, None)
+            self._running_kinds.pop(task.id, None)
+
+    async def _heartbeat_loop(self) -> None:
+        interval = max(1.0, settings.DISCOVERY_TASK_LEASE_SECONDS / 3)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await asyncio.to_thread(discovery_queue.heartbeat, list(self._running.keys()), self.worker_id)
+                reaped = await asyncio.to_thread(discovery_queue.reap_abandoned)
+                if reaped:
+                    logger.warning(f"⚠️ Failed {reaped} tasks whose final attempt lost its lease")
+            except Exception as e:
+                logger.warning(f"⚠️ Heartbeat failed: {e}")
+
+    async def _cancel_loop(self) -> None:
+        """Stop running parcel-level tasks whose job was cancelled."""
+        while True:
+            await asyncio.sleep(settings.DISCOVERY_CANCEL_POLL_SECONDS)
+            parcel_tasks = [
+                task_id for task_id, kind in self._running_kinds.items()
+                if kind in discovery_queue.PARCEL_KINDS
+            ]
+            if not parcel_tasks:
+                continue
+            try:
+                for task_id in await asyncio.to_thread(discovery_queue.cancelled, parcel_tasks):
+                    running = self._running.get(task_id)
+                    if running is not None:
+                        running.cancel()
+            except Exception as e:
+                logger.warning(f"⚠️ Cancellation check failed: {e}")
+
+
+async def main() -> None:
+    worker = DiscoveryWorker(
+        concurrency=settings.DISCOVERY_WORKER_CONCURRENCY,
+        parcel_concurrency=settings.DISCOVERY_WORKER_PARCEL_CONCURRENCY,
+        poll_seconds=settings.DISCOVERY_WORKER_POLL_SECONDS,
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, worker.stop)
+        except NotImplementedError:
+            pass
+
+    try:
+        await worker.run()
+    finally:
+        close_db_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
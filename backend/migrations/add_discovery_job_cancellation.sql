@@ -0,0 +1,13 @@
+-- Migration: Cancelling discovery jobs
+-- Once started, a discovery job ran to the end. POST /discover/jobs/{job_id}/cancel
+-- now records the request here; whichever process runs the job polls it and stops
+-- the job, aborting its in-flight upstream calls (see app/core/cancellation.py)
+-- Run this in Supabase SQL editor with schema set to worksightdev
+
+ALTER TABLE discovery_jobs ADD COLUMN IF NOT EXISTS cancel_requested_at TIMESTAMPTZ;
+
+-- Cancelled jobs are finished - keep them out of the resume scan
+DROP INDEX IF EXISTS idx_discovery_jobs_resumable;
+CREATE INDEX IF NOT EXISTS idx_discovery_jobs_resumable
+    ON discovery_jobs(updated_at)
+    WHERE checkpoint IS NOT NULL AND status NOT IN ('completed', 'failed', 'cancelled');
@@ -0,0 +1,12 @@
+-- Migration: Checkpoints for resumable discovery jobs
+-- Regrid-first / tile-first jobs store their page cursor, shortlisted parcels and
+-- each parcel's last completed stage, so an interrupted job resumes without
+-- repeating paid Regrid, imagery, VLM or enrichment calls
+-- Run this in Supabase SQL editor with schema set to worksightdev
+
+ALTER TABLE discovery_jobs ADD COLUMN IF NOT EXISTS checkpoint JSONB;
+
+-- Workers look for checkpointed jobs that stopped updating
+CREATE INDEX IF NOT EXISTS idx_discovery_jobs_resumable
+    ON discovery_jobs(updated_at)
+    WHERE checkpoint IS NOT NULL AND status NOT IN ('completed', 'failed');
@@ -0,0 +1,53 @@
+-- Migration: Index parcel ids per user for discovery de-duplication
+-- Discovery checks candidate parcels against the user's properties in bulk
+-- (unnest + anti-join) and claims new parcels with INSERT ... ON CONFLICT DO NOTHING
+-- Run this in Supabase SQL editor with schema set to worksightdev
+
+-- Anti-join lookups: "which of these parcel ids does the user already have?"
+CREATE INDEX IF NOT EXISTS idx_properties_user_regrid_id
+    ON properties(user_id, regrid_id)
+    WHERE regrid_id IS NOT NULL;
+
+-- Step 1: Preview duplicate parcel-keyed properties (run this first to check)
+-- Only regrid_first / tile_first properties are unique per parcel; business-first,
+-- contact-first and map-click properties may legitimately share a parcel
+WITH duplicates AS (
+    SELECT
+        id,
+        user_id,
+        regrid_id,
+        created_at,
+        ROW_NUMBER() OVER (
+            PARTITION BY user_id, regrid_id
+            ORDER BY created_at ASC  -- Keep the oldest one
+        ) as rn
+    FROM properties
+    WHERE regrid_id IS NOT NULL
+      AND discovery_source IN ('regrid_first', 'tile_first')
+)
+SELECT id, user_id, regrid_id, created_at, 'TO BE DELETED' as status
+FROM duplicates
+WHERE rn > 1;
+
+-- Uncomment below to delete the duplicates (after verifying the preview)
+/*
+DELETE FROM properties
+WHERE id IN (
+    SELECT id FROM (
+        SELECT
+            id,
+            ROW_NUMBER() OVER (PARTITION BY user_id, regrid_id ORDER BY created_at ASC) as rn
+        FROM properties
+        WHERE regrid_id IS NOT NULL
+          AND discovery_source IN ('regrid_first', 'tile_first')
+    ) ranked
+    WHERE rn > 1
+);
+*/
+
+-- Step 2: One parcel-keyed property per (user, parcel) - fails while duplicates remain
+-- Must match the ON CONFLICT target in app/core/discovery_dedup.py
+CREATE UNIQUE INDEX IF NOT EXISTS uq_properties_user_regrid_id_parcel_keyed
+    ON properties(user_id, regrid_id)
+    WHERE regrid_id IS NOT NULL
+      AND discovery_source IN ('regrid_first', 'tile_first');
@@ -0,0 +1,25 @@
+-- Migration: Discovery job stage metrics
+-- Job progress only counted items, so a slow job didn't show whether it was stuck in
+-- Regrid paging, imagery, VLM or enrichment. Each finished job now stores the latency
+-- of every stage here (count, total, p50/p95/max), summarized by GET /metrics/discovery
+-- (see app/core/discovery_metrics.py)
+-- Run this in Supabase SQL editor with schema set to worksightdev
+
+CREATE TABLE IF NOT EXISTS discovery_job_metrics (
+    id SERIAL PRIMARY KEY,
+    job_id UUID NOT NULL,  -- No FK - metrics outlive the expiring discovery_jobs row
+    user_id UUID,
+    mode VARCHAR(50),
+    status VARCHAR(50) NOT NULL,
+    stage VARCHAR(50) NOT NULL,  -- "job" = the whole job's wall time
+    count INTEGER NOT NULL,
+    total_seconds DOUBLE PRECISION NOT NULL,
+    p50_seconds DOUBLE PRECISION NOT NULL,
+    p95_seconds DOUBLE PRECISION NOT NULL,
+    max_seconds DOUBLE PRECISION NOT NULL,
+    recorded_at TIMESTAMPTZ DEFAULT NOW(),
+    CONSTRAINT uq_discovery_job_metrics_job_stage UNIQUE (job_id, stage)
+);
+
+-- The summary endpoint scans a recent time window
+CREATE INDEX IF NOT EXISTS idx_discovery_job_metrics_recorded_at ON discovery_job_metrics(recorded_at);
@@ -0,0 +1,25 @@
+-- Migration: Persistent discovery job state
+-- Discovery job status, progress and results were kept in process memory, so they
+-- were invisible to other workers and lost on restart. Every API worker now reads
+-- and writes this table (see app/core/discovery_job_store.py)
+-- Run this in Supabase SQL editor with schema set to worksightdev
+
+CREATE TABLE IF NOT EXISTS discovery_jobs (
+    id UUID PRIMARY KEY,  -- The discovery job_id
+    user_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+    mode VARCHAR(50),
+    status VARCHAR(50) NOT NULL,
+    progress JSONB,
+    params JSONB,
+    result JSONB,
+    error TEXT,
+    started_at TIMESTAMPTZ DEFAULT NOW(),
+    completed_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL  -- Pushed forward on every update
+);
+
+CREATE INDEX IF NOT EXISTS idx_discovery_jobs_user_id ON discovery_jobs(user_id);
+
+-- Expired jobs are purged by the API; this keeps that delete cheap
+CREATE INDEX IF NOT EXISTS idx_discovery_jobs_expires_at ON discovery_jobs(expires_at);
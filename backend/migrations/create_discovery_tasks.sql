@@ -0,0 +1,37 @@
+-- Migration: Discovery work queue
+-- Discovery jobs ran as background tasks inside the API process that received the
+-- request. With DISCOVERY_EXECUTION=queue they are enqueued here instead and run by
+-- worker processes (python -m app.worker) that claim tasks with FOR UPDATE SKIP LOCKED
+-- (see app/core/discovery_queue.py)
+-- Run this in Supabase SQL editor with schema set to worksightdev
+
+CREATE TABLE IF NOT EXISTS discovery_tasks (
+    id UUID PRIMARY KEY,
+    kind VARCHAR(50) NOT NULL,  -- discovery_job, resume_job, enrich_property
+    job_id UUID,  -- Discovery job it belongs to
+    payload JSONB NOT NULL,
+    status VARCHAR(20) NOT NULL DEFAULT 'queued',  -- queued, running, done, failed
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    run_after TIMESTAMPTZ NOT NULL DEFAULT NOW(),  -- Retry backoff
+    locked_by VARCHAR(100),  -- Worker holding the lease
+    lease_expires_at TIMESTAMPTZ,  -- Extended by worker heartbeats
+    heartbeat_at TIMESTAMPTZ,
+    result JSONB,
+    last_error TEXT,
+    created_at TIMESTAMPTZ DEFAULT NOW(),
+    started_at TIMESTAMPTZ,
+    finished_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_discovery_tasks_job_id ON discovery_tasks(job_id);
+
+-- Claim scan: runnable queued tasks in order
+CREATE INDEX IF NOT EXISTS idx_discovery_tasks_queued
+ON discovery_tasks(run_after)
+WHERE status = 'queued';
+
+-- Lease reclaim scan: running tasks whose worker went away
+CREATE INDEX IF NOT EXISTS idx_discovery_tasks_running_lease
+ON discovery_tasks(lease_expires_at)
+WHERE status = 'running';
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from app.core.county_service import (
+    COUNTY_SNAPSHOT_PATH,
+    US_STATES,
+    County,
+    CountyService,
+    normalize_county_name,
+    normalize_state,
+)
+
+
+def _county(fips: str, name: str, state: str) -> County:
+    return County(fips=fips, name=name, state=state, state_fips=fips[:2], full_name=f"{name}, {state}")
+
+
+CENSUS_COUNTIES = [
+    _county("48113", "Dallas County", "TX"),
+    _county("01047", "Dallas County", "AL"),
+    _county("22071", "Orleans Parish", "LA"),
+    _county("02110", "Juneau City and Borough", "AK"),
+    _county("51760", "Richmond city", "VA"),
+    _county("51159", "Richmond County", "VA"),
+    _county("29189", "St. Louis County", "MO"),
+    _county("29510", "St. Louis city", "MO"),
+    _county("35013", "Doña Ana County", "NM"),
+    _county("12086", "Miami-Dade County", "FL"),
+    _county("72127", "San Juan Municipio", "PR"),
+]
+
+
+@pytest.fixture
+def service(tmp_path):
+    return CountyService(snapshot_path=tmp_path / "census_counties.json")
+
+
+@pytest.fixture
+def census_service(service):
+    service._counties_cache = CENSUS_COUNTIES
+    return service
+
+
+@pytest.fixture(scope="module")
+def snapshot_service():
+    """Service on the committed Census snapshot (every county, no network)."""
+    service = CountyService(snapshot_path=COUNTY_SNAPSHOT_PATH)
+    service._counties_cache = service._load_fallback_counties()
+    return service
+
+
+def test_normalize_county_name():
+    assert normalize_county_name("St. Louis County") == normalize_county_name("Saint Louis")
+    assert normalize_county_name("Miami-Dade County") == normalize_county_name("Miami Dade")
+    assert normalize_county_name("Doña Ana County") == normalize_county_name("Dona Ana")
+    assert normalize_county_name("Richmond city") != normalize_county_name("Richmond County")
+
+
+def test_normalize_state():
+    assert normalize_state("tx") == "TX"
+    assert normalize_state("Texas") == "TX"
+    assert normalize_state("48") == "TX"
+    assert normalize_state("Atlantis") is None
+
+
+@pytest.mark.parametrize(
+    "county, state, fips",
+    [
+        ("Dallas", "TX", "48113"),
+        ("Dallas County", "Alabama", "01047"),
+        ("Orleans", "LA", "22071"),
+        ("Juneau", "AK", "02110"),
+        ("Richmond", "VA", "51159"),
+        ("Richmond city", "VA", "51760"),
+        ("Saint Louis", "MO", "29189"),
+        ("St Louis city", "MO", "29510"),
+        ("Dona Ana", "NM", "35013"),
+        ("Miami Dade", "FL", "12086"),
+        ("San Juan", "PR", "72127"),
+    ],
+)
+def test_resolve_fips_by_name_across_states(census_service, county, state, fips):
+    assert asyncio.run(census_service.resolve_fips_by_name(county, state)) == fips
+
+
+def test_census_outage_backs_off_and_uses_builtin_counties(service, monkeypatch):
+    calls = []
+    
+    async def failing_fetch():
+        calls.append(1)
+        raise RuntimeError("Census API error: 503")
+    
+    monkeypatch.setattr(service, "_fetch_counties", failing_fetch)
+    
+    async def resolve_twice():
+        first = await service.resolve_fips_by_name("Dallas", "TX")
+        second = await service.resolve_fips_by_name("Cook County", "IL")
+        return first, second
+    
+    assert asyncio.run(resolve_twice()) == ("48113", "17031")
+    assert len(calls) == 1  # The second lookup didn't wait on the API again
+
+
+def test_census_snapshot_used_during_outage(service, monkeypatch):
+    async def fetch():
+        return CENSUS_COUNTIES
+    
+    async def failing_fetch():
+        raise RuntimeError("Census API error: 503")
+    
+    monkeypatch.setattr(service, "_fetch_counties", fetch)
+    asyncio.run(service.get_all_counties())
+    assert service.snapshot_path.exists()
+    
+    restarted = CountyService(snapshot_path=service.snapshot_path)
+    monkeypatch.setattr(restarted, "_fetch_counties", failing_fetch)
+    assert asyncio.run(restarted.resolve_fips_by_name("Orleans Parish", "LA")) == "22071"
+
+
+def test_snapshot_covers_every_state():
+    counties = CountyService(snapshot_path=COUNTY_SNAPSHOT_PATH)._load_fallback_counties()
+    assert len(counties) > 3200
+    assert {county.state for county in counties} == set(US_STATES.values())
+
+
+@pytest.mark.parametrize("state", sorted(US_STATES.values()))
+def test_resolve_every_county_in_state(snapshot_service, state):
+    counties = [county for county in snapshot_service._counties_cache if county.state == state]
+    assert counties
+    
+    async def resolve_all():
+        return {county.fips: await snapshot_service.resolve_fips_by_name(county.name, state) for county in counties}
+    
+    assert asyncio.run(resolve_all()) == {county.fips: county.fips for county in counties}
@@ -0,0 +1,99 @@
+import math
+
+import numpy as np
+import pyproj
+import pytest
+from shapely.geometry import MultiPolygon, Point, box
+
+from app.core.geo_utils import (
+    SQ_METERS_PER_ACRE,
+    acres,
+    area_m2,
+    areas_m2,
+    bounds_radius_m,
+    geometry_distance_m,
+    haversine_m,
+    meters_per_degree,
+)
+
+GEOD = pyproj.Geod(ellps="WGS84")
+
+# Parcel-sized boxes (lng/lat) at different latitudes, incl. a 6-degree cell edge
+PARCELS = [
+    box(-96.80, 32.78, -96.799, 32.781),      # Dallas, ~1 ha
+    box(-149.90, 61.21, -149.897, 61.212),    # Anchorage
+    box(-80.20, 25.76, -80.198, 25.7615),     # Miami
+    box(-66.10, 18.46, -66.099, 18.4605),     # San Juan
+    box(-102.001, 40.00, -101.999, 40.001),   # Straddles -102 (cell edge)
+    box(-122.5, 37.5, -122.4, 37.6),          # ~10 km square
+]
+
+
+def _geod_area(geom) -> float:
+    return abs(GEOD.geometry_area_perimeter(geom)[0])
+
+
+@pytest.mark.parametrize("geom", PARCELS)
+def test_area_matches_geodesic(geom):
+    assert area_m2(geom) == pytest.approx(_geod_area(geom), rel=1e-3)
+
+
+def test_batch_areas_match_single():
+    batch = areas_m2(PARCELS)
+    expected = [_geod_area(geom) for geom in PARCELS]
+    np.testing.assert_allclose(batch, expected, rtol=1e-3)
+
+
+def test_multipolygon_and_acres():
+    parts = MultiPolygon([PARCELS[0], box(-96.79, 32.78, -96.789, 32.781)])
+    assert area_m2(parts) == pytest.approx(_geod_area(parts), rel=1e-3)
+    assert acres(PARCELS[0]) == pytest.approx(_geod_area(PARCELS[0]) / SQ_METERS_PER_ACRE, rel=1e-3)
+
+
+def test_empty_and_non_polygon_geometries_have_no_area():
+    assert area_m2(Point(-96.8, 32.78)) == 0.0
+    assert area_m2(box(0, 0, 0, 0)) == 0.0
+
+
+@pytest.mark.parametrize(
+    "lat1, lng1, lat2, lng2",
+    [
+        (32.78, -96.80, 32.79, -96.81),   # ~1.4 km
+        (61.21, -149.90, 61.30, -149.70),
+        (25.76, -80.20, 40.71, -74.01),   # Miami - New York
+    ],
+)
+def test_haversine_close_to_geodesic(lat1, lng1, lat2, lng2):
+    _, _, geodesic = GEOD.inv(lng1, lat1, lng2, lat2)
+    # Spherical model: within 0.5% of the ellipsoidal distance
+    assert haversine_m(lat1, lng1, lat2, lng2) == pytest.approx(geodesic, rel=5e-3)
+
+
+def test_haversine_vectorized():
+    lat2 = np.array([32.79, 32.80])
+    lng2 = np.array([-96.81, -96.82])
+    distances = haversine_m(32.78, -96.80, lat2, lng2)
+    assert distances.shape == (2,)
+    assert distances[0] == pytest.approx(haversine_m(32.78, -96.80, 32.79, -96.81))
+    assert math.isclose(haversine_m(32.78, -96.80, 32.78, -96.80), 0.0, abs_tol=1e-6)
+
+
+@pytest.mark.parametrize("lat", [0.0, 18.46, 32.78, 45.0, 61.21])
+def test_meters_per_degree_matches_geodesic(lat):
+    m_lat, m_lng = meters_per_degree(lat)
+    # Over a small step the geodesic is the local scale
+    _, _, north = GEOD.inv(-96.8, lat - 0.0005, -96.8, lat + 0.0005)
+    _, _, east = GEOD.inv(-96.8005, lat, -96.7995, lat)
+    assert m_lat * 0.001 == pytest.approx(north, rel=1e-4)
+    assert m_lng * 0.001 == pytest.approx(east, rel=1e-4)
+
+
+def test_geometry_distance_and_bounds_radius():
+    parcel = PARCELS[0]
+    assert geometry_distance_m(parcel, Point(-96.7995, 32.7805)) == 0.0
+    # 0.001 degrees east of the parcel's east edge
+    _, _, east = GEOD.inv(-96.799, 32.7805, -96.798, 32.7805)
+    assert geometry_distance_m(parcel, Point(-96.798, 32.7805)) == pytest.approx(east, rel=5e-3)
+    
+    _, _, height = GEOD.inv(-122.5, 37.5, -122.5, 37.6)
+    assert bounds_radius_m(PARCELS[-1].bounds) == pytest.approx(height / 2, rel=5e-3)
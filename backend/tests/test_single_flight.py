@@ -0,0 +1,165 @@
+import asyncio
+
+import httpx
+import mercantile
+import pytest
+
+from app.core.adaptive_limiter import AdaptiveLimiter
+from app.core.arcgis_parcel_service import RegridTileService, TileFetchError
+from app.core.single_flight import SingleFlight
+
+
+class StandInTileServer:
+    """httpx transport standing in for the Regrid tileserver; counts hits per path."""
+
+    def __init__(self, status_code: int = 200, delay: float = 0.05, throttle_first: int = 0):
+        self.status_code = status_code
+        self.delay = delay
+        self.throttle_first = throttle_first
+        self.hits = {}
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.hits[path] = self.hits.get(path, 0) + 1
+        await asyncio.sleep(self.delay)
+        if sum(self.hits.values()) <= self.throttle_first:
+            return httpx.Response(429, headers={"Retry-After": "0"})
+        if self.status_code != 200:
+            return httpx.Response(self.status_code)
+        return httpx.Response(200, content=f"mvt:{path}".encode())
+
+    @property
+    def total(self) -> int:
+        return sum(self.hits.values())
+
+
+def _service(server: StandInTileServer) -> RegridTileService:
+    service = RegridTileService()
+    service.token = "test-token"
+    service.client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    # Fresh limiter / single-flight group / cache so tests don't share state
+    service._limiter = AdaptiveLimiter("test_tiles", initial_limit=4)
+    service._tile_flight = SingleFlight("test_tiles")
+    service._tile_cache.clear()
+    return service
+
+
+def test_single_flight_coalesces_identical_keys():
+    calls = []
+
+    async def fetch(key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return key * 2
+
+    async def run():
+        flight = SingleFlight("test")
+        results = await asyncio.gather(
+            *(flight.do("a", lambda: fetch("a")) for _ in range(10)),
+            flight.do("b", lambda: fetch("b")),
+        )
+        return flight, results
+
+    flight, results = asyncio.run(run())
+    assert results == ["aa"] * 10 + ["bb"]
+    assert sorted(calls) == ["a", "b"]
+    assert flight.snapshot()["calls"] == 2
+    assert flight.snapshot()["shared"] == 9
+    assert flight.in_flight == 0
+
+
+def test_single_flight_shares_exceptions_and_retries_after():
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    async def run():
+        flight = SingleFlight("test")
+        results = await asyncio.gather(*(flight.do("k", failing) for _ in range(5)), return_exceptions=True)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        with pytest.raises(RuntimeError):
+            await flight.do("k", failing)
+
+    asyncio.run(run())
+    assert len(calls) == 2  # One for the concurrent burst, one for the later call
+
+
+def test_single_flight_survives_a_cancelled_caller():
+    async def slow():
+        await asyncio.sleep(0.05)
+        return "done"
+
+    async def run():
+        flight = SingleFlight("test")
+        first = asyncio.ensure_future(flight.do("k", slow))
+        second = asyncio.ensure_future(flight.do("k", slow))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(run()) == "done"
+
+
+def test_concurrent_tile_requests_hit_the_server_once():
+    server = StandInTileServer()
+
+    async def run():
+        service = _service(server)
+        tile = mercantile.Tile(x=15000, y=26000, z=16)
+        results = await asyncio.gather(*(service._get_tile_bytes(tile) for _ in range(20)))
+        # Cached afterwards - no further hits
+        again = await service._get_tile_bytes(tile)
+        return results, again
+
+    results, again = asyncio.run(run())
+    assert server.total == 1
+    assert len(set(results)) == 1 and again == results[0]
+
+
+def test_overzoomed_tiles_share_their_parent_fetch():
+    server = StandInTileServer()
+
+    async def run():
+        service = _service(server)
+        parent = mercantile.Tile(x=15000, y=26000, z=service.max_zoom)
+        children = mercantile.children(parent)
+        sources = [service._source_tile(child) for child in children]
+        return await asyncio.gather(*(service._get_tile_bytes(source) for source in sources))
+
+    results = asyncio.run(run())
+    assert server.total == 1
+    assert len(set(results)) == 1
+
+
+def test_failed_tile_raises_for_every_caller_and_is_not_cached():
+    server = StandInTileServer(status_code=403)
+
+    async def run():
+        service = _service(server)
+        tile = mercantile.Tile(x=15000, y=26000, z=16)
+        results = await asyncio.gather(*(service._get_tile_bytes(tile) for _ in range(5)), return_exceptions=True)
+        assert all(isinstance(result, TileFetchError) and result.status_code == 403 for result in results)
+        with pytest.raises(TileFetchError):
+            await service._get_tile_bytes(tile)
+
+    asyncio.run(run())
+    assert server.total == 2
+
+
+def test_limiter_retries_throttled_tiles():
+    server = StandInTileServer(throttle_first=1)
+
+    async def run():
+        service = _service(server)
+        content = await service._get_tile_bytes(mercantile.Tile(x=15000, y=26000, z=16))
+        return service, content
+
+    service, content = asyncio.run(run())
+    assert content.startswith(b"mvt:")
+    assert server.total == 2
+    snapshot = service._limiter.snapshot()
+    assert snapshot["throttled"] == 1
+    assert snapshot["in_flight"] == 0